@@ -6,7 +6,8 @@ import pandas as pd
 
 from freqtrade.strategy import IStrategy
 
-from backend.app.freqtrade.adapter_v1 import annotate_factor_ledger, build_series_id
+from backend.app.freqtrade.adapter_v1 import build_series_id
+from backend.app.freqtrade.ledger_annotator import shared_ledger_annotator
 
 
 class TradeCanvasFactorLedgerStrategy(IStrategy):
@@ -27,7 +28,7 @@ class TradeCanvasFactorLedgerStrategy(IStrategy):
 
     def populate_indicators(self, dataframe: pd.DataFrame, metadata: dict[str, Any]) -> pd.DataFrame:
         series_id = build_series_id(metadata.get("pair", ""), self.timeframe)
-        res = annotate_factor_ledger(dataframe, series_id=series_id, timeframe=self.timeframe)
+        res = shared_ledger_annotator().annotate(dataframe, series_id=series_id, timeframe=self.timeframe)
         return res.dataframe if res.ok else dataframe
 
     def populate_entry_trend(self, dataframe: pd.DataFrame, metadata: dict[str, Any]) -> pd.DataFrame:
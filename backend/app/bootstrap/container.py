@@ -26,6 +26,7 @@ from .container_contexts import (
 from ..market.runtime_builder import MarketRuntimeBuildOptions, build_market_runtime
 from ..runtime.api_gates import ApiGateConfig
 from ..runtime.flags import RuntimeFlags, load_runtime_flags
+from ..runtime.ingest_trace import IngestTracer
 from ..runtime.metrics import RuntimeMetrics
 from ..storage import PostgresPool, PostgresPoolSettings, bootstrap_postgres_schema
 from ..worktree.manager import WorktreeManager
@@ -83,10 +84,15 @@ def build_app_container(*, settings: Settings, project_root: Path) -> AppContain
     postgres_pool = _maybe_bootstrap_postgres(settings=settings, runtime_flags=runtime_flags)
     configure_blocking_executor(workers=int(runtime_flags.blocking_workers))
     runtime_metrics = RuntimeMetrics(enabled=bool(runtime_flags.enable_runtime_metrics))
+    ingest_tracer = IngestTracer(
+        sample_rate=float(runtime_flags.ingest_trace_sample_rate),
+        capacity=int(runtime_flags.ingest_trace_capacity),
+    )
     core = build_domain_core(
         settings=settings,
         runtime_flags=runtime_flags,
         postgres_pool=postgres_pool,
+        runtime_metrics=runtime_metrics,
     )
     read_core_services = build_read_core_services(core=core, runtime_flags=runtime_flags)
 
@@ -100,6 +106,8 @@ def build_app_container(*, settings: Settings, project_root: Path) -> AppContain
         options=MarketRuntimeBuildOptions(
             runtime_flags=runtime_flags,
             feature_orchestrator=core.feature_orchestrator,
+            ingest_tracer=ingest_tracer,
+            ccxt_backfill=core.ccxt_backfill,
         ),
     )
     lifecycle = AppLifecycleService(market_runtime=runtime_build.runtime)
@@ -128,6 +136,7 @@ def build_app_container(*, settings: Settings, project_root: Path) -> AppContain
         api_gates=api_gates,
         debug_hub=core.debug_hub,
         runtime_metrics=runtime_metrics,
+        ingest_tracer=ingest_tracer,
         worktree_manager=worktree_manager,
     )
     store_ctx = StoreContainerContext(
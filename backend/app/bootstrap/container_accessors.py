@@ -43,6 +43,10 @@ class AppContainerAccessors:
     def runtime_metrics(self):
         return self.core.runtime_metrics
 
+    @property
+    def ingest_tracer(self):
+        return self.core.ingest_tracer
+
     @property
     def worktree_manager(self):
         return self.core.worktree_manager
@@ -14,6 +14,8 @@ from ..factor.slices_service import FactorSlicesService
 from ..factor.store import FactorStore
 from ..feature import FeatureOrchestrator, FeatureReadService, FeatureSettings, FeatureStore
 from ..ledger.sync_service import LedgerSyncService
+from ..market.ccxt_backfill_engine import CcxtBackfillConfig, CcxtBackfillEngine
+from ..overlay.integrity_cache import OverlayIntegrityVerdictCache
 from ..overlay.orchestrator import OverlayOrchestrator, OverlaySettings
 from ..overlay.store import OverlayStore
 from ..pipelines import IngestPipeline
@@ -21,6 +23,7 @@ from ..read_models import DrawReadService, FactorReadService, ReadRepairService,
 from ..replay.prepare_service import ReplayPrepareService
 from ..replay.package_service_v1 import ReplayPackageServiceConfig, ReplayPackageServiceV1
 from ..runtime.flags import RuntimeFlags
+from ..runtime.metrics import RuntimeMetrics
 from ..storage.candle_store import CandleStore
 from ..storage import PostgresCandleRepository, PostgresFactorRepository, PostgresOverlayRepository, PostgresPool
 
@@ -36,6 +39,8 @@ class DomainCore:
     overlay_store: OverlayStore
     overlay_orchestrator: OverlayOrchestrator
     debug_hub: DebugHub
+    integrity_verdicts: OverlayIntegrityVerdictCache
+    ccxt_backfill: CcxtBackfillEngine
 
 
 @dataclass(frozen=True)
@@ -68,7 +73,26 @@ def _build_candle_store(
     return CandleStore(db_path=settings.db_path)
 
 
-def build_domain_core(*, settings: Settings, runtime_flags: RuntimeFlags, postgres_pool: PostgresPool | None) -> DomainCore:
+def _build_ccxt_backfill(*, settings: Settings, runtime_flags: RuntimeFlags) -> CcxtBackfillEngine:
+    checkpoint_dir = None
+    if bool(runtime_flags.enable_market_backfill_progress_persistence):
+        checkpoint_dir = settings.db_path.parent / "runtime_state" / "ccxt_backfill"
+    return CcxtBackfillEngine(
+        config=CcxtBackfillConfig(
+            concurrency=max(1, int(runtime_flags.ccxt_backfill_concurrency)),
+            rate_per_s=max(0.0, float(runtime_flags.ccxt_backfill_rate_per_s)),
+            checkpoint_dir=checkpoint_dir,
+        )
+    )
+
+
+def build_domain_core(
+    *,
+    settings: Settings,
+    runtime_flags: RuntimeFlags,
+    postgres_pool: PostgresPool | None,
+    runtime_metrics: RuntimeMetrics | None = None,
+) -> DomainCore:
     store = _build_candle_store(
         settings=settings,
         postgres_pool=postgres_pool,
@@ -125,12 +149,16 @@ def build_domain_core(*, settings: Settings, runtime_flags: RuntimeFlags, postgr
         settings=OverlaySettings(
             ingest_enabled=bool(runtime_flags.enable_overlay_ingest),
             window_candles=int(runtime_flags.overlay_window_candles),
+            incremental_ingest=bool(runtime_flags.enable_overlay_incremental_ingest),
         ),
     )
 
     debug_hub = DebugHub()
     factor_orchestrator.set_debug_hub(debug_hub)
     overlay_orchestrator.set_debug_hub(debug_hub)
+    integrity_verdicts = OverlayIntegrityVerdictCache(runtime_metrics=runtime_metrics)
+    factor_orchestrator.set_integrity_invalidator(integrity_verdicts.invalidate)
+    overlay_orchestrator.set_integrity_invalidator(integrity_verdicts.invalidate)
 
     return DomainCore(
         store=store,
@@ -142,6 +170,8 @@ def build_domain_core(*, settings: Settings, runtime_flags: RuntimeFlags, postgr
         overlay_store=overlay_store,
         overlay_orchestrator=overlay_orchestrator,
         debug_hub=debug_hub,
+        integrity_verdicts=integrity_verdicts,
+        ccxt_backfill=_build_ccxt_backfill(settings=settings, runtime_flags=runtime_flags),
     )
 
 
@@ -164,6 +194,7 @@ def build_read_core_services(*, core: DomainCore, runtime_flags: RuntimeFlags) -
         factor_read_service=factor_read_service,
         debug_hub=core.debug_hub,
         debug_api_enabled=bool(runtime_flags.enable_debug_api),
+        integrity_verdicts=core.integrity_verdicts,
     )
     world_read_service = WorldReadService(
         store=core.store,
@@ -217,6 +248,7 @@ def build_replay_services(
             replay_enabled=bool(runtime_flags.enable_replay_v1),
             coverage_enabled=bool(runtime_flags.enable_replay_ensure_coverage),
             ccxt_backfill_enabled=bool(runtime_flags.enable_ccxt_backfill),
+            ccxt_backfill=core.ccxt_backfill,
             market_history_source=str(runtime_flags.market_history_source),
         ),
     )
@@ -19,6 +19,7 @@ from ..replay.package_service_v1 import ReplayPackageServiceV1
 from ..replay.prepare_service import ReplayPrepareService
 from ..runtime.api_gates import ApiGateConfig
 from ..runtime.flags import RuntimeFlags
+from ..runtime.ingest_trace import IngestTracer
 from ..runtime.metrics import RuntimeMetrics
 from ..storage.candle_store import CandleStore
 from ..worktree.manager import WorktreeManager
@@ -31,6 +32,7 @@ class CoreContainerContext:
     api_gates: ApiGateConfig
     debug_hub: DebugHub
     runtime_metrics: RuntimeMetrics
+    ingest_tracer: IngestTracer
     worktree_manager: WorktreeManager
 
 
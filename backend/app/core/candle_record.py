@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+
+from .schemas import CandleClosed
+
+
+class CandleRecord(NamedTuple):
+    """
+    Immutable tuple-backed candle for storage/factor/overlay internals.
+    Same attribute names as `CandleClosed`, so read-only consumers accept either; convert at API/WS boundaries.
+    """
+
+    candle_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @classmethod
+    def from_closed(cls, candle: Any) -> CandleRecord:
+        if type(candle) is cls:
+            return candle
+        return cls(
+            int(candle.candle_time),
+            float(candle.open),
+            float(candle.high),
+            float(candle.low),
+            float(candle.close),
+            float(candle.volume),
+        )
+
+    def to_closed(self) -> CandleClosed:
+        # Plain constructor on purpose: on pydantic 2 it is faster than `model_construct` for int/float fields.
+        return CandleClosed(
+            candle_time=self.candle_time,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+        )
+
+
+def as_closed(candle: CandleClosed | CandleRecord) -> CandleClosed:
+    """The pydantic model for a WS/API payload; records decoded on the ingest path are converted only here."""
+    return candle.to_closed() if type(candle) is CandleRecord else candle
+
+
+def records_from_closed(candles: Iterable[Any]) -> list[CandleRecord]:
+    from_closed = CandleRecord.from_closed
+    return [from_closed(c) for c in candles]
+
+
+def closed_from_records(records: Iterable[CandleRecord]) -> list[CandleClosed]:
+    return [
+        CandleClosed(candle_time=r[0], open=r[1], high=r[2], low=r[3], close=r[4], volume=r[5])
+        for r in records
+    ]
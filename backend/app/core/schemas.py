@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from .schemas_dev import (
     DevCreateWorktreeRequest,
     DevCreateWorktreeResponse,
@@ -24,6 +24,9 @@ from .schemas_dev import (
 
 
 class CandleClosed(BaseModel):
+    # Frozen: the store caches boundary models per series and hands the same instance to every reader.
+    model_config = ConfigDict(frozen=True)
+
     candle_time: int = Field(..., description="Unix seconds (candle open time)")
     open: float
     high: float
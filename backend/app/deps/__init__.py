@@ -57,6 +57,7 @@ from .read import (
     DrawReadServiceDep,
     FactorReadServiceDep,
     FactorStoreDep,
+    IngestTracerDep,
     OverlayStoreDep,
     ReadRepairServiceDep,
     RuntimeMetricsDep,
@@ -66,6 +67,7 @@ from .read import (
     get_draw_read_service,
     get_factor_read_service,
     get_factor_store,
+    get_ingest_tracer,
     get_overlay_store,
     get_read_repair_service,
     get_runtime_metrics,
@@ -88,6 +90,7 @@ __all__ = [
     "FactorReadServiceDep",
     "FactorStoreDep",
     "IngestSupervisorDep",
+    "IngestTracerDep",
     "MarketBackfillProgressDep",
     "MarketDataDep",
     "MarketDerivedInitialBackfillDep",
@@ -122,6 +125,7 @@ __all__ = [
     "get_factor_read_service",
     "get_factor_store",
     "get_ingest_supervisor",
+    "get_ingest_tracer",
     "get_market_backfill_progress",
     "get_market_data",
     "get_market_derived_initial_backfill",
@@ -9,6 +9,7 @@ from ..debug.hub import DebugHub
 from ..factor.store import FactorStore
 from ..overlay.store import OverlayStore
 from ..read_models import DrawReadService, FactorReadService, ReadRepairService, WorldReadService
+from ..runtime.ingest_trace import IngestTracer
 from ..runtime.metrics import RuntimeMetrics
 from ..storage.candle_store import CandleStore
 from .core import get_app_container
@@ -50,6 +51,10 @@ def get_runtime_metrics(container: AppContainer = Depends(get_app_container)) ->
     return container.runtime_metrics
 
 
+def get_ingest_tracer(container: AppContainer = Depends(get_app_container)) -> IngestTracer:
+    return container.ingest_tracer
+
+
 CandleStoreDep = Annotated[CandleStore, Depends(get_candle_store)]
 FactorStoreDep = Annotated[FactorStore, Depends(get_factor_store)]
 OverlayStoreDep = Annotated[OverlayStore, Depends(get_overlay_store)]
@@ -59,3 +64,4 @@ WorldReadServiceDep = Annotated[WorldReadService, Depends(get_world_read_service
 ReadRepairServiceDep = Annotated[ReadRepairService, Depends(get_read_repair_service)]
 DebugHubDep = Annotated[DebugHub, Depends(get_debug_hub)]
 RuntimeMetricsDep = Annotated[RuntimeMetrics, Depends(get_runtime_metrics)]
+IngestTracerDep = Annotated[IngestTracer, Depends(get_ingest_tracer)]
@@ -38,7 +38,7 @@ class PenSlicePlugin:
             pen_head = dict(pen_head_row.head or {})
         else:
             try:
-                candles = ctx.candle_store.get_closed_between_times(
+                candles = ctx.candle_store.get_closed_records_between_times(
                     ctx.series_id,
                     start_time=int(ctx.start_time),
                     end_time=int(ctx.aligned_time),
@@ -34,7 +34,7 @@ class ZhongshuSlicePlugin:
         zhongshu_head: dict[str, Any] = {}
         if pen_confirmed:
             try:
-                candles_for_zhongshu = ctx.candle_store.get_closed_between_times(
+                candles_for_zhongshu = ctx.candle_store.get_closed_records_between_times(
                     ctx.series_id,
                     start_time=int(ctx.start_time),
                     end_time=int(ctx.aligned_time),
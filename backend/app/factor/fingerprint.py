@@ -4,6 +4,7 @@ import hashlib
 import inspect
 import json
 from pathlib import Path
+from typing import Mapping
 
 from . import pen as pen_module
 from . import zhongshu as zhongshu_module
@@ -23,6 +24,33 @@ def _file_sha256(path: Path) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def fingerprint_source_files(*, registry: FactorRegistry, orchestrator_file: Path) -> dict[str, Path]:
+    files = {
+        "factor_orchestrator.py": orchestrator_file,
+        "factor_manifest.py": orchestrator_file.with_name("factor_manifest.py"),
+        "factor_plugin_contract.py": orchestrator_file.with_name("factor_plugin_contract.py"),
+        "factor_plugin_registry.py": orchestrator_file.with_name("factor_plugin_registry.py"),
+        "pen.py": Path(getattr(pen_module, "__file__", "")),
+        "zhongshu.py": Path(getattr(zhongshu_module, "__file__", "")),
+        "zhongshu_state_models.py": Path(getattr(zhongshu_state_models_module, "__file__", "")),
+        "zhongshu_state_transitions.py": Path(getattr(zhongshu_state_transitions_module, "__file__", "")),
+        "zhongshu_state_updates.py": Path(getattr(zhongshu_state_updates_module, "__file__", "")),
+    }
+
+    for plugin in sorted(registry.plugins(), key=lambda p: str(p.spec.factor_name)):
+        try:
+            plugin_file = Path(inspect.getfile(plugin.__class__))
+        except (TypeError, OSError):
+            continue
+        files[f"plugin:{plugin.spec.factor_name}"] = plugin_file
+    return files
+
+
+def fingerprint_source_digests(*, registry: FactorRegistry, orchestrator_file: Path) -> dict[str, str]:
+    sources = fingerprint_source_files(registry=registry, orchestrator_file=orchestrator_file)
+    return {key: _file_sha256(path) for key, path in sources.items()}
+
+
 def build_series_fingerprint(
     *,
     series_id: str,
@@ -31,27 +59,12 @@ def build_series_fingerprint(
     registry: FactorRegistry,
     orchestrator_file: Path,
     logic_version_override: str = "",
+    source_digests: Mapping[str, str] | None = None,
 ) -> str:
-    files = {
-        "factor_orchestrator.py": _file_sha256(orchestrator_file),
-        "factor_manifest.py": _file_sha256(orchestrator_file.with_name("factor_manifest.py")),
-        "factor_plugin_contract.py": _file_sha256(orchestrator_file.with_name("factor_plugin_contract.py")),
-        "factor_plugin_registry.py": _file_sha256(orchestrator_file.with_name("factor_plugin_registry.py")),
-        "pen.py": _file_sha256(Path(getattr(pen_module, "__file__", ""))),
-        "zhongshu.py": _file_sha256(Path(getattr(zhongshu_module, "__file__", ""))),
-        "zhongshu_state_models.py": _file_sha256(Path(getattr(zhongshu_state_models_module, "__file__", ""))),
-        "zhongshu_state_transitions.py": _file_sha256(
-            Path(getattr(zhongshu_state_transitions_module, "__file__", ""))
-        ),
-        "zhongshu_state_updates.py": _file_sha256(Path(getattr(zhongshu_state_updates_module, "__file__", ""))),
-    }
-
-    for plugin in sorted(registry.plugins(), key=lambda p: str(p.spec.factor_name)):
-        try:
-            plugin_file = Path(inspect.getfile(plugin.__class__))
-        except (TypeError, OSError):
-            continue
-        files[f"plugin:{plugin.spec.factor_name}"] = _file_sha256(plugin_file)
+    if source_digests is None:
+        files = fingerprint_source_digests(registry=registry, orchestrator_file=orchestrator_file)
+    else:
+        files = dict(source_digests)
 
     payload = {
         "series_id": str(series_id),
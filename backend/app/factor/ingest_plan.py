@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
+from .fingerprint import build_series_fingerprint, fingerprint_source_digests, fingerprint_source_files
+from .graph import FactorGraph
+from .registry import FactorRegistry
+from .runtime_config import FactorSettings
+
+_SourceStamp = tuple[tuple[str, int, int], ...]
+
+
+@dataclass(frozen=True)
+class FactorIngestPlan:
+    series_id: str
+    settings: FactorSettings
+    tf_s: int
+    max_window: int
+    fingerprint: str
+    topo_order: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class FactorIngestPlanLookup:
+    plan: FactorIngestPlan
+    cache_hit: bool
+    duration_ms: float
+
+
+def _source_stamp(sources: dict[str, Path]) -> _SourceStamp:
+    out: list[tuple[str, int, int]] = []
+    for key in sorted(sources.keys()):
+        try:
+            st = sources[key].stat()
+        except OSError:
+            out.append((key, -1, -1))
+            continue
+        out.append((key, int(st.st_mtime_ns), int(st.st_size)))
+    return tuple(out)
+
+
+class FactorIngestPlanCache:
+    """
+    Per-process cache of the static part of factor ingest:
+    - One plan per series_id, rebuilt (not added) when the series' settings change;
+      at most `max_series` series are kept (LRU). logic_version_override is fixed per cache.
+    - Source files are hashed once and shared by every series fingerprint.
+    - Invalidated when a fingerprinted source file changes (mtime/size), checked at most
+      once per `source_check_interval_s`.
+    """
+
+    def __init__(
+        self,
+        *,
+        graph: FactorGraph,
+        registry: FactorRegistry,
+        orchestrator_file: Path,
+        logic_version_override: str = "",
+        source_check_interval_s: float = 5.0,
+        max_series: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._graph = graph
+        self._registry = registry
+        self._orchestrator_file = orchestrator_file
+        self._logic_version_override = str(logic_version_override or "")
+        self._source_check_interval_s = max(0.0, float(source_check_interval_s))
+        self._max_series = max(1, int(max_series))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._plans: OrderedDict[str, FactorIngestPlan] = OrderedDict()
+        self._source_digests: dict[str, str] | None = None
+        self._source_stamp: _SourceStamp = ()
+        self._source_checked_at = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _sources(self) -> dict[str, Path]:
+        return fingerprint_source_files(registry=self._registry, orchestrator_file=self._orchestrator_file)
+
+    def _refresh_sources_locked(self) -> None:
+        now = float(self._clock())
+        if self._source_digests is not None:
+            if (now - self._source_checked_at) < self._source_check_interval_s:
+                return
+            self._source_checked_at = now
+            stamp = _source_stamp(self._sources())
+            if stamp == self._source_stamp:
+                return
+            self._plans.clear()
+            self._invalidations += 1
+        self._source_stamp = _source_stamp(self._sources())
+        self._source_digests = fingerprint_source_digests(
+            registry=self._registry,
+            orchestrator_file=self._orchestrator_file,
+        )
+        self._source_checked_at = now
+
+    def _build_plan_locked(self, *, series_id: str, settings: FactorSettings) -> FactorIngestPlan:
+        fingerprint = build_series_fingerprint(
+            series_id=series_id,
+            settings=settings,
+            graph=self._graph,
+            registry=self._registry,
+            orchestrator_file=self._orchestrator_file,
+            logic_version_override=self._logic_version_override,
+            source_digests=self._source_digests,
+        )
+        return FactorIngestPlan(
+            series_id=str(series_id),
+            settings=settings,
+            tf_s=int(timeframe_to_seconds(series_id_timeframe(series_id))),
+            max_window=max(int(settings.pivot_window_major), int(settings.pivot_window_minor)),
+            fingerprint=str(fingerprint),
+            topo_order=tuple(str(name) for name in self._graph.topo_order),
+        )
+
+    def lookup(self, *, series_id: str, settings: FactorSettings) -> FactorIngestPlanLookup:
+        t0 = time.perf_counter()
+        key = str(series_id)
+        with self._lock:
+            self._refresh_sources_locked()
+            plan = self._plans.get(key)
+            cache_hit = plan is not None and plan.settings == settings
+            if plan is None or not cache_hit:
+                plan = self._build_plan_locked(series_id=key, settings=settings)
+                self._plans[key] = plan
+                self._misses += 1
+                while len(self._plans) > self._max_series:
+                    self._plans.popitem(last=False)
+            else:
+                self._hits += 1
+            self._plans.move_to_end(key)
+        return FactorIngestPlanLookup(
+            plan=plan,
+            cache_hit=bool(cache_hit),
+            duration_ms=(time.perf_counter() - t0) * 1000.0,
+        )
+
+    def warm(self, *, series_ids: Iterable[str], settings: FactorSettings) -> int:
+        warmed = 0
+        for series_id in series_ids:
+            try:
+                self.lookup(series_id=str(series_id), settings=settings)
+            except ValueError:
+                continue
+            warmed += 1
+        return int(warmed)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self._source_digests = None
+            self._source_stamp = ()
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": int(len(self._plans)),
+                "hits": int(self._hits),
+                "misses": int(self._misses),
+                "invalidations": int(self._invalidations),
+            }
@@ -74,7 +74,7 @@ class FactorIngestWindowPlanner:
         head_time: int,
         plan: FactorIngestWindowPlan,
     ) -> FactorIngestCandleBatch | None:
-        candles = self._candle_store.get_closed_between_times(
+        candles = self._candle_store.get_closed_records_between_times(
             series_id,
             start_time=int(plan.start_time),
             end_time=int(up_to),
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from ..debug.hub import DebugHub
 from .fingerprint import build_series_fingerprint
 from .fingerprint_rebuild import FactorFingerprintRebuildCoordinator
 from .graph import FactorGraph, FactorSpec
 from .ingest_outputs import HeadBuildState, HeadSnapshotBuildRequest, build_head_snapshots, persist_ingest_outputs
+from .ingest_plan import FactorIngestPlanCache, FactorIngestPlanLookup
 from .orchestrator_ingest import ingest_closed
 from .orchestrator_ops import (
     collect_rebuild_event_buckets,
@@ -37,6 +38,8 @@ from ..storage.candle_store import CandleStore
 class FactorIngestResult:
     rebuilt: bool = False
     fingerprint: str | None = None
+    plan_cache_hit: bool | None = None
+    plan_ms: float = 0.0
 
 
 class FactorOrchestrator:
@@ -70,6 +73,7 @@ class FactorOrchestrator:
         self._factor_rebuild_keep_candles = max(100, int(factor_rebuild_keep_candles))
         self._logic_version_override = str(logic_version_override or "")
         self._debug_hub: DebugHub | None = None
+        self._invalidate_integrity: Callable[[str], None] | None = None
         manifest = build_default_factor_manifest()
         self._registry = FactorRegistry(list(manifest.tick_plugins))
         self._graph = FactorGraph([FactorSpec(factor_name=s.factor_name, depends_on=s.depends_on) for s in self._registry.specs()])
@@ -81,6 +85,12 @@ class FactorOrchestrator:
             anchor_processor=anchor_selector,
             services=services,
         )
+        self._ingest_plans = FactorIngestPlanCache(
+            graph=self._graph,
+            registry=self._registry,
+            orchestrator_file=Path(__file__),
+            logic_version_override=self._logic_version_override,
+        )
 
     def _resolve_anchor_strength_selector(self) -> Any | None:
         anchor_plugin = self._registry.get("anchor")
@@ -94,6 +104,10 @@ class FactorOrchestrator:
     def set_debug_hub(self, hub: DebugHub | None) -> None:
         self._debug_hub = hub
 
+    def set_integrity_invalidator(self, invalidate: Callable[[str], None] | None) -> None:
+        """Called with the series id after every factor commit (e.g. overlay integrity verdict cache)."""
+        self._invalidate_integrity = invalidate
+
     def _fingerprint_rebuild_enabled(self) -> bool:
         return bool(self._fingerprint_rebuild_enabled_flag)
 
@@ -107,6 +121,20 @@ class FactorOrchestrator:
             logic_version_override=self._logic_version_override,
         )
 
+    def _ingest_plan(self, *, series_id: str, settings: FactorSettings) -> FactorIngestPlanLookup:
+        return self._ingest_plans.lookup(series_id=series_id, settings=settings)
+
+    def warm_ingest_plans(self, *, series_ids: Iterable[str]) -> int:
+        if not self.enabled():
+            return 0
+        return self._ingest_plans.warm(series_ids=series_ids, settings=self._load_settings())
+
+    def invalidate_ingest_plans(self) -> None:
+        self._ingest_plans.invalidate()
+
+    def ingest_plan_stats(self) -> dict[str, int]:
+        return self._ingest_plans.stats()
+
     def enabled(self) -> bool:
         return bool(self._ingest_enabled)
 
@@ -198,7 +226,7 @@ class FactorOrchestrator:
         auto_rebuild: bool,
         fingerprint: str,
     ) -> int:
-        return persist_ingest_outputs(
+        wrote = persist_ingest_outputs(
             factor_store=self._factor_store,
             topo_order=[str(name) for name in self._graph.topo_order],
             series_id=series_id,
@@ -208,6 +236,9 @@ class FactorOrchestrator:
             auto_rebuild=bool(auto_rebuild),
             fingerprint=str(fingerprint),
         )
+        if self._invalidate_integrity is not None:
+            self._invalidate_integrity(series_id)
+        return wrote
 
     def ingest_closed(self, *, series_id: str, up_to_candle_time: int) -> FactorIngestResult:
         return ingest_closed(
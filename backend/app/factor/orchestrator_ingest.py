@@ -4,19 +4,24 @@ import time
 from typing import Any
 
 from .ingest_outputs import HeadBuildState
+from .ingest_plan import FactorIngestPlanLookup
 from .orchestrator_ops import build_incremental_bootstrap_state
 from .store import FactorEventWrite
 from .tick_executor import FactorTickRunRequest
-from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
 
 
 def _build_ingest_result(
     result_cls: type[Any],
     *,
     rebuilt: bool,
-    fingerprint: str,
+    plan_lookup: FactorIngestPlanLookup,
 ) -> Any:
-    return result_cls(rebuilt=bool(rebuilt), fingerprint=fingerprint)
+    return result_cls(
+        rebuilt=bool(rebuilt),
+        fingerprint=str(plan_lookup.plan.fingerprint),
+        plan_cache_hit=bool(plan_lookup.cache_hit),
+        plan_ms=float(plan_lookup.duration_ms),
+    )
 
 
 def _emit_ingest_debug(
@@ -28,6 +33,7 @@ def _emit_ingest_debug(
     events: list[FactorEventWrite],
     wrote: int,
     started_at: float,
+    plan_lookup: FactorIngestPlanLookup,
 ) -> None:
     if orchestrator._debug_hub is None:
         return
@@ -41,6 +47,8 @@ def _emit_ingest_debug(
             "candles_read": int(len(candles)),
             "events_planned": int(len(events)),
             "db_changes": int(wrote),
+            "plan_cache_hit": bool(plan_lookup.cache_hit),
+            "plan_ms": round(float(plan_lookup.duration_ms), 3),
             "duration_ms": int((time.perf_counter() - started_at) * 1000),
         },
     )
@@ -62,10 +70,11 @@ def ingest_closed(
         return result_cls()
 
     settings = orchestrator._load_settings()
-    tf_s = timeframe_to_seconds(series_id_timeframe(series_id))
-    max_window = max(int(settings.pivot_window_major), int(settings.pivot_window_minor))
+    plan_lookup = orchestrator._ingest_plan(series_id=series_id, settings=settings)
+    tf_s = int(plan_lookup.plan.tf_s)
+    max_window = int(plan_lookup.plan.max_window)
     auto_rebuild = orchestrator._fingerprint_rebuild_enabled()
-    current_fingerprint = orchestrator._build_series_fingerprint(series_id=series_id, settings=settings)
+    current_fingerprint = str(plan_lookup.plan.fingerprint)
     rebuild_outcome = orchestrator._fingerprint_rebuild_coordinator().ensure_series_ready(
         series_id=series_id,
         auto_rebuild=bool(auto_rebuild),
@@ -79,7 +88,7 @@ def ingest_closed(
         return _build_ingest_result(
             result_cls,
             rebuilt=force_rebuild_from_earliest,
-            fingerprint=current_fingerprint,
+            plan_lookup=plan_lookup,
         )
 
     window_plan = planner.plan_window(
@@ -95,7 +104,7 @@ def ingest_closed(
         return _build_ingest_result(
             result_cls,
             rebuilt=force_rebuild_from_earliest,
-            fingerprint=current_fingerprint,
+            plan_lookup=plan_lookup,
         )
 
     candle_batch = planner.load_candle_batch(
@@ -108,7 +117,7 @@ def ingest_closed(
         return _build_ingest_result(
             result_cls,
             rebuilt=force_rebuild_from_earliest,
-            fingerprint=current_fingerprint,
+            plan_lookup=plan_lookup,
         )
     candles = candle_batch.candles
     time_to_idx = candle_batch.time_to_idx
@@ -192,9 +201,10 @@ def ingest_closed(
         events=events,
         wrote=int(wrote),
         started_at=float(t0),
+        plan_lookup=plan_lookup,
     )
     return _build_ingest_result(
         result_cls,
         rebuilt=force_rebuild_from_earliest,
-        fingerprint=current_fingerprint,
+        plan_lookup=plan_lookup,
     )
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -13,7 +14,7 @@ from ..storage.local_store_runtime import (
     merge_series_head_time,
     read_series_head_time,
 )
-from .store_local_sql import execute_local_factor_sql
+from .store_local_sql import bump_series_revision, execute_local_factor_sql
 
 
 @dataclass(frozen=True)
@@ -61,6 +62,8 @@ class _FactorStoreState:
     series_head: dict[str, int] = field(default_factory=dict)
     fingerprints: dict[str, FactorSeriesFingerprintRow] = field(default_factory=dict)
     event_unique_keys: set[tuple[str, str, str]] = field(default_factory=set)
+    last_event_id_by_series: dict[str, int] = field(default_factory=dict)
+    revision_by_series: dict[str, int] = field(default_factory=dict)
     next_event_id: int = 1
     next_head_snapshot_id: int = 1
 
@@ -115,13 +118,7 @@ class FactorStore:
 
     def get_series_fingerprint(self, series_id: str) -> FactorSeriesFingerprintRow | None:
         row = _get_store_state(self.db_path).fingerprints.get(str(series_id))
-        if row is None:
-            return None
-        return FactorSeriesFingerprintRow(
-            series_id=str(row.series_id),
-            fingerprint=str(row.fingerprint),
-            updated_at_ms=int(row.updated_at_ms),
-        )
+        return None if row is None else replace(row)
 
     def upsert_series_fingerprint_in_conn(self, conn: _FactorStoreConnection, *, series_id: str, fingerprint: str) -> None:
         sid = str(series_id)
@@ -139,17 +136,19 @@ class FactorStore:
         conn._state.events = [row for row in conn._state.events if str(row.series_id) != sid]
         conn._state.head_snapshots = [row for row in conn._state.head_snapshots if str(row.series_id) != sid]
         conn._state.series_head.pop(sid, None)
-        conn._state.event_unique_keys = {
-            key for key in conn._state.event_unique_keys if str(key[0]) != sid
-        }
+        conn._state.last_event_id_by_series.pop(sid, None)
+        bump_series_revision(conn._state, sid)
+        conn._state.event_unique_keys = {key for key in conn._state.event_unique_keys if str(key[0]) != sid}
         deleted = (before_events - len(conn._state.events)) + (before_heads - len(conn._state.head_snapshots))
         if deleted > 0:
             conn.total_changes += int(deleted)
 
     def last_event_id(self, series_id: str) -> int:
-        sid = str(series_id)
-        event_ids = [int(row.id) for row in _get_store_state(self.db_path).events if str(row.series_id) == sid]
-        return int(max(event_ids)) if event_ids else 0
+        return int(_get_store_state(self.db_path).last_event_id_by_series.get(str(series_id), 0))
+
+    def series_revision(self, series_id: str) -> int:
+        """Bumped once per inserted event and once per payload update / clear of the series."""
+        return int(_get_store_state(self.db_path).revision_by_series.get(str(series_id), 0))
 
     def insert_events_in_conn(self, conn: _FactorStoreConnection, *, events: list[FactorEventWrite]) -> None:
         inserted = 0
@@ -169,6 +168,8 @@ class FactorStore:
                     payload=dict(event.payload or {}),
                 )
             )
+            conn._state.last_event_id_by_series[str(event.series_id)] = int(conn._state.next_event_id)
+            bump_series_revision(conn._state, str(event.series_id))
             conn._state.next_event_id += 1
             inserted += 1
         if inserted > 0:
@@ -191,9 +192,8 @@ class FactorStore:
             for row in conn._state.head_snapshots
             if str(row.series_id) == sid and str(row.factor_name) == fname and int(row.candle_time) == ctime
         ]
-        rows.sort(key=lambda row: int(row.seq), reverse=True)
-        if rows:
-            latest = rows[0]
+        latest = max(rows, key=lambda row: int(row.seq), default=None)
+        if latest is not None:
             if dict(latest.head or {}) == dict(head or {}):
                 return int(latest.seq)
             next_seq = int(latest.seq) + 1
@@ -229,10 +229,7 @@ class FactorStore:
             for row in _get_store_state(self.db_path).head_snapshots
             if str(row.series_id) == sid and str(row.factor_name) == fname and int(row.candle_time) <= ctime
         ]
-        if not candidates:
-            return None
-        candidates.sort(key=lambda row: (int(row.candle_time), int(row.seq)), reverse=True)
-        return candidates[0]
+        return max(candidates, key=lambda row: (int(row.candle_time), int(row.seq)), default=None)
 
     def get_events_between_times(
         self,
@@ -255,9 +252,14 @@ class FactorStore:
             and (fname is None or str(row.factor_name) == fname)
         ]
         rows.sort(key=lambda row: (int(row.candle_time), int(row.id)))
-        if int(limit) > 0:
-            rows = rows[: int(limit)]
-        return list(rows)
+        return rows[: int(limit)] if int(limit) > 0 else rows
+
+    def get_events_after_id(self, *, series_id: str, after_event_id: int, limit: int = 20000) -> list[FactorEventRow]:
+        """Series events with id > after_event_id in id order; the log is id-ordered, so O(log n + newer events)."""
+        events = _get_store_state(self.db_path).events
+        start = bisect_right(events, int(after_event_id), key=lambda row: int(row.id))
+        rows = [row for row in events[start:] if str(row.series_id) == str(series_id)]
+        return rows[: int(limit)] if int(limit) > 0 else rows
 
     def get_events_between_times_paged(
         self,
@@ -276,10 +278,7 @@ class FactorStore:
             end_candle_time=int(end_candle_time),
             limit=10**9,
         )
-        out: list[FactorEventRow] = []
-        for idx in range(0, len(rows), page):
-            out.extend(rows[idx : idx + page])
-        return out
+        return [row for idx in range(0, len(rows), page) for row in rows[idx : idx + page]]
 
     def iter_events_between_times_paged(
         self,
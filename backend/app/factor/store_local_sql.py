@@ -6,6 +6,10 @@ from typing import Any
 from ..storage.local_store_runtime import LocalConnectionBase, MemoryCursor
 
 
+def bump_series_revision(state: Any, series_id: str) -> None:
+    state.revision_by_series[series_id] = int(state.revision_by_series.get(series_id, 0)) + 1
+
+
 def execute_local_factor_sql(
     *,
     conn: LocalConnectionBase,
@@ -78,6 +82,7 @@ def execute_local_factor_sql(
         if not isinstance(payload, dict):
             payload = {}
         rowcount = 0
+        updated_series_id = ""
         updated_events: list[Any] = []
         for event in state.events:
             if int(event.id) == int(event_id):
@@ -93,10 +98,12 @@ def execute_local_factor_sql(
                     )
                 )
                 rowcount = 1
+                updated_series_id = str(event.series_id)
             else:
                 updated_events.append(event)
         if rowcount > 0:
             state.events = updated_events
+            bump_series_revision(state, updated_series_id)
             conn.total_changes += int(rowcount)
         return MemoryCursor(rowcount=rowcount)
 
@@ -11,10 +11,11 @@ from .contracts import (
 )
 from .orchestrator import FeatureIngestResult, FeatureOrchestrator, FeatureSettings
 from .read_service import FeatureReadService
-from .store import FeatureStore, FeatureVectorRow, FeatureVectorWrite
+from .store import FeatureColumnsRange, FeatureStore, FeatureVectorRow, FeatureVectorWrite
 
 __all__ = [
     "FeatureColumnSpec",
+    "FeatureColumnsRange",
     "FeatureContractError",
     "FeatureIngestResult",
     "FeatureOrchestrator",
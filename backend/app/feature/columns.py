@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+from .contracts import FeatureValue
+
+# Per-cell state: the key was not written for that candle / was written as None / holds a value.
+_ABSENT, _NULL, _SET = 0, 1, 2
+_TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+_FILL: dict[str, Any] = {"bool": 0, "int": 0, "float": 0.0, "object": None}
+
+
+def _value_kind(value: FeatureValue) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    return "object"
+
+
+class FeatureColumn:
+    """
+    One feature key of one series: a typed array (bool/int/float) or a list (str/mixed) plus one state byte per row.
+    The type is fixed by the first non-null value; a value of another type demotes the column to a list.
+    """
+
+    __slots__ = ("kind", "values", "state")
+
+    def __init__(self, *, size: int) -> None:
+        self.kind: str | None = None
+        self.values: Any = [None] * size
+        self.state = bytearray(size)
+
+    def _retype(self, kind: str) -> None:
+        size = len(self.state)
+        if kind == "object":
+            self.values = self.get_many(0, size)
+        else:
+            self.values = array(_TYPECODES[kind], [_FILL[kind]]) * size
+        self.kind = kind
+
+    def append_slot(self) -> None:
+        self.values.append(_FILL[self.kind or "object"])
+        self.state.append(_ABSENT)
+
+    def insert_slot(self, pos: int) -> None:
+        self.values.insert(pos, _FILL[self.kind or "object"])
+        self.state.insert(pos, _ABSENT)
+
+    def clear(self, pos: int) -> None:
+        self.state[pos] = _ABSENT
+
+    def set(self, pos: int, value: FeatureValue) -> None:
+        if value is None:
+            self.state[pos] = _NULL
+            return
+        kind = _value_kind(value)
+        if self.kind is None:
+            self._retype(kind)
+        elif self.kind != kind and self.kind != "object":
+            self._retype("object")
+        try:
+            self.values[pos] = value
+        except OverflowError:
+            self._retype("object")
+            self.values[pos] = value
+        self.state[pos] = _SET
+
+    def touched(self, lo: int, hi: int) -> bool:
+        return self.state[lo:hi].count(_ABSENT) != hi - lo
+
+    def has(self, pos: int) -> bool:
+        return self.state[pos] != _ABSENT
+
+    def get(self, pos: int) -> FeatureValue:
+        if self.state[pos] != _SET:
+            return None
+        value = self.values[pos]
+        return bool(value) if self.kind == "bool" else value
+
+    def get_many(self, lo: int, hi: int) -> list[FeatureValue]:
+        """Values of rows [lo, hi) with None for absent/null cells."""
+        values = self.values[lo:hi]
+        out = values.tolist() if isinstance(values, array) else list(values)
+        if self.kind == "bool":
+            out = [bool(v) for v in out]
+        state = self.state[lo:hi]
+        if state.count(_SET) != len(state):
+            for idx, cell in enumerate(state):
+                if cell != _SET:
+                    out[idx] = None
+        return out
+
+
+class FeatureSeriesColumns:
+    """All feature rows of one series, sorted by candle_time, stored column-wise."""
+
+    __slots__ = ("times", "row_ids", "candle_ids", "columns")
+
+    def __init__(self) -> None:
+        self.times = array("q")
+        self.row_ids = array("q")
+        self.candle_ids: list[str] = []
+        self.columns: dict[str, FeatureColumn] = {}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def position(self, candle_time: int) -> int | None:
+        pos = bisect_left(self.times, int(candle_time))
+        return pos if pos < len(self.times) and self.times[pos] == int(candle_time) else None
+
+    def bounds(self, start_time: int, end_time: int) -> tuple[int, int]:
+        return bisect_left(self.times, int(start_time)), bisect_right(self.times, int(end_time))
+
+    def values_at(self, pos: int) -> dict[str, FeatureValue]:
+        return {key: column.get(pos) for key, column in self.columns.items() if column.has(pos)}
+
+    def _column(self, key: str) -> FeatureColumn:
+        column = self.columns.get(key)
+        if column is None:
+            column = FeatureColumn(size=len(self.times))
+            self.columns[key] = column
+        return column
+
+    def insert_row(self, *, row_id: int, candle_time: int, candle_id: str) -> int:
+        t = int(candle_time)
+        if not self.times or t > self.times[-1]:
+            pos = len(self.times)
+            self.times.append(t)
+            self.row_ids.append(int(row_id))
+            self.candle_ids.append(candle_id)
+            for column in self.columns.values():
+                column.append_slot()
+            return pos
+        pos = bisect_left(self.times, t)
+        self.times.insert(pos, t)
+        self.row_ids.insert(pos, int(row_id))
+        self.candle_ids.insert(pos, candle_id)
+        for column in self.columns.values():
+            column.insert_slot(pos)
+        return pos
+
+    def write_values(self, pos: int, values: dict[str, FeatureValue]) -> None:
+        for column in self.columns.values():
+            column.clear(pos)
+        for key, value in values.items():
+            self._column(str(key)).set(pos, value)
+
+    def column_slices(self, lo: int, hi: int, keys: tuple[str, ...] | None = None) -> dict[str, list[FeatureValue]]:
+        """Columns of rows [lo, hi) in first-written order; without `keys`, only columns written in that range."""
+        if keys is not None:
+            missing: list[FeatureValue] = [None] * (hi - lo)
+            return {key: self.columns[key].get_many(lo, hi) if key in self.columns else list(missing) for key in keys}
+        return {key: column.get_many(lo, hi) for key, column in self.columns.items() if column.touched(lo, hi)}
@@ -8,7 +8,7 @@ from ..factor.capability_manifest import (
     build_default_factor_capability_manifest,
 )
 from ..factor.manifest import FactorManifest
-from ..factor.store import FactorStore
+from ..factor.store import FactorEventRow, FactorStore
 from .contracts import FeatureValue
 from .store import FeatureStore, FeatureVectorWrite
 
@@ -84,24 +84,48 @@ class FeatureOrchestrator:
             return value
         return None
 
-    def _build_feature_rows(
+    def _read_new_events(
         self,
         *,
         series_id: str,
-        start_time: int,
+        current_head: int,
+        factor_head: int,
         up_to_time: int,
-        enabled_factors: tuple[str, ...],
-    ) -> list[FeatureVectorWrite]:
-        if not enabled_factors:
-            return []
-        enabled_set = set(enabled_factors)
+    ) -> tuple[list[FactorEventRow], int | None]:
+        """
+        Events with candle_time in (current_head, up_to_time] and the event cursor to persist (None = leave unset).
+        With a cursor only events newer than it are scanned; events past up_to_time hold the cursor back.
+        """
+        cursor = self._feature_store.event_cursor(series_id) if current_head > 0 else None
+        if cursor is not None:
+            newer = self._factor_store.get_events_after_id(series_id=series_id, after_event_id=int(cursor), limit=0)
+            rows = [row for row in newer if current_head < int(row.candle_time) <= up_to_time]
+            pending = [int(row.id) for row in newer if int(row.candle_time) > up_to_time]
+            if pending:
+                return rows, min(pending) - 1
+            return rows, int(newer[-1].id) if newer else int(cursor)
+
+        last_event_id = int(self._factor_store.last_event_id(series_id))
         rows = self._factor_store.get_events_between_times(
             series_id=series_id,
             factor_name=None,
-            start_candle_time=int(start_time),
+            start_candle_time=int(current_head + 1) if current_head > 0 else 0,
             end_candle_time=int(up_to_time),
             limit=200000,
         )
+        # Events beyond up_to_time may already exist when factor runs ahead; only then is the cursor unsafe.
+        return rows, last_event_id if factor_head <= up_to_time else None
+
+    def _build_feature_rows(
+        self,
+        *,
+        series_id: str,
+        rows: list[FactorEventRow],
+        enabled_factors: tuple[str, ...],
+    ) -> list[FeatureVectorWrite]:
+        if not enabled_factors:
+            return []
+        enabled_set = set(enabled_factors)
         count_by_time: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
         value_by_time: dict[int, dict[str, FeatureValue]] = defaultdict(dict)
         for row in rows:
@@ -157,16 +181,22 @@ class FeatureOrchestrator:
         if up_to <= current_head:
             return FeatureIngestResult(wrote=0, head_time=current_head)
 
-        start_time = int(current_head + 1) if current_head > 0 else 0
-        feature_rows = self._build_feature_rows(
+        events, next_cursor = self._read_new_events(
             series_id=series_id,
-            start_time=int(start_time),
+            current_head=current_head,
+            factor_head=factor_head,
             up_to_time=int(up_to),
+        )
+        feature_rows = self._build_feature_rows(
+            series_id=series_id,
+            rows=events,
             enabled_factors=enabled_factors,
         )
 
         with self._feature_store.connect() as conn:
             wrote = self._feature_store.upsert_rows_in_conn(conn, rows=feature_rows)
+            if next_cursor is not None:
+                self._feature_store.upsert_event_cursor_in_conn(conn, series_id=series_id, event_id=int(next_cursor))
             self._feature_store.upsert_head_time_in_conn(conn, series_id=series_id, head_time=int(up_to))
             conn.commit()
         return FeatureIngestResult(wrote=int(wrote), head_time=int(up_to))
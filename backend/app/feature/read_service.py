@@ -13,7 +13,7 @@ from .contracts import (
     normalize_feature_row_values,
     validate_feature_columns,
 )
-from .store import FeatureVectorRow
+from .store import FeatureColumnsRange, FeatureVectorRow
 
 
 class FeatureStoreReadPort(HeadStorePort, Protocol):
@@ -26,6 +26,16 @@ class FeatureStoreReadPort(HeadStorePort, Protocol):
         limit: int = 20000,
     ) -> list[FeatureVectorRow]: ...
 
+    def get_columns_between_times(
+        self,
+        *,
+        series_id: str,
+        start_candle_time: int,
+        end_candle_time: int,
+        keys: tuple[str, ...] | None = None,
+        limit: int = 0,
+    ) -> FeatureColumnsRange: ...
+
 
 @dataclass(frozen=True)
 class FeatureReadService:
@@ -112,16 +122,16 @@ class FeatureReadService:
         window = max(1, int(window_candles))
         return max(0, int(aligned_time) - window * timeframe_seconds)
 
-    def read_batch(
+    def _read_window(
         self,
         *,
         series_id: str,
         at_time: int,
         window_candles: int,
-        aligned_time: int | None = None,
-        ensure_fresh: bool = True,
-        limit: int = 20000,
-    ) -> FeatureVectorBatchV1:
+        aligned_time: int | None,
+        ensure_fresh: bool,
+    ) -> tuple[int, int] | None:
+        """(start_time, aligned_time) of the requested window, or None when nothing is aligned yet."""
         aligned = self.resolve_aligned_time(
             series_id=series_id,
             at_time=int(at_time),
@@ -130,6 +140,60 @@ class FeatureReadService:
         if bool(self.strict_mode) and bool(ensure_fresh):
             self._ensure_strict_freshness(series_id=series_id, aligned_time=aligned)
         if aligned is None:
+            return None
+        start_time = self._resolve_window_start(
+            aligned_time=int(aligned),
+            window_candles=int(window_candles),
+            series_id=series_id,
+        )
+        return int(start_time), int(aligned)
+
+    def read_columns(
+        self,
+        *,
+        series_id: str,
+        at_time: int,
+        window_candles: int,
+        aligned_time: int | None = None,
+        ensure_fresh: bool = True,
+        limit: int = 20000,
+    ) -> FeatureColumnsRange:
+        """Same window/freshness rules as `read_batch`, returned column-wise without per-row dicts."""
+        window = self._read_window(
+            series_id=series_id,
+            at_time=at_time,
+            window_candles=window_candles,
+            aligned_time=aligned_time,
+            ensure_fresh=ensure_fresh,
+        )
+        if window is None:
+            return FeatureColumnsRange(series_id=str(series_id), candle_times=[], candle_ids=[], columns={})
+        start_time, aligned = window
+        return self.feature_store.get_columns_between_times(
+            series_id=series_id,
+            start_candle_time=start_time,
+            end_candle_time=aligned,
+            limit=max(1, int(limit)),
+        )
+
+    def read_batch(
+        self,
+        *,
+        series_id: str,
+        at_time: int,
+        window_candles: int,
+        aligned_time: int | None = None,
+        ensure_fresh: bool = True,
+        limit: int = 20000,
+    ) -> FeatureVectorBatchV1:
+        window = self._read_window(
+            series_id=series_id,
+            at_time=at_time,
+            window_candles=window_candles,
+            aligned_time=aligned_time,
+            ensure_fresh=ensure_fresh,
+        )
+        if window is None:
             return FeatureVectorBatchV1(
                 series_id=str(series_id),
                 aligned_time=0,
@@ -137,11 +201,7 @@ class FeatureReadService:
                 rows=tuple(),
             )
 
-        start_time = self._resolve_window_start(
-            aligned_time=int(aligned),
-            window_candles=int(window_candles),
-            series_id=series_id,
-        )
+        start_time, aligned = window
         read_limit = max(1, int(limit))
         rows = self.feature_store.get_rows_between_times(
             series_id=series_id,
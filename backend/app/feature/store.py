@@ -11,6 +11,7 @@ from ..storage.local_store_runtime import (
     merge_series_head_time,
     read_series_head_time,
 )
+from .columns import FeatureSeriesColumns
 from .contracts import FeatureValue
 
 
@@ -31,11 +32,26 @@ class FeatureVectorWrite:
     values: dict[str, FeatureValue]
 
 
+@dataclass(frozen=True)
+class FeatureColumnsRange:
+    """Column-wise range read: `columns[key][i]` belongs to `candle_times[i]`; None = not written / null."""
+
+    series_id: str
+    candle_times: list[int]
+    candle_ids: list[str]
+    columns: dict[str, list[FeatureValue]]
+
+    def rows_by_time(self) -> dict[int, dict[str, FeatureValue]]:
+        """candle_time -> {key: value} over every column in the range, same shape as normalized batch rows."""
+        keys = tuple(self.columns)
+        return {t: {key: self.columns[key][i] for key in keys} for i, t in enumerate(self.candle_times)}
+
+
 @dataclass
 class _FeatureStoreState:
-    rows: list[FeatureVectorRow] = field(default_factory=list)
+    series: dict[str, FeatureSeriesColumns] = field(default_factory=dict)
     series_head: dict[str, int] = field(default_factory=dict)
-    row_index: dict[tuple[str, int], int] = field(default_factory=dict)
+    event_cursor: dict[str, int] = field(default_factory=dict)
     next_row_id: int = 1
 
 
@@ -79,59 +95,59 @@ class FeatureStore:
             series_id=series_id,
         )
 
+    def event_cursor(self, series_id: str) -> int | None:
+        """Last factor event id already folded into this series' features (None = unknown, read by time)."""
+        return _get_store_state(self.db_path).event_cursor.get(str(series_id))
+
+    def upsert_event_cursor_in_conn(self, conn: _FeatureStoreConnection, *, series_id: str, event_id: int) -> None:
+        conn._state.event_cursor[str(series_id)] = int(event_id)
+        conn.total_changes += 1
+
     def clear_series_in_conn(self, conn: _FeatureStoreConnection, *, series_id: str) -> None:
         sid = str(series_id)
-        before_count = len(conn._state.rows)
-        conn._state.rows = [row for row in conn._state.rows if str(row.series_id) != sid]
+        cols = conn._state.series.pop(sid, None)
         conn._state.series_head.pop(sid, None)
-        conn._state.row_index = {
-            (str(row.series_id), int(row.candle_time)): int(idx)
-            for idx, row in enumerate(conn._state.rows)
-        }
-        deleted = before_count - len(conn._state.rows)
-        if deleted > 0:
-            conn.total_changes += int(deleted)
+        conn._state.event_cursor.pop(sid, None)
+        if cols is not None and len(cols) > 0:
+            conn.total_changes += len(cols)
 
     def upsert_rows_in_conn(self, conn: _FeatureStoreConnection, *, rows: list[FeatureVectorWrite]) -> int:
         changed = 0
         for row in rows:
             sid = str(row.series_id)
-            candle_time = int(row.candle_time)
-            key = (sid, candle_time)
+            cols = conn._state.series.get(sid)
+            if cols is None:
+                cols = FeatureSeriesColumns()
+                conn._state.series[sid] = cols
             values = dict(row.values or {})
             candle_id = str(row.candle_id)
-            index = conn._state.row_index.get(key)
-            if index is None:
-                conn._state.rows.append(
-                    FeatureVectorRow(
-                        id=int(conn._state.next_row_id),
-                        series_id=sid,
-                        candle_time=candle_time,
-                        candle_id=candle_id,
-                        values=values,
-                    )
-                )
-                conn._state.row_index[key] = len(conn._state.rows) - 1
+            pos = cols.position(int(row.candle_time))
+            if pos is None:
+                pos = cols.insert_row(row_id=conn._state.next_row_id, candle_time=int(row.candle_time), candle_id=candle_id)
                 conn._state.next_row_id += 1
-                changed += 1
+            elif cols.candle_ids[pos] == candle_id and cols.values_at(pos) == values:
                 continue
-
-            existing = conn._state.rows[index]
-            if existing.candle_id == candle_id and dict(existing.values or {}) == values:
-                continue
-            conn._state.rows[index] = FeatureVectorRow(
-                id=int(existing.id),
-                series_id=sid,
-                candle_time=candle_time,
-                candle_id=candle_id,
-                values=values,
-            )
+            cols.candle_ids[pos] = candle_id
+            cols.write_values(pos, values)
             changed += 1
 
         if changed > 0:
             conn.total_changes += int(changed)
         return int(changed)
 
+    def _series(self, series_id: str) -> FeatureSeriesColumns | None:
+        return _get_store_state(self.db_path).series.get(str(series_id))
+
+    @staticmethod
+    def _row(series_id: str, cols: FeatureSeriesColumns, pos: int) -> FeatureVectorRow:
+        return FeatureVectorRow(
+            id=int(cols.row_ids[pos]),
+            series_id=str(series_id),
+            candle_time=int(cols.times[pos]),
+            candle_id=cols.candle_ids[pos],
+            values=cols.values_at(pos),
+        )
+
     def get_rows_between_times(
         self,
         *,
@@ -140,18 +156,36 @@ class FeatureStore:
         end_candle_time: int,
         limit: int = 20000,
     ) -> list[FeatureVectorRow]:
-        sid = str(series_id)
-        start_time = int(start_candle_time)
-        end_time = int(end_candle_time)
-        rows = [
-            row
-            for row in _get_store_state(self.db_path).rows
-            if str(row.series_id) == sid and start_time <= int(row.candle_time) <= end_time
-        ]
-        rows.sort(key=lambda row: (int(row.candle_time), int(row.id)))
+        cols = self._series(series_id)
+        if cols is None:
+            return []
+        lo, hi = cols.bounds(int(start_candle_time), int(end_candle_time))
+        if int(limit) > 0:
+            hi = min(hi, lo + int(limit))
+        return [self._row(series_id, cols, pos) for pos in range(lo, hi)]
+
+    def get_columns_between_times(
+        self,
+        *,
+        series_id: str,
+        start_candle_time: int,
+        end_candle_time: int,
+        keys: tuple[str, ...] | None = None,
+        limit: int = 0,
+    ) -> FeatureColumnsRange:
+        """Range read straight from the column arrays, without materializing per-row dicts."""
+        cols = self._series(series_id)
+        if cols is None:
+            return FeatureColumnsRange(series_id=str(series_id), candle_times=[], candle_ids=[], columns={})
+        lo, hi = cols.bounds(int(start_candle_time), int(end_candle_time))
         if int(limit) > 0:
-            rows = rows[: int(limit)]
-        return list(rows)
+            hi = min(hi, lo + int(limit))
+        return FeatureColumnsRange(
+            series_id=str(series_id),
+            candle_times=cols.times[lo:hi].tolist(),
+            candle_ids=cols.candle_ids[lo:hi],
+            columns=cols.column_slices(lo, hi, keys),
+        )
 
     def iter_rows_between_times_paged(
         self,
@@ -173,15 +207,8 @@ class FeatureStore:
                 yield row
 
     def get_row_at_or_before(self, *, series_id: str, candle_time: int) -> FeatureVectorRow | None:
-        sid = str(series_id)
-        ctime = int(candle_time)
-        rows = [
-            row
-            for row in _get_store_state(self.db_path).rows
-            if str(row.series_id) == sid and int(row.candle_time) <= ctime
-        ]
-        if not rows:
+        cols = self._series(series_id)
+        if cols is None:
             return None
-        rows.sort(key=lambda row: (int(row.candle_time), int(row.id)), reverse=True)
-        return rows[0]
-
+        _, hi = cols.bounds(0, int(candle_time))
+        return self._row(series_id, cols, hi - 1) if hi > 0 else None
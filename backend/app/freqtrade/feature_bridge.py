@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator, Mapping, Sequence
 
 from .signal_plugin_contract import FreqtradeSignalBucketSpec
 
@@ -63,3 +63,117 @@ def build_signal_buckets_from_features(
             bucket.append(payload)
         out[str(spec.bucket_name)] = bucket
     return out
+
+
+def _positive_counts(column: Sequence[Any] | None, *, size: int) -> Any:
+    """Vectorized `to_positive_int` over one feature column (int64, 0 where missing/invalid/<= 0)."""
+    import numpy as np  # type: ignore[import-untyped]
+    import pandas as pd  # type: ignore[import-untyped]
+
+    if column is None:
+        return np.zeros(size, dtype=np.int64)
+    values = pd.to_numeric(pd.Series(list(column), dtype=object), errors="coerce").to_numpy(dtype=float)
+    values = np.where(np.isfinite(values), np.trunc(values), 0.0)
+    return np.clip(values, 0, np.iinfo(np.int64).max).astype(np.int64)
+
+
+def _bucket_fields(spec: FreqtradeSignalBucketSpec) -> tuple[str, ...]:
+    fields = ["candle_time", "visible_time", "count"]
+    fields.extend(str(key) for key in tuple(spec.sort_keys or ()) if str(key) not in fields)
+    return (*fields, "direction")
+
+
+def build_signal_columns_from_features(
+    *,
+    bucket_specs: tuple[FreqtradeSignalBucketSpec, ...],
+    feature_times: Sequence[int],
+    feature_columns: Mapping[str, Sequence[Any]],
+    times: Any,
+) -> dict[str, Any]:
+    """
+    Columnar `build_signal_buckets_from_features`: one DataFrame per bucket whose rows/columns are the bucket
+    payloads (direction None = absent). `feature_times` must be ascending and unique, aligned with each column.
+    """
+    import numpy as np  # type: ignore[import-untyped]
+    import pandas as pd  # type: ignore[import-untyped]
+
+    ordered = np.unique(np.asarray(times, dtype=np.int64))
+    ordered = ordered[ordered > 0]
+    ftimes = np.asarray(feature_times, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(ftimes, ordered), max(0, len(ftimes) - 1))
+    matched = ftimes[pos] == ordered if len(ftimes) else np.zeros(len(ordered), dtype=bool)
+
+    out: dict[str, Any] = {}
+    for spec in bucket_specs:
+        factor_name = str(spec.factor_name)
+        kind_key = feature_kind_key(factor_name=factor_name, event_kind=str(spec.event_kind))
+        counts = _positive_counts(feature_columns.get(f"{factor_name}_{kind_key}_count"), size=len(ftimes))
+        raw_directions = feature_columns.get(f"{factor_name}_{kind_key}_direction")
+        directions = np.empty(len(ftimes), dtype=object)
+        if raw_directions is not None:
+            directions[:] = list(raw_directions)
+        row_counts = np.where(matched, counts[pos] if len(ftimes) else 0, 0)
+        keep = row_counts > 0
+        hit_times = ordered[keep]
+        columns: dict[str, Any] = {name: hit_times for name in _bucket_fields(spec)}
+        columns["count"] = row_counts[keep]
+        columns["direction"] = directions[pos[keep]] if len(ftimes) else np.empty(0, dtype=object)
+        out[str(spec.bucket_name)] = pd.DataFrame(columns)
+    return out
+
+
+def signal_bucket_records(frame: Any) -> list[dict[str, Any]]:
+    """Bucket DataFrame -> the row-wise payload dicts (direction omitted when None)."""
+    records = frame.to_dict("records")
+    for payload in records:
+        if payload.get("direction") is None:
+            payload.pop("direction", None)
+    return records
+
+
+class LazyBucketRecords(Mapping[str, list[dict[str, Any]]]):
+    """Bucket name -> payload dicts, converted from its column frame only when a plugin reads that bucket."""
+
+    def __init__(self, frames: Mapping[str, Any]) -> None:
+        self._frames = frames
+        self._records: dict[str, list[dict[str, Any]]] = {}
+
+    def __getitem__(self, name: str) -> list[dict[str, Any]]:
+        records = self._records.get(name)
+        if records is None:
+            records = signal_bucket_records(self._frames[name])
+            self._records[name] = records
+        return records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+class LazyFeatureRows(Mapping[int, Mapping[str, Any]]):
+    """
+    candle_time -> {key: value} over feature columns; each row dict is built on lookup, never for the range.
+    Like the stored rows, a row holds only the keys written for that candle (None cells are left out).
+    """
+
+    def __init__(self, *, feature_times: Sequence[int], feature_columns: Mapping[str, Sequence[Any]]) -> None:
+        self._times = feature_times
+        self._columns = feature_columns
+        self._positions: dict[int, int] | None = None
+
+    def _index(self) -> dict[int, int]:
+        if self._positions is None:
+            self._positions = {int(t): i for i, t in enumerate(self._times)}
+        return self._positions
+
+    def __getitem__(self, candle_time: int) -> Mapping[str, Any]:
+        i = self._index()[int(candle_time)]
+        return {key: column[i] for key, column in self._columns.items() if column[i] is not None}
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._times)
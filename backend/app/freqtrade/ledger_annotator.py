@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..runtime.flags import load_runtime_flags
+from ..storage.local_store_runtime import release_store_states
+from .adapter_v1 import LedgerAnnotateResult, _resolve_db_path, prepare_ledger_frame, unix_seconds
+from .ledger_runtime import (
+    LedgerRuntime,
+    apply_ledger_signals,
+    build_ledger_runtime,
+    build_signal_runtime,
+    sync_ledger,
+)
+from .signal_plugin_contract import FreqtradeSignalPlugin
+
+
+@dataclass
+class _SeriesLedger:
+    runtime: LedgerRuntime
+    runtime_flags: Any
+    signal_columns: tuple[str, ...]
+    # candle_time-indexed (sorted, unique) signal columns of already annotated rows; None = nothing cached.
+    annotated: Any = None
+
+
+@dataclass
+class _SeriesLock:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Threads holding or waiting on `lock`; the lock is dropped from the annotator when this reaches 0.
+    users: int = 0
+
+
+def _plugins_key(signal_plugins: tuple[FreqtradeSignalPlugin, ...] | None) -> tuple[Any, ...]:
+    if signal_plugins is None:
+        return ("default",)
+    return tuple((type(p).__module__, type(p).__qualname__, str(p.spec.factor_name)) for p in signal_plugins)
+
+
+class FreqtradeLedgerAnnotator:
+    """
+    Long-lived `annotate_factor_ledger`: runtime objects stay warm per (db, series, plugins), and the signal
+    columns of already annotated candle times are served from a cache, so each call only runs plugins for new rows.
+    Memory is bounded by `max_series` (LRU) and `max_rows` cached candles per series; when the last series of a
+    db is evicted, that db's in-memory stores are released too (a later call re-ingests from its dataframe).
+    Calls for different (db, series) run concurrently; calls for the same one are serialized.
+
+    Assumes a plugin's output for a row depends only on that row's candle time and the ledger (true for the
+    bundled plugins). The cache is dropped when the series is rebuilt, its candle head rewinds or the flags change.
+    """
+
+    def __init__(self, *, max_series: int = 64, max_rows: int = 5000) -> None:
+        self._max_series = max(1, int(max_series))
+        self._max_rows = max(1, int(max_rows))
+        self._series: OrderedDict[tuple[Any, ...], _SeriesLedger] = OrderedDict()
+        self._series_locks: dict[tuple[str, str], _SeriesLock] = {}
+        # Guards `_series` and `_series_locks` only; annotation itself runs under the per-series lock.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _store(self, key: tuple[Any, ...], entry: _SeriesLedger) -> list[str]:
+        """Insert `entry` as most recent; returns the dbs no cached or in-flight series uses any more."""
+        self._series[key] = entry
+        self._series.move_to_end(key)
+        evicted: set[str] = set()
+        while len(self._series) > self._max_series:
+            evicted.add(self._series.popitem(last=False)[0][0])
+        live = {k[0] for k in self._series} | {k[0] for k in self._series_locks}
+        return sorted(evicted - live)
+
+    def _acquire(self, lock_key: tuple[str, str]) -> _SeriesLock:
+        with self._lock:
+            series_lock = self._series_locks.setdefault(lock_key, _SeriesLock())
+            series_lock.users += 1
+        series_lock.lock.acquire()
+        return series_lock
+
+    def _release(self, lock_key: tuple[str, str], series_lock: _SeriesLock) -> None:
+        series_lock.lock.release()
+        with self._lock:
+            series_lock.users -= 1
+            if series_lock.users == 0:
+                self._series_locks.pop(lock_key, None)
+
+    def annotate(
+        self,
+        dataframe: Any,
+        *,
+        series_id: str,
+        timeframe: str,
+        db_path: Path | None = None,
+        signal_plugins: tuple[FreqtradeSignalPlugin, ...] | None = None,
+    ) -> LedgerAnnotateResult:
+        try:
+            __import__("pandas")
+        except Exception as exc:
+            return LedgerAnnotateResult(ok=False, reason=f"pandas_missing:{exc}", dataframe=dataframe)
+
+        db = _resolve_db_path(db_path)
+        key = (str(db), str(series_id), str(timeframe), _plugins_key(signal_plugins))
+        runtime_flags = load_runtime_flags()
+        lock_key = (str(db), str(series_id))
+        series_lock = self._acquire(lock_key)
+        try:
+            with self._lock:
+                entry = self._series.get(key)
+            if entry is None or entry.runtime_flags != runtime_flags:
+                try:
+                    signal = build_signal_runtime(signal_plugins)
+                except Exception as exc:
+                    return LedgerAnnotateResult(ok=False, reason=f"signal_plugin_invalid:{exc}", dataframe=dataframe)
+                entry = _SeriesLedger(
+                    runtime=build_ledger_runtime(db_path=db, signal=signal, runtime_flags=runtime_flags),
+                    runtime_flags=runtime_flags,
+                    signal_columns=_signal_columns(signal.plugins),
+                )
+            with self._lock:
+                released = self._store(key, entry)
+            for released_db in released:
+                release_store_states(Path(released_db))
+            return self._annotate(entry, dataframe, series_id=series_id, timeframe=timeframe)
+        finally:
+            self._release(lock_key, series_lock)
+
+    def _annotate(
+        self,
+        entry: _SeriesLedger,
+        dataframe: Any,
+        *,
+        series_id: str,
+        timeframe: str,
+    ) -> LedgerAnnotateResult:
+        rt = entry.runtime
+        df, reason = prepare_ledger_frame(dataframe, signal=rt.signal)
+        if reason is not None:
+            return LedgerAnnotateResult(ok=False, reason=reason, dataframe=dataframe)
+        if df.empty:
+            return LedgerAnnotateResult(ok=True, reason=None, dataframe=df)
+
+        times = unix_seconds(df["date"])
+        order = times.sort_values().index
+        reason, rebuilt = sync_ledger(rt, df, series_id=series_id, order=order, times=times)
+        candle_head = rt.store.head_time(series_id)
+        cached = entry.annotated
+        if rebuilt or candle_head is None or (cached is not None and int(cached.index[-1]) > int(candle_head)):
+            cached = entry.annotated = None
+        if reason is None and candle_head is not None:
+            known = times.isin(cached.index if cached is not None else ())
+            fresh = [idx for idx in order if not bool(known.loc[idx])]
+            if cached is not None and bool(known.any()):
+                hits = cached.loc[times[known].to_numpy()]
+                for column in entry.signal_columns:
+                    df.loc[known, column] = hits[column].to_numpy()
+            if fresh:
+                reason = apply_ledger_signals(
+                    rt, df, series_id=series_id, timeframe=timeframe, order=fresh, times=times
+                )
+            if reason is None and fresh:
+                entry.annotated = self._merge(cached, df.loc[fresh, list(entry.signal_columns)], times.loc[fresh])
+        if reason is not None:
+            entry.annotated = None
+            df["tc_ok"] = 0
+            return LedgerAnnotateResult(ok=False, reason=reason, dataframe=df)
+        return LedgerAnnotateResult(ok=True, reason=None, dataframe=df)
+
+    def _merge(self, cached: Any, rows: Any, row_times: Any) -> Any:
+        import pandas as pd  # type: ignore[import-untyped]
+
+        rows = rows.set_axis(row_times.to_numpy())
+        merged = rows if cached is None else pd.concat([cached, rows])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        return merged.iloc[-self._max_rows :]
+
+
+def _signal_columns(plugins: tuple[FreqtradeSignalPlugin, ...]) -> tuple[str, ...]:
+    """Columns `prepare_ledger_frame` adds, probed on an empty frame."""
+    import pandas as pd  # type: ignore[import-untyped]
+
+    probe = pd.DataFrame(index=pd.RangeIndex(0))
+    probe["tc_ok"] = 1
+    for plugin in plugins:
+        plugin.prepare_dataframe(dataframe=probe)
+    return tuple(str(c) for c in probe.columns)
+
+
+_SHARED_ANNOTATOR = FreqtradeLedgerAnnotator()
+
+
+def shared_ledger_annotator() -> FreqtradeLedgerAnnotator:
+    """Process-wide annotator used by the freqtrade strategy entry."""
+    return _SHARED_ANNOTATOR
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from ..core.event_buckets import build_event_bucket_config
+from ..core.schemas import CandleClosed
+from ..core.service_errors import ServiceError
+from ..factor.capability_manifest import FactorCapabilitySpec
+from ..factor.graph import FactorGraph, FactorSpec
+from ..factor.orchestrator import FactorOrchestrator
+from ..factor.plugin_registry import FactorPluginRegistry
+from ..factor.runtime_config import build_factor_orchestrator_runtime_config
+from ..factor.store import FactorStore
+from ..feature import FeatureOrchestrator, FeatureReadService, FeatureSettings, FeatureStore
+from ..pipelines import IngestPipeline
+from ..storage.candle_store import CandleStore
+from .feature_bridge import (
+    LazyBucketRecords,
+    LazyFeatureRows,
+    build_signal_columns_from_features,
+    required_feature_factors,
+)
+from .signal_plugin_contract import FreqtradeSignalBucketSpec, FreqtradeSignalContext, FreqtradeSignalPlugin
+from .signal_plugins import build_default_freqtrade_signal_plugins
+
+
+@dataclass(frozen=True)
+class FreqtradeSignalRuntime:
+    plugins: tuple[FreqtradeSignalPlugin, ...]
+    bucket_specs: tuple[FreqtradeSignalBucketSpec, ...]
+
+
+def build_signal_runtime(signal_plugins: tuple[FreqtradeSignalPlugin, ...] | None) -> FreqtradeSignalRuntime:
+    plugins = tuple(signal_plugins or build_default_freqtrade_signal_plugins())
+    registry = FactorPluginRegistry(list(plugins))
+    graph = FactorGraph([FactorSpec(factor_name=s.factor_name, depends_on=s.depends_on) for s in registry.specs()])
+    topo_plugins = tuple(cast(FreqtradeSignalPlugin, registry.require(name)) for name in graph.topo_order)
+
+    bucket_specs = tuple(spec for plugin in topo_plugins for spec in plugin.bucket_specs)
+    build_event_bucket_config(
+        bucket_specs=bucket_specs,
+        conflict_prefix="signal",
+    )
+    return FreqtradeSignalRuntime(
+        plugins=topo_plugins,
+        bucket_specs=bucket_specs,
+    )
+
+
+@dataclass(frozen=True)
+class LedgerRuntime:
+    """Stores/orchestrators/pipeline needed to sync and read one db's ledger; series-agnostic and reusable."""
+
+    signal: FreqtradeSignalRuntime
+    store: CandleStore
+    factor_store: FactorStore
+    feature_store: FeatureStore
+    feature_required: bool
+    feature_enabled: bool
+    feature_read_service: FeatureReadService
+    ingest_pipeline: IngestPipeline
+
+
+def build_ledger_runtime(*, db_path: Path, signal: FreqtradeSignalRuntime, runtime_flags: Any) -> LedgerRuntime:
+    factor_runtime_config = build_factor_orchestrator_runtime_config(runtime_flags=runtime_flags)
+    store = CandleStore(db_path=db_path)
+    factor_store = FactorStore(db_path=db_path)
+    feature_store = FeatureStore(db_path=db_path)
+    orchestrator = FactorOrchestrator(
+        candle_store=store,
+        factor_store=factor_store,
+        settings=factor_runtime_config.settings,
+        ingest_enabled=factor_runtime_config.ingest_enabled,
+        fingerprint_rebuild_enabled=factor_runtime_config.fingerprint_rebuild_enabled,
+        factor_rebuild_keep_candles=factor_runtime_config.rebuild_keep_candles,
+        logic_version_override=factor_runtime_config.logic_version_override,
+    )
+    required_feature_factor_names = required_feature_factors(bucket_specs=signal.bucket_specs)
+    feature_required = bool(required_feature_factor_names)
+    feature_orchestrator = FeatureOrchestrator(
+        factor_store=factor_store,
+        feature_store=feature_store,
+        capability_overrides={
+            factor_name: FactorCapabilitySpec(
+                factor_name=factor_name,
+                enable_feature=True,
+            )
+            for factor_name in required_feature_factor_names
+        },
+        settings=FeatureSettings(
+            ingest_enabled=bool(runtime_flags.enable_feature_ingest),
+        ),
+    )
+    return LedgerRuntime(
+        signal=signal,
+        store=store,
+        factor_store=factor_store,
+        feature_store=feature_store,
+        feature_required=feature_required,
+        feature_enabled=feature_orchestrator.enabled(),
+        feature_read_service=FeatureReadService(
+            store=store,
+            feature_store=feature_store,
+            strict_mode=bool(runtime_flags.enable_feature_strict_read),
+        ),
+        ingest_pipeline=IngestPipeline(
+            store=store,
+            factor_orchestrator=orchestrator,
+            feature_orchestrator=feature_orchestrator if feature_required else None,
+            overlay_orchestrator=None,
+            hub=None,
+            candle_compensate_on_error=True,
+        ),
+    )
+
+
+def sync_ledger(rt: LedgerRuntime, df: Any, *, series_id: str, order: Any, times: Any) -> tuple[str | None, bool]:
+    """
+    Write rows newer than the candle head through the ingest pipeline and check freshness.
+    Returns (failure reason, whether the pipeline rebuilt the series).
+    """
+    store_head = rt.store.head_time(series_id)
+    to_write: list[CandleClosed] = []
+    last_time: int | None = None
+    for idx in order:
+        open_time = int(times.loc[idx])
+        if store_head is not None and open_time <= int(store_head):
+            continue
+        candle = CandleClosed(
+            candle_time=open_time,
+            open=float(df.at[idx, "open"]),
+            high=float(df.at[idx, "high"]),
+            low=float(df.at[idx, "low"]),
+            close=float(df.at[idx, "close"]),
+            volume=float(df.at[idx, "volume"]),
+        )
+        if last_time is not None and open_time == last_time:
+            to_write[-1] = candle
+            continue
+        to_write.append(candle)
+        last_time = open_time
+
+    rebuilt = False
+    if to_write:
+        try:
+            result = rt.ingest_pipeline.run_sync(batches={series_id: to_write})
+        except Exception:
+            return "ledger_out_of_sync", False
+        rebuilt = series_id in tuple(result.rebuilt_series or ())
+
+    candle_head = rt.store.head_time(series_id)
+    factor_head = rt.factor_store.head_time(series_id)
+    feature_head = rt.feature_store.head_time(series_id)
+    if candle_head is not None and (factor_head is None or int(factor_head) < int(candle_head)):
+        return "ledger_out_of_sync", rebuilt
+    if rt.feature_required and not rt.feature_enabled:
+        return "ledger_out_of_sync", rebuilt
+    feature_behind = feature_head is None or (candle_head is not None and int(feature_head) < int(candle_head))
+    if rt.feature_required and candle_head is not None and feature_behind:
+        return "ledger_out_of_sync", rebuilt
+    return None, rebuilt
+
+
+def apply_ledger_signals(
+    rt: LedgerRuntime,
+    df: Any,
+    *,
+    series_id: str,
+    timeframe: str,
+    order: list[Any],
+    times: Any,
+) -> str | None:
+    """
+    Run the signal plugins over the `order` rows of `df` in place; returns a failure reason or None.
+    Plugins get column frames per bucket; row-wise `buckets` / `feature_rows_by_time` are built only if read.
+    """
+    row_times = [int(t) for t in times.loc[order].tolist()]
+    times_by_idx = dict(zip(order, row_times))
+    feature_times: list[int] = []
+    feature_columns: dict[str, list[Any]] = {}
+    if rt.feature_required and row_times:
+        span = max(1, len(row_times))
+        try:
+            feature_range = rt.feature_read_service.read_columns(
+                series_id=series_id,
+                at_time=max(row_times),
+                window_candles=span,
+                ensure_fresh=True,
+                limit=span + 10,
+            )
+        except ServiceError:
+            return "ledger_out_of_sync"
+        feature_times = feature_range.candle_times
+        feature_columns = feature_range.columns
+
+    bucket_frames = build_signal_columns_from_features(
+        bucket_specs=rt.signal.bucket_specs,
+        feature_times=feature_times,
+        feature_columns=feature_columns,
+        times=row_times,
+    )
+    signal_ctx = FreqtradeSignalContext(
+        series_id=series_id,
+        timeframe=str(timeframe),
+        dataframe=df,
+        order=list(order),
+        times_by_index=times_by_idx,
+        buckets=LazyBucketRecords(bucket_frames),
+        feature_rows_by_time=LazyFeatureRows(feature_times=feature_times, feature_columns=feature_columns),
+        bucket_frames=bucket_frames,
+    )
+    for plugin in rt.signal.plugins:
+        plugin.apply(ctx=signal_ctx)
+    return None
@@ -23,6 +23,8 @@ class FreqtradeSignalContext:
     times_by_index: Mapping[Any, int]
     buckets: Mapping[str, list[dict[str, Any]]]
     feature_rows_by_time: Mapping[int, Mapping[str, Any]] = field(default_factory=dict)
+    # Column DataFrame per bucket (same fields as the `buckets` payloads); prefer it over the row dicts.
+    bucket_frames: Mapping[str, Any] = field(default_factory=dict)
 
 
 class FreqtradeSignalPlugin(Protocol):
@@ -26,34 +26,40 @@ class PenDirectionSignalPlugin:
         dataframe["tc_enter_short"] = 0
 
     def apply(self, *, ctx: FreqtradeSignalContext) -> None:
-        pen_events = list(ctx.buckets.get("pen_confirmed") or [])
-        directions_by_time: dict[int, list[int]] = {}
-        for payload in pen_events:
-            visible_time = int(payload.get("visible_time") or payload.get("candle_time") or 0)
+        frame = ctx.bucket_frames.get("pen_confirmed")
+        if frame is not None:
+            pen_events = zip(frame["visible_time"].tolist(), frame["direction"].tolist())
+        else:
+            pen_events = (
+                (payload.get("visible_time") or payload.get("candle_time"), payload.get("direction"))
+                for payload in ctx.buckets.get("pen_confirmed") or []
+            )
+        last_direction_by_time: dict[int, int] = {}
+        for raw_time, raw_direction in pen_events:
+            visible_time = int(raw_time or 0)
             if visible_time <= 0:
                 continue
             try:
-                direction = int(payload.get("direction") or 0)
+                direction = int(raw_direction or 0)
             except Exception:
                 continue
             if direction not in {-1, 1}:
                 continue
-            directions_by_time.setdefault(visible_time, []).append(direction)
+            last_direction_by_time[visible_time] = direction
 
+        hits: dict[int, list[Any]] = {1: [], -1: []}
         for idx in ctx.order:
-            row_time = int(ctx.times_by_index.get(idx) or 0)
-            if row_time <= 0:
-                continue
-            directions = directions_by_time.get(row_time)
-            if not directions:
-                continue
-            direction = int(directions[-1])
-            ctx.dataframe.at[idx, "tc_pen_confirmed"] = 1
-            ctx.dataframe.at[idx, "tc_pen_dir"] = direction
-            if direction == 1:
-                ctx.dataframe.at[idx, "tc_enter_long"] = 1
-            elif direction == -1:
-                ctx.dataframe.at[idx, "tc_enter_short"] = 1
+            direction = last_direction_by_time.get(int(ctx.times_by_index.get(idx) or 0))
+            if direction is not None:
+                hits[direction].append(idx)
+        # One labelled write per column instead of per-row `.at` calls.
+        df = ctx.dataframe
+        for direction, column in ((1, "tc_enter_long"), (-1, "tc_enter_short")):
+            rows = hits[direction]
+            if rows:
+                df.loc[rows, "tc_pen_confirmed"] = 1
+                df.loc[rows, "tc_pen_dir"] = direction
+                df.loc[rows, column] = 1
 
 
 def build_signal_plugin() -> FreqtradeSignalPlugin:
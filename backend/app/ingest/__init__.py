@@ -1,4 +1,5 @@
 from .binance_ws import parse_binance_kline_payload, parse_binance_kline_payload_any, run_binance_ws_ingest_loop
+from .binance_ws_mux import BinanceWsMux, BinanceWsMuxConfig
 from .capacity_policy import IngestCapacityPlan, plan_ondemand_capacity
 from .guardrail_registry import IngestGuardrailRegistry
 from .job_runner import IngestJobRunner, IngestJobRunnerConfig, IngestLoopFn
@@ -11,6 +12,8 @@ from .source_registry import IngestSourceBinding, IngestSourceRegistry
 from .supervisor import IngestSupervisor
 
 __all__ = [
+    "BinanceWsMux",
+    "BinanceWsMuxConfig",
     "IngestCapacityPlan",
     "IngestGuardrailRegistry",
     "IngestJobRunner",
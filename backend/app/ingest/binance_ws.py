@@ -1,20 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from dataclasses import dataclass
-from typing import SupportsFloat, SupportsInt, cast
 
+from .binance_ws_series import BinanceWsSeriesState, _publish_pipeline_result_from_ws, maybe_bootstrap_series_history
+from .kline_decode import decode_ws_message, kline_candle, kline_head
 from .loop_guardrail import IngestLoopGuardrail
-from ..pipelines import IngestPipeline, IngestPipelineResult
+from ..pipelines import IngestPipeline
 from ..core.schemas import CandleClosed
 from ..core.series_id import SeriesId, parse_series_id
 from ..storage.candle_store import CandleStore
-from .ws_hotpath import flush_ws_buffer, publish_forming_with_derived, should_emit_forming
 from ..ws.hub import CandleHub
 from .settings import WhitelistIngestSettings
-from ..market.derived_timeframes import DerivedTimeframeFanout
+from ..market.binance_endpoints import resolve_binance_endpoints
 
 
 @dataclass(frozen=True)
@@ -32,31 +31,10 @@ class BinanceWsIngestLoopRequest:
     batch_max: int = 200
     flush_s: float = 0.5
     forming_min_interval_ms: int = 250
+    adaptive_flush: bool = False
     loop_guardrail: IngestLoopGuardrail | None = None
 
 
-def _coerce_int(value: object) -> int | None:
-    if value is None:
-        return None
-    try:
-        if isinstance(value, (int, str, bytes, bytearray)):
-            return int(value)
-        return int(cast(SupportsInt, value))
-    except Exception:
-        return None
-
-
-def _coerce_float(value: object) -> float | None:
-    if value is None:
-        return None
-    try:
-        if isinstance(value, (int, float, str, bytes, bytearray)):
-            return float(value)
-        return float(cast(SupportsFloat, value))
-    except Exception:
-        return None
-
-
 def _binance_stream_symbol(symbol: str) -> str | None:
     if not isinstance(symbol, str) or not symbol:
         return None
@@ -66,7 +44,7 @@ def _binance_stream_symbol(symbol: str) -> str | None:
     return base.replace("/", "").replace("-", "").strip().lower()
 
 
-def build_binance_kline_ws_url(series: SeriesId) -> str:
+def binance_kline_stream_name(series: SeriesId) -> str:
     if series.exchange != "binance":
         raise ValueError(f"unsupported exchange: {series.exchange!r}")
     stream_symbol = _binance_stream_symbol(series.symbol)
@@ -77,11 +55,14 @@ def build_binance_kline_ws_url(series: SeriesId) -> str:
     if not tf:
         raise ValueError("missing timeframe")
 
-    if series.market == "futures":
-        return f"wss://fstream.binance.com/ws/{stream_symbol}@kline_{tf}"
-    if series.market == "spot":
-        return f"wss://stream.binance.com:9443/ws/{stream_symbol}@kline_{tf}"
-    raise ValueError(f"unsupported market: {series.market!r}")
+    if series.market not in ("futures", "spot"):
+        raise ValueError(f"unsupported market: {series.market!r}")
+    return f"{stream_symbol}@kline_{tf}"
+
+
+def build_binance_kline_ws_url(series: SeriesId) -> str:
+    stream = binance_kline_stream_name(series)
+    return f"{resolve_binance_endpoints().ws_base(series.market)}/ws/{stream}"
 
 
 def parse_binance_kline_payload(payload: object) -> CandleClosed | None:
@@ -93,99 +74,29 @@ def parse_binance_kline_payload(payload: object) -> CandleClosed | None:
 
 
 def parse_binance_kline_payload_any(payload: object) -> tuple[CandleClosed, bool] | None:
-    if not isinstance(payload, dict):
-        return None
-
-    k = payload.get("k")
-    if not isinstance(k, dict):
+    head = kline_head(payload)
+    if head is None:
         return None
-
-    open_ms_int = _coerce_int(k.get("t"))
-    if open_ms_int is None:
-        return None
-    if open_ms_int <= 0:
-        return None
-    candle_time = int(open_ms_int // 1000)
-
-    is_final = bool(k.get("x"))
-
-    o = _coerce_float(k.get("o"))
-    h = _coerce_float(k.get("h"))
-    l = _coerce_float(k.get("l"))
-    c = _coerce_float(k.get("c"))
-    v = _coerce_float(k.get("v"))
-    if o is None or h is None or l is None or c is None or v is None:
+    candle_time, is_final, k = head
+    candle = kline_candle(k, candle_time)
+    if candle is None:
         return None
-
-    return CandleClosed(
-        candle_time=candle_time,
-        open=float(o),
-        high=float(h),
-        low=float(l),
-        close=float(c),
-        volume=float(v),
-    ), is_final
+    return candle.to_closed(), is_final
 
 
 async def run_binance_ws_ingest_loop(request: BinanceWsIngestLoopRequest) -> None:
-    series_id = request.series_id
-    store = request.store
-    hub = request.hub
-    ingest_pipeline = request.ingest_pipeline
-    settings = request.settings
     stop = request.stop
     loop_guardrail = request.loop_guardrail
-    series = parse_series_id(series_id)
+    series = parse_series_id(request.series_id)
 
     if series.exchange != "binance":
         raise ValueError(f"unsupported exchange: {series.exchange!r}")
-    if ingest_pipeline is None:
+    if request.ingest_pipeline is None:
         raise RuntimeError("ingest_pipeline_not_configured")
 
-    history_source = str(request.market_history_source).strip().lower()
-    if store.head_time(series_id) is None and history_source == "freqtrade":
-        try:
-            from ..market.history_bootstrapper import maybe_bootstrap_from_freqtrade
-
-            limit = int(getattr(settings, "bootstrap_backfill_count", 2000) or 2000)
-            maybe_bootstrap_from_freqtrade(
-                store,
-                series_id=series_id,
-                limit=limit,
-                market_history_source=history_source,
-            )
-        except Exception:
-            pass
-
+    maybe_bootstrap_series_history(request)
     url = build_binance_kline_ws_url(series)
-
-    batch_max = max(1, int(request.batch_max))
-    flush_s = max(0.05, float(request.flush_s))
-
-    last_emitted_time = store.head_time(series_id) or 0
-    buf: list[CandleClosed] = []
-    last_flush_at = time.time()
-
-    forming_min_interval_ms = max(0, int(request.forming_min_interval_ms))
-    forming_min_interval_s = forming_min_interval_ms / 1000.0
-    last_forming_emit_at = 0.0
-    last_forming_candle_time: int | None = None
-
-    use_derived = bool(request.derived_enabled)
-    base_timeframe = str(request.derived_base_timeframe).strip() or "1m"
-    derived_targets = tuple(str(tf).strip() for tf in (request.derived_timeframes or ()) if str(tf).strip())
-
-    fanout: DerivedTimeframeFanout | None = None
-    if use_derived:
-        try:
-            if str(series.timeframe).strip() == str(base_timeframe).strip():
-                fanout = DerivedTimeframeFanout(
-                    base_timeframe=base_timeframe,
-                    derived=derived_targets,
-                    forming_min_interval_ms=int(forming_min_interval_ms),
-                )
-        except Exception:
-            fanout = None
+    state = BinanceWsSeriesState(request, series=series)
 
     while not stop.is_set():
         if loop_guardrail is not None:
@@ -212,72 +123,11 @@ async def run_binance_ws_ingest_loop(request: BinanceWsIngestLoopRequest) -> Non
                     try:
                         raw = await asyncio.wait_for(upstream.recv(), timeout=1.0)
                     except asyncio.TimeoutError:
-                        if buf and (time.time() - last_flush_at) >= flush_s:
-                            last_emitted_time, last_flush_at = await flush_ws_buffer(
-                                series_id=series_id,
-                                ingest_pipeline=ingest_pipeline,
-                                fanout=fanout,
-                                buf=buf,
-                                reason="timeout",
-                                last_emitted_time=int(last_emitted_time),
-                                last_flush_at=float(last_flush_at),
-                                publish_pipeline_result=_publish_pipeline_result_from_ws,
-                            )
-                        continue
-
-                    try:
-                        payload = json.loads(raw)
-                    except Exception:
-                        continue
-
-                    parsed = parse_binance_kline_payload_any(payload)
-                    if parsed is None:
-                        continue
-                    candle, is_final = parsed
-
-                    if not is_final:
-                        now = time.monotonic()
-                        if should_emit_forming(
-                            candle_time=int(candle.candle_time),
-                            last_emitted_time=int(last_emitted_time),
-                            last_forming_candle_time=last_forming_candle_time,
-                            last_forming_emit_at=float(last_forming_emit_at),
-                            now=float(now),
-                            forming_min_interval_s=float(forming_min_interval_s),
-                        ):
-                            await publish_forming_with_derived(
-                                hub=hub,
-                                series_id=series_id,
-                                candle=candle,
-                                fanout=fanout,
-                                now=float(now),
-                            )
-                            last_forming_emit_at = float(now)
-                            last_forming_candle_time = int(candle.candle_time)
+                        await state.flush_if_due(now=time.time())
                         continue
 
-                    buf.append(candle)
-                    if len(buf) >= batch_max or (time.time() - last_flush_at) >= flush_s:
-                        last_emitted_time, last_flush_at = await flush_ws_buffer(
-                            series_id=series_id,
-                            ingest_pipeline=ingest_pipeline,
-                            fanout=fanout,
-                            buf=buf,
-                            reason="threshold",
-                            last_emitted_time=int(last_emitted_time),
-                            last_flush_at=float(last_flush_at),
-                            publish_pipeline_result=_publish_pipeline_result_from_ws,
-                        )
-                last_emitted_time, last_flush_at = await flush_ws_buffer(
-                    series_id=series_id,
-                    ingest_pipeline=ingest_pipeline,
-                    fanout=fanout,
-                    buf=buf,
-                    reason="disconnect",
-                    last_emitted_time=int(last_emitted_time),
-                    last_flush_at=float(last_flush_at),
-                    publish_pipeline_result=_publish_pipeline_result_from_ws,
-                )
+                    await state.on_kline(decode_ws_message(raw))
+                await state.flush(reason="disconnect")
                 if loop_guardrail is not None:
                     loop_guardrail.on_success()
         except asyncio.CancelledError:
@@ -292,9 +142,3 @@ async def run_binance_ws_ingest_loop(request: BinanceWsIngestLoopRequest) -> Non
                 await asyncio.wait_for(stop.wait(), timeout=float(sleep_s))
             except asyncio.TimeoutError:
                 pass
-async def _publish_pipeline_result_from_ws(
-    *,
-    ingest_pipeline: IngestPipeline,
-    pipeline_result: IngestPipelineResult,
-) -> None:
-    await ingest_pipeline.publish_ws(result=pipeline_result)
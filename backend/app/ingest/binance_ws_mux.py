@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+
+from ..core.series_id import parse_series_id
+from ..market.binance_endpoints import resolve_binance_endpoints
+from .binance_ws import BinanceWsIngestLoopRequest, binance_kline_stream_name
+from .binance_ws_series import BinanceWsSeriesState, maybe_bootstrap_series_history
+from .kline_decode import decode_ws_message
+from .loop_guardrail import IngestLoopGuardrail
+
+
+@dataclass(frozen=True)
+class BinanceWsMuxConfig:
+    streams_per_socket: int = 200
+    control_min_interval_s: float = 0.25
+    reconnect_backoff_s: float = 2.0
+    recv_timeout_s: float = 1.0
+    flush_tick_s: float = 0.1
+
+
+_STOP = object()
+
+
+class _MuxMember:
+    """
+    One series on a shard. The shard reader only routes decoded payloads into `inbox`; the series' own
+    task (`run`) drives the ingest pipeline, so one slow flush never blocks `recv()` or other series.
+    """
+
+    __slots__ = ("stream", "state", "guardrail", "inbox")
+
+    def __init__(self, *, stream: str, state: BinanceWsSeriesState, guardrail: IngestLoopGuardrail | None) -> None:
+        self.stream = stream
+        self.state = state
+        self.guardrail = guardrail
+        self.inbox: asyncio.Queue[object] = asyncio.Queue()
+
+    def parked(self) -> bool:
+        return self.guardrail is not None and float(self.guardrail.before_attempt()) > 0
+
+    async def run(self, *, stop: asyncio.Event, tick_s: float) -> None:
+        """Consume routed payloads until `stop`; a quiet inbox still runs the flush deadline check every tick."""
+        stopper = asyncio.ensure_future(stop.wait())
+        stopper.add_done_callback(lambda _: self.inbox.put_nowait(_STOP))
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(self.inbox.get(), timeout=tick_s)
+                except asyncio.TimeoutError:
+                    await self.state.flush_if_due(now=time.time())
+                    continue
+                if data is _STOP:
+                    break
+                await self.state.on_kline(data)
+            while not self.inbox.empty():
+                data = self.inbox.get_nowait()
+                if data is not _STOP:
+                    await self.state.on_kline(data)
+        finally:
+            stopper.cancel()
+
+
+class _MuxShard:
+    """
+    One combined-stream socket (`/stream?streams=a/b/...`) shared by up to `streams_per_socket` series.
+    Membership changes are applied with SUBSCRIBE/UNSUBSCRIBE on the live socket; members whose
+    guardrail circuit is open are left unsubscribed until their cooldown ends.
+    """
+
+    def __init__(self, *, market: str, config: BinanceWsMuxConfig) -> None:
+        self.market = market
+        self._config = config
+        self._members: dict[str, list[_MuxMember]] = {}
+        self._subscribed: set[str] = set()
+        self._task: asyncio.Task | None = None
+        self._next_id = 0
+        self._last_control_at = 0.0
+        self.connected = False
+        self.messages = 0
+        self.connects = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._members)
+
+    def has_room(self, stream: str) -> bool:
+        return stream in self._members or len(self._members) < max(1, int(self._config.streams_per_socket))
+
+    def add(self, member: _MuxMember) -> None:
+        self._members.setdefault(member.stream, []).append(member)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def remove(self, member: _MuxMember) -> None:
+        group = self._members.get(member.stream) or []
+        if member in group:
+            group.remove(member)
+        if not group:
+            self._members.pop(member.stream, None)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "market": self.market,
+            "streams": sorted(self._members),
+            "subscribed": len(self._subscribed),
+            "connected": bool(self.connected),
+            "messages": int(self.messages),
+            "connects": int(self.connects),
+            "backlog": sum(m.inbox.qsize() for m in self._all_members()),
+        }
+
+    def _desired(self) -> set[str]:
+        return {stream for stream, group in self._members.items() if not all(m.parked() for m in group)}
+
+    def _all_members(self) -> list[_MuxMember]:
+        return [m for group in self._members.values() for m in group]
+
+    async def _run(self) -> None:
+        while self._members:
+            desired = self._desired()
+            if not desired:
+                await asyncio.sleep(float(self._config.recv_timeout_s))
+                continue
+            try:
+                await self._session(desired)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await asyncio.sleep(self._on_failure(exc))
+            finally:
+                self.connected = False
+                self._subscribed = set()
+
+    async def _session(self, desired: set[str]) -> None:
+        import websockets
+
+        url = f"{resolve_binance_endpoints().ws_base(self.market)}/stream?streams={'/'.join(sorted(desired))}"
+        async with websockets.connect(url, ping_interval=20, ping_timeout=20, close_timeout=2, max_queue=256) as upstream:
+            self.connected = True
+            self.connects += 1
+            self._subscribed = set(desired)
+            self._mark_success(desired)
+            while self._members:
+                await self._sync(upstream)
+                try:
+                    raw = await asyncio.wait_for(upstream.recv(), timeout=float(self._config.recv_timeout_s))
+                except asyncio.TimeoutError:
+                    continue
+                self.messages += 1
+                self._dispatch(raw)
+
+    async def _sync(self, upstream) -> None:
+        desired = self._desired()
+        added = sorted(desired - self._subscribed)
+        removed = sorted(self._subscribed - desired)
+        for method, params in (("UNSUBSCRIBE", removed), ("SUBSCRIBE", added)):
+            if not params:
+                continue
+            wait_s = float(self._config.control_min_interval_s) - (time.monotonic() - self._last_control_at)
+            if wait_s > 0:
+                await asyncio.sleep(wait_s)
+            self._next_id += 1
+            await upstream.send(json.dumps({"method": method, "params": params, "id": self._next_id}))
+            self._last_control_at = time.monotonic()
+        self._subscribed = desired
+        if added:
+            self._mark_success(set(added))
+
+    def _dispatch(self, raw: str | bytes) -> None:
+        """Decode and route only; never awaits, so the reader keeps draining the socket during flushes."""
+        msg = decode_ws_message(raw)
+        if not isinstance(msg, dict):
+            return
+        group = self._members.get(str(msg.get("stream") or ""))
+        if not group:
+            return
+        data = msg.get("data")
+        for member in group:
+            member.inbox.put_nowait(data)
+
+    def _mark_success(self, streams: set[str]) -> None:
+        for stream in streams:
+            for member in self._members.get(stream) or []:
+                if member.guardrail is not None:
+                    member.guardrail.on_success()
+
+    def _on_failure(self, exc: Exception) -> float:
+        # One socket failure counts against every member; the shard retries at the shortest member backoff.
+        waits = [
+            float(member.guardrail.on_failure(error=exc))
+            for member in self._all_members()
+            if member.guardrail is not None
+        ]
+        positive = [w for w in waits if w > 0]
+        return min(positive) if positive else max(0.0, float(self._config.reconnect_backoff_s))
+
+
+class BinanceWsMux:
+    """
+    Combined-stream binance kline ingest: many series share a few sockets, demuxed by stream name.
+    `run_series` has the IngestLoopFn signature so the supervisor can bind it like the per-series loop.
+    """
+
+    def __init__(self, *, config: BinanceWsMuxConfig | None = None) -> None:
+        self._config = config or BinanceWsMuxConfig()
+        self._shards: list[_MuxShard] = []
+
+    async def run_series(self, *, request: BinanceWsIngestLoopRequest) -> None:
+        series = parse_series_id(request.series_id)
+        stream = binance_kline_stream_name(series)
+        if request.ingest_pipeline is None:
+            raise RuntimeError("ingest_pipeline_not_configured")
+
+        maybe_bootstrap_series_history(request)
+        member = _MuxMember(
+            stream=stream,
+            state=BinanceWsSeriesState(request, series=series),
+            guardrail=request.loop_guardrail,
+        )
+        shard = self._attach(market=str(series.market), member=member)
+        try:
+            await member.run(stop=request.stop, tick_s=max(0.01, float(self._config.flush_tick_s)))
+        finally:
+            await self._detach(shard, member)
+            await member.state.flush(reason="disconnect")
+
+    def snapshot(self) -> dict[str, object]:
+        shards = [shard.snapshot() for shard in self._shards]
+        return {
+            "connections": sum(1 for item in shards if item["connected"]),
+            "streams": sum(len(item["streams"]) for item in shards),
+            "shards": shards,
+        }
+
+    async def close(self) -> None:
+        shards, self._shards = self._shards, []
+        await asyncio.gather(*(shard.stop() for shard in shards), return_exceptions=True)
+
+    def _attach(self, *, market: str, member: _MuxMember) -> _MuxShard:
+        shard = next((s for s in self._shards if s.market == market and s.has_room(member.stream)), None)
+        if shard is None:
+            shard = _MuxShard(market=market, config=self._config)
+            self._shards.append(shard)
+        shard.add(member)
+        return shard
+
+    async def _detach(self, shard: _MuxShard, member: _MuxMember) -> None:
+        shard.remove(member)
+        if shard.size == 0 and shard in self._shards:
+            self._shards.remove(shard)
+            await shard.stop()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from ..core.candle_record import CandleRecord
+from ..core.series_id import SeriesId
+from ..market.derived_timeframes import DerivedTimeframeFanout
+from ..pipelines import IngestPipeline, IngestPipelineResult
+from .flush_controller import AdaptiveFlushConfig, AdaptiveFlushController
+from .kline_decode import kline_candle, kline_head
+from .ws_hotpath import flush_ws_buffer, publish_forming_with_derived, should_emit_forming
+
+if TYPE_CHECKING:
+    from .binance_ws import BinanceWsIngestLoopRequest
+
+
+async def _publish_pipeline_result_from_ws(
+    *,
+    ingest_pipeline: IngestPipeline,
+    pipeline_result: IngestPipelineResult,
+) -> None:
+    await ingest_pipeline.publish_ws(result=pipeline_result)
+
+
+def maybe_bootstrap_series_history(request: BinanceWsIngestLoopRequest) -> None:
+    store = request.store
+    history_source = str(request.market_history_source).strip().lower()
+    if store.head_time(request.series_id) is not None or history_source != "freqtrade":
+        return
+    try:
+        from ..market.history_bootstrapper import maybe_bootstrap_from_freqtrade
+
+        limit = int(getattr(request.settings, "bootstrap_backfill_count", 2000) or 2000)
+        maybe_bootstrap_from_freqtrade(
+            store,
+            series_id=request.series_id,
+            limit=limit,
+            market_history_source=history_source,
+        )
+    except Exception:
+        pass
+
+
+def _build_fanout(request: BinanceWsIngestLoopRequest, series: SeriesId) -> DerivedTimeframeFanout | None:
+    if not bool(request.derived_enabled):
+        return None
+    base_timeframe = str(request.derived_base_timeframe).strip() or "1m"
+    targets = tuple(str(tf).strip() for tf in (request.derived_timeframes or ()) if str(tf).strip())
+    try:
+        if str(series.timeframe).strip() != base_timeframe:
+            return None
+        return DerivedTimeframeFanout(
+            base_timeframe=base_timeframe,
+            derived=targets,
+            forming_min_interval_ms=max(0, int(request.forming_min_interval_ms)),
+        )
+    except Exception:
+        return None
+
+
+class BinanceWsSeriesState:
+    """
+    Per-series ws ingest state: closed-candle buffer, flush thresholds and forming throttle.
+    Shared by the one-socket-per-series loop and the combined-stream mux so both keep identical
+    batch/flush/forming semantics. With `adaptive_flush`, `AdaptiveFlushController` replaces the
+    fixed batch_max/flush_s thresholds (flush_s becomes the latency ceiling).
+    """
+
+    def __init__(self, request: BinanceWsIngestLoopRequest, *, series: SeriesId) -> None:
+        if request.ingest_pipeline is None:
+            raise RuntimeError("ingest_pipeline_not_configured")
+        self.series_id = request.series_id
+        self._hub = request.hub
+        self._ingest_pipeline: IngestPipeline = request.ingest_pipeline
+        self._batch_max = max(1, int(request.batch_max))
+        self._flush_s = max(0.05, float(request.flush_s))
+        self._forming_min_interval_s = max(0, int(request.forming_min_interval_ms)) / 1000.0
+        self._fanout = _build_fanout(request, series)
+        self._metrics = self._ingest_pipeline.runtime_metrics
+        self._flush_controller = (
+            AdaptiveFlushController(
+                AdaptiveFlushConfig(max_batch=self._batch_max, latency_ceiling_s=self._flush_s)
+            )
+            if bool(request.adaptive_flush)
+            else None
+        )
+        self.last_emitted_time = int(request.store.head_time(request.series_id) or 0)
+        self.last_flush_at = time.time()
+        self.buf: list[CandleRecord] = []
+        self._last_forming_emit_at = 0.0
+        self._last_forming_candle_time: int | None = None
+
+    async def on_kline(self, payload: object) -> None:
+        """
+        Handle one decoded kline event; throttled forming updates are dropped before any candle is built.
+        Every message also runs the timer-side flush check first: a live socket delivers forming updates
+        every ~250ms, so a recv timeout alone would never enforce the latency ceiling or the idle flush.
+        """
+        await self.flush_if_due(now=time.time())
+        head = kline_head(payload)
+        if head is None:
+            return
+        candle_time, is_final, k = head
+        if not is_final:
+            now = time.monotonic()
+            if not should_emit_forming(
+                candle_time=candle_time,
+                last_emitted_time=int(self.last_emitted_time),
+                last_forming_candle_time=self._last_forming_candle_time,
+                last_forming_emit_at=float(self._last_forming_emit_at),
+                now=float(now),
+                forming_min_interval_s=float(self._forming_min_interval_s),
+            ):
+                return
+            candle = kline_candle(k, candle_time)
+            if candle is not None:
+                await self._publish_forming(candle, now=now)
+            return
+        candle = kline_candle(k, candle_time)
+        if candle is None:
+            return
+        reason = self.add_closed(candle)
+        if reason is not None:
+            await self.flush(reason=reason)
+
+    async def _publish_forming(self, candle: CandleRecord, *, now: float) -> None:
+        await publish_forming_with_derived(
+            hub=self._hub,
+            series_id=self.series_id,
+            candle=candle,
+            fanout=self._fanout,
+            now=float(now),
+        )
+        self._last_forming_emit_at = float(now)
+        self._last_forming_candle_time = int(candle.candle_time)
+
+    def add_closed(self, candle: CandleRecord) -> str | None:
+        """Buffer a final candle; returns the flush reason once a threshold is reached, else None."""
+        self.buf.append(candle)
+        now = time.time()
+        if self._flush_controller is not None:
+            return self._flush_controller.on_closed(now=now, buffered=len(self.buf))
+        if len(self.buf) >= self._batch_max or (now - self.last_flush_at) >= self._flush_s:
+            return "threshold"
+        return None
+
+    def due_reason(self, *, now: float) -> str | None:
+        """Timer-side flush reason for the current buffer, or None to keep waiting."""
+        if self._flush_controller is not None:
+            return self._flush_controller.due(now=float(now), buffered=len(self.buf))
+        if self.buf and (float(now) - self.last_flush_at) >= self._flush_s:
+            return "timeout"
+        return None
+
+    def flush_due(self, *, now: float) -> bool:
+        return self.due_reason(now=now) is not None
+
+    async def flush_if_due(self, *, now: float) -> None:
+        reason = self.due_reason(now=now)
+        if reason is not None:
+            await self.flush(reason=reason)
+
+    async def flush(self, *, reason: str) -> None:
+        if not self.buf:
+            return
+        rows = len(self.buf)
+        controller = self._flush_controller
+        wait_s = 0.0 if controller is None else controller.oldest_wait_s(now=time.time())
+        t0 = time.perf_counter()
+        self.last_emitted_time, self.last_flush_at = await flush_ws_buffer(
+            series_id=self.series_id,
+            ingest_pipeline=self._ingest_pipeline,
+            fanout=self._fanout,
+            buf=self.buf,
+            reason=reason,
+            last_emitted_time=int(self.last_emitted_time),
+            last_flush_at=float(self.last_flush_at),
+            publish_pipeline_result=_publish_pipeline_result_from_ws,
+        )
+        self._after_flush(reason=reason, rows=rows, wait_s=wait_s, duration_s=time.perf_counter() - t0)
+
+    def _after_flush(self, *, reason: str, rows: int, wait_s: float, duration_s: float) -> None:
+        controller = self._flush_controller
+        metrics = self._metrics
+        if metrics is not None and metrics.enabled():
+            metrics.incr("ingest_ws_flush_total", labels={"reason": reason})
+            metrics.incr("ingest_ws_flush_rows_total", value=float(rows), labels={"reason": reason})
+            if controller is not None:
+                metrics.observe_ms("ingest_ws_flush_oldest_wait_ms", duration_ms=wait_s * 1000.0)
+                metrics.set_gauge(
+                    "ingest_ws_flush_target_batch",
+                    value=float(controller.target_batch),
+                    labels={"series_id": self.series_id},
+                )
+        if controller is not None:
+            controller.on_flush(duration_s=duration_s)
@@ -21,6 +21,9 @@ class IngestWsConfig:
     batch_max: int = 200
     flush_s: float = 0.5
     forming_min_interval_ms: int = 250
+    mux_enabled: bool = False
+    mux_streams_per_socket: int = 200
+    adaptive_flush: bool = False
 
 
 @dataclass(frozen=True)
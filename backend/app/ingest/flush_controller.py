@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AdaptiveFlushConfig:
+    max_batch: int = 200
+    latency_ceiling_s: float = 0.5
+    ewma_alpha: float = 0.3
+
+
+def _ewma(prev: float | None, value: float, *, alpha: float) -> float:
+    return value if prev is None else prev + alpha * (value - prev)
+
+
+class AdaptiveFlushController:
+    """
+    Per-series flush policy for the ws closed-candle buffer.
+
+    Tracks EWMAs of closed-candle inter-arrival gap and flush (pipeline+publish) duration:
+    - quiet: fewer than one candle is expected during a pipeline run -> flush on close;
+    - burst: target batch ~= candles arriving during one pipeline run, capped by `max_batch`;
+    - the oldest buffered candle never waits longer than `latency_ceiling_s`.
+    """
+
+    def __init__(self, config: AdaptiveFlushConfig) -> None:
+        self._max_batch = max(1, int(config.max_batch))
+        self._ceiling_s = max(0.0, float(config.latency_ceiling_s))
+        self._alpha = min(1.0, max(0.01, float(config.ewma_alpha)))
+        self._gap_s: float | None = None
+        self._flush_s: float | None = None
+        self._last_arrival_at: float | None = None
+        self._oldest_at: float | None = None
+        self.target_batch = 1
+
+    def on_closed(self, *, now: float, buffered: int) -> str | None:
+        """Record one buffered closed candle; returns the flush reason, or None to keep batching."""
+        if self._last_arrival_at is not None:
+            gap = max(0.0, float(now) - self._last_arrival_at)
+            self._gap_s = _ewma(self._gap_s, gap, alpha=self._alpha)
+        self._last_arrival_at = float(now)
+        if self._oldest_at is None:
+            self._oldest_at = float(now)
+        self.target_batch = self._target_batch()
+        if buffered >= self._max_batch:
+            return "max_batch"
+        if self.target_batch <= 1:
+            return "quiet"
+        if buffered >= self.target_batch:
+            return "burst"
+        if float(now) - self._oldest_at >= self._ceiling_s:
+            return "ceiling"
+        return None
+
+    def due(self, *, now: float, buffered: int) -> str | None:
+        """Timer-side check (recv timeout): latency ceiling, or the burst has gone idle."""
+        if buffered <= 0 or self._oldest_at is None:
+            return None
+        if float(now) - self._oldest_at >= self._ceiling_s:
+            return "ceiling"
+        if self._last_arrival_at is not None and self._gap_s is not None:
+            if float(now) - self._last_arrival_at >= 2.0 * self._gap_s:
+                return "idle"
+        return None
+
+    def on_flush(self, *, duration_s: float) -> None:
+        self._flush_s = _ewma(self._flush_s, max(0.0, float(duration_s)), alpha=self._alpha)
+        self._oldest_at = None
+
+    def oldest_wait_s(self, *, now: float) -> float:
+        return 0.0 if self._oldest_at is None else max(0.0, float(now) - self._oldest_at)
+
+    def _target_batch(self) -> int:
+        if self._flush_s is None or self._gap_s is None:
+            # No measurement yet: flush the first candle right away so the pipeline duration gets sampled.
+            return 1
+        if self._gap_s <= 0.0:
+            return self._max_batch
+        expected = self._flush_s / self._gap_s
+        if self._ceiling_s > 0.0:
+            expected = min(expected, self._ceiling_s / self._gap_s)
+        return max(1, min(self._max_batch, int(math.ceil(expected - 1e-9))))
+
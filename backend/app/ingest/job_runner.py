@@ -24,6 +24,7 @@ class IngestJobRunnerConfig:
     batch_max: int
     flush_s: float
     forming_min_interval_ms: int
+    adaptive_flush: bool = False
 
 
 class IngestJobRunner:
@@ -70,6 +71,7 @@ class IngestJobRunner:
                         batch_max=config.batch_max,
                         flush_s=config.flush_s,
                         forming_min_interval_ms=config.forming_min_interval_ms,
+                        adaptive_flush=config.adaptive_flush,
                         loop_guardrail=guardrail,
                     )
                 )
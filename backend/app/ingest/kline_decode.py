@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any, Callable
+
+from ..core.candle_record import CandleRecord
+
+_KLINE_PRICE_KEYS = ("o", "h", "l", "c", "v")
+
+
+def _load_json_loads() -> tuple[str, Callable[[str | bytes], Any]]:
+    try:
+        module = importlib.import_module("orjson")
+    except ImportError:
+        return "json", json.loads
+    loads = getattr(module, "loads", None)
+    return ("orjson", loads) if callable(loads) else ("json", json.loads)
+
+
+KLINE_JSON_BACKEND, _json_loads = _load_json_loads()
+
+
+def decode_ws_message(raw: str | bytes) -> Any:
+    """Decode one ws text frame; returns None on malformed JSON."""
+    try:
+        return _json_loads(raw)
+    except ValueError:
+        return None
+
+
+def _as_int(value: object) -> int | None:
+    if type(value) is int:
+        return value
+    try:
+        return int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def kline_head(payload: object) -> tuple[int, bool, dict[str, Any]] | None:
+    """
+    Cheap first stage: (candle_time, is_final, k) from a kline event, without touching prices.
+    Callers drop throttled forming updates here, before any float parsing or model construction.
+    """
+    if not isinstance(payload, dict):
+        return None
+    k = payload.get("k")
+    if not isinstance(k, dict):
+        return None
+    open_ms = _as_int(k.get("t"))
+    if open_ms is None or open_ms <= 0:
+        return None
+    return open_ms // 1000, bool(k.get("x")), k
+
+
+def kline_candle(k: dict[str, Any], candle_time: int) -> CandleRecord | None:
+    """
+    Second stage, only for frames that survive the forming throttle: float prices into a `CandleRecord`.
+    The pydantic `CandleClosed` is built only at the WS publish boundary (`as_closed`); the store keeps records.
+    """
+    try:
+        o, h, l, c, v = (float(k[key]) for key in _KLINE_PRICE_KEYS)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return CandleRecord(int(candle_time), o, h, l, c, v)
@@ -21,6 +21,7 @@ from .supervisor_support import (
     stop_jobs,
 )
 from .binance_ws import run_binance_ws_ingest_loop
+from .binance_ws_mux import BinanceWsMux, BinanceWsMuxConfig
 from .settings import WhitelistIngestSettings
 from ..storage.candle_store import CandleStore
 from ..ws.hub import CandleHub
@@ -51,14 +52,13 @@ class IngestSupervisor:
         self._binance_ws_batch_max = max(1, int(cfg.ws.batch_max))
         self._binance_ws_flush_s = max(0.05, float(cfg.ws.flush_s))
         self._forming_min_interval_ms = max(0, int(cfg.ws.forming_min_interval_ms))
-        self._source_registry = IngestSourceRegistry(
-            bindings={
-                "binance": IngestSourceBinding(
-                    source="binance_ws",
-                    get_ingest_fn=lambda: run_binance_ws_ingest_loop,
-                )
-            }
-        )
+        self._mux: BinanceWsMux | None = None
+        binance_binding = IngestSourceBinding(source="binance_ws", get_ingest_fn=lambda: run_binance_ws_ingest_loop)
+        if bool(cfg.ws.mux_enabled):
+            mux = BinanceWsMux(config=BinanceWsMuxConfig(streams_per_socket=max(1, int(cfg.ws.mux_streams_per_socket))))
+            self._mux = mux
+            binance_binding = IngestSourceBinding(source="binance_ws_mux", get_ingest_fn=lambda: mux.run_series)
+        self._source_registry = IngestSourceRegistry(bindings={"binance": binance_binding})
         self._series_router = IngestSeriesRouter(
             source_registry=self._source_registry,
             config=IngestSeriesRouterConfig(
@@ -80,6 +80,7 @@ class IngestSupervisor:
                 batch_max=self._binance_ws_batch_max,
                 flush_s=self._binance_ws_flush_s,
                 forming_min_interval_ms=self._forming_min_interval_ms,
+                adaptive_flush=bool(cfg.ws.adaptive_flush),
             ),
         )
         self._guardrails = IngestGuardrailRegistry(
@@ -162,6 +163,8 @@ class IngestSupervisor:
             self._jobs.clear()
             self._guardrails.clear()
         await stop_jobs(jobs=jobs, wait=True)
+        if self._mux is not None:
+            await self._mux.close()
 
         if self._reaper_task is not None:
             self._reaper_stop.set()
@@ -170,7 +173,7 @@ class IngestSupervisor:
 
     async def debug_snapshot(self) -> dict:
         async with self._lock:
-            return build_debug_snapshot_locked(
+            snapshot = build_debug_snapshot_locked(
                 jobs=self._jobs,
                 whitelist=self._whitelist,
                 ondemand_max_jobs=self._ondemand_max_jobs,
@@ -180,6 +183,9 @@ class IngestSupervisor:
                 ingest_jobs_enabled=self._ingest_jobs_enabled,
                 loop_guardrail_enabled=self._guardrails.enabled,
             )
+        if self._mux is not None:
+            snapshot["binance_ws_mux"] = self._mux.snapshot()
+        return snapshot
 
     @property
     def whitelist_ingest_enabled(self) -> bool:
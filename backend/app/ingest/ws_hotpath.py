@@ -6,17 +6,20 @@ from typing import Awaitable, Callable
 
 from ..market.derived_timeframes import DerivedTimeframeFanout
 from ..pipelines import IngestPipeline, IngestPipelineResult
+from ..core.candle_record import CandleRecord, as_closed
 from ..core.schemas import CandleClosed
 from ..ws.hub import CandleHub
 
 logger = logging.getLogger(__name__)
 
 PublishPipelineResultFn = Callable[..., Awaitable[None]]
+# Decoded WS klines stay `CandleRecord` until the hub; derived rollups are `CandleClosed`.
+WsCandle = CandleClosed | CandleRecord
 
 
-def dedupe_closed_batch(*, candles: list[CandleClosed], last_emitted_time: int) -> list[CandleClosed]:
+def dedupe_closed_batch(*, candles: list[WsCandle], last_emitted_time: int) -> list[WsCandle]:
     ordered = sorted(candles, key=lambda c: c.candle_time)
-    deduped: list[CandleClosed] = []
+    deduped: list[WsCandle] = []
     last_time: int | None = None
     for candle in ordered:
         if candle.candle_time <= int(last_emitted_time):
@@ -32,9 +35,9 @@ def dedupe_closed_batch(*, candles: list[CandleClosed], last_emitted_time: int)
 def build_ingest_batches(
     *,
     base_series_id: str,
-    base_candles: list[CandleClosed],
+    base_candles: list[WsCandle],
     fanout: DerivedTimeframeFanout | None,
-) -> dict[str, list[CandleClosed]]:
+) -> dict[str, list[WsCandle]]:
     derived_batches: dict[str, list[CandleClosed]] = {}
     if fanout is not None:
         try:
@@ -42,7 +45,7 @@ def build_ingest_batches(
         except Exception:
             derived_batches = {}
 
-    all_batches: dict[str, list[CandleClosed]] = {base_series_id: base_candles}
+    all_batches: dict[str, list[WsCandle]] = {base_series_id: base_candles}
     for derived_series_id, derived in derived_batches.items():
         if derived:
             all_batches[derived_series_id] = derived
@@ -71,11 +74,11 @@ async def publish_forming_with_derived(
     *,
     hub: CandleHub,
     series_id: str,
-    candle: CandleClosed,
+    candle: WsCandle,
     fanout: DerivedTimeframeFanout | None,
     now: float,
 ) -> None:
-    await hub.publish_forming(series_id=series_id, candle=candle)
+    await hub.publish_forming(series_id=series_id, candle=as_closed(candle))
     if fanout is None:
         return
     try:
@@ -95,7 +98,7 @@ async def flush_ws_buffer(
     series_id: str,
     ingest_pipeline: IngestPipeline,
     fanout: DerivedTimeframeFanout | None,
-    buf: list[CandleClosed],
+    buf: list[WsCandle],
     reason: str,
     last_emitted_time: int,
     last_flush_at: float,
@@ -104,6 +107,10 @@ async def flush_ws_buffer(
     if not buf:
         return int(last_emitted_time), float(last_flush_at)
 
+    tracer = ingest_pipeline.tracer
+    trace = None if tracer is None else tracer.maybe_start(source="binance_ws", series_id=series_id, reason=reason)
+    buffered = len(buf)
+    prepare_span = None if trace is None else trace.start_span("ws.prepare_batches", buffered=buffered)
     deduped = dedupe_closed_batch(
         candles=list(buf),
         last_emitted_time=int(last_emitted_time),
@@ -111,6 +118,8 @@ async def flush_ws_buffer(
     buf.clear()
     flushed_at = time.time()
     if not deduped:
+        if trace is not None:
+            trace.finish(candle_time=int(last_emitted_time), rows=0, buffered=buffered)
         return int(last_emitted_time), float(flushed_at)
 
     up_to_time = int(deduped[-1].candle_time)
@@ -119,19 +128,38 @@ async def flush_ws_buffer(
         base_candles=deduped,
         fanout=fanout,
     )
+    if trace is not None and prepare_span is not None:
+        trace.end_span(prepare_span, rows=len(deduped), series=len(all_batches))
 
-    pipeline_result = await ingest_pipeline.run(
-        batches=all_batches,
-        publish=False,
-    )
-    db_ms = int(pipeline_result.duration_ms)
-
-    t1 = time.perf_counter()
-    await publish_pipeline_result(
-        ingest_pipeline=ingest_pipeline,
-        pipeline_result=pipeline_result,
-    )
-    publish_ms = int((time.perf_counter() - t1) * 1000)
+    error: str | None = None
+    try:
+        pipeline_span = None if trace is None else trace.start_span("ingest_pipeline.run")
+        pipeline_result = await ingest_pipeline.run(
+            batches=all_batches,
+            publish=False,
+        )
+        db_ms = int(pipeline_result.duration_ms)
+        if trace is not None and pipeline_span is not None:
+            trace.end_span(pipeline_span, rebuilt=len(pipeline_result.rebuilt_series))
+            trace.add_pipeline_steps(steps=pipeline_result.steps, parent=pipeline_span)
+
+        publish_span = None if trace is None else trace.start_span("hub.publish", series=len(all_batches))
+        t1 = time.perf_counter()
+        await publish_pipeline_result(
+            ingest_pipeline=ingest_pipeline,
+            pipeline_result=pipeline_result,
+        )
+        publish_ms = int((time.perf_counter() - t1) * 1000)
+        if trace is not None and publish_span is not None:
+            trace.end_span(publish_span)
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        # Failed batches are the ones worth inspecting: record the trace either way, open spans end here.
+        if trace is not None:
+            attrs = {} if error is None else {"error": error}
+            trace.finish(candle_time=int(up_to_time), rows=len(deduped), buffered=buffered, **attrs)
 
     emitted_time = max(int(last_emitted_time), int(up_to_time))
     logger.info(
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import logging
+from dataclasses import dataclass, field
 
 from ..market.runtime import MarketRuntime
 from .startup_kline_sync import run_startup_kline_sync_for_runtime
+from .startup_sync_scheduler import StartupKlineSyncProgress, StartupKlineSyncSchedule
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
 class AppLifecycleService:
     market_runtime: MarketRuntime
+    startup_sync_progress: StartupKlineSyncProgress = field(default_factory=StartupKlineSyncProgress)
+    _background: set[asyncio.Task] = field(default_factory=set, init=False, repr=False, compare=False)
 
     async def startup(self) -> None:
         runtime_flags = self.market_runtime.runtime_flags
@@ -17,22 +24,66 @@ class AppLifecycleService:
         start_pubsub = getattr(hub, "start_pubsub", None)
         if callable(start_pubsub):
             await start_pubsub()
+        sync_task: asyncio.Task | None = None
         if bool(runtime_flags.enable_startup_kline_sync):
-            await run_startup_kline_sync_for_runtime(
+            sync_task = await self._start_kline_sync()
+
+        if bool(supervisor.whitelist_ingest_enabled):
+            if sync_task is None or sync_task.done():
+                await supervisor.start_whitelist()
+            else:
+                # Priority series are synced; the rest finish in the background before whitelist ingest starts.
+                self._spawn(self._start_whitelist_after(sync_task))
+
+        if bool(supervisor.whitelist_ingest_enabled) or bool(runtime_flags.enable_ondemand_ingest):
+            await supervisor.start_reaper()
+
+    async def _start_kline_sync(self) -> asyncio.Task:
+        runtime_flags = self.market_runtime.runtime_flags
+        progress = self.startup_sync_progress
+        progress.start()
+        sync_task = self._spawn(
+            run_startup_kline_sync_for_runtime(
                 runtime=self.market_runtime,
                 enabled=bool(runtime_flags.enable_startup_kline_sync),
                 target_candles=int(runtime_flags.startup_kline_sync_target_candles),
+                schedule=StartupKlineSyncSchedule(
+                    concurrency=int(runtime_flags.startup_kline_sync_concurrency),
+                    rate_per_s=float(runtime_flags.startup_kline_sync_rate_per_s),
+                    base_timeframe=str(runtime_flags.derived_base_timeframe),
+                ),
+                progress=progress,
             )
+        )
+        ready = asyncio.create_task(progress.wait_ready())
+        try:
+            await asyncio.wait({sync_task, ready}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready.cancel()
+        if sync_task.done():
+            sync_task.result()
+        return sync_task
 
-        if bool(supervisor.whitelist_ingest_enabled):
-            await supervisor.start_whitelist()
+    async def _start_whitelist_after(self, sync_task: asyncio.Task) -> None:
+        try:
+            await sync_task
+        except Exception:
+            logger.exception("startup kline sync failed; starting whitelist ingest anyway")
+        await self.market_runtime.ingest_ctx.supervisor.start_whitelist()
 
-        if bool(supervisor.whitelist_ingest_enabled) or bool(runtime_flags.enable_ondemand_ingest):
-            await supervisor.start_reaper()
+    def _spawn(self, coro) -> asyncio.Task:  # noqa: ANN001
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
 
     async def shutdown(self) -> None:
         hub = self.market_runtime.hub
         supervisor = self.market_runtime.ingest_ctx.supervisor
+        for task in list(self._background):
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
         close_pubsub = getattr(hub, "close_pubsub", None)
         if callable(close_pubsub):
             try:
@@ -44,3 +95,7 @@ class AppLifecycleService:
         except Exception:
             pass
         await supervisor.close()
+        read_ctx = getattr(self.market_runtime, "read_ctx", None)
+        close_backfill_progress = getattr(getattr(read_ctx, "backfill_progress", None), "close", None)
+        if callable(close_backfill_progress):
+            close_backfill_progress()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..core.ports import AlignedStorePort, BackfillPort
+from ..core.timeframe import expected_latest_closed_time, series_id_timeframe, timeframe_to_seconds
+from ..ledger.ports import LedgerSyncPreparePort
+
+
+@dataclass(frozen=True)
+class StartupKlineSyncSeriesResult:
+    series_id: str
+    target_time: int | None
+    before_head_time: int | None
+    after_head_time: int | None
+    covered_candles: int
+    refreshed: bool
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class StartupKlineSyncResult:
+    enabled: bool
+    target_candles: int
+    series_total: int
+    series_synced: int
+    series_lagging: int
+    series_errors: int
+    duration_ms: int
+    series_results: tuple[StartupKlineSyncSeriesResult, ...]
+
+
+def series_timeframe_seconds(series_id: str) -> int:
+    try:
+        return int(timeframe_to_seconds(series_id_timeframe(series_id)))
+    except (ValueError, KeyError):
+        return 0
+
+
+def target_time_for_series(*, series_id: str, now_time: int) -> int | None:
+    tf_s = series_timeframe_seconds(series_id)
+    if int(tf_s) <= 0:
+        return None
+    return expected_latest_closed_time(now_time=int(now_time), timeframe_seconds=int(tf_s))
+
+
+def series_result(
+    *,
+    series_id: str,
+    target_time: int | None,
+    before_head_time: int | None,
+    after_head_time: int | None = None,
+    covered_candles: int = 0,
+    refreshed: bool = False,
+    error: str | BaseException | None = None,
+) -> StartupKlineSyncSeriesResult:
+    before = None if before_head_time is None else int(before_head_time)
+    after = before if after_head_time is None else int(after_head_time)
+    return StartupKlineSyncSeriesResult(
+        series_id=str(series_id),
+        target_time=None if target_time is None else int(target_time),
+        before_head_time=before,
+        after_head_time=after,
+        covered_candles=max(0, int(covered_candles)),
+        refreshed=bool(refreshed),
+        error=None if error is None else str(error),
+    )
+
+
+def sync_one_series(
+    *,
+    store: AlignedStorePort,
+    backfill: BackfillPort,
+    ledger_sync: LedgerSyncPreparePort,
+    series_id: str,
+    target_candles: int,
+    now_time: int,
+) -> StartupKlineSyncSeriesResult:
+    before_head_time = store.head_time(series_id)
+    target_time = target_time_for_series(series_id=series_id, now_time=int(now_time))
+    if target_time is None:
+        return series_result(
+            series_id=str(series_id),
+            target_time=None,
+            before_head_time=before_head_time,
+            error="invalid_series_timeframe",
+        )
+    if int(target_time) <= 0:
+        return series_result(
+            series_id=str(series_id),
+            target_time=int(target_time),
+            before_head_time=before_head_time,
+            error=None,
+        )
+
+    covered_candles = int(
+        backfill.ensure_tail_coverage(
+            series_id=str(series_id),
+            target_candles=int(target_candles),
+            to_time=int(target_time),
+        )
+    )
+
+    refresh_outcome = ledger_sync.refresh_if_needed(
+        series_id=str(series_id),
+        up_to_time=int(target_time),
+    )
+    refreshed = bool(refresh_outcome.refreshed)
+
+    after_head_time = store.head_time(series_id)
+    return series_result(
+        series_id=str(series_id),
+        target_time=int(target_time),
+        before_head_time=before_head_time,
+        after_head_time=after_head_time,
+        covered_candles=int(covered_candles),
+        refreshed=bool(refreshed),
+        error=None,
+    )
+
+
+def is_lagging(item: StartupKlineSyncSeriesResult) -> bool:
+    if item.error is not None:
+        return False
+    if item.target_time is None:
+        return False
+    if int(item.target_time) <= 0:
+        return False
+    if item.after_head_time is None:
+        return True
+    return int(item.after_head_time) < int(item.target_time)
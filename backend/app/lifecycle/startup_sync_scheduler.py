@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from ..core.timeframe import series_id_timeframe
+from .startup_kline_sync_series import series_timeframe_seconds
+
+# CCXT fetch_ohlcv page size used by tail backfill; one page ~= one exchange request.
+CCXT_PAGE_CANDLES = 1000
+
+
+@dataclass(frozen=True)
+class StartupKlineSyncSchedule:
+    concurrency: int = 4
+    rate_per_s: float = 5.0
+    base_timeframe: str = "1m"
+
+
+class AsyncTokenBucket:
+    """Shared exchange budget: `rate_per_s` tokens/s with `burst` capacity; rate <= 0 disables it."""
+
+    def __init__(self, *, rate_per_s: float, burst: float | None = None) -> None:
+        self._rate = max(0.0, float(rate_per_s))
+        self._capacity = max(1.0, float(burst if burst is not None else self._rate))
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    async def acquire(self, cost: float = 1.0) -> float:
+        """
+        Wait for `cost` tokens; returns seconds waited. A cost above capacity waits for a full bucket
+        and leaves it in debt, so later callers pay the rest and the long-run rate still holds.
+        """
+        cost = max(0.0, float(cost))
+        need = min(self._capacity, cost)
+        if self._rate <= 0.0 or need <= 0.0:
+            return 0.0
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill(time.monotonic())
+                if self._tokens >= need:
+                    self._tokens -= cost
+                    return waited
+                delay = (need - self._tokens) / self._rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+def order_startup_series(
+    series_ids: Sequence[str],
+    *,
+    base_timeframe: str,
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    """
+    Sync order: base-timeframe series first (they feed derived timeframes and are what users open),
+    then ascending timeframe; ties keep whitelist order, which is the operator's watch ranking.
+    Returns (ordered ids, priority ids = base-timeframe series).
+    """
+    base = str(base_timeframe).strip()
+    rank = {sid: idx for idx, sid in enumerate(series_ids)}
+
+    def _key(sid: str) -> tuple[int, int, int]:
+        is_base = _series_timeframe(sid) == base
+        return (0 if is_base else 1, series_timeframe_seconds(sid), rank[sid])
+
+    ordered = tuple(sorted(series_ids, key=_key))
+    priority = frozenset(sid for sid in ordered if _series_timeframe(sid) == base)
+    return ordered, priority
+
+
+def _series_timeframe(series_id: str) -> str:
+    try:
+        return str(series_id_timeframe(series_id)).strip()
+    except (ValueError, KeyError):
+        return ""
+
+
+def estimate_fetch_pages(*, head_time: int | None, target_time: int | None, timeframe_s: int, target_candles: int) -> int:
+    """Exchange requests a tail sync will likely issue; 0 when the local head already reaches the target."""
+    if target_time is None or int(target_time) <= 0 or int(timeframe_s) <= 0:
+        return 0
+    if head_time is not None and int(head_time) >= int(target_time):
+        return 0
+    missing = int(target_candles)
+    if head_time is not None and int(head_time) > 0:
+        missing = min(missing, (int(target_time) - int(head_time)) // int(timeframe_s))
+    return int(math.ceil(max(1, missing) / CCXT_PAGE_CANDLES))
+
+
+class StartupKlineSyncProgress:
+    """
+    Incremental startup-sync progress for readiness: ready once every priority series finished
+    (or sync is disabled/done); the remaining series keep syncing in the background.
+    """
+
+    def __init__(self) -> None:
+        self.state = "idle"
+        self._series: dict[str, str] = {}
+        self._priority: frozenset[str] = frozenset()
+        self._priority_ready = asyncio.Event()
+        self._priority_ready.set()
+
+    def start(self) -> None:
+        """Mark not-ready before the sync task gets scheduled, so readiness never races the plan."""
+        self.state = "running"
+        self._priority_ready.clear()
+
+    def plan(self, *, series_ids: Sequence[str], priority: frozenset[str]) -> None:
+        self.start()
+        self._series = {sid: "pending" for sid in series_ids}
+        self._priority = frozenset(sid for sid in priority if sid in self._series)
+        self._check_priority()
+
+    def mark_running(self, series_id: str) -> None:
+        self._series[series_id] = "running"
+
+    def mark_done(self, series_id: str, *, error: str | None) -> None:
+        self._series[series_id] = "error" if error is not None else "done"
+        self._check_priority()
+
+    def finish(self) -> None:
+        self.state = "done"
+        self._priority_ready.set()
+
+    def _check_priority(self) -> None:
+        if all(self._series.get(sid) in {"done", "error"} for sid in self._priority):
+            self._priority_ready.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._priority_ready.is_set()
+
+    async def wait_ready(self) -> None:
+        await self._priority_ready.wait()
+
+    def snapshot(self) -> dict:
+        counts: dict[str, int] = {"pending": 0, "running": 0, "done": 0, "error": 0}
+        for value in self._series.values():
+            counts[value] = counts.get(value, 0) + 1
+        priority_done = sum(1 for sid in self._priority if self._series.get(sid) in {"done", "error"})
+        return {
+            "state": self.state,
+            "ready": bool(self.ready),
+            "series_total": len(self._series),
+            "priority_total": len(self._priority),
+            "priority_done": int(priority_done),
+            **counts,
+            "series": dict(self._series),
+        }
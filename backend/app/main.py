@@ -26,9 +26,12 @@ from .factor.routes import register_factor_routes
 from .market.http_routes import register_market_http_routes
 from .market.meta_routes import register_market_meta_routes
 from .market.ws_routes import handle_market_ws
+from .routes.metrics import register_metrics_routes
+from .routes.readiness import register_readiness_routes
 from .routes.repair import register_repair_routes
 from .replay.routes import register_replay_routes
 from .lifecycle.shutdown_cancellation_middleware import ShutdownCancellationMiddleware, ShutdownState
+from .runtime.http_metrics_middleware import HttpMetricsMiddleware
 from .routes.world import register_world_routes
 
 _faulthandler_file: TextIO | None = None
@@ -93,6 +96,7 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(ShutdownCancellationMiddleware, shutdown_state=shutdown_state)
+    app.add_middleware(HttpMetricsMiddleware, runtime_metrics=container.runtime_metrics)
 
     app.state.container = container
 
@@ -105,6 +109,8 @@ def create_app() -> FastAPI:
     register_world_routes(app)
     register_market_meta_routes(app)
     register_market_http_routes(app)
+    register_metrics_routes(app)
+    register_readiness_routes(app)
 
     @app.websocket("/ws/market")
     async def ws_market(
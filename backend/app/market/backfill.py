@@ -3,9 +3,8 @@ from __future__ import annotations
 import logging
 import time
 
-from ..market.ccxt_client import _make_exchange_client, ccxt_symbol_for_series
+from .ccxt_backfill_engine import CcxtBackfillEngine
 from ..market.history_bootstrapper import backfill_tail_from_freqtrade
-from ..core.schemas import CandleClosed
 from ..core.series_id import parse_series_id
 from ..storage.candle_store import CandleStore
 from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
@@ -21,10 +20,12 @@ def backfill_from_ccxt_range(
     end_time: int,
     batch_limit: int = 1000,
     ccxt_timeout_ms: int = 10_000,
+    engine: CcxtBackfillEngine | None = None,
 ) -> int:
     """
-    Best-effort CCXT backfill for [start_time, end_time] (inclusive).
-    Returns number of rows written (upsert count).
+    Best-effort CCXT backfill for [start_time, end_time] (inclusive), via the segmented engine
+    (concurrent, rate-limited, resumable). Returns number of rows written (upsert count).
+    `engine` carries the app's backfill config and shared limiters; without one a default engine runs.
     """
     if int(end_time) < int(start_time):
         return 0
@@ -40,60 +41,14 @@ def backfill_from_ccxt_range(
     if end <= 0:
         end = int(time.time() // int(tf_s) * int(tf_s))
 
-    exchange = _make_exchange_client(series, timeout_ms=int(ccxt_timeout_ms))
-    symbol = ccxt_symbol_for_series(series)
-    since_ms = int(start * 1000)
-    total_written = 0
-
-    try:
-        while since_ms <= int(end * 1000):
-            rows = exchange.fetch_ohlcv(symbol, series.timeframe, since_ms, int(batch_limit))
-            if not rows:
-                break
-
-            to_write: list[CandleClosed] = []
-            max_open_time_s: int | None = None
-
-            for row in rows:
-                open_time_s = int(row[0] // 1000)
-                max_open_time_s = open_time_s if max_open_time_s is None else max(max_open_time_s, open_time_s)
-                if open_time_s < start or open_time_s > end:
-                    continue
-                to_write.append(
-                    CandleClosed(
-                        candle_time=open_time_s,
-                        open=float(row[1]),
-                        high=float(row[2]),
-                        low=float(row[3]),
-                        close=float(row[4]),
-                        volume=float(row[5]),
-                    )
-                )
-
-            if to_write:
-                with candle_store.connect() as conn:
-                    candle_store.upsert_many_closed_in_conn(conn, series_id, to_write)
-                    conn.commit()
-                total_written += len(to_write)
-
-            if max_open_time_s is None:
-                break
-            if max_open_time_s >= end:
-                break
-
-            next_since_ms = int((max_open_time_s + int(tf_s)) * 1000)
-            if next_since_ms <= since_ms:
-                break
-            since_ms = next_since_ms
-    finally:
-        try:
-            close = getattr(exchange, "close", None)
-            if callable(close):
-                close()
-        except Exception:
-            pass
-
-    return total_written
+    return (engine or CcxtBackfillEngine()).run(
+        candle_store=candle_store,
+        series_id=series_id,
+        start_time=start,
+        end_time=end,
+        batch_limit=int(batch_limit),
+        ccxt_timeout_ms=int(ccxt_timeout_ms),
+    )
 
 
 def backfill_market_gap_best_effort(
@@ -102,7 +57,7 @@ def backfill_market_gap_best_effort(
     series_id: str,
     expected_next_time: int,
     actual_time: int,
-    enable_ccxt_backfill: bool = False,
+    ccxt_backfill: CcxtBackfillEngine | None = None,
     freqtrade_limit: int = 2000,
     market_history_source: str = "",
     ccxt_timeout_ms: int = 10_000,
@@ -111,6 +66,7 @@ def backfill_market_gap_best_effort(
     Best-effort gap backfill for realtime market stream.
 
     Gap range is [expected_next_time, actual_time - timeframe].
+    The CCXT fallback runs only when `ccxt_backfill` (the app's backfill engine) is given.
     Returns newly available candle count in that range.
     """
     tf_s = timeframe_to_seconds(series_id_timeframe(series_id))
@@ -144,7 +100,7 @@ def backfill_market_gap_best_effort(
             str(exc),
         )
 
-    if bool(enable_ccxt_backfill):
+    if ccxt_backfill is not None:
         try:
             backfill_from_ccxt_range(
                 candle_store=store,
@@ -152,6 +108,7 @@ def backfill_market_gap_best_effort(
                 start_time=int(start),
                 end_time=int(end),
                 ccxt_timeout_ms=int(ccxt_timeout_ms),
+                engine=ccxt_backfill,
             )
         except Exception as exc:
             logger.warning(
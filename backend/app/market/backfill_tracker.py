@@ -3,12 +3,17 @@ from __future__ import annotations
 import json
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
+from typing import Iterator
 from typing import Literal
 from typing import cast
 
+from ..runtime.metrics import RuntimeMetrics
+from .backfill_tracker_persistence import BackfillStateWriter
+
 BackfillState = Literal["idle", "running", "succeeded", "failed"]
 
 
@@ -53,12 +58,41 @@ def _calc_progress_pct(*, start_missing_seconds: int, current_missing_seconds: i
 
 
 class MarketBackfillProgressTracker:
-    def __init__(self, *, state_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        state_path: Path | None = None,
+        flush_interval_s: float = 0.0,
+        runtime_metrics: RuntimeMetrics | None = None,
+    ) -> None:
         self._lock = threading.Lock()
         self._state_path = state_path
         self._states: dict[str, _MutableBackfillState] = {}
+        self._version = 0
+        self._metrics = runtime_metrics
+        self._writer = (
+            None
+            if state_path is None
+            else BackfillStateWriter(
+                path=state_path,
+                snapshot_fn=self._snapshot_payload,
+                flush_interval_s=flush_interval_s,
+                runtime_metrics=runtime_metrics,
+            )
+        )
         self._load_from_disk()
 
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                held_ms = (time.perf_counter() - started) * 1000.0
+        if self._metrics is not None:
+            self._metrics.observe_ms("market_backfill_progress_lock_hold_ms", duration_ms=held_ms)
+
     @staticmethod
     def _from_payload(payload: dict[str, Any]) -> _MutableBackfillState:
         state_raw = str(payload.get("state") or "idle")
@@ -117,27 +151,25 @@ class MarketBackfillProgressTracker:
             "error": state.error,
         }
 
-    def _persist_locked(self) -> None:
-        path = self._state_path
-        if path is None:
-            return
-        try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            payload = {
-                "version": 1,
-                "states": {
-                    series_id: self._state_to_payload(state)
-                    for series_id, state in sorted(self._states.items(), key=lambda item: str(item[0]))
-                },
+    def _snapshot_payload(self) -> tuple[int, dict[str, Any]]:
+        with self._locked():
+            states = {
+                series_id: self._state_to_payload(state)
+                for series_id, state in sorted(self._states.items(), key=lambda item: str(item[0]))
             }
-            tmp = path.with_suffix(path.suffix + ".tmp")
-            tmp.write_text(
-                json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n",
-                encoding="utf-8",
-            )
-            tmp.replace(path)
-        except OSError:
-            return
+            return self._version, {"version": 1, "states": states}
+
+    def _persist(self) -> None:
+        if self._writer is not None:
+            self._writer.request()
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
 
     @staticmethod
     def _now(now_time: int | None) -> int:
@@ -153,7 +185,8 @@ class MarketBackfillProgressTracker:
         now_time: int | None = None,
     ) -> None:
         now = self._now(now_time)
-        with self._lock:
+        with self._locked():
+            self._version += 1
             state = self._states.setdefault(series_id, _MutableBackfillState())
             state.state = "running"
             state.started_at = now
@@ -165,7 +198,7 @@ class MarketBackfillProgressTracker:
             state.reason = str(reason)
             state.note = None
             state.error = None
-            self._persist_locked()
+        self._persist()
 
     def update(
         self,
@@ -177,7 +210,8 @@ class MarketBackfillProgressTracker:
         now_time: int | None = None,
     ) -> None:
         now = self._now(now_time)
-        with self._lock:
+        with self._locked():
+            self._version += 1
             state = self._states.setdefault(series_id, _MutableBackfillState())
             if state.started_at is None:
                 state.started_at = now
@@ -188,7 +222,7 @@ class MarketBackfillProgressTracker:
             state.current_missing_candles = max(0, int(current_missing_candles))
             if note:
                 state.note = str(note)
-            self._persist_locked()
+        self._persist()
 
     def succeed(
         self,
@@ -200,7 +234,8 @@ class MarketBackfillProgressTracker:
         now_time: int | None = None,
     ) -> None:
         now = self._now(now_time)
-        with self._lock:
+        with self._locked():
+            self._version += 1
             state = self._states.setdefault(series_id, _MutableBackfillState())
             if state.started_at is None:
                 state.started_at = now
@@ -210,7 +245,7 @@ class MarketBackfillProgressTracker:
             state.current_missing_candles = max(0, int(current_missing_candles))
             state.note = str(note) if note else state.note
             state.error = None
-            self._persist_locked()
+        self._persist()
 
     def fail(
         self,
@@ -223,7 +258,8 @@ class MarketBackfillProgressTracker:
         now_time: int | None = None,
     ) -> None:
         now = self._now(now_time)
-        with self._lock:
+        with self._locked():
+            self._version += 1
             state = self._states.setdefault(series_id, _MutableBackfillState())
             if state.started_at is None:
                 state.started_at = now
@@ -233,10 +269,10 @@ class MarketBackfillProgressTracker:
             state.current_missing_candles = max(0, int(current_missing_candles))
             state.error = str(error)
             state.note = str(note) if note else state.note
-            self._persist_locked()
+        self._persist()
 
     def snapshot(self, *, series_id: str) -> BackfillProgressSnapshot:
-        with self._lock:
+        with self._locked():
             state = self._states.get(series_id, _MutableBackfillState())
             progress = _calc_progress_pct(
                 start_missing_seconds=int(state.start_missing_seconds),
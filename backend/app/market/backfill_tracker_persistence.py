@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from ..runtime.metrics import RuntimeMetrics
+
+# Returns (state version, payload) captured under the tracker lock.
+SnapshotFn = Callable[[], tuple[int, dict[str, Any]]]
+
+
+class BackfillStateWriter:
+    """
+    Atomic JSON snapshot writer for the backfill progress tracker; runs outside the tracker lock.
+
+    - flush_interval_s <= 0: write synchronously on every request;
+    - flush_interval_s > 0: write-behind; requests only mark dirty and a daemon thread writes at most
+      once per interval, so a crash loses at most `flush_interval_s` of transitions.
+    Snapshots carry a monotonically increasing version; an older snapshot never overwrites a newer one.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        snapshot_fn: SnapshotFn,
+        flush_interval_s: float = 0.0,
+        runtime_metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._path = path
+        self._snapshot_fn = snapshot_fn
+        self._interval_s = max(0.0, float(flush_interval_s))
+        self._metrics = runtime_metrics
+        self._io_lock = threading.Lock()
+        self._written_version = 0
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def write_behind(self) -> bool:
+        return self._interval_s > 0.0
+
+    def request(self) -> None:
+        if not self.write_behind:
+            self.flush()
+            return
+        self._dirty.set()
+        self._ensure_thread()
+
+    def flush(self) -> bool:
+        """Write the latest snapshot now if it is newer than what is on disk; returns True when written."""
+        with self._io_lock:
+            version, payload = self._snapshot_fn()
+            if version <= self._written_version:
+                return False
+            started = time.perf_counter()
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+                tmp.write_text(
+                    json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n",
+                    encoding="utf-8",
+                )
+                tmp.replace(self._path)
+            except OSError:
+                return False
+            self._written_version = version
+        if self._metrics is not None:
+            self._metrics.incr("market_backfill_progress_persist_total")
+            self._metrics.observe_ms(
+                "market_backfill_progress_persist_ms",
+                duration_ms=(time.perf_counter() - started) * 1000.0,
+            )
+        return True
+
+    def close(self) -> None:
+        """Stop the write-behind thread and flush whatever is still pending."""
+        self._stop.set()
+        self._dirty.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=max(1.0, self._interval_s * 2.0))
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None or self._stop.is_set():
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="market-backfill-progress-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._dirty.wait()
+            if self._stop.is_set():
+                return
+            # Coalesce every transition that lands within the interval into one snapshot.
+            self._stop.wait(self._interval_s)
+            self._dirty.clear()
+            self.flush()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from ..core.flags import resolve_env_str
+
+BINANCE_SPOT_REST = "https://api.binance.com"
+BINANCE_FUTURES_REST = "https://fapi.binance.com"
+BINANCE_SPOT_WS = "wss://stream.binance.com:9443"
+BINANCE_FUTURES_WS = "wss://fstream.binance.com"
+
+
+@dataclass(frozen=True)
+class BinanceEndpoints:
+    spot_rest: str
+    futures_rest: str
+    spot_ws: str
+    futures_ws: str
+
+    def rest_base(self, market: str) -> str:
+        return self.futures_rest if market == "futures" else self.spot_rest
+
+    def ws_base(self, market: str) -> str:
+        return self.futures_ws if market == "futures" else self.spot_ws
+
+
+def resolve_binance_endpoints() -> BinanceEndpoints:
+    """
+    Binance REST/WS base URLs; every client (ws ingest, ccxt backfill, market list) reads them here,
+    so pointing the env vars at a local stand-in (see `market/fake_binance`) redirects all traffic.
+    """
+    return BinanceEndpoints(
+        spot_rest=resolve_env_str("TRADE_CANVAS_BINANCE_SPOT_BASE_URL", fallback=BINANCE_SPOT_REST).rstrip("/"),
+        futures_rest=resolve_env_str("TRADE_CANVAS_BINANCE_FUTURES_BASE_URL", fallback=BINANCE_FUTURES_REST).rstrip("/"),
+        spot_ws=resolve_env_str("TRADE_CANVAS_BINANCE_SPOT_WS_BASE_URL", fallback=BINANCE_SPOT_WS).rstrip("/"),
+        futures_ws=resolve_env_str("TRADE_CANVAS_BINANCE_FUTURES_WS_BASE_URL", fallback=BINANCE_FUTURES_WS).rstrip("/"),
+    )
+
+
+def apply_ccxt_rest_overrides(exchange: Any, endpoints: BinanceEndpoints, *, market: str) -> None:
+    """Rewrite ccxt `urls['api']` hosts when a non-default REST base is configured; no-op otherwise."""
+    rewrites = {
+        BINANCE_SPOT_REST: endpoints.spot_rest,
+        BINANCE_FUTURES_REST: endpoints.futures_rest,
+    }
+    rewrites = {src: dst for src, dst in rewrites.items() if dst != src}
+    urls = getattr(exchange, "urls", None)
+    api = urls.get("api") if isinstance(urls, dict) else None
+    if not rewrites or not isinstance(api, dict):
+        return
+    for key, value in list(api.items()):
+        if not isinstance(value, str):
+            continue
+        for src, dst in rewrites.items():
+            if value.startswith(src):
+                api[key] = dst + value[len(src) :]
+                break
+    options = getattr(exchange, "options", None)
+    if isinstance(options, dict):
+        # Only the overridden host is reachable; skip inverse/dapi market discovery on load_markets.
+        options["fetchMarkets"] = {"types": ["linear"] if market == "futures" else ["spot"]}
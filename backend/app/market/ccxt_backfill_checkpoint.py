@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def _file_name(series_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(series_id)).strip("_") + ".json"
+
+
+@dataclass
+class CcxtBackfillCheckpoint:
+    """
+    Completed backfill segments for one series, as inclusive [start_time, end_time] ranges.
+    Persisted as json (tmp + replace) when `path` is set; in-memory only otherwise.
+    """
+
+    series_id: str
+    path: Path | None = None
+    done: list[tuple[int, int]] = field(default_factory=list)
+
+    @classmethod
+    def for_series(cls, checkpoint_dir: Path | None, *, series_id: str) -> CcxtBackfillCheckpoint:
+        if checkpoint_dir is None:
+            return cls(series_id=str(series_id))
+        path = Path(checkpoint_dir) / _file_name(series_id)
+        checkpoint = cls(series_id=str(series_id), path=path)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return checkpoint
+        if isinstance(payload, dict) and payload.get("series_id") == str(series_id):
+            for item in payload.get("done") or ():
+                try:
+                    checkpoint.done.append((int(item[0]), int(item[1])))
+                except (TypeError, ValueError, IndexError):
+                    continue
+        return checkpoint
+
+    def covers(self, start_time: int, end_time: int) -> bool:
+        return any(s <= int(start_time) and int(end_time) <= e for s, e in self.done)
+
+    def mark_done(self, ranges: list[tuple[int, int]]) -> None:
+        self.done.extend((int(s), int(e)) for s, e in ranges)
+        self._persist()
+
+    def clear(self) -> None:
+        self.done.clear()
+        if self.path is None:
+            return
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            return
+
+    def _persist(self) -> None:
+        path = self.path
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"version": 1, "series_id": self.series_id, "done": sorted(self.done)}
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")) + "\n", encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            return
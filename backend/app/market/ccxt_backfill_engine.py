@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from ..core.schemas import CandleClosed
+from ..core.series_id import SeriesId, parse_series_id
+from ..core.timeframe import timeframe_to_seconds
+from ..storage.candle_store import CandleStore
+from .ccxt_backfill_checkpoint import CcxtBackfillCheckpoint
+from .ccxt_client import _make_exchange_client, ccxt_symbol_for_series
+
+ExchangeClientFactory = Callable[..., Any]
+_SegmentResult = tuple[int, list[CandleClosed] | None, BaseException | None]
+
+
+@dataclass(frozen=True)
+class CcxtBackfillConfig:
+    concurrency: int = 4
+    rate_per_s: float = 10.0
+    pages_per_segment: int = 4
+    checkpoint_dir: Path | None = None
+
+
+@dataclass(frozen=True)
+class BackfillSegment:
+    index: int
+    start_time: int
+    end_time: int
+
+
+class RestRateLimiter:
+    """Thread-safe token bucket shared by every backfill hitting the same exchange market; rate <= 0 disables it."""
+
+    def __init__(self, *, rate_per_s: float, burst: float | None = None) -> None:
+        self._rate = max(0.0, float(rate_per_s))
+        self._capacity = max(1.0, float(burst if burst is not None else self._rate))
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        if self._rate <= 0.0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self._rate
+            waited += delay
+            time.sleep(delay)
+
+
+class _SharedMarkets:
+    """Loads exchange markets once per run (one rate-limited request) and hands them to every other worker client."""
+
+    def __init__(self, limiter: RestRateLimiter) -> None:
+        self._limiter = limiter
+        self._lock = threading.Lock()
+        self._markets: Any = None
+
+    def prime(self, client: Any) -> None:
+        load = getattr(client, "load_markets", None)
+        if not callable(load):
+            return
+        with self._lock:
+            set_markets = getattr(client, "set_markets", None)
+            if self._markets is not None and callable(set_markets):
+                set_markets(self._markets)
+                return
+            self._limiter.acquire()
+            self._markets = load()
+
+
+def plan_segments(*, start_time: int, end_time: int, tf_s: int, candles_per_segment: int) -> list[BackfillSegment]:
+    span = max(1, int(candles_per_segment)) * int(tf_s)
+    out: list[BackfillSegment] = []
+    seg_start = int(start_time)
+    while seg_start <= int(end_time):
+        seg_end = min(int(end_time), seg_start + span - int(tf_s))
+        out.append(BackfillSegment(index=len(out), start_time=seg_start, end_time=seg_end))
+        seg_start = seg_end + int(tf_s)
+    return out
+
+
+def _fetch_segment(
+    *,
+    client: Any,
+    series: SeriesId,
+    segment: BackfillSegment,
+    batch_limit: int,
+    limiter: RestRateLimiter,
+) -> list[CandleClosed]:
+    tf_s = timeframe_to_seconds(series.timeframe)
+    symbol = ccxt_symbol_for_series(series)
+    start, end = int(segment.start_time), int(segment.end_time)
+    since_ms = start * 1000
+    out: list[CandleClosed] = []
+    while since_ms <= end * 1000:
+        limiter.acquire()
+        rows = client.fetch_ohlcv(symbol, series.timeframe, since_ms, int(batch_limit))
+        if not rows:
+            break
+        max_open_time_s: int | None = None
+        for row in rows:
+            open_time_s = int(row[0] // 1000)
+            max_open_time_s = open_time_s if max_open_time_s is None else max(max_open_time_s, open_time_s)
+            if start <= open_time_s <= end:
+                out.append(
+                    CandleClosed(
+                        candle_time=open_time_s,
+                        open=float(row[1]),
+                        high=float(row[2]),
+                        low=float(row[3]),
+                        close=float(row[4]),
+                        volume=float(row[5]),
+                    )
+                )
+        if max_open_time_s is None or max_open_time_s >= end:
+            break
+        next_since_ms = (max_open_time_s + int(tf_s)) * 1000
+        if next_since_ms <= since_ms:
+            break
+        since_ms = next_since_ms
+    return out
+
+
+def _close_client(client: Any) -> None:
+    try:
+        close = getattr(client, "close", None)
+        if callable(close):
+            close()
+    except Exception:
+        pass
+
+
+def _fail_pending(
+    pending: queue.Queue[BackfillSegment],
+    results: queue.Queue[_SegmentResult],
+    error: BaseException,
+) -> None:
+    while True:
+        try:
+            seg = pending.get_nowait()
+        except queue.Empty:
+            return
+        results.put((seg.index, None, error))
+
+
+class CcxtBackfillEngine:
+    """
+    Segmented CCXT range backfill: fixed-size segments fetched by `concurrency` workers (one client each)
+    under per-market rate limiters shared by every run of this engine. Segments are merged in order,
+    bulk-written and checkpointed up to the first failure, so a rerun resumes from the failed segment.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: CcxtBackfillConfig | None = None,
+        client_factory: ExchangeClientFactory = _make_exchange_client,
+        limiter: RestRateLimiter | None = None,
+    ) -> None:
+        self._config = config or CcxtBackfillConfig()
+        self._client_factory = client_factory
+        self._limiter = limiter
+        self._limiters: dict[tuple[str, str], RestRateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+
+    def rest_limiter(self, series: SeriesId) -> RestRateLimiter:
+        if self._limiter is not None:
+            return self._limiter
+        key = (str(series.exchange), str(series.market))
+        with self._limiters_lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = RestRateLimiter(rate_per_s=self._config.rate_per_s)
+                self._limiters[key] = limiter
+            return limiter
+
+    def run(
+        self,
+        *,
+        candle_store: CandleStore,
+        series_id: str,
+        start_time: int,
+        end_time: int,
+        batch_limit: int = 1000,
+        ccxt_timeout_ms: int = 10_000,
+    ) -> int:
+        series = parse_series_id(series_id)
+        tf_s = timeframe_to_seconds(series.timeframe)
+        segments = plan_segments(
+            start_time=max(0, int(start_time)),
+            end_time=int(end_time),
+            tf_s=int(tf_s),
+            candles_per_segment=max(1, int(batch_limit)) * max(1, int(self._config.pages_per_segment)),
+        )
+        checkpoint = CcxtBackfillCheckpoint.for_series(self._config.checkpoint_dir, series_id=series_id)
+        todo = [seg for seg in segments if not checkpoint.covers(seg.start_time, seg.end_time)]
+        if not todo:
+            checkpoint.clear()
+            return 0
+
+        results: queue.Queue[_SegmentResult] = queue.Queue()
+        pending: queue.Queue[BackfillSegment] = queue.Queue()
+        for seg in todo:
+            pending.put(seg)
+        limiter = self.rest_limiter(series)
+        markets = _SharedMarkets(limiter)
+
+        def worker() -> None:
+            try:
+                client = self._client_factory(series, timeout_ms=int(ccxt_timeout_ms))
+                markets.prime(client)
+            except Exception as exc:
+                _fail_pending(pending, results, exc)
+                return
+            try:
+                while True:
+                    try:
+                        seg = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        rows = _fetch_segment(
+                            client=client, series=series, segment=seg, batch_limit=int(batch_limit), limiter=limiter
+                        )
+                        results.put((seg.index, rows, None))
+                    except Exception as exc:
+                        results.put((seg.index, None, exc))
+            finally:
+                _close_client(client)
+
+        workers = max(1, min(int(self._config.concurrency), len(todo)))
+        if workers == 1:
+            worker()
+            return self._merge(candle_store, series_id, todo, pending, results, checkpoint)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ccxt-backfill") as pool:
+            for _ in range(workers):
+                pool.submit(worker)
+            return self._merge(candle_store, series_id, todo, pending, results, checkpoint)
+
+    @staticmethod
+    def _merge(
+        candle_store: CandleStore,
+        series_id: str,
+        todo: list[BackfillSegment],
+        pending: queue.Queue[BackfillSegment],
+        results: queue.Queue[_SegmentResult],
+        checkpoint: CcxtBackfillCheckpoint,
+    ) -> int:
+        """
+        Write resolved segments in segment order: each contiguous run becomes one bulk upsert + checkpoint.
+        The first failed segment ends the write (unstarted segments are cancelled, later ones discarded).
+        """
+        resolved: dict[int, tuple[list[CandleClosed] | None, BaseException | None]] = {}
+        next_pos = 0
+        written = 0
+        first_error: BaseException | None = None
+        for _ in range(len(todo)):
+            index, rows, error = results.get()
+            if first_error is not None:
+                continue
+            if error is not None:
+                _fail_pending(pending, results, error)
+            resolved[index] = (rows, error)
+            batch: list[CandleClosed] = []
+            flushed: list[BackfillSegment] = []
+            while next_pos < len(todo) and todo[next_pos].index in resolved:
+                seg = todo[next_pos]
+                seg_rows, seg_error = resolved.pop(seg.index)
+                if seg_error is not None:
+                    first_error = seg_error
+                    break
+                next_pos += 1
+                batch.extend(seg_rows or ())
+                flushed.append(seg)
+            if batch:
+                with candle_store.connect() as conn:
+                    candle_store.upsert_many_closed_in_conn(conn, series_id, batch)
+                    conn.commit()
+                written += len(batch)
+            if flushed:
+                checkpoint.mark_done([(seg.start_time, seg.end_time) for seg in flushed])
+        if first_error is not None:
+            raise first_error
+        checkpoint.clear()
+        return written
+
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..core.series_id import SeriesId
+from .binance_endpoints import apply_ccxt_rest_overrides, resolve_binance_endpoints
 
 
 def _make_exchange_client(series: SeriesId, *, timeout_ms: int = 10_000):
@@ -26,6 +27,7 @@ def _make_exchange_client(series: SeriesId, *, timeout_ms: int = 10_000):
             session.trust_env = True
         except Exception:
             pass
+    apply_ccxt_rest_overrides(exchange, resolve_binance_endpoints(), market=series.market)
     return exchange
 
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from fastapi import APIRouter, FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 
-from ..deps import ApiGatesDep, CandleStoreDep, IngestSupervisorDep, RuntimeMetricsDep
+from ..deps import ApiGatesDep, CandleStoreDep, IngestSupervisorDep, IngestTracerDep, RuntimeMetricsDep
+from ..runtime.ingest_trace import render_collapsed_stacks
 from .kline_health import analyze_series_health
 
 router = APIRouter()
@@ -43,5 +47,25 @@ def get_market_runtime_metrics(api_gates: ApiGatesDep, runtime_metrics: RuntimeM
     return runtime_metrics.snapshot()
 
 
+@router.get("/api/market/debug/ingest_traces", response_model=None)
+def get_market_ingest_traces(
+    limit: int = Query(50, ge=1, le=1000),
+    series_id: str | None = Query(None, min_length=1),
+    format: Literal["json", "collapsed"] = Query("json"),
+    *,
+    api_gates: ApiGatesDep,
+    tracer: IngestTracerDep,
+) -> dict | PlainTextResponse:
+    if not api_gates.debug_api:
+        raise HTTPException(status_code=404, detail="not_found")
+    traces = tracer.recent(limit=int(limit), series_id=series_id)
+    if format == "collapsed":
+        return PlainTextResponse(content=render_collapsed_stacks(traces))
+    return {
+        **tracer.stats(),
+        "traces": [trace.to_dict() for trace in traces],
+    }
+
+
 def register_market_debug_routes(app: FastAPI) -> None:
     app.include_router(router)
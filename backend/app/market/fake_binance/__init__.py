@@ -0,0 +1,11 @@
+from .app import create_fake_binance_app
+from .book import FakeBinanceConfig, FakeKlineBook, load_recorded_klines
+from .server import FakeBinanceServer
+
+__all__ = [
+    "FakeBinanceConfig",
+    "FakeBinanceServer",
+    "FakeKlineBook",
+    "create_fake_binance_app",
+    "load_recorded_klines",
+]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, Query, WebSocket
+from starlette.websockets import WebSocketDisconnect
+
+from .book import FakeKlineBook
+
+
+def _parse_stream(book: FakeKlineBook, stream: str) -> str | None:
+    symbol, _, kind = str(stream).strip().partition("@")
+    symbol_id = symbol.upper()
+    if kind != f"kline_{book.interval}" or symbol_id not in book.symbols:
+        return None
+    return symbol_id
+
+
+class _StreamState:
+    __slots__ = ("name", "symbol_id", "next_idx", "forming_sent")
+
+    def __init__(self, *, name: str, symbol_id: str, next_idx: int) -> None:
+        self.name = name
+        self.symbol_id = symbol_id
+        self.next_idx = next_idx
+        self.forming_sent = 0
+
+
+async def _inject_latency(book: FakeKlineBook) -> None:
+    cfg = book.config
+    delay_ms = float(cfg.latency_ms) + random.random() * float(cfg.jitter_ms)
+    if delay_ms > 0:
+        await asyncio.sleep(delay_ms / 1000.0)
+
+
+def _apply_control(book: FakeKlineBook, states: dict[str, _StreamState], msg: Any) -> dict[str, Any]:
+    """Binance live subscribe API: SUBSCRIBE / UNSUBSCRIBE / LIST_SUBSCRIPTIONS on an open socket."""
+    req_id = msg.get("id") if isinstance(msg, dict) else None
+    method = str(msg.get("method") or "") if isinstance(msg, dict) else ""
+    params = [str(p) for p in (msg.get("params") or [])] if isinstance(msg, dict) else []
+    if method == "LIST_SUBSCRIPTIONS":
+        return {"result": sorted(states), "id": req_id}
+    if method == "SUBSCRIBE":
+        resolved = {name: _parse_stream(book, name) for name in params}
+        if any(symbol_id is None for symbol_id in resolved.values()):
+            return {"error": {"code": 2, "msg": "Invalid request: unknown stream"}, "id": req_id}
+        for name, symbol_id in resolved.items():
+            if name not in states and symbol_id is not None:
+                states[name] = _StreamState(name=name, symbol_id=symbol_id, next_idx=book.head_index(symbol_id))
+        return {"result": None, "id": req_id}
+    if method == "UNSUBSCRIBE":
+        for name in params:
+            states.pop(name, None)
+        return {"result": None, "id": req_id}
+    return {"error": {"code": 1, "msg": f"Unknown method: {method}"}, "id": req_id}
+
+
+async def _serve_streams(ws: WebSocket, book: FakeKlineBook, streams: list[str], *, combined: bool) -> None:
+    cfg = book.config
+    states: dict[str, _StreamState] = {}
+    for name in streams:
+        symbol_id = _parse_stream(book, name)
+        if symbol_id is None:
+            await ws.close(code=1008)
+            return
+        states[name] = _StreamState(name=name, symbol_id=symbol_id, next_idx=book.head_index(symbol_id))
+    await ws.accept()
+
+    forming = max(0, int(cfg.forming_per_candle))
+    step_s = 1.0 / max(1e-6, float(cfg.tick_hz) * float(forming + 1))
+    latency_s = float(cfg.latency_ms) / 1000.0
+    jitter_s = float(cfg.jitter_ms) / 1000.0
+    limit = max(0, int(cfg.disconnect_after_messages))
+    # (due_at, text): messages are produced on the book clock and released after the injected latency.
+    pending: deque[tuple[float, str]] = deque()
+    sent = 0
+
+    def _push(body: dict[str, Any]) -> None:
+        due = time.monotonic() + latency_s + random.random() * jitter_s
+        pending.append((due, json.dumps(body, separators=(",", ":"))))
+
+    def _emit(state: _StreamState, payload: dict[str, Any]) -> None:
+        _push({"stream": state.name, "data": payload} if combined else payload)
+
+    async def _read_controls() -> None:
+        while True:
+            text = await ws.receive_text()
+            try:
+                msg = json.loads(text)
+            except ValueError:
+                continue
+            _push(_apply_control(book, states, msg))
+
+    reader = asyncio.create_task(_read_controls())
+    try:
+        while not reader.done():
+            now = book.now()
+            for state in list(states.values()):
+                head = book.head_index(state.symbol_id, now=now)
+                while state.next_idx < head:
+                    _emit(state, book.kline_event(state.symbol_id, state.next_idx, final=True))
+                    state.next_idx += 1
+                    state.forming_sent = 0
+                if forming and state.forming_sent < forming:
+                    state.forming_sent += 1
+                    fraction = state.forming_sent / float(forming + 1)
+                    _emit(state, book.kline_event(state.symbol_id, state.next_idx, final=False, fraction=fraction))
+            mono = time.monotonic()
+            while pending and pending[0][0] <= mono:
+                await ws.send_text(pending.popleft()[1])
+                sent += 1
+                if limit and sent >= limit:
+                    await ws.close(code=1001)
+                    return
+            await asyncio.sleep(min(step_s, 0.05) if not pending else max(0.0, min(step_s, pending[0][0] - mono)))
+    except (WebSocketDisconnect, RuntimeError):
+        return
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+
+def create_fake_binance_app(book: FakeKlineBook) -> FastAPI:
+    """Binance-compatible subset: spot `/api/v3/*`, futures `/fapi/v1/*`, `/ws/<stream>` and `/stream?streams=`."""
+    app = FastAPI(title="fake-binance", docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.book = book
+    app.state.ws_connections = 0
+    app.state.ws_active = 0
+
+    def _register_rest(prefix: str, *, futures: bool) -> None:
+        async def exchange_info() -> dict[str, Any]:
+            await _inject_latency(book)
+            return book.exchange_info(futures=futures)
+
+        async def klines(
+            symbol: str = Query(...),
+            interval: str = Query(...),
+            startTime: int | None = Query(None),
+            endTime: int | None = Query(None),
+            limit: int = Query(500),
+        ) -> list[list[Any]]:
+            await _inject_latency(book)
+            symbol_id = symbol.upper()
+            if symbol_id not in book.symbols:
+                raise HTTPException(status_code=400, detail={"code": -1121, "msg": "Invalid symbol."})
+            if interval != book.interval:
+                raise HTTPException(status_code=400, detail={"code": -1120, "msg": "Invalid interval."})
+            return book.rest_klines(symbol_id, start_ms=startTime, end_ms=endTime, limit=limit)
+
+        async def ticker_24hr() -> list[dict[str, Any]]:
+            await _inject_latency(book)
+            return book.tickers()
+
+        async def server_time() -> dict[str, int]:
+            return {"serverTime": int(book.now() * 1000)}
+
+        app.add_api_route(f"{prefix}/exchangeInfo", exchange_info, methods=["GET"])
+        app.add_api_route(f"{prefix}/klines", klines, methods=["GET"])
+        app.add_api_route(f"{prefix}/ticker/24hr", ticker_24hr, methods=["GET"])
+        app.add_api_route(f"{prefix}/time", server_time, methods=["GET"])
+
+    _register_rest("/api/v3", futures=False)
+    _register_rest("/fapi/v1", futures=True)
+
+    async def _track(ws: WebSocket, streams: list[str], *, combined: bool) -> None:
+        app.state.ws_connections += 1
+        app.state.ws_active += 1
+        try:
+            await _serve_streams(ws, book, streams, combined=combined)
+        finally:
+            app.state.ws_active -= 1
+
+    @app.websocket("/ws/{stream}")
+    async def single_stream(ws: WebSocket, stream: str) -> None:
+        await _track(ws, [stream], combined=False)
+
+    @app.websocket("/stream")
+    async def combined_stream(ws: WebSocket) -> None:
+        streams = [s for s in str(ws.query_params.get("streams") or "").split("/") if s]
+        await _track(ws, streams, combined=True)
+
+    return app
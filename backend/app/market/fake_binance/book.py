@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from ...core.timeframe import timeframe_to_seconds
+
+_KNOWN_BASES = ("BTC", "ETH", "SOL", "BNB", "XRP", "DOGE", "ADA", "AVAX", "LINK", "DOT")
+_Row = tuple[int, float, float, float, float, float]
+
+
+@dataclass(frozen=True)
+class FakeBinanceConfig:
+    symbol_count: int = 5
+    quote_asset: str = "USDT"
+    timeframe: str = "1m"
+    history_candles: int = 1000
+    tick_hz: float = 1.0
+    forming_per_candle: int = 0
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    disconnect_after_messages: int = 0
+    seed: int = 7
+    start_time: int = 0
+    recorded_path: str = ""
+
+
+def _unit(seed: int, key: str) -> float:
+    return (zlib.crc32(f"{seed}:{key}".encode("utf-8")) & 0xFFFFFFFF) / 4294967296.0
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.8f}".rstrip("0").rstrip(".")
+
+
+def load_recorded_klines(path: Path) -> dict[str, list[_Row]]:
+    """Recorded jsonl (fixtures format: symbol/open_time/open/high/low/close/volume) keyed by Binance symbol id."""
+    out: dict[str, list[_Row]] = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        symbol_id = str(row["symbol"]).split(":", 1)[0].replace("/", "").upper()
+        out.setdefault(symbol_id, []).append(
+            (
+                int(row["open_time"]),
+                float(row["open"]),
+                float(row["high"]),
+                float(row["low"]),
+                float(row["close"]),
+                float(row["volume"]),
+            )
+        )
+    for rows in out.values():
+        rows.sort(key=lambda r: r[0])
+    return out
+
+
+class FakeKlineBook:
+    """
+    Deterministic kline source shared by the fake REST and WS endpoints.
+    - Candle `i` of a symbol is a pure function of (seed, symbol, i), so REST and WS always agree.
+    - The head advances with wall time at `tick_hz` closed candles per second (time-compressed when
+      `tick_hz * tf > 1`), starting `history_candles` after `start_time`.
+    - Recorded symbols serve their recorded rows and stop advancing when the recording ends.
+    """
+
+    def __init__(self, config: FakeBinanceConfig, *, clock: Callable[[], float] = time.time) -> None:
+        self.config = config
+        self._clock = clock
+        self.tf_s = timeframe_to_seconds(config.timeframe)
+        self.interval = str(config.timeframe)
+        self.started_at = float(clock())
+        if int(config.start_time) > 0:
+            self.start_time = (int(config.start_time) // self.tf_s) * self.tf_s
+        else:
+            self.start_time = (int(self.started_at) // self.tf_s - int(config.history_candles)) * self.tf_s
+        self.recorded = load_recorded_klines(Path(config.recorded_path)) if config.recorded_path else {}
+        quote = str(config.quote_asset).upper()
+        bases = [_KNOWN_BASES[i] if i < len(_KNOWN_BASES) else f"F{i:03d}" for i in range(max(0, int(config.symbol_count)))]
+        self.symbols: dict[str, tuple[str, str]] = {f"{base}{quote}": (base, quote) for base in bases}
+        for symbol_id in self.recorded:
+            if symbol_id not in self.symbols and symbol_id.endswith(quote):
+                self.symbols[symbol_id] = (symbol_id[: -len(quote)], quote)
+
+    def now(self) -> float:
+        return float(self._clock())
+
+    def head_index(self, symbol_id: str, *, now: float | None = None) -> int:
+        """Number of closed candles currently visible for `symbol_id`."""
+        at = self.now() if now is None else float(now)
+        head = int(self.config.history_candles) + int(max(0.0, at - self.started_at) * float(self.config.tick_hz))
+        recorded = self.recorded.get(symbol_id)
+        return min(head, len(recorded)) if recorded is not None else head
+
+    def index_of(self, symbol_id: str, open_time_s: int) -> int:
+        recorded = self.recorded.get(symbol_id)
+        if recorded is not None:
+            lo, hi = 0, len(recorded)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if recorded[mid][0] < open_time_s:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+        return max(0, -(-(int(open_time_s) - self.start_time) // self.tf_s))
+
+    def _close_at(self, symbol_id: str, idx: int) -> float:
+        seed = int(self.config.seed)
+        base = 10.0 + 50000.0 * _unit(seed, f"{symbol_id}:base") ** 3
+        phase = 6.283 * _unit(seed, f"{symbol_id}:phase")
+        trend = 0.04 * math.sin(idx / 97.0 + phase) + 0.015 * math.sin(idx / 13.0)
+        noise = (_unit(seed, f"{symbol_id}:{idx}") - 0.5) * 0.004
+        return base * (1.0 + trend + noise)
+
+    def candle(self, symbol_id: str, idx: int) -> _Row:
+        recorded = self.recorded.get(symbol_id)
+        if recorded is not None:
+            return recorded[idx]
+        close = self._close_at(symbol_id, idx)
+        open_ = self._close_at(symbol_id, idx - 1) if idx > 0 else close
+        wick = 0.001 * _unit(int(self.config.seed), f"{symbol_id}:{idx}:wick")
+        volume = 1.0 + 100.0 * _unit(int(self.config.seed), f"{symbol_id}:{idx}:vol")
+        return (
+            self.start_time + idx * self.tf_s,
+            round(open_, 4),
+            round(max(open_, close) * (1.0 + wick), 4),
+            round(min(open_, close) * (1.0 - wick), 4),
+            round(close, 4),
+            round(volume, 4),
+        )
+
+    def rest_klines(self, symbol_id: str, *, start_ms: int | None, end_ms: int | None, limit: int) -> list[list[Any]]:
+        head = self.head_index(symbol_id)
+        limit = max(1, min(1500, int(limit)))
+        if start_ms is not None:
+            first = self.index_of(symbol_id, int(start_ms) // 1000)
+        elif end_ms is not None:
+            first = max(0, self.index_of(symbol_id, int(end_ms) // 1000 + 1) - limit)
+        else:
+            first = max(0, head - limit)
+        rows: list[list[Any]] = []
+        for idx in range(first, min(head, first + limit)):
+            t, o, h, l, c, v = self.candle(symbol_id, idx)
+            if end_ms is not None and t * 1000 > int(end_ms):
+                break
+            rows.append(
+                [t * 1000, _fmt(o), _fmt(h), _fmt(l), _fmt(c), _fmt(v), (t + self.tf_s) * 1000 - 1, _fmt(v * c), 100, "0", "0", "0"]
+            )
+        return rows
+
+    def kline_event(self, symbol_id: str, idx: int, *, final: bool, fraction: float = 1.0) -> dict[str, Any]:
+        t, o, h, l, c, v = self.candle(symbol_id, idx)
+        if not final:
+            frac = max(0.0, min(1.0, float(fraction)))
+            c = o + (c - o) * frac
+            h, l, v = max(o, c), min(o, c), v * frac
+        return {
+            "e": "kline",
+            "E": int(self.now() * 1000),
+            "s": symbol_id,
+            "k": {
+                "t": t * 1000,
+                "T": (t + self.tf_s) * 1000 - 1,
+                "s": symbol_id,
+                "i": self.interval,
+                "o": _fmt(o),
+                "c": _fmt(c),
+                "h": _fmt(h),
+                "l": _fmt(l),
+                "v": _fmt(v),
+                "n": 100,
+                "x": bool(final),
+                "q": _fmt(v * c),
+            },
+        }
+
+    def exchange_info(self, *, futures: bool) -> dict[str, Any]:
+        symbols: list[dict[str, Any]] = []
+        for symbol_id, (base, quote) in sorted(self.symbols.items()):
+            item: dict[str, Any] = {
+                "symbol": symbol_id,
+                "status": "TRADING",
+                "baseAsset": base,
+                "quoteAsset": quote,
+                "baseAssetPrecision": 8,
+                "quotePrecision": 8,
+                "quoteAssetPrecision": 8,
+                "orderTypes": ["LIMIT", "MARKET"],
+                "filters": [
+                    {"filterType": "PRICE_FILTER", "minPrice": "0.0001", "maxPrice": "1000000", "tickSize": "0.0001"},
+                    {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "100000", "stepSize": "0.001"},
+                ],
+            }
+            if futures:
+                item.update(
+                    pair=symbol_id,
+                    contractType="PERPETUAL",
+                    deliveryDate=4133404800000,
+                    onboardDate=1569398400000,
+                    marginAsset=quote,
+                    pricePrecision=4,
+                    quantityPrecision=3,
+                    underlyingType="COIN",
+                    timeInForce=["GTC"],
+                )
+            else:
+                item.update(isSpotTradingAllowed=True, isMarginTradingAllowed=False, permissions=["SPOT"])
+            symbols.append(item)
+        return {"timezone": "UTC", "serverTime": int(self.now() * 1000), "rateLimits": [], "symbols": symbols}
+
+    def tickers(self) -> list[dict[str, Any]]:
+        out: list[dict[str, Any]] = []
+        for symbol_id in sorted(self.symbols):
+            head = self.head_index(symbol_id)
+            if head <= 0:
+                continue
+            last = self.candle(symbol_id, head - 1)
+            first = self.candle(symbol_id, max(0, head - 1440))
+            change = (last[4] - first[1]) / first[1] * 100.0 if first[1] else 0.0
+            out.append(
+                {
+                    "symbol": symbol_id,
+                    "lastPrice": _fmt(last[4]),
+                    "priceChangePercent": f"{change:.3f}",
+                    "quoteVolume": _fmt(last[4] * last[5] * 1440.0),
+                }
+            )
+        return out
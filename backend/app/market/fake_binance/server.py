@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+
+from .app import create_fake_binance_app
+from .book import FakeBinanceConfig, FakeKlineBook
+
+
+class FakeBinanceServer:
+    """
+    Runs the fake exchange on a background uvicorn thread (port 0 = pick a free port).
+    `env()` returns the settings that point ws ingest, ccxt backfill and the market list at it.
+    """
+
+    def __init__(self, config: FakeBinanceConfig, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.book = FakeKlineBook(config)
+        self.app = create_fake_binance_app(self.book)
+        self._host = str(host)
+        self._port = int(port)
+        self._server = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return int(self._port)
+
+    @property
+    def http_base(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    @property
+    def ws_base(self) -> str:
+        return f"ws://{self._host}:{self._port}"
+
+    def env(self) -> dict[str, str]:
+        return {
+            "TRADE_CANVAS_BINANCE_SPOT_BASE_URL": self.http_base,
+            "TRADE_CANVAS_BINANCE_FUTURES_BASE_URL": self.http_base,
+            "TRADE_CANVAS_BINANCE_SPOT_WS_BASE_URL": self.ws_base,
+            "TRADE_CANVAS_BINANCE_FUTURES_WS_BASE_URL": self.ws_base,
+        }
+
+    def start(self, *, timeout_s: float = 10.0) -> FakeBinanceServer:
+        import uvicorn
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self._host, self._port))
+        self._port = int(sock.getsockname()[1])
+        config = uvicorn.Config(self.app, log_level="warning", lifespan="off", ws_ping_interval=None)
+        server = uvicorn.Server(config)
+        self._server = server
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(server.serve(sockets=[sock])),
+            name="fake-binance",
+            daemon=True,
+        )
+        self._thread.start()
+        deadline = time.monotonic() + float(timeout_s)
+        while not server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("fake_binance_server_start_timeout")
+            time.sleep(0.01)
+        return self
+
+    def stop(self, *, timeout_s: float = 5.0) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=float(timeout_s))
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> FakeBinanceServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..core.candle_record import CandleRecord
+
+_OHLCV_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+_TIMESTAMP_DIVISORS = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+
+@dataclass(frozen=True)
+class FeatherFileMeta:
+    """What the last tail read learned about a file, valid while (mtime_ns, size) is unchanged."""
+
+    mtime_ns: int
+    size: int
+    rows: int
+    tail_rows: int
+    tail_first_time: int | None
+    last_time: int | None
+
+
+_meta_cache: dict[Path, FeatherFileMeta] = {}
+_meta_lock = threading.Lock()
+
+
+def _signature(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return int(st.st_mtime_ns), int(st.st_size)
+
+
+def cached_feather_meta(path: Path) -> FeatherFileMeta | None:
+    """Cached metadata for `path`, or None when the file changed since it was last read."""
+    try:
+        mtime_ns, size = _signature(path)
+    except OSError:
+        return None
+    with _meta_lock:
+        meta = _meta_cache.get(path)
+    if meta is None or meta.mtime_ns != mtime_ns or meta.size != size:
+        return None
+    return meta
+
+
+def _tail_table(path: Path, *, limit: int) -> tuple[Any, int]:
+    """Memory-map the file and materialize only the trailing record batches covering `limit` rows."""
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.feather as feather  # type: ignore[import-untyped]
+
+    with pa.memory_map(str(path), "r") as source:
+        try:
+            reader = pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            # Feather v1 is not an Arrow IPC file; read it whole (still memory-mapped).
+            table = feather.read_table(path, columns=list(_OHLCV_COLUMNS), memory_map=True)
+            return table, int(table.num_rows)
+        missing = [name for name in _OHLCV_COLUMNS if reader.schema.get_field_index(name) < 0]
+        if missing:
+            raise ValueError(f"missing_ohlcv_columns:{','.join(missing)}")
+        batches: list[Any] = []
+        rows = 0
+        idx = reader.num_record_batches
+        while idx > 0 and rows < limit:
+            idx -= 1
+            batch = reader.get_batch(idx).select(list(_OHLCV_COLUMNS))
+            batches.append(batch)
+            rows += int(batch.num_rows)
+        if not batches:
+            return reader.schema.empty_table().select(list(_OHLCV_COLUMNS)), 0
+        batches.reverse()
+        # Row counts come from the IPC footer/message headers; batch bodies stay unread.
+        return pa.Table.from_batches(batches), int(reader.count_rows())
+
+
+def _candle_times(column: Any) -> Any:
+    """Arrow `date` column -> numpy int64 epoch seconds."""
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+    col_type = column.type
+    if pa.types.is_timestamp(col_type):
+        return column.cast(pa.int64()).to_numpy() // _TIMESTAMP_DIVISORS[col_type.unit]
+    if pa.types.is_integer(col_type):
+        ts = column.cast(pa.int64()).to_numpy()
+        # Heuristic: seconds ~ 1e9, ms ~ 1e12, ns ~ 1e18.
+        max_v = int(ts.max()) if len(ts) else 0
+        if max_v > 10**14:
+            return ts // 1_000_000_000
+        if max_v > 10**11:
+            return ts // 1000
+        return ts
+    if pa.types.is_string(col_type) or pa.types.is_large_string(col_type):
+        parsed = column.cast(pa.timestamp("ns", tz="UTC"))
+        return parsed.cast(pa.int64()).to_numpy() // 1_000_000_000
+    raise ValueError(f"unsupported_date_type:{col_type}")
+
+
+def read_freqtrade_tail(path: Path, *, limit: int, after_time: int | None = None) -> list[CandleRecord]:
+    """
+    Last `limit` OHLCV rows of a freqtrade feather file (sorted, de-duplicated keeping the last row),
+    optionally only those newer than `after_time`. Reads Arrow columns directly, no pandas.
+    """
+    import numpy as np  # type: ignore[import-untyped]
+    import pyarrow.compute as pc  # type: ignore[import-untyped]
+
+    limit = max(1, int(limit))
+    mtime_ns, size = _signature(path)
+    table, total_rows = _tail_table(path, limit=limit)
+    if table.num_rows > 0:
+        valid = pc.is_valid(table.column(0))
+        for name in _OHLCV_COLUMNS[1:]:
+            valid = pc.and_(valid, pc.is_valid(table.column(name)))
+        table = table.filter(valid)
+    if table.num_rows <= 0:
+        _remember(path, FeatherFileMeta(mtime_ns, size, total_rows, tail_rows=0, tail_first_time=None, last_time=None))
+        return []
+
+    times = _candle_times(table.column("date")).astype(np.int64, copy=False)
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    keep = np.append(times[1:] != times[:-1], True)
+    order, times = order[keep][-limit:], times[keep][-limit:]
+    _remember(
+        path,
+        FeatherFileMeta(
+            mtime_ns,
+            size,
+            total_rows,
+            tail_rows=len(times),
+            tail_first_time=int(times[0]),
+            last_time=int(times[-1]),
+        ),
+    )
+    if after_time is not None:
+        newer = times > int(after_time)
+        order, times = order[newer], times[newer]
+    columns = [table.column(name).to_numpy()[order].astype(np.float64).tolist() for name in _OHLCV_COLUMNS[1:]]
+    return list(map(CandleRecord._make, zip(times.tolist(), *columns)))
+
+
+def _remember(path: Path, meta: FeatherFileMeta) -> None:
+    with _meta_lock:
+        _meta_cache[path] = meta
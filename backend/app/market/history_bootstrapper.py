@@ -4,9 +4,9 @@ import json
 from pathlib import Path
 
 from ..core.config import load_settings
-from ..core.schemas import CandleClosed
 from ..core.series_id import SeriesId, parse_series_id
 from ..storage.candle_store import CandleStore
+from .freqtrade_history import cached_feather_meta, read_freqtrade_tail
 
 
 def _resolve_freqtrade_datadir() -> Path | None:
@@ -111,64 +111,41 @@ def _history_source(value: str | None) -> str:
     return str(value).strip().lower()
 
 
-def _read_freqtrade_feather(path: Path, *, limit: int) -> list[CandleClosed]:
-    import pandas as pd  # type: ignore[import-untyped]
-    import pyarrow.feather as feather  # type: ignore[import-untyped]
-
-    table = feather.read_table(path, columns=["date", "open", "high", "low", "close", "volume"])
-    if table.num_rows <= 0:
-        return []
-
-    df = table.to_pandas()
-    if df.empty:
-        return []
-
-    date_col = df["date"]
-    if pd.api.types.is_datetime64_any_dtype(date_col):
-        ts_ns = date_col.astype("int64", copy=False)
-        candle_time = (ts_ns // 1_000_000_000).astype("int64", copy=False)
-    elif pd.api.types.is_integer_dtype(date_col):
-        ts = date_col.astype("int64", copy=False)
-        # Heuristic: seconds ~ 1e9, ms ~ 1e12, ns ~ 1e18.
-        max_v = int(ts.max()) if not ts.empty else 0
-        if max_v > 10**14:
-            candle_time = (ts // 1_000_000_000).astype("int64", copy=False)
-        elif max_v > 10**11:
-            candle_time = (ts // 1000).astype("int64", copy=False)
-        else:
-            candle_time = ts
-    else:
-        parsed = pd.to_datetime(date_col, utc=True, errors="coerce")
-        parsed = parsed.dropna()
-        if parsed.empty:
-            return []
-        ts_ns = parsed.astype("int64", copy=False)
-        candle_time = (ts_ns // 1_000_000_000).astype("int64", copy=False)
-        df = df.loc[parsed.index]
-
-    df = df.assign(candle_time=candle_time)
-    df = df.dropna(subset=["candle_time", "open", "high", "low", "close", "volume"])
-    if df.empty:
-        return []
-
-    df = df.sort_values("candle_time", kind="stable")
-    df = df.drop_duplicates(subset=["candle_time"], keep="last")
-    if limit > 0 and len(df) > limit:
-        df = df.iloc[-limit:].copy()
-
-    out: list[CandleClosed] = []
-    for row in df.itertuples(index=False):
-        out.append(
-            CandleClosed(
-                candle_time=int(getattr(row, "candle_time")),
-                open=float(getattr(row, "open")),
-                high=float(getattr(row, "high")),
-                low=float(getattr(row, "low")),
-                close=float(getattr(row, "close")),
-                volume=float(getattr(row, "volume")),
-            )
+def _tail_already_imported(store: CandleStore, *, series_id: str, path: Path, limit: int) -> bool:
+    """Unchanged file whose last-read tail (at least `limit` rows) is still fully present in the store."""
+    meta = cached_feather_meta(path)
+    if meta is None or meta.last_time is None or meta.tail_first_time is None:
+        return False
+    if int(meta.tail_rows) < int(limit) and int(meta.tail_rows) < int(meta.rows):
+        return False
+    present = store.count_closed_between_times(series_id, start_time=meta.tail_first_time, end_time=meta.last_time)
+    return int(present) >= int(meta.tail_rows)
+
+
+def _import_missing_tail(store: CandleStore, *, series_id: str, path: Path, limit: int) -> int:
+    if _tail_already_imported(store, series_id=series_id, path=path, limit=limit):
+        return 0
+    try:
+        candles = read_freqtrade_tail(path, limit=max(int(limit), 1))
+    except (OSError, ValueError):
+        return 0
+    if not candles:
+        return 0
+
+    with store.connect() as conn:
+        existing = store.existing_closed_times_in_conn(
+            conn,
+            series_id=series_id,
+            candle_times=[c.candle_time for c in candles],
         )
-    return out
+        if existing:
+            candles = [c for c in candles if c.candle_time not in existing]
+        if not candles:
+            return 0
+        store.upsert_many_closed_in_conn(conn, series_id, candles)
+        conn.commit()
+
+    return len(candles)
 
 
 def maybe_bootstrap_from_freqtrade(
@@ -196,19 +173,7 @@ def maybe_bootstrap_from_freqtrade(
     path = _find_freqtrade_ohlcv_file(series)
     if path is None:
         return 0
-
-    try:
-        candles = _read_freqtrade_feather(path, limit=max(int(limit), 1))
-    except (OSError, ValueError):
-        return 0
-    if not candles:
-        return 0
-
-    with store.connect() as conn:
-        store.upsert_many_closed_in_conn(conn, series_id, candles)
-        conn.commit()
-
-    return len(candles)
+    return _import_missing_tail(store, series_id=series_id, path=path, limit=limit)
 
 
 def backfill_tail_from_freqtrade(
@@ -219,8 +184,10 @@ def backfill_tail_from_freqtrade(
     market_history_source: str | None = None,
 ) -> int:
     """
-    Best-effort tail backfill (append/update) from freqtrade datadir.
-    Unlike maybe_bootstrap_from_freqtrade, this runs even if the store already has data.
+    Best-effort tail backfill from freqtrade datadir: append-only, rows already in the store are never rewritten.
+    Unlike maybe_bootstrap_from_freqtrade, this runs even if the store already has data;
+    only candles missing from the store (beyond head or holes inside the tail) are written,
+    and an unchanged file whose tail is already stored is skipped without being opened.
     Returns the number of candles written (0 if skipped / not found).
     """
     if _history_source(market_history_source) != "freqtrade":
@@ -234,16 +201,4 @@ def backfill_tail_from_freqtrade(
     path = _find_freqtrade_ohlcv_file(series)
     if path is None:
         return 0
-
-    try:
-        candles = _read_freqtrade_feather(path, limit=max(int(limit), 1))
-    except (OSError, ValueError):
-        return 0
-    if not candles:
-        return 0
-
-    with store.connect() as conn:
-        store.upsert_many_closed_in_conn(conn, series_id, candles)
-        conn.commit()
-
-    return len(candles)
+    return _import_missing_tail(store, series_id=series_id, path=path, limit=limit)
@@ -119,14 +119,16 @@ class MarketIngestService:
             value=float(req.candle.candle_time),
             labels={"series_id": req.series_id},
         )
-        steps = [
-            {
+        steps: list[dict[str, object]] = []
+        for step in result.steps:
+            item: dict[str, object] = {
                 "name": str(step.name),
                 "ok": bool(step.ok),
                 "duration_ms": int(step.duration_ms),
             }
-            for step in result.steps
-        ]
+            if step.detail:
+                item["detail"] = dict(step.detail)
+            steps.append(item)
 
         if self._debug_enabled():
             self._debug_hub.emit(
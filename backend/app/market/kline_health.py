@@ -5,6 +5,7 @@ import time
 from typing import Any, Iterator
 
 from ..core.series_id import SeriesId, parse_series_id
+from ..storage.candle_gap_index import CandleGapIndex
 from ..storage.candle_store import CandleStore
 from ..core.timeframe import timeframe_to_seconds
 
@@ -18,6 +19,30 @@ def _base_series_id(series: SeriesId) -> str:
     ).raw
 
 
+def _gap_payload(*, prev_time: int, next_time: int, timeframe_s: int) -> dict[str, int]:
+    delta_seconds = int(next_time) - int(prev_time)
+    return {
+        "prev_time": int(prev_time),
+        "next_time": int(next_time),
+        "delta_seconds": int(delta_seconds),
+        "missing_candles": max(0, int(delta_seconds // int(timeframe_s) - 1)),
+    }
+
+
+def _indexed_recent_gaps(
+    index: CandleGapIndex,
+    *,
+    timeframe_s: int,
+    limit: int,
+) -> tuple[int, int | None, list[dict[str, int]]]:
+    max_gap_seconds = max((int(b) - int(a) for a, b in index.gaps()), default=None)
+    recent = [
+        _gap_payload(prev_time=a, next_time=b, timeframe_s=timeframe_s)
+        for a, b in index.recent_gaps(max(1, int(limit)))
+    ]
+    return int(index.gap_count), max_gap_seconds, recent
+
+
 def _query_recent_gaps(
     *,
     store: CandleStore,
@@ -41,14 +66,7 @@ def _query_recent_gaps(
                 if max_gap_seconds is None
                 else max(int(max_gap_seconds), int(delta_seconds))
             )
-            recent.append(
-                {
-                    "prev_time": int(prev_time),
-                    "next_time": int(candle_time),
-                    "delta_seconds": int(delta_seconds),
-                    "missing_candles": max(0, int(delta_seconds // int(timeframe_s) - 1)),
-                }
-            )
+            recent.append(_gap_payload(prev_time=prev_time, next_time=candle_time, timeframe_s=timeframe_s))
         prev_time = int(candle_time)
 
     recent_list = list(recent)
@@ -67,7 +85,8 @@ def _query_recent_bucket_completeness(
         return []
 
     base_series_id = _base_series_id(series)
-    base_head = store.head_time(base_series_id)
+    base_index = store.gap_index(base_series_id)
+    base_head = base_index.last_time if base_index is not None else store.head_time(base_series_id)
     if base_head is None:
         return []
 
@@ -75,6 +94,15 @@ def _query_recent_bucket_completeness(
     expected = int(timeframe_s // base_step)
     end_bucket = int(base_head // int(timeframe_s)) * int(timeframe_s)
     start_bucket = max(0, int(end_bucket) - max(0, int(buckets) - 1) * int(timeframe_s))
+    if base_index is not None:
+        return [
+            _bucket_payload(
+                bucket_open=bucket_open,
+                expected=expected,
+                have=base_index.count_between(bucket_open, bucket_open + int(timeframe_s) - base_step),
+            )
+            for bucket_open in range(int(start_bucket), int(end_bucket) + 1, int(timeframe_s))
+        ]
     base_start = max(0, int(start_bucket) - int(timeframe_s) + int(base_step))
     base_limit = max(
         128,
@@ -94,17 +122,19 @@ def _query_recent_bucket_completeness(
             t = int(bucket_open) + int(i) * int(base_step)
             if t in base_times:
                 have += 1
-        out.append(
-            {
-                "bucket_open_time": int(bucket_open),
-                "expected_minutes": int(expected),
-                "actual_minutes": int(have),
-                "missing_minutes": max(0, int(expected) - int(have)),
-            }
-        )
+        out.append(_bucket_payload(bucket_open=bucket_open, expected=expected, have=have))
     return out
 
 
+def _bucket_payload(*, bucket_open: int, expected: int, have: int) -> dict[str, int]:
+    return {
+        "bucket_open_time": int(bucket_open),
+        "expected_minutes": int(expected),
+        "actual_minutes": int(have),
+        "missing_minutes": max(0, int(expected) - int(have)),
+    }
+
+
 def analyze_series_health(
     *,
     store: CandleStore,
@@ -116,25 +146,33 @@ def analyze_series_health(
     series = parse_series_id(series_id)
     timeframe_s = int(timeframe_to_seconds(series.timeframe))
     now = int(now_time) if now_time is not None else int(time.time())
-    first_time = store.first_time(series_id)
-    head_time = store.head_time(series_id)
-    if first_time is None or head_time is None:
-        candle_count = 0
+    index = store.gap_index(series_id)
+    if index is not None:
+        first_time, head_time, candle_count = index.first_time, index.last_time, int(index.count)
+        gap_count, max_gap_seconds, recent_gaps = _indexed_recent_gaps(
+            index,
+            timeframe_s=timeframe_s,
+            limit=max(1, int(max_recent_gaps)),
+        )
     else:
-        candle_count = store.count_closed_between_times(
-            series_id,
-            start_time=int(first_time),
-            end_time=int(head_time),
+        first_time = store.first_time(series_id)
+        head_time = store.head_time(series_id)
+        if first_time is None or head_time is None:
+            candle_count = 0
+        else:
+            candle_count = store.count_closed_between_times(
+                series_id,
+                start_time=int(first_time),
+                end_time=int(head_time),
+            )
+        gap_count, max_gap_seconds, recent_gaps = _query_recent_gaps(
+            store=store,
+            series_id=series_id,
+            timeframe_s=timeframe_s,
+            limit=max(1, int(max_recent_gaps)),
         )
     lag_seconds = None if head_time is None else max(0, int(now) - int(head_time))
 
-    gap_count, max_gap_seconds, recent_gaps = _query_recent_gaps(
-        store=store,
-        series_id=series_id,
-        timeframe_s=timeframe_s,
-        limit=max(1, int(max_recent_gaps)),
-    )
-
     base_bucket_completeness = _query_recent_bucket_completeness(
         store=store,
         series=series,
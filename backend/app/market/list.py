@@ -7,7 +7,8 @@ from dataclasses import dataclass
 from typing import Any, Literal
 from urllib.request import Request, urlopen
 
-from ..core.flags import resolve_env_int, resolve_env_str
+from ..core.flags import resolve_env_int
+from .binance_endpoints import resolve_binance_endpoints
 
 
 @dataclass(frozen=True)
@@ -45,20 +46,6 @@ def _fetch_json(url: str, *, timeout_s: float = 5.0) -> Any:
     return json.loads(raw.decode("utf-8"))
 
 
-def _spot_base_url() -> str:
-    return resolve_env_str(
-        "TRADE_CANVAS_BINANCE_SPOT_BASE_URL",
-        fallback="https://api.binance.com",
-    ).rstrip("/")
-
-
-def _futures_base_url() -> str:
-    return resolve_env_str(
-        "TRADE_CANVAS_BINANCE_FUTURES_BASE_URL",
-        fallback="https://fapi.binance.com",
-    ).rstrip("/")
-
-
 def _exchangeinfo_ttl_s() -> int:
     return resolve_env_int(
         "TRADE_CANVAS_BINANCE_EXCHANGEINFO_TTL_S",
@@ -77,8 +64,9 @@ def _ticker_ttl_s() -> int:
 
 class BinanceMarketListService:
     def __init__(self) -> None:
-        self._spot_base = _spot_base_url()
-        self._futures_base = _futures_base_url()
+        endpoints = resolve_binance_endpoints()
+        self._spot_base = endpoints.spot_rest
+        self._futures_base = endpoints.futures_rest
         self._exchangeinfo_ttl_s = _exchangeinfo_ttl_s()
         self._ticker_ttl_s = _ticker_ttl_s()
         self._lock = threading.Lock()
@@ -9,6 +9,7 @@ from ..factor.orchestrator import FactorOrchestrator
 from ..feature.orchestrator import FeatureOrchestrator
 from ..ingest.supervisor import IngestSupervisor
 from ..ledger.sync_service import LedgerSyncService
+from .ccxt_backfill_engine import CcxtBackfillEngine
 from .runtime_components import (
     IngestContextBuildRequest,
     ReadContextBuildRequest,
@@ -24,9 +25,10 @@ from .runtime import (
     MarketRealtimeContext,
     MarketRuntime,
 )
-from ..pipelines import IngestPipeline
+from ..pipelines import IngestPipeline, IngestTelemetry
 from ..overlay.orchestrator import OverlayOrchestrator
 from ..runtime.flags import RuntimeFlags, load_runtime_flags
+from ..runtime.ingest_trace import IngestTracer
 from ..runtime.metrics import RuntimeMetrics
 from ..storage.candle_store import CandleStore
 from ..ws.hub import CandleHub
@@ -44,6 +46,8 @@ class MarketRuntimeBuildOptions:
     runtime_flags: RuntimeFlags | None = None
     ingest_pipeline: IngestPipeline | None = None
     feature_orchestrator: FeatureOrchestrator | None = None
+    ingest_tracer: IngestTracer | None = None
+    ccxt_backfill: CcxtBackfillEngine | None = None
 
 
 @dataclass(frozen=True)
@@ -72,13 +76,15 @@ def _build_runtime_bootstrap(
     overlay_orchestrator: OverlayOrchestrator,
     runtime_flags: RuntimeFlags | None,
     ingest_pipeline: IngestPipeline | None,
+    telemetry: IngestTelemetry,
 ) -> _RuntimeBootstrap:
     effective_runtime_flags = runtime_flags or load_runtime_flags()
     hub = CandleHub(
         publisher=_build_ws_publisher(
             settings=settings,
             runtime_flags=effective_runtime_flags,
-        )
+        ),
+        runtime_metrics=telemetry.runtime_metrics,
     )
     if ingest_pipeline is None:
         pipeline = IngestPipeline(
@@ -89,6 +95,7 @@ def _build_runtime_bootstrap(
             hub=hub,
             overlay_compensate_on_error=bool(effective_runtime_flags.enable_ingest_compensate_overlay_error),
             candle_compensate_on_error=bool(effective_runtime_flags.enable_ingest_compensate_new_candles),
+            telemetry=telemetry,
         )
     else:
         pipeline = ingest_pipeline
@@ -164,6 +171,7 @@ def build_market_runtime(
         overlay_orchestrator=overlay_orchestrator,
         runtime_flags=build_options.runtime_flags,
         ingest_pipeline=build_options.ingest_pipeline,
+        telemetry=IngestTelemetry(runtime_metrics=runtime_metrics, tracer=build_options.ingest_tracer),
     )
     read_build = build_read_context(
         ReadContextBuildRequest(
@@ -174,8 +182,10 @@ def build_market_runtime(
             ledger_sync_service=bootstrap.ledger_sync_service,
             runtime_flags=bootstrap.runtime_flags,
             runtime_metrics=runtime_metrics,
+            ccxt_backfill=build_options.ccxt_backfill,
         )
     )
+    factor_orchestrator.warm_ingest_plans(series_ids=read_build.context.whitelist.series_ids)
     derived_initial_backfill = _build_derived_initial_backfill(
         store=store,
         factor_orchestrator=factor_orchestrator,
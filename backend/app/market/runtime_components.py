@@ -25,6 +25,7 @@ from ..market.whitelist import load_market_whitelist
 from ..ws.hub import CandleHub
 from .backfill import backfill_market_gap_best_effort
 from .backfill_tracker import MarketBackfillProgressTracker
+from .ccxt_backfill_engine import CcxtBackfillEngine
 from .ingest_service import MarketIngestService
 from .ledger_warmup_service import MarketLedgerWarmupService
 from .list import BinanceMarketListService, MinIntervalLimiter
@@ -57,18 +58,26 @@ class ReadContextBuildRequest:
     ledger_sync_service: LedgerSyncService
     runtime_flags: RuntimeFlags
     runtime_metrics: RuntimeMetrics
+    ccxt_backfill: CcxtBackfillEngine | None = None
 
 
 def build_read_context(request: ReadContextBuildRequest) -> ReadBuildResult:
     backfill_state_path = None
     if bool(request.runtime_flags.enable_market_backfill_progress_persistence):
         backfill_state_path = request.settings.db_path.parent / "runtime_state" / "market_backfill_progress.json"
-    backfill_progress = MarketBackfillProgressTracker(state_path=backfill_state_path)
+    backfill_progress = MarketBackfillProgressTracker(
+        state_path=backfill_state_path,
+        flush_interval_s=float(request.runtime_flags.market_backfill_progress_flush_ms) / 1000.0,
+        runtime_metrics=request.runtime_metrics,
+    )
     reader_service = StoreCandleReadService(store=request.store)
+    ccxt_backfill = None
+    if bool(request.runtime_flags.enable_ccxt_backfill):
+        ccxt_backfill = request.ccxt_backfill or CcxtBackfillEngine()
     backfill_service = StoreBackfillService(
         store=request.store,
         gap_backfill_fn=lambda **kwargs: backfill_market_gap_best_effort(
-            enable_ccxt_backfill=bool(request.runtime_flags.enable_ccxt_backfill),
+            ccxt_backfill=ccxt_backfill,
             freqtrade_limit=int(request.runtime_flags.market_gap_backfill_freqtrade_limit),
             market_history_source=str(request.runtime_flags.market_history_source),
             ccxt_timeout_ms=int(request.runtime_flags.ccxt_timeout_ms),
@@ -86,6 +95,7 @@ def build_read_context(request: ReadContextBuildRequest) -> ReadBuildResult:
             enable_ccxt_backfill_on_read=bool(request.runtime_flags.enable_ccxt_backfill_on_read),
             enable_strict_closed_only=bool(request.runtime_flags.enable_strict_closed_only),
             ccxt_timeout_ms=int(request.runtime_flags.ccxt_timeout_ms),
+            ccxt_backfill=ccxt_backfill,
         ),
     )
     request.hub.set_gap_backfill_handler(
@@ -171,6 +181,9 @@ def build_ingest_context(request: IngestContextBuildRequest) -> MarketIngestCont
             batch_max=int(request.runtime_flags.binance_ws_batch_max),
             flush_s=float(request.runtime_flags.binance_ws_flush_s),
             forming_min_interval_ms=int(request.runtime_flags.market_forming_min_interval_ms),
+            mux_enabled=bool(request.runtime_flags.enable_binance_ws_mux),
+            mux_streams_per_socket=int(request.runtime_flags.binance_ws_streams_per_socket),
+            adaptive_flush=bool(request.runtime_flags.enable_binance_ws_adaptive_flush),
         ),
         guardrail=IngestGuardrailConfig(
             enabled=bool(request.runtime_flags.enable_ingest_loop_guardrail),
@@ -40,7 +40,7 @@ def best_effort_backfill_from_base_1m(
 
     base_start = max(0, int(start_time) - int(derived_tf_s) + int(base_tf_s))
     base_limit = max(20000, int((int(end_time) - int(base_start)) // int(base_tf_s)) + 16)
-    base_candles = store.get_closed_between_times(
+    base_candles = store.get_closed_records_between_times(
         base_series_id,
         start_time=int(base_start),
         end_time=int(end_time),
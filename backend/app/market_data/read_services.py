@@ -7,6 +7,7 @@ from typing import Callable
 from ..market.history_bootstrapper import backfill_tail_from_freqtrade
 from ..market.backfill import backfill_from_ccxt_range, backfill_market_gap_best_effort
 from ..market.backfill_tracker import MarketBackfillProgressTracker
+from ..market.ccxt_backfill_engine import CcxtBackfillEngine
 from ..market.health_service import compute_missing_to_time
 from ..core.schemas import CandleClosed
 from ..core.series_id import parse_series_id
@@ -57,6 +58,7 @@ class StoreBackfillOptions:
     enable_ccxt_backfill_on_read: bool = False
     enable_strict_closed_only: bool = False
     ccxt_timeout_ms: int = 10_000
+    ccxt_backfill: CcxtBackfillEngine | None = None
 
 
 class StoreBackfillService(BackfillService):
@@ -77,6 +79,7 @@ class StoreBackfillService(BackfillService):
         self._enable_ccxt_backfill_on_read = bool(opts.enable_ccxt_backfill_on_read)
         self._enable_strict_closed_only = bool(opts.enable_strict_closed_only)
         self._ccxt_timeout_ms = max(1000, int(opts.ccxt_timeout_ms))
+        self._ccxt_backfill = opts.ccxt_backfill
 
     def _best_effort_backfill_from_base_1m(
         self,
@@ -182,6 +185,7 @@ class StoreBackfillService(BackfillService):
                     start_time=int(start_time),
                     end_time=int(end_time),
                     ccxt_timeout_ms=int(self._ccxt_timeout_ms),
+                    engine=self._ccxt_backfill,
                 )
             except Exception as exc:
                 errors.append(f"ccxt_backfill_failed:{exc}")
@@ -7,6 +7,8 @@ from ..factor.store import FactorEventRow, FactorStore
 from ..storage.candle_store import CandleStore
 from .renderer_bucketing import collect_overlay_event_buckets
 
+OVERLAY_EVENT_LIMIT = 50000
+
 
 @dataclass(frozen=True)
 class OverlayIngestInput:
@@ -16,6 +18,8 @@ class OverlayIngestInput:
     factor_rows: list[FactorEventRow]
     buckets: dict[str, list[dict[str, Any]]]
     candles: list[Any]
+    # Buckets whose contents changed since the previous read of the series; None = unknown (all dirty).
+    dirty_buckets: frozenset[str] | None = None
 
 
 class OverlayIngestReader:
@@ -43,12 +47,11 @@ class OverlayIngestReader:
         window_candles: int,
     ) -> OverlayIngestInput:
         cutoff_time = max(0, int(to_time) - int(window_candles) * int(tf_s))
-        factor_rows = self._factor_store.get_events_between_times(
+        factor_rows, candles = self._read_range(
             series_id=series_id,
-            factor_name=None,
-            start_candle_time=int(cutoff_time),
-            end_candle_time=int(to_time),
-            limit=50000,
+            start_time=int(cutoff_time),
+            to_time=int(to_time),
+            window_candles=int(window_candles),
         )
         buckets = collect_overlay_event_buckets(
             rows=factor_rows,
@@ -56,12 +59,6 @@ class OverlayIngestReader:
             event_bucket_sort_keys=self._event_bucket_sort_keys,
             event_bucket_names=self._event_bucket_names,
         )
-        candles = self._candle_store.get_closed_between_times(
-            series_id,
-            start_time=int(cutoff_time),
-            end_time=int(to_time),
-            limit=int(window_candles) + 10,
-        )
         return OverlayIngestInput(
             to_time=int(to_time),
             cutoff_time=int(cutoff_time),
@@ -70,3 +67,26 @@ class OverlayIngestReader:
             buckets=buckets,
             candles=candles,
         )
+
+    def _read_range(
+        self,
+        *,
+        series_id: str,
+        start_time: int,
+        to_time: int,
+        window_candles: int,
+    ) -> tuple[list[FactorEventRow], list[Any]]:
+        factor_rows = self._factor_store.get_events_between_times(
+            series_id=series_id,
+            factor_name=None,
+            start_candle_time=int(start_time),
+            end_candle_time=int(to_time),
+            limit=OVERLAY_EVENT_LIMIT,
+        )
+        candles = self._candle_store.get_closed_records_between_times(
+            series_id,
+            start_time=int(start_time),
+            end_time=int(to_time),
+            limit=int(window_candles) + 10,
+        )
+        return factor_rows, candles
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from ..factor.store import FactorEventRow
+from .ingest_reader import OVERLAY_EVENT_LIMIT, OverlayIngestInput, OverlayIngestReader
+
+_WindowEntry = tuple[FactorEventRow, str | None, dict[str, Any] | None]
+
+
+@dataclass
+class _SeriesWindow:
+    tf_s: int
+    window_candles: int
+    to_time: int
+    candles: list[Any]
+    entries: deque[_WindowEntry]
+    buckets: dict[str, list[dict[str, Any]]]
+    last_event_id: int
+    revision: int
+
+
+class SlidingWindowIngestReader(OverlayIngestReader):
+    """
+    Keeps each series' last window and slides it forward: only candles/events in (previous to_time, to_time]
+    are read, rows older than the new cutoff are evicted, and `dirty_buckets` names the buckets that changed.
+    Whenever the delta cannot be proven equivalent to a full read (rewind, settings change, event writes outside
+    the new range, candle count drift, event row limit), it falls back to the full read.
+    Both store backends provide `series_revision` and an indexed `count_closed_between_times`, so the slide
+    works the same on the in-memory stores and on Postgres.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._windows: dict[str, _SeriesWindow] = {}
+
+    def reset_series(self, *, series_id: str) -> None:
+        self._windows.pop(str(series_id), None)
+
+    def read(
+        self,
+        *,
+        series_id: str,
+        to_time: int,
+        tf_s: int,
+        window_candles: int,
+    ) -> OverlayIngestInput:
+        # Popped while advancing: an exception mid-way leaves no state, so the next read is a full one.
+        state = self._windows.pop(str(series_id), None)
+        if (
+            state is not None
+            and state.tf_s == int(tf_s)
+            and state.window_candles == int(window_candles)
+            and int(to_time) > state.to_time
+        ):
+            advanced = self._advance(series_id=series_id, state=state, to_time=int(to_time))
+            if advanced is not None:
+                return advanced
+        return self._load(series_id=series_id, to_time=int(to_time), tf_s=int(tf_s), window_candles=int(window_candles))
+
+    def _entry(self, row: FactorEventRow) -> _WindowEntry:
+        bucket_name = self._event_bucket_by_kind.get((str(row.factor_name), str(row.kind)))
+        if bucket_name is None:
+            return row, None, None
+        payload = dict(row.payload or {})
+        payload.setdefault("candle_time", int(row.candle_time or 0))
+        payload.setdefault("visible_time", int(row.candle_time or 0))
+        return row, bucket_name, payload
+
+    def _sort_bucket(self, bucket_name: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        sort_pair = self._event_bucket_sort_keys.get(bucket_name)
+        if sort_pair is not None:
+            key_a, key_b = sort_pair
+            items.sort(key=lambda d: (int(d.get(key_a) or 0), int(d.get(key_b) or 0)))
+        return items
+
+    def _load(self, *, series_id: str, to_time: int, tf_s: int, window_candles: int) -> OverlayIngestInput:
+        cutoff_time = max(0, int(to_time) - int(window_candles) * int(tf_s))
+        revision = int(self._factor_store.series_revision(series_id))
+        last_event_id = int(self._factor_store.last_event_id(series_id))
+        rows, candles = self._read_range(
+            series_id=series_id, start_time=cutoff_time, to_time=to_time, window_candles=window_candles
+        )
+        entries = deque(self._entry(row) for row in rows)
+        buckets: dict[str, list[dict[str, Any]]] = {name: [] for name in self._event_bucket_names}
+        for _, bucket_name, payload in entries:
+            if bucket_name is not None and payload is not None:
+                buckets[bucket_name].append(payload)
+        for bucket_name, items in buckets.items():
+            self._sort_bucket(bucket_name, items)
+        if len(rows) < OVERLAY_EVENT_LIMIT:
+            self._windows[str(series_id)] = _SeriesWindow(
+                tf_s=int(tf_s),
+                window_candles=int(window_candles),
+                to_time=int(to_time),
+                candles=list(candles),
+                entries=entries,
+                buckets=dict(buckets),
+                last_event_id=last_event_id,
+                revision=revision,
+            )
+        return OverlayIngestInput(
+            to_time=int(to_time),
+            cutoff_time=int(cutoff_time),
+            window_candles=int(window_candles),
+            factor_rows=rows,
+            buckets=buckets,
+            candles=candles,
+        )
+
+    def _advance(self, *, series_id: str, state: _SeriesWindow, to_time: int) -> OverlayIngestInput | None:
+        cutoff_time = max(0, int(to_time) - state.window_candles * state.tf_s)
+        if cutoff_time > state.to_time:
+            return None
+        revision = int(self._factor_store.series_revision(series_id))
+        last_event_id = int(self._factor_store.last_event_id(series_id))
+        rows, new_candles = self._read_range(
+            series_id=series_id, start_time=state.to_time + 1, to_time=to_time, window_candles=state.window_candles
+        )
+        # Every event written since the last read must fall in the new range; otherwise the window is stale.
+        if revision - state.revision != sum(1 for row in rows if int(row.id) > state.last_event_id):
+            return None
+        if len(state.entries) + len(rows) >= OVERLAY_EVENT_LIMIT:
+            return None
+        kept = [c for c in state.candles if int(c.candle_time) >= cutoff_time]
+        candles = kept + list(new_candles)
+        stored = self._candle_store.count_closed_between_times(series_id, start_time=cutoff_time, end_time=int(to_time))
+        if int(stored) != len(candles):
+            return None
+
+        dirty = self._evict(state, cutoff_time=cutoff_time)
+        added: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            entry = self._entry(row)
+            state.entries.append(entry)
+            if entry[1] is not None and entry[2] is not None:
+                added.setdefault(entry[1], []).append(entry[2])
+        for bucket_name, items in added.items():
+            state.buckets[bucket_name] = self._sort_bucket(bucket_name, state.buckets[bucket_name] + items)
+        dirty.update(added)
+
+        state.to_time = int(to_time)
+        state.candles = candles
+        state.last_event_id = last_event_id
+        state.revision = revision
+        self._windows[str(series_id)] = state
+        return OverlayIngestInput(
+            to_time=int(to_time),
+            cutoff_time=int(cutoff_time),
+            window_candles=state.window_candles,
+            factor_rows=[entry[0] for entry in state.entries],
+            buckets=dict(state.buckets),
+            candles=list(candles),
+            dirty_buckets=frozenset(dirty),
+        )
+
+    @staticmethod
+    def _evict(state: _SeriesWindow, *, cutoff_time: int) -> set[str]:
+        evicted: dict[str, set[int]] = {}
+        entries = state.entries
+        while entries and int(entries[0][0].candle_time) < int(cutoff_time):
+            _, bucket_name, payload = entries.popleft()
+            if bucket_name is not None:
+                evicted.setdefault(bucket_name, set()).add(id(payload))
+        for bucket_name, ids in evicted.items():
+            state.buckets[bucket_name] = [p for p in state.buckets[bucket_name] if id(p) not in ids]
+        return set(evicted)
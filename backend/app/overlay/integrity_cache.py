@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..runtime.metrics import RuntimeMetrics
+from .integrity_plugins import OverlayIntegrityResult
+
+
+@dataclass(frozen=True)
+class OverlayIntegrityKey:
+    """
+    Store watermarks an integrity verdict was computed against.
+    Any overlay version/delete or factor event/rebuild/head move yields a new key, so stale verdicts are never read.
+    """
+
+    series_id: str
+    to_time: int
+    window_candles: int
+    overlay_version_id: int
+    overlay_revision: int
+    factor_event_id: int
+    factor_revision: int
+    factor_head_time: int | None
+
+
+@dataclass(frozen=True)
+class OverlayIntegrityVerdict:
+    should_rebuild: bool
+    results: tuple[OverlayIntegrityResult, ...]
+
+
+class OverlayIntegrityVerdictCache:
+    """
+    Per-process LRU of overlay integrity verdicts:
+    - Keyed by `OverlayIntegrityKey` (store watermarks + aligned time).
+    - Overlay/factor write paths call `invalidate(series_id)` after committing, which also covers writes the
+      watermarks cannot see (head snapshots rewritten in place).
+    - Hit/miss counters feed `overlay_integrity_verdict_cache_total` and `_hit_ratio` when metrics are on.
+    """
+
+    def __init__(self, *, capacity: int = 1024, runtime_metrics: RuntimeMetrics | None = None) -> None:
+        self._capacity = max(1, int(capacity))
+        self._metrics = runtime_metrics
+        self._lock = threading.Lock()
+        self._verdicts: OrderedDict[OverlayIntegrityKey, OverlayIntegrityVerdict] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: OverlayIntegrityKey) -> OverlayIntegrityVerdict | None:
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is None:
+                self._misses += 1
+            else:
+                self._verdicts.move_to_end(key)
+                self._hits += 1
+            hit_ratio = self._hit_ratio_locked()
+        self._observe(hit=verdict is not None, hit_ratio=hit_ratio)
+        return verdict
+
+    def put(self, key: OverlayIntegrityKey, verdict: OverlayIntegrityVerdict) -> None:
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self._capacity:
+                self._verdicts.popitem(last=False)
+
+    def invalidate(self, series_id: str) -> None:
+        sid = str(series_id)
+        with self._lock:
+            stale = [key for key in self._verdicts if key.series_id == sid]
+            for key in stale:
+                del self._verdicts[key]
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "size": int(len(self._verdicts)),
+                "hits": int(self._hits),
+                "misses": int(self._misses),
+                "invalidations": int(self._invalidations),
+                "hit_ratio": self._hit_ratio_locked(),
+            }
+
+    def _hit_ratio_locked(self) -> float:
+        total = self._hits + self._misses
+        return float(self._hits) / float(total) if total else 0.0
+
+    def _observe(self, *, hit: bool, hit_ratio: float) -> None:
+        metrics = self._metrics
+        if metrics is None or not metrics.enabled():
+            return
+        metrics.incr("overlay_integrity_verdict_cache_total", labels={"result": "hit" if hit else "miss"})
+        metrics.set_gauge("overlay_integrity_verdict_cache_hit_ratio", value=hit_ratio)
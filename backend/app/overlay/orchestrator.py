@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Protocol, cast
+from typing import Callable, Protocol, cast
 
 from ..debug.hub import DebugHub
 from ..factor.graph import FactorGraph, FactorSpec
@@ -11,6 +11,7 @@ from ..factor.store import FactorStore
 from ..storage.candle_store import CandleStore
 from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
 from .ingest_reader import OverlayIngestInput, OverlayIngestReader
+from .ingest_window import SlidingWindowIngestReader
 from .ingest_writer import OverlayInstructionWriter
 from .renderer_plugins import (
     OverlayRenderContext,
@@ -26,6 +27,7 @@ from .store import OverlayStore
 class OverlaySettings:
     ingest_enabled: bool = True
     window_candles: int = 2000
+    incremental_ingest: bool = True
 
 
 class OverlayIngestReaderLike(Protocol):
@@ -76,8 +78,10 @@ class OverlayOrchestrator:
         self._settings = OverlaySettings(
             ingest_enabled=bool(cfg.ingest_enabled),
             window_candles=max(100, int(cfg.window_candles)),
+            incremental_ingest=bool(cfg.incremental_ingest),
         )
         self._debug_hub: DebugHub | None = None
+        self._invalidate_integrity: Callable[[str], None] | None = None
         self._renderer_registry = FactorPluginRegistry(list(build_default_overlay_render_plugins()))
         self._renderer_graph = FactorGraph(
             [FactorSpec(factor_name=s.factor_name, depends_on=s.depends_on) for s in self._renderer_registry.specs()]
@@ -89,7 +93,8 @@ class OverlayOrchestrator:
         self._event_bucket_by_kind = by_kind
         self._event_bucket_sort_keys = sort_keys
         self._event_bucket_names = bucket_names
-        self._ingest_reader = ingest_reader or OverlayIngestReader(
+        reader_cls = SlidingWindowIngestReader if self._settings.incremental_ingest else OverlayIngestReader
+        self._ingest_reader = ingest_reader or reader_cls(
             candle_store=self._candle_store,
             factor_store=self._factor_store,
             event_bucket_by_kind=self._event_bucket_by_kind,
@@ -101,6 +106,14 @@ class OverlayOrchestrator:
     def set_debug_hub(self, hub: DebugHub | None) -> None:
         self._debug_hub = hub
 
+    def set_integrity_invalidator(self, invalidate: Callable[[str], None] | None) -> None:
+        """Called with the series id after every overlay commit (e.g. overlay integrity verdict cache)."""
+        self._invalidate_integrity = invalidate
+
+    def _integrity_changed(self, series_id: str) -> None:
+        if self._invalidate_integrity is not None:
+            self._invalidate_integrity(series_id)
+
     def enabled(self) -> bool:
         return bool(self._settings.ingest_enabled)
 
@@ -111,13 +124,40 @@ class OverlayOrchestrator:
         with self._overlay_store.connect() as conn:
             self._overlay_store.clear_series_in_conn(conn, series_id=series_id)
             conn.commit()
+        self._integrity_changed(series_id)
+        self._reset_reader(series_id=series_id)
+
+    def _reset_reader(self, *, series_id: str) -> None:
+        reset = getattr(self._ingest_reader, "reset_series", None)
+        if callable(reset):
+            reset(series_id=series_id)
 
     def _load_window_candles(self) -> int:
         return int(self._settings.window_candles)
 
-    def _run_render_plugins(self, *, ctx: OverlayRenderContext) -> OverlayRenderOutput:
+    def _plugins_to_render(self, dirty_buckets: frozenset[str] | None) -> tuple[OverlayRendererPlugin, ...]:
+        """
+        Renderers that declare `window_sensitive = False` only depend on their buckets; when none of those
+        buckets changed, every def they would emit equals the latest persisted def and the writer would
+        drop it anyway, so they are skipped.
+        """
+        if dirty_buckets is None:
+            return self._topo_renderers
+        return tuple(
+            plugin
+            for plugin in self._topo_renderers
+            if getattr(plugin, "window_sensitive", True)
+            or any(spec.bucket_name in dirty_buckets for spec in plugin.bucket_specs)
+        )
+
+    def _run_render_plugins(
+        self,
+        *,
+        ctx: OverlayRenderContext,
+        plugins: tuple[OverlayRendererPlugin, ...],
+    ) -> OverlayRenderOutput:
         merged = OverlayRenderOutput()
-        for plugin in self._topo_renderers:
+        for plugin in plugins:
             rendered = plugin.render(ctx=ctx)
             if rendered.marker_defs:
                 merged.marker_defs.extend(rendered.marker_defs)
@@ -140,30 +180,38 @@ class OverlayOrchestrator:
 
         tf_s = timeframe_to_seconds(series_id_timeframe(series_id))
         window_candles = self._load_window_candles()
-        ingest_input = self._ingest_reader.read(
-            series_id=series_id,
-            to_time=int(to_time),
-            tf_s=int(tf_s),
-            window_candles=int(window_candles),
-        )
-        rendered = self._run_render_plugins(
-            ctx=OverlayRenderContext(
+        try:
+            ingest_input = self._ingest_reader.read(
                 series_id=series_id,
                 to_time=int(to_time),
-                cutoff_time=int(ingest_input.cutoff_time),
-                window_candles=int(ingest_input.window_candles),
-                candles=ingest_input.candles,
-                buckets=ingest_input.buckets,
+                tf_s=int(tf_s),
+                window_candles=int(window_candles),
             )
-        )
-        marker_defs = rendered.marker_defs
-        polyline_defs = rendered.polyline_defs
-        wrote = self._instruction_writer.persist(
-            series_id=series_id,
-            to_time=int(to_time),
-            marker_defs=marker_defs,
-            polyline_defs=polyline_defs,
-        )
+            plugins = self._plugins_to_render(getattr(ingest_input, "dirty_buckets", None))
+            rendered = self._run_render_plugins(
+                ctx=OverlayRenderContext(
+                    series_id=series_id,
+                    to_time=int(to_time),
+                    cutoff_time=int(ingest_input.cutoff_time),
+                    window_candles=int(ingest_input.window_candles),
+                    candles=ingest_input.candles,
+                    buckets=ingest_input.buckets,
+                ),
+                plugins=plugins,
+            )
+            marker_defs = rendered.marker_defs
+            polyline_defs = rendered.polyline_defs
+            wrote = self._instruction_writer.persist(
+                series_id=series_id,
+                to_time=int(to_time),
+                marker_defs=marker_defs,
+                polyline_defs=polyline_defs,
+            )
+            self._integrity_changed(series_id)
+        except Exception:
+            # Skipping clean renderers assumes the previous window was persisted; start over with a full read.
+            self._reset_reader(series_id=series_id)
+            raise
 
         if self._debug_hub is not None:
             self._debug_hub.emit(
@@ -178,6 +226,7 @@ class OverlayOrchestrator:
                     "marker_defs": int(len(marker_defs)),
                     "pen_points": int(rendered.pen_points_count),
                     "polyline_defs": int(len(polyline_defs)),
+                    "renderers": int(len(plugins)),
                     "db_changes": int(wrote),
                     "duration_ms": int((time.perf_counter() - t0) * 1000),
                 },
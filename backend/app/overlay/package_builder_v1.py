@@ -133,7 +133,7 @@ def build_overlay_replay_package_v1(
     end_time = int(params.to_candle_time)
     start_time = max(0, end_time - (window_candles - 1) * int(tf_s))
 
-    candles = candle_store.get_closed_between_times(
+    candles = candle_store.get_closed_records_between_times(
         params.series_id,
         start_time=int(start_time),
         end_time=int(end_time),
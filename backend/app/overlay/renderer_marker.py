@@ -22,6 +22,8 @@ class MarkerOverlayRenderer:
         PIVOT_MINOR_BUCKET_SPEC,
         ANCHOR_SWITCH_BUCKET_SPEC,
     )
+    # Output depends only on the buckets (cutoff just filters out defs that were already written).
+    window_sensitive: bool = False
 
     def render(self, *, ctx: OverlayRenderContext) -> OverlayRenderOutput:
         out = OverlayRenderOutput()
@@ -30,6 +30,11 @@ class _OverlayStoreState:
     series_head: dict[str, int] = field(default_factory=dict)
     versions: list[OverlayInstructionVersionRow] = field(default_factory=list)
     next_version_id: int = 1
+    revision_by_series: dict[str, int] = field(default_factory=dict)
+
+
+def _bump_series_revision(state: _OverlayStoreState, series_id: str) -> None:
+    state.revision_by_series[series_id] = int(state.revision_by_series.get(series_id, 0)) + 1
 
 
 _STORE_STATES: dict[str, _OverlayStoreState] = {}
@@ -75,6 +80,7 @@ class _OverlayStoreConnection(LocalConnectionBase):
             deleted = before - len(self._state.versions)
             if deleted > 0:
                 self.total_changes += int(deleted)
+                _bump_series_revision(self._state, series_id)
             return MemoryCursor(rowcount=int(deleted))
 
         if normalized.startswith("insert into overlay_instruction_versions"):
@@ -103,6 +109,7 @@ class _OverlayStoreConnection(LocalConnectionBase):
                 )
             )
             self.total_changes += 1
+            _bump_series_revision(self._state, series_id)
             return MemoryCursor(rowcount=1, lastrowid=version_id)
 
         raise RuntimeError(f"unsupported_local_store_sql:{sql.strip()[:96]}")
@@ -133,6 +140,7 @@ class OverlayStore:
             removed += 1
         if removed > 0:
             conn.total_changes += int(removed)
+        _bump_series_revision(conn._state, sid)
 
     def head_time(self, series_id: str) -> int | None:
         return read_series_head_time(
@@ -145,6 +153,10 @@ class OverlayStore:
         versions = [int(row.version_id) for row in _get_store_state(self.db_path).versions if str(row.series_id) == sid]
         return int(max(versions)) if versions else 0
 
+    def series_revision(self, series_id: str) -> int:
+        """Bumped by every version insert/delete and clear of the series."""
+        return int(_get_store_state(self.db_path).revision_by_series.get(str(series_id), 0))
+
     def insert_instruction_version_in_conn(
         self,
         conn: _OverlayStoreConnection,
@@ -168,6 +180,7 @@ class OverlayStore:
             )
         )
         conn.total_changes += 1
+        _bump_series_revision(conn._state, str(series_id))
         return int(version_id)
 
     def get_latest_defs_up_to_time(
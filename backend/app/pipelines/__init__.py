@@ -5,6 +5,7 @@ from .ingest_pipeline import (
     IngestSeriesBatch,
     IngestStepResult,
 )
+from .ingest_pipeline_models import IngestTelemetry
 
 __all__ = [
     "IngestPipeline",
@@ -12,4 +13,5 @@ __all__ = [
     "IngestPipelineResult",
     "IngestSeriesBatch",
     "IngestStepResult",
+    "IngestTelemetry",
 ]
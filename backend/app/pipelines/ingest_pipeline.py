@@ -5,8 +5,12 @@ from typing import Mapping, Sequence
 
 from ..core.ports import CandleHubPort
 from ..runtime.blocking import run_blocking
+from ..runtime.ingest_trace import IngestTracer
+from ..runtime.metrics import RuntimeMetrics
+from ..core.candle_record import CandleRecord, as_closed
 from ..core.schemas import CandleClosed
 from ..storage.candle_store import CandleStore
+from .ingest_pipeline_models import IngestTelemetry
 from .ingest_pipeline_steps import (
     FactorOrchestratorLike,
     FeatureOrchestratorLike,
@@ -36,6 +40,7 @@ class IngestPipeline:
         hub: CandleHubPort | None = None,
         overlay_compensate_on_error: bool = False,
         candle_compensate_on_error: bool = False,
+        telemetry: IngestTelemetry | None = None,
     ) -> None:
         self._store = store
         self._factor_orchestrator = factor_orchestrator
@@ -44,6 +49,15 @@ class IngestPipeline:
         self._hub = hub
         self._overlay_compensate_on_error = bool(overlay_compensate_on_error)
         self._candle_compensate_on_error = bool(candle_compensate_on_error)
+        self._telemetry = telemetry or IngestTelemetry()
+
+    @property
+    def tracer(self) -> IngestTracer | None:
+        return self._telemetry.tracer
+
+    @property
+    def runtime_metrics(self) -> RuntimeMetrics | None:
+        return self._telemetry.runtime_metrics
 
     def _rollback_new_candles(self, *, series_id: str, new_candle_times: list[int]) -> tuple[int, BaseException | None]:
         return rollback_new_candles(
@@ -54,13 +68,15 @@ class IngestPipeline:
         )
 
     @staticmethod
-    def _normalize_batches(*, batches: Mapping[str, Sequence[CandleClosed]]) -> tuple[IngestSeriesBatch, ...]:
+    def _normalize_batches(
+        *, batches: Mapping[str, Sequence[CandleClosed | CandleRecord]]
+    ) -> tuple[IngestSeriesBatch, ...]:
         return normalize_batches(batches=batches)
 
     def run_sync(
         self,
         *,
-        batches: Mapping[str, Sequence[CandleClosed]],
+        batches: Mapping[str, Sequence[CandleClosed | CandleRecord]],
     ) -> IngestPipelineResult:
         return self._run_sync(
             series_batches=self._normalize_batches(batches=batches),
@@ -145,17 +161,31 @@ class IngestPipeline:
                 )
                 steps.append(overlay_step)
 
+        duration_ms = (time.perf_counter() - t0) * 1000.0
+        self._observe_latency(steps=steps, duration_ms=duration_ms)
         return IngestPipelineResult(
             series_batches=series_batches,
             rebuilt_series=tuple(sorted(rebuilt_series)),
             steps=tuple(steps),
-            duration_ms=int((time.perf_counter() - t0) * 1000),
+            duration_ms=int(duration_ms),
         )
 
+    def _observe_latency(self, *, steps: Sequence[IngestStepResult], duration_ms: float) -> None:
+        metrics = self._telemetry.runtime_metrics
+        if metrics is None or not metrics.enabled():
+            return
+        metrics.timer("ingest_pipeline_duration_ms").observe_ms(duration_ms)
+        for step in steps:
+            # step name is "<step>:<series_id>"; label by step only to keep cardinality bounded.
+            step_name = str(step.name).split(":", 1)[0]
+            metrics.timer("ingest_pipeline_step_duration_ms", labels={"step": step_name}).observe_ms(
+                float(step.elapsed_ms)
+            )
+
     async def run(
         self,
         *,
-        batches: Mapping[str, Sequence[CandleClosed]],
+        batches: Mapping[str, Sequence[CandleClosed | CandleRecord]],
         publish: bool = True,
     ) -> IngestPipelineResult:
         result = await run_blocking(self.run_sync, batches=batches)
@@ -208,7 +238,8 @@ class IngestPipeline:
     async def _publish_series_batch(self, *, batch: IngestSeriesBatch, best_effort: bool) -> None:
         if self._hub is None:
             return
-        candles = list(batch.candles)
+        # WS boundary: records decoded on the ingest path become pydantic models only here.
+        candles = [as_closed(candle) for candle in batch.candles]
         if not candles:
             return
         if len(candles) == 1:
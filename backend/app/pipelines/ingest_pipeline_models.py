@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Mapping
+
+from ..core.candle_record import CandleRecord
+from ..core.schemas import CandleClosed
+
+if TYPE_CHECKING:
+    from ..runtime.ingest_trace import IngestTracer
+    from ..runtime.metrics import RuntimeMetrics
+
+
+@dataclass(frozen=True)
+class IngestStepResult:
+    name: str
+    ok: bool
+    duration_ms: int
+    error: str | None = None
+    detail: Mapping[str, Any] | None = None
+    started_at: float = 0.0
+    elapsed_ms: float = 0.0
+    rows: int | None = None
+
+
+@dataclass(frozen=True)
+class IngestTelemetry:
+    runtime_metrics: RuntimeMetrics | None = None
+    tracer: IngestTracer | None = None
+
+
+@dataclass(frozen=True)
+class IngestSeriesBatch:
+    series_id: str
+    candles: tuple[CandleClosed | CandleRecord, ...]
+    up_to_candle_time: int
+
+
+@dataclass(frozen=True)
+class IngestPipelineResult:
+    series_batches: tuple[IngestSeriesBatch, ...]
+    rebuilt_series: tuple[str, ...]
+    steps: tuple[IngestStepResult, ...]
+    duration_ms: int
+
+
+class IngestPipelineError(RuntimeError):
+    def __init__(
+        self,
+        *,
+        step: str,
+        series_id: str,
+        cause: BaseException,
+        compensated: bool = False,
+        compensation_error: BaseException | None = None,
+        overlay_compensated: bool = False,
+        candle_compensated_rows: int = 0,
+    ) -> None:
+        self.step = str(step)
+        self.series_id = str(series_id)
+        self.cause = cause
+        self.compensated = bool(compensated)
+        self.compensation_error = compensation_error
+        self.overlay_compensated = bool(overlay_compensated)
+        self.candle_compensated_rows = max(0, int(candle_compensated_rows))
+        suffix = ":compensated" if self.compensated else ""
+        if self.overlay_compensated:
+            suffix = f"{suffix}:overlay_reset"
+        if self.candle_compensated_rows > 0:
+            suffix = f"{suffix}:candle_rows:{self.candle_compensated_rows}"
+        if compensation_error is not None:
+            suffix = f"{suffix}:compensation_error:{compensation_error}"
+        super().__init__(f"ingest_pipeline_failed:{self.step}:{self.series_id}:{cause}{suffix}")
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
 from typing import Any, Mapping, Protocol, Sequence
 
 from ..core.ports import FactorOrchestratorPort, FeatureOrchestratorPort, OverlayOrchestratorPort
+from ..core.candle_record import CandleRecord
 from ..core.schemas import CandleClosed
 from ..storage.contracts import CandleRepository
+from .ingest_pipeline_models import (
+    IngestPipelineError,
+    IngestPipelineResult,
+    IngestSeriesBatch,
+    IngestStepResult,
+)
 
 
 FactorOrchestratorLike = FactorOrchestratorPort
@@ -24,59 +30,7 @@ class RollbackNewCandlesFn(Protocol):
     ) -> tuple[int, BaseException | None]: ...
 
 
-@dataclass(frozen=True)
-class IngestStepResult:
-    name: str
-    ok: bool
-    duration_ms: int
-    error: str | None = None
-
-
-@dataclass(frozen=True)
-class IngestSeriesBatch:
-    series_id: str
-    candles: tuple[CandleClosed, ...]
-    up_to_candle_time: int
-
-
-@dataclass(frozen=True)
-class IngestPipelineResult:
-    series_batches: tuple[IngestSeriesBatch, ...]
-    rebuilt_series: tuple[str, ...]
-    steps: tuple[IngestStepResult, ...]
-    duration_ms: int
-
-
-class IngestPipelineError(RuntimeError):
-    def __init__(
-        self,
-        *,
-        step: str,
-        series_id: str,
-        cause: BaseException,
-        compensated: bool = False,
-        compensation_error: BaseException | None = None,
-        overlay_compensated: bool = False,
-        candle_compensated_rows: int = 0,
-    ) -> None:
-        self.step = str(step)
-        self.series_id = str(series_id)
-        self.cause = cause
-        self.compensated = bool(compensated)
-        self.compensation_error = compensation_error
-        self.overlay_compensated = bool(overlay_compensated)
-        self.candle_compensated_rows = max(0, int(candle_compensated_rows))
-        suffix = ":compensated" if self.compensated else ""
-        if self.overlay_compensated:
-            suffix = f"{suffix}:overlay_reset"
-        if self.candle_compensated_rows > 0:
-            suffix = f"{suffix}:candle_rows:{self.candle_compensated_rows}"
-        if compensation_error is not None:
-            suffix = f"{suffix}:compensation_error:{compensation_error}"
-        super().__init__(f"ingest_pipeline_failed:{self.step}:{self.series_id}:{cause}{suffix}")
-
-
-def normalize_batches(*, batches: Mapping[str, Sequence[CandleClosed]]) -> tuple[IngestSeriesBatch, ...]:
+def normalize_batches(*, batches: Mapping[str, Sequence[CandleClosed | CandleRecord]]) -> tuple[IngestSeriesBatch, ...]:
     out: list[IngestSeriesBatch] = []
     for series_id, candles in sorted((batches or {}).items(), key=lambda item: str(item[0])):
         dedup: dict[int, CandleClosed] = {}
@@ -161,11 +115,15 @@ def persist_closed_batch(
             cause=exc,
         ) from exc
 
+    elapsed_ms = (time.perf_counter() - t_step) * 1000.0
     steps: list[IngestStepResult] = [
         IngestStepResult(
             name=f"store.upsert_many_closed:{batch.series_id}",
             ok=True,
-            duration_ms=int((time.perf_counter() - t_step) * 1000),
+            duration_ms=int(elapsed_ms),
+            started_at=t_step,
+            elapsed_ms=elapsed_ms,
+            rows=len(candle_times),
         )
     ]
     return new_candle_times, tuple(steps)
@@ -200,10 +158,17 @@ def run_factor_step(
         ) from exc
 
     rebuilt = bool(getattr(result, "rebuilt", False))
+    plan_cache_hit = getattr(result, "plan_cache_hit", None)
+    plan_ms = round(float(getattr(result, "plan_ms", 0.0) or 0.0), 3)
+    detail = None if plan_cache_hit is None else {"plan_cache_hit": bool(plan_cache_hit), "plan_ms": plan_ms}
+    elapsed_ms = (time.perf_counter() - t_step) * 1000.0
     return rebuilt, IngestStepResult(
         name=f"factor.ingest_closed:{series_id}",
         ok=True,
-        duration_ms=int((time.perf_counter() - t_step) * 1000),
+        duration_ms=int(elapsed_ms),
+        detail=detail,
+        started_at=t_step,
+        elapsed_ms=elapsed_ms,
     )
 
 
@@ -238,10 +203,13 @@ def run_feature_step(
             candle_compensated_rows=int(candle_rows),
         ) from exc
 
+    elapsed_ms = (time.perf_counter() - t_step) * 1000.0
     return IngestStepResult(
         name=f"feature.ingest_closed:{series_id}",
         ok=True,
-        duration_ms=int((time.perf_counter() - t_step) * 1000),
+        duration_ms=int(elapsed_ms),
+        started_at=t_step,
+        elapsed_ms=elapsed_ms,
     )
 
 
@@ -291,8 +259,11 @@ def run_overlay_step(
             candle_compensated_rows=int(candle_rows),
         ) from exc
 
+    elapsed_ms = (time.perf_counter() - t_step) * 1000.0
     return IngestStepResult(
         name=f"overlay.ingest_closed:{series_id}",
         ok=True,
-        duration_ms=int((time.perf_counter() - t_step) * 1000),
+        duration_ms=int(elapsed_ms),
+        started_at=t_step,
+        elapsed_ms=elapsed_ms,
     )
@@ -3,11 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ..core.ports import AlignedStorePort, DebugHubPort
+from ..overlay.integrity_cache import OverlayIntegrityVerdict
 from ..overlay.integrity_plugins import evaluate_overlay_integrity
 from ..overlay.store import OverlayInstructionVersionRow
 from ..core.schemas import GetFactorSlicesResponseV1, OverlayInstructionPatchItemV1
 from ..core.service_errors import ServiceError
 from .ports import FactorReadServicePort, OverlayStoreReadPort
+from .read_context import FrameReadContext
 
 @dataclass(frozen=True)
 class DrawDeltaDebugEmitRequest:
@@ -68,6 +70,7 @@ def read_slices_for_overlay_if_needed(
     cursor_version_id: int,
     window_candles: int,
     to_time: int,
+    read_ctx: FrameReadContext | None = None,
 ) -> GetFactorSlicesResponseV1 | None:
     if int(cursor_version_id) != 0:
         return None
@@ -83,23 +86,17 @@ def read_slices_for_overlay_if_needed(
         aligned_time=int(to_time),
         window_candles=int(window_candles),
         ensure_fresh=True,
+        read_ctx=read_ctx,
     )
 
 
-def ensure_overlay_integrity_if_needed(
+def evaluate_integrity_verdict(
     *,
     series_id: str,
-    cursor_version_id: int,
     to_time: int,
-    strict_mode: bool,
     latest_defs: list[OverlayInstructionVersionRow],
     slices_for_overlay: GetFactorSlicesResponseV1 | None,
-    debug_enabled: bool,
-    debug_hub: DebugHubPort,
-) -> None:
-    if int(cursor_version_id) != 0:
-        return
-
+) -> OverlayIntegrityVerdict:
     slices = slices_for_overlay
     if slices is None:
         slices = GetFactorSlicesResponseV1(
@@ -112,7 +109,19 @@ def ensure_overlay_integrity_if_needed(
         slices=slices,
         latest_defs=latest_defs,
     )
-    if not should_rebuild_overlay:
+    return OverlayIntegrityVerdict(should_rebuild=bool(should_rebuild_overlay), results=tuple(integrity_results))
+
+
+def ensure_overlay_integrity_if_needed(
+    *,
+    series_id: str,
+    to_time: int,
+    strict_mode: bool,
+    verdict: OverlayIntegrityVerdict | None,
+    debug_enabled: bool,
+    debug_hub: DebugHubPort,
+) -> None:
+    if verdict is None or not verdict.should_rebuild:
         return
     if bool(debug_enabled):
         debug_hub.emit(
@@ -129,7 +138,7 @@ def ensure_overlay_integrity_if_needed(
                         "should_rebuild": bool(item.should_rebuild),
                         "reason": None if item.reason is None else str(item.reason),
                     }
-                    for item in integrity_results
+                    for item in verdict.results
                 ],
             },
         )
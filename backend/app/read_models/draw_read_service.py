@@ -5,7 +5,10 @@ from dataclasses import dataclass
 from ..core.ports import AlignedStorePort, DebugHubPort
 from ..core.schemas import DrawCursorV1, DrawDeltaV1
 from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
+from ..overlay.integrity_cache import OverlayIntegrityKey, OverlayIntegrityVerdict, OverlayIntegrityVerdictCache
+from ..overlay.store import OverlayInstructionVersionRow
 from .ports import FactorReadServicePort, OverlayOrchestratorReadPort, OverlayStoreReadPort
+from .read_context import FrameReadContext, frame_read_context
 from .draw_delta_steps import (
     DrawDeltaDebugEmitRequest,
     assert_overlay_head_covers,
@@ -13,6 +16,7 @@ from .draw_delta_steps import (
     collect_active_ids,
     emit_draw_delta_debug_if_needed,
     ensure_overlay_integrity_if_needed,
+    evaluate_integrity_verdict,
     read_slices_for_overlay_if_needed,
     resolve_to_time,
 )
@@ -25,6 +29,7 @@ class DrawReadService:
     factor_read_service: FactorReadServicePort
     debug_hub: DebugHubPort
     debug_api_enabled: bool = False
+    integrity_verdicts: OverlayIntegrityVerdictCache | None = None
 
     def _empty_delta(self, *, series_id: str, cursor_version_id: int) -> DrawDeltaV1:
         return DrawDeltaV1(
@@ -40,6 +45,67 @@ class DrawReadService:
     def _debug_enabled(self) -> bool:
         return bool(self.debug_api_enabled)
 
+    def _last_version_id(self, series_id: str, ctx: FrameReadContext) -> int:
+        overlay_store = self.overlay_store
+        key = (id(overlay_store), "last_version_id", series_id)
+        return int(ctx.once(key, lambda: overlay_store.last_version_id(series_id)))
+
+    def _integrity_key(
+        self, *, series_id: str, to_time: int, window_candles: int, ctx: FrameReadContext
+    ) -> OverlayIntegrityKey | None:
+        if self.integrity_verdicts is None:
+            return None
+        factor_store = self.factor_read_service.factor_store
+        if factor_store is None:
+            # No factor watermarks to key on: every read evaluates integrity instead of caching a partial key.
+            return None
+        factor_head = ctx.view(factor_store).head_time(series_id)
+        return OverlayIntegrityKey(
+            series_id=series_id,
+            to_time=int(to_time),
+            window_candles=int(window_candles),
+            overlay_version_id=self._last_version_id(series_id, ctx),
+            overlay_revision=int(self.overlay_store.series_revision(series_id)),
+            factor_event_id=int(factor_store.last_event_id(series_id)),
+            factor_revision=int(factor_store.series_revision(series_id)),
+            factor_head_time=None if factor_head is None else int(factor_head),
+        )
+
+    def _integrity_verdict(
+        self,
+        *,
+        series_id: str,
+        window_candles: int,
+        to_time: int,
+        latest_defs: list[OverlayInstructionVersionRow],
+        key: OverlayIntegrityKey | None,
+        ctx: FrameReadContext,
+    ) -> OverlayIntegrityVerdict:
+        # Same watermarks and aligned time mean the same slices and defs, so a cached verdict also
+        # skips the slices read (its freshness check passed against the same factor head).
+        cache = self.integrity_verdicts
+        if key is not None and cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        slices_for_overlay = read_slices_for_overlay_if_needed(
+            factor_read_service=self.factor_read_service,
+            series_id=series_id,
+            cursor_version_id=0,
+            window_candles=int(window_candles),
+            to_time=int(to_time),
+            read_ctx=ctx,
+        )
+        verdict = evaluate_integrity_verdict(
+            series_id=series_id,
+            to_time=int(to_time),
+            latest_defs=latest_defs,
+            slices_for_overlay=slices_for_overlay,
+        )
+        if key is not None and cache is not None:
+            cache.put(key, verdict)
+        return verdict
+
     def read_delta(
         self,
         *,
@@ -47,12 +113,15 @@ class DrawReadService:
         cursor_version_id: int,
         window_candles: int,
         at_time: int | None = None,
+        read_ctx: FrameReadContext | None = None,
     ) -> DrawDeltaV1:
         strict_mode = bool(getattr(self.factor_read_service, "strict_mode", False))
-        store_head = self.store.head_time(series_id)
-        overlay_head = self.overlay_store.head_time(series_id)
+        ctx = frame_read_context(read_ctx)
+        store = ctx.view(self.store)
+        store_head = store.head_time(series_id)
+        overlay_head = ctx.view(self.overlay_store).head_time(series_id)
         to_time = resolve_to_time(
-            store=self.store,
+            store=store,
             series_id=series_id,
             at_time=at_time,
             store_head=store_head,
@@ -66,25 +135,31 @@ class DrawReadService:
         if strict_mode:
             assert_overlay_head_covers(required_time=int(to_time), overlay_head=overlay_head)
 
-        slices_for_overlay = read_slices_for_overlay_if_needed(
-            factor_read_service=self.factor_read_service,
-            series_id=series_id,
-            cursor_version_id=int(cursor_version_id),
-            window_candles=int(window_candles),
-            to_time=int(to_time),
-        )
-
         tf_s = timeframe_to_seconds(series_id_timeframe(series_id))
         cutoff_time = max(0, int(to_time) - int(window_candles) * int(tf_s))
 
+        integrity_key = None
+        if int(cursor_version_id) == 0:
+            # Watermarks before defs/slices: a write racing those reads can only cache under the older key.
+            integrity_key = self._integrity_key(
+                series_id=series_id, to_time=int(to_time), window_candles=int(window_candles), ctx=ctx
+            )
         latest_defs = self.overlay_store.get_latest_defs_up_to_time(series_id=series_id, up_to_time=int(to_time))
+        verdict = None
+        if int(cursor_version_id) == 0:
+            verdict = self._integrity_verdict(
+                series_id=series_id,
+                window_candles=int(window_candles),
+                to_time=int(to_time),
+                latest_defs=latest_defs,
+                key=integrity_key,
+                ctx=ctx,
+            )
         ensure_overlay_integrity_if_needed(
             series_id=series_id,
-            cursor_version_id=int(cursor_version_id),
             to_time=int(to_time),
             strict_mode=bool(strict_mode),
-            latest_defs=latest_defs,
-            slices_for_overlay=slices_for_overlay,
+            verdict=verdict,
             debug_enabled=self._debug_enabled(),
             debug_hub=self.debug_hub,
         )
@@ -100,7 +175,7 @@ class DrawReadService:
             cursor_version_id=int(cursor_version_id),
             to_time=int(to_time),
         )
-        next_version_id = int(self.overlay_store.last_version_id(series_id))
+        next_version_id = self._last_version_id(series_id, ctx)
         next_cursor = DrawCursorV1(version_id=int(next_version_id), point_time=None)
 
         emit_draw_delta_debug_if_needed(
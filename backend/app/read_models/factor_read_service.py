@@ -2,15 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from ..core.ports import AlignedStorePort, HeadStorePort
+from ..core.ports import AlignedStorePort
 from ..factor.read_freshness import FactorSlicesServicePort, read_factor_slices_with_freshness
 from ..core.schemas import GetFactorSlicesResponseV1
+from .ports import FactorWatermarkStorePort
+from .read_context import FrameReadContext, frame_read_context
 
 
 @dataclass(frozen=True)
 class FactorReadService:
     store: AlignedStorePort
-    factor_store: HeadStorePort
+    factor_store: FactorWatermarkStorePort | None
     factor_slices_service: FactorSlicesServicePort
     strict_mode: bool = True
 
@@ -20,11 +22,13 @@ class FactorReadService:
         series_id: str,
         at_time: int,
         aligned_time: int | None = None,
+        read_ctx: FrameReadContext | None = None,
     ) -> int | None:
         if aligned_time is not None:
             candidate = int(aligned_time)
             return candidate if candidate > 0 else None
-        return self.store.floor_time(series_id, at_time=int(at_time))
+        store = self.store if read_ctx is None else read_ctx.view(self.store)
+        return store.floor_time(series_id, at_time=int(at_time))
 
     def read_slices(
         self,
@@ -34,19 +38,27 @@ class FactorReadService:
         window_candles: int,
         aligned_time: int | None = None,
         ensure_fresh: bool = True,
+        read_ctx: FrameReadContext | None = None,
     ) -> GetFactorSlicesResponseV1:
+        ctx = frame_read_context(read_ctx)
         aligned = self.resolve_aligned_time(
             series_id=series_id,
             at_time=int(at_time),
             aligned_time=aligned_time,
+            read_ctx=ctx,
         )
-        return read_factor_slices_with_freshness(
-            store=self.store,
-            factor_slices_service=self.factor_slices_service,
-            series_id=series_id,
-            at_time=int(at_time),
-            window_candles=int(window_candles),
-            aligned_time=aligned,
-            ensure_fresh=bool(ensure_fresh),
-            factor_store=self.factor_store,
+        # The world frame and its draw delta ask for the same slices; build them once per request.
+        key = ("factor_slices", series_id, aligned, int(at_time), int(window_candles), bool(ensure_fresh))
+        return ctx.once(
+            key,
+            lambda: read_factor_slices_with_freshness(
+                store=ctx.view(self.store),
+                factor_slices_service=self.factor_slices_service,
+                series_id=series_id,
+                at_time=int(at_time),
+                window_candles=int(window_candles),
+                aligned_time=aligned,
+                ensure_fresh=bool(ensure_fresh),
+                factor_store=None if self.factor_store is None else ctx.view(self.factor_store),
+            ),
         )
@@ -5,6 +5,7 @@ from typing import Protocol
 from ..core.ports import HeadStorePort, OverlayOrchestratorPort
 from ..core.schemas import DrawDeltaV1, GetFactorSlicesResponseV1
 from ..overlay.store import OverlayInstructionVersionRow
+from .read_context import FrameReadContext
 
 
 class OverlayStoreReadPort(HeadStorePort, Protocol):
@@ -21,11 +22,22 @@ class OverlayStoreReadPort(HeadStorePort, Protocol):
 
     def last_version_id(self, series_id: str) -> int: ...
 
+    def series_revision(self, series_id: str) -> int: ...
+
+
+class FactorWatermarkStorePort(HeadStorePort, Protocol):
+    def last_event_id(self, series_id: str) -> int: ...
+
+    def series_revision(self, series_id: str) -> int: ...
+
 
 class FactorReadServicePort(Protocol):
     @property
     def strict_mode(self) -> bool: ...
 
+    @property
+    def factor_store(self) -> FactorWatermarkStorePort | None: ...
+
     def read_slices(
         self,
         *,
@@ -34,6 +46,7 @@ class FactorReadServicePort(Protocol):
         window_candles: int,
         aligned_time: int | None = None,
         ensure_fresh: bool = True,
+        read_ctx: FrameReadContext | None = None,
     ) -> GetFactorSlicesResponseV1: ...
 
 
@@ -45,6 +58,7 @@ class DrawReadServicePort(Protocol):
         cursor_version_id: int,
         window_candles: int,
         at_time: int | None = None,
+        read_ctx: FrameReadContext | None = None,
     ) -> DrawDeltaV1: ...
 
 
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class _MemoStoreView:
+    """`head_time` / `floor_time` of one store, answered from the owning `FrameReadContext`."""
+
+    __slots__ = ("_ctx", "_store")
+
+    def __init__(self, ctx: FrameReadContext, store: Any) -> None:
+        self._ctx = ctx
+        self._store = store
+
+    def head_time(self, series_id: str) -> int | None:
+        store = self._store
+        return self._ctx.once((id(store), "head_time", series_id), lambda: store.head_time(series_id))
+
+    def floor_time(self, series_id: str, *, at_time: int) -> int | None:
+        store = self._store
+        floor = self._ctx.once(
+            (id(store), "floor_time", series_id, int(at_time)),
+            lambda: store.floor_time(series_id, at_time=int(at_time)),
+        )
+        if floor is not None:
+            # A candle time is its own floor, so re-aligning the aligned time needs no second query.
+            self._ctx.once((id(store), "floor_time", series_id, int(floor)), lambda: int(floor))
+        return floor
+
+
+class FrameReadContext:
+    """
+    Per-request memo of the store reads behind one frame: head times, floor (aligned) times and factor slices
+    are each queried at most once, however many read services ask for them.
+    Lives for a single request only, so it never needs invalidation; do not keep or share it.
+    """
+
+    __slots__ = ("_memo", "_views")
+
+    def __init__(self) -> None:
+        self._memo: dict[tuple[Any, ...], Any] = {}
+        self._views: dict[int, _MemoStoreView] = {}
+
+    def once(self, key: tuple[Any, ...], load: Callable[[], T]) -> T:
+        if key in self._memo:
+            return self._memo[key]
+        value = load()
+        self._memo[key] = value
+        return value
+
+    def view(self, store: Any) -> _MemoStoreView:
+        """A head/floor-time port over `store` whose reads are memoized in this context."""
+        view = self._views.get(id(store))
+        if view is None:
+            view = self._views[id(store)] = _MemoStoreView(self, store)
+        return view
+
+
+def frame_read_context(read_ctx: FrameReadContext | None) -> FrameReadContext:
+    return read_ctx if read_ctx is not None else FrameReadContext()
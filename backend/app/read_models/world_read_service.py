@@ -14,6 +14,7 @@ from ..core.schemas import (
 )
 from ..core.service_errors import ServiceError
 from .ports import DrawReadServicePort, FactorReadServicePort
+from .read_context import FrameReadContext
 
 @dataclass(frozen=True)
 class WorldReadService:
@@ -33,11 +34,13 @@ class WorldReadService:
         series_id: str,
         at_time: int,
         window_candles: int,
+        read_ctx: FrameReadContext,
     ) -> GetFactorSlicesResponseV1:
         return self.factor_read_service.read_slices(
             series_id=series_id,
             at_time=int(at_time),
             window_candles=int(window_candles),
+            read_ctx=read_ctx,
         )
 
     def _read_draw_delta(
@@ -47,12 +50,14 @@ class WorldReadService:
         cursor_version_id: int,
         window_candles: int,
         at_time: int | None,
+        read_ctx: FrameReadContext,
     ) -> DrawDeltaV1:
         return self.draw_read_service.read_delta(
             series_id=series_id,
             cursor_version_id=int(cursor_version_id),
             window_candles=int(window_candles),
             at_time=None if at_time is None else int(at_time),
+            read_ctx=read_ctx,
         )
 
     @staticmethod
@@ -103,17 +108,20 @@ class WorldReadService:
         aligned_time: int,
         window_candles: int,
         debug_event: str,
+        read_ctx: FrameReadContext,
     ) -> WorldStateV1:
         factor_slices = self._read_factor_slices(
             series_id=series_id,
             at_time=int(aligned_time),
             window_candles=int(window_candles),
+            read_ctx=read_ctx,
         )
         draw_state = self._read_draw_delta(
             series_id=series_id,
             cursor_version_id=0,
             window_candles=int(window_candles),
             at_time=int(aligned_time),
+            read_ctx=read_ctx,
         )
         candle_id = self._require_matching_candle_id(
             series_id=series_id,
@@ -141,14 +149,17 @@ class WorldReadService:
         series_id: str,
         window_candles: int,
     ) -> WorldStateV1:
-        store_head = self.store.head_time(series_id)
+        # One context per frame: head/aligned times and slices are shared with the draw delta below.
+        read_ctx = FrameReadContext()
+        store = read_ctx.view(self.store)
+        store_head = store.head_time(series_id)
         if store_head is None:
             raise ServiceError(status_code=404, detail="no_data", code="world_read.no_data")
-        overlay_head = self.overlay_store.head_time(series_id)
+        overlay_head = read_ctx.view(self.overlay_store).head_time(series_id)
         if overlay_head is None:
             raise ServiceError(status_code=404, detail="no_overlay", code="world_read.no_overlay")
         aligned_base = min(int(store_head), int(overlay_head))
-        aligned_time = self.store.floor_time(series_id, at_time=int(aligned_base))
+        aligned_time = store.floor_time(series_id, at_time=int(aligned_base))
         if aligned_time is None:
             raise ServiceError(status_code=404, detail="no_data", code="world_read.no_data")
         return self._build_world_state(
@@ -157,6 +168,7 @@ class WorldReadService:
             aligned_time=int(aligned_time),
             window_candles=int(window_candles),
             debug_event="read.http.world_frame_live",
+            read_ctx=read_ctx,
         )
 
     def read_frame_at_time(
@@ -166,7 +178,8 @@ class WorldReadService:
         at_time: int,
         window_candles: int,
     ) -> WorldStateV1:
-        aligned_time = self.store.floor_time(series_id, at_time=int(at_time))
+        read_ctx = FrameReadContext()
+        aligned_time = read_ctx.view(self.store).floor_time(series_id, at_time=int(at_time))
         if aligned_time is None:
             raise ServiceError(status_code=404, detail="no_data", code="world_read.no_data")
         return self._build_world_state(
@@ -175,6 +188,7 @@ class WorldReadService:
             aligned_time=int(aligned_time),
             window_candles=int(window_candles),
             debug_event="read.http.world_frame_at_time",
+            read_ctx=read_ctx,
         )
 
     def poll_delta(
@@ -186,11 +200,13 @@ class WorldReadService:
         window_candles: int,
     ) -> WorldDeltaPollResponseV1:
         _ = int(limit)
+        read_ctx = FrameReadContext()
         draw = self._read_draw_delta(
             series_id=series_id,
             cursor_version_id=int(after_id),
             window_candles=int(window_candles),
             at_time=None,
+            read_ctx=read_ctx,
         )
         next_id = int(draw.next_cursor.version_id or 0)
         if draw.to_candle_id is None or draw.to_candle_time is None:
@@ -209,6 +225,7 @@ class WorldReadService:
                 series_id=series_id,
                 at_time=int(draw.to_candle_time),
                 window_candles=int(window_candles),
+                read_ctx=read_ctx,
             ),
         )
         if self._debug_enabled():
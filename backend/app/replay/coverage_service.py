@@ -7,6 +7,7 @@ from typing import Any, Callable
 
 from ..market.history_bootstrapper import backfill_tail_from_freqtrade
 from ..market.backfill import backfill_from_ccxt_range
+from ..market.ccxt_backfill_engine import CcxtBackfillEngine
 from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
 
 
@@ -31,11 +32,13 @@ class ReplayCoverageCoordinator:
         coverage_fn: Callable[..., Any],
         ccxt_backfill_enabled: bool,
         market_history_source: str,
+        ccxt_backfill: CcxtBackfillEngine | None = None,
     ) -> None:
         self._candle_store = candle_store
         self._ingest_pipeline = ingest_pipeline
         self._coverage_fn = coverage_fn
         self._ccxt_backfill_enabled = bool(ccxt_backfill_enabled)
+        self._ccxt_backfill = ccxt_backfill
         self._market_history_source = str(market_history_source).strip().lower()
         self._lock = threading.Lock()
         self._jobs: dict[str, CoverageJob] = {}
@@ -110,6 +113,7 @@ class ReplayCoverageCoordinator:
                         series_id=series_id,
                         start_time=int(int(to_time) - int(target_candles) * int(tf_s) - int(tf_s)),
                         end_time=int(to_time),
+                        engine=self._ccxt_backfill,
                     )
                 if self._ingest_pipeline is None:
                     raise RuntimeError("ingest_pipeline_not_configured")
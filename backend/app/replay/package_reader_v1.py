@@ -51,7 +51,7 @@ class ReplayPackageReaderV1:
     ) -> ReplayCoverageV1:
         tf_s = timeframe_to_seconds(series_id_timeframe(series_id))
         start_time = max(0, int(to_time) - (int(target_candles) - 1) * int(tf_s))
-        candles = self._candle_store.get_closed_between_times(
+        candles = self._candle_store.get_closed_records_between_times(
             series_id,
             start_time=int(start_time),
             end_time=int(to_time),
@@ -14,6 +14,7 @@ from ..build.package_service_helpers import (
     normalize_window_params,
 )
 from ..factor.slices_service import FactorSlicesService
+from ..market.ccxt_backfill_engine import CcxtBackfillEngine
 from ..factor.store import FactorStore
 from ..overlay.store import OverlayStore
 from ..build.service_base import PackageBuildServiceBase
@@ -44,6 +45,7 @@ class ReplayPackageServiceConfig:
     replay_enabled: bool = False
     coverage_enabled: bool = False
     ccxt_backfill_enabled: bool = False
+    ccxt_backfill: CcxtBackfillEngine | None = None
     market_history_source: str = ""
 
 
@@ -89,6 +91,7 @@ class ReplayPackageServiceV1(PackageBuildServiceBase):
                 target_candles=target_candles,
             ),
             ccxt_backfill_enabled=bool(self._ccxt_backfill_enabled),
+            ccxt_backfill=cfg.ccxt_backfill,
             market_history_source=str(self._market_history_source),
         )
 
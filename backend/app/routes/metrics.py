@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from ..deps import ApiGatesDep, RuntimeMetricsDep
+from ..runtime.metrics_prometheus import PROMETHEUS_CONTENT_TYPE, render_prometheus_text
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_prometheus_metrics(api_gates: ApiGatesDep, runtime_metrics: RuntimeMetricsDep) -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint (text format 0.0.4).
+    Gated by runtime metrics only, so it can be scraped without enabling the debug API.
+    """
+    if not api_gates.runtime_metrics:
+        raise HTTPException(status_code=404, detail="not_found")
+    return PlainTextResponse(
+        content=render_prometheus_text(runtime_metrics.export()),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
+
+
+def register_metrics_routes(app: FastAPI) -> None:
+    app.include_router(router)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+
+from ..deps import AppContainerDep
+
+router = APIRouter()
+
+
+@router.get("/readyz", include_in_schema=False)
+def get_readiness(container: AppContainerDep) -> JSONResponse:
+    """
+    Readiness probe: 200 once startup kline sync finished its priority (base-timeframe) series,
+    503 while they are still syncing. The remaining series keep syncing in the background.
+    """
+    progress = container.lifecycle.startup_sync_progress
+    ready = bool(progress.ready)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "startup_kline_sync": progress.snapshot()},
+    )
+
+
+def register_readiness_routes(app: FastAPI) -> None:
+    app.include_router(router)
@@ -61,6 +61,11 @@ def load_runtime_flags() -> RuntimeFlags:
             default=120,
             minimum=5,
         ),
+        ingest_trace_sample_rate=min(
+            1.0,
+            resolve_env_float("TRADE_CANVAS_INGEST_TRACE_SAMPLE_RATE", fallback=0.0, minimum=0.0),
+        ),
+        ingest_trace_capacity=env_int("TRADE_CANVAS_INGEST_TRACE_CAPACITY", default=256, minimum=1),
     )
 
     scaleout = RuntimeScaleoutFlags(
@@ -107,6 +112,7 @@ def load_runtime_flags() -> RuntimeFlags:
             default=2000,
             minimum=100,
         ),
+        enable_overlay_incremental_ingest=env_bool("TRADE_CANVAS_ENABLE_OVERLAY_INCREMENTAL_INGEST", default=True),
     )
 
     feature = RuntimeFeatureFlags(
@@ -139,6 +145,12 @@ def load_runtime_flags() -> RuntimeFlags:
             default=250,
             minimum=0,
         ),
+        enable_binance_ws_mux=env_bool("TRADE_CANVAS_ENABLE_BINANCE_WS_MUX", default=False),
+        binance_ws_streams_per_socket=min(
+            1024,
+            env_int("TRADE_CANVAS_BINANCE_WS_STREAMS_PER_SOCKET", default=200, minimum=1),
+        ),
+        enable_binance_ws_adaptive_flush=env_bool("TRADE_CANVAS_ENABLE_BINANCE_WS_ADAPTIVE_FLUSH", default=False),
     )
 
     market = RuntimeMarketFlags(
@@ -149,6 +161,11 @@ def load_runtime_flags() -> RuntimeFlags:
             "TRADE_CANVAS_ENABLE_MARKET_BACKFILL_PROGRESS_PERSISTENCE",
             default=False,
         ),
+        market_backfill_progress_flush_ms=env_int(
+            "TRADE_CANVAS_MARKET_BACKFILL_PROGRESS_FLUSH_MS",
+            default=1000,
+            minimum=0,
+        ),
         enable_market_gap_backfill=env_bool("TRADE_CANVAS_ENABLE_MARKET_GAP_BACKFILL"),
         market_gap_backfill_freqtrade_limit=env_int(
             "TRADE_CANVAS_MARKET_GAP_BACKFILL_FREQTRADE_LIMIT",
@@ -161,6 +178,15 @@ def load_runtime_flags() -> RuntimeFlags:
             default=2000,
             minimum=100,
         ),
+        startup_kline_sync_concurrency=min(
+            32,
+            env_int("TRADE_CANVAS_STARTUP_KLINE_SYNC_CONCURRENCY", default=4, minimum=1),
+        ),
+        startup_kline_sync_rate_per_s=resolve_env_float(
+            "TRADE_CANVAS_STARTUP_KLINE_SYNC_RATE_PER_S",
+            fallback=5.0,
+            minimum=0.0,
+        ),
         ccxt_timeout_ms=env_int(
             "TRADE_CANVAS_CCXT_TIMEOUT_MS",
             default=10_000,
@@ -201,6 +227,15 @@ def load_runtime_flags() -> RuntimeFlags:
         ),
         backtest_require_trades=env_bool("TRADE_CANVAS_BACKTEST_REQUIRE_TRADES"),
         freqtrade_mock_enabled=env_bool("TRADE_CANVAS_FREQTRADE_MOCK"),
+        ccxt_backfill_concurrency=min(
+            16,
+            env_int("TRADE_CANVAS_CCXT_BACKFILL_CONCURRENCY", default=4, minimum=1),
+        ),
+        ccxt_backfill_rate_per_s=resolve_env_float(
+            "TRADE_CANVAS_CCXT_BACKFILL_RATE_PER_S",
+            fallback=10.0,
+            minimum=0.0,
+        ),
     )
 
     return RuntimeFlags(
@@ -14,6 +14,8 @@ class RuntimeApiFlags:
     enable_kline_health_v2: bool
     enable_read_repair_api: bool
     kline_health_backfill_recent_seconds: int
+    ingest_trace_sample_rate: float
+    ingest_trace_capacity: int
 
 
 @dataclass(frozen=True)
@@ -39,6 +41,7 @@ class RuntimeFactorFlags:
 class RuntimeOverlayFlags:
     enable_overlay_ingest: bool
     window_candles: int
+    enable_overlay_incremental_ingest: bool
 
 
 @dataclass(frozen=True)
@@ -61,6 +64,9 @@ class RuntimeIngestFlags:
     binance_ws_batch_max: int
     binance_ws_flush_s: float
     market_forming_min_interval_ms: int
+    enable_binance_ws_mux: bool
+    binance_ws_streams_per_socket: int
+    enable_binance_ws_adaptive_flush: bool
 
 
 @dataclass(frozen=True)
@@ -69,10 +75,13 @@ class RuntimeMarketFlags:
     enable_strict_closed_only: bool
     market_auto_tail_backfill_max_candles: int | None
     enable_market_backfill_progress_persistence: bool
+    market_backfill_progress_flush_ms: int
     enable_market_gap_backfill: bool
     market_gap_backfill_freqtrade_limit: int
     enable_startup_kline_sync: bool
     startup_kline_sync_target_candles: int
+    startup_kline_sync_concurrency: int
+    startup_kline_sync_rate_per_s: float
     ccxt_timeout_ms: int
     enable_ccxt_backfill: bool
     enable_ccxt_backfill_on_read: bool
@@ -98,6 +107,8 @@ class RuntimeExecutionFlags:
     blocking_workers: int
     backtest_require_trades: bool
     freqtrade_mock_enabled: bool
+    ccxt_backfill_concurrency: int
+    ccxt_backfill_rate_per_s: float
 
 
 @dataclass(frozen=True)
@@ -122,6 +133,8 @@ class RuntimeFlags:
         "enable_kline_health_v2": ("api", "enable_kline_health_v2"),
         "enable_read_repair_api": ("api", "enable_read_repair_api"),
         "kline_health_backfill_recent_seconds": ("api", "kline_health_backfill_recent_seconds"),
+        "ingest_trace_sample_rate": ("api", "ingest_trace_sample_rate"),
+        "ingest_trace_capacity": ("api", "ingest_trace_capacity"),
         "enable_pg_store": ("scaleout", "enable_pg_store"),
         "enable_pg_only": ("scaleout", "enable_pg_only"),
         "enable_ws_pubsub": ("scaleout", "enable_ws_pubsub"),
@@ -135,6 +148,7 @@ class RuntimeFlags:
         "factor_logic_version_override": ("factor", "logic_version_override"),
         "enable_overlay_ingest": ("overlay", "enable_overlay_ingest"),
         "overlay_window_candles": ("overlay", "window_candles"),
+        "enable_overlay_incremental_ingest": ("overlay", "enable_overlay_incremental_ingest"),
         "enable_feature_ingest": ("feature", "enable_feature_ingest"),
         "enable_feature_strict_read": ("feature", "enable_feature_strict_read"),
         "enable_ingest_role_guard": ("ingest", "enable_ingest_role_guard"),
@@ -148,15 +162,21 @@ class RuntimeFlags:
         "ondemand_max_jobs": ("ingest", "ondemand_max_jobs"),
         "binance_ws_batch_max": ("ingest", "binance_ws_batch_max"),
         "binance_ws_flush_s": ("ingest", "binance_ws_flush_s"),
+        "enable_binance_ws_mux": ("ingest", "enable_binance_ws_mux"),
+        "binance_ws_streams_per_socket": ("ingest", "binance_ws_streams_per_socket"),
+        "enable_binance_ws_adaptive_flush": ("ingest", "enable_binance_ws_adaptive_flush"),
         "market_forming_min_interval_ms": ("ingest", "market_forming_min_interval_ms"),
         "enable_market_auto_tail_backfill": ("market", "enable_market_auto_tail_backfill"),
         "enable_strict_closed_only": ("market", "enable_strict_closed_only"),
         "market_auto_tail_backfill_max_candles": ("market", "market_auto_tail_backfill_max_candles"),
         "enable_market_backfill_progress_persistence": ("market", "enable_market_backfill_progress_persistence"),
+        "market_backfill_progress_flush_ms": ("market", "market_backfill_progress_flush_ms"),
         "enable_market_gap_backfill": ("market", "enable_market_gap_backfill"),
         "market_gap_backfill_freqtrade_limit": ("market", "market_gap_backfill_freqtrade_limit"),
         "enable_startup_kline_sync": ("market", "enable_startup_kline_sync"),
         "startup_kline_sync_target_candles": ("market", "startup_kline_sync_target_candles"),
+        "startup_kline_sync_concurrency": ("market", "startup_kline_sync_concurrency"),
+        "startup_kline_sync_rate_per_s": ("market", "startup_kline_sync_rate_per_s"),
         "ccxt_timeout_ms": ("market", "ccxt_timeout_ms"),
         "enable_ccxt_backfill": ("market", "enable_ccxt_backfill"),
         "enable_ccxt_backfill_on_read": ("market", "enable_ccxt_backfill_on_read"),
@@ -170,6 +190,8 @@ class RuntimeFlags:
         "blocking_workers": ("execution", "blocking_workers"),
         "backtest_require_trades": ("execution", "backtest_require_trades"),
         "freqtrade_mock_enabled": ("execution", "freqtrade_mock_enabled"),
+        "ccxt_backfill_concurrency": ("execution", "ccxt_backfill_concurrency"),
+        "ccxt_backfill_rate_per_s": ("execution", "ccxt_backfill_rate_per_s"),
     }
 
     def __getattr__(self, name: str) -> Any:
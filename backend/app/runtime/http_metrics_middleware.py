@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from .metrics import RuntimeMetrics
+
+_Scope = MutableMapping[str, Any]
+_Message = MutableMapping[str, Any]
+_Receive = Callable[[], Awaitable[_Message]]
+_Send = Callable[[_Message], Awaitable[None]]
+
+
+class HttpMetricsMiddleware:
+    """
+    Record `http_request_duration_ms{method,route,status}` for every HTTP request.
+    `route` is the matched route template (bounded cardinality), never the raw path.
+    """
+
+    def __init__(self, app: Callable[[_Scope, _Receive, _Send], Awaitable[None]], *, runtime_metrics: RuntimeMetrics) -> None:
+        self._app = app
+        self._runtime_metrics = runtime_metrics
+
+    async def __call__(self, scope: _Scope, receive: _Receive, send: _Send) -> None:
+        if scope.get("type") != "http" or not self._runtime_metrics.enabled():
+            await self._app(scope, receive, send)
+            return
+
+        t0 = time.perf_counter()
+        status_code = 500
+
+        async def _send(message: _Message) -> None:
+            nonlocal status_code
+            if message.get("type") == "http.response.start":
+                status_code = int(message.get("status") or 500)
+            await send(message)
+
+        try:
+            await self._app(scope, receive, _send)
+        finally:
+            route = scope.get("route")
+            self._runtime_metrics.observe_ms(
+                "http_request_duration_ms",
+                duration_ms=(time.perf_counter() - t0) * 1000.0,
+                labels={
+                    "method": str(scope.get("method") or ""),
+                    "route": str(getattr(route, "path", "") or "unmatched"),
+                    "status": f"{int(status_code) // 100}xx",
+                },
+            )
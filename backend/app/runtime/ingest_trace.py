@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from ..pipelines.ingest_pipeline_models import IngestStepResult
+
+
+@dataclass(frozen=True)
+class IngestTraceSpan:
+    name: str
+    start_ms: float
+    duration_ms: float
+    attrs: Mapping[str, Any]
+    children: tuple[IngestTraceSpan, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "start_ms": round(float(self.start_ms), 3),
+            "duration_ms": round(float(self.duration_ms), 3),
+            "attrs": dict(self.attrs),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass(frozen=True)
+class IngestTrace:
+    trace_id: int
+    source: str
+    series_id: str
+    candle_time: int
+    started_at_ms: int
+    root: IngestTraceSpan
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": int(self.trace_id),
+            "source": self.source,
+            "series_id": self.series_id,
+            "candle_time": int(self.candle_time),
+            "started_at_ms": int(self.started_at_ms),
+            "duration_ms": round(float(self.root.duration_ms), 3),
+            "root": self.root.to_dict(),
+        }
+
+
+class _OpenSpan:
+    __slots__ = ("name", "started_at", "ended_at", "attrs", "children")
+
+    def __init__(self, name: str, *, started_at: float, attrs: Mapping[str, Any] | None) -> None:
+        self.name = str(name)
+        self.started_at = float(started_at)
+        self.ended_at: float | None = None
+        self.attrs: dict[str, Any] = dict(attrs or {})
+        self.children: list[_OpenSpan] = []
+
+    def freeze(self, *, origin: float, now: float) -> IngestTraceSpan:
+        ended_at = self.ended_at if self.ended_at is not None else now
+        return IngestTraceSpan(
+            name=self.name,
+            start_ms=(self.started_at - origin) * 1000.0,
+            duration_ms=max(0.0, (ended_at - self.started_at) * 1000.0),
+            attrs=dict(self.attrs),
+            children=tuple(child.freeze(origin=origin, now=now) for child in self.children),
+        )
+
+
+class IngestTraceBuilder:
+    """
+    Span tree of one sampled ingest batch.
+    - Times are `time.perf_counter()` seconds, so spans recorded in worker threads line up.
+    - Only created for sampled batches; unsampled batches never allocate a builder.
+    """
+
+    def __init__(self, *, tracer: IngestTracer, source: str, series_id: str, reason: str) -> None:
+        self._tracer = tracer
+        self._source = str(source)
+        self._series_id = str(series_id)
+        self._started_at_ms = int(time.time() * 1000)
+        self._root = _OpenSpan(
+            f"{self._source}.flush",
+            started_at=time.perf_counter(),
+            attrs={"series_id": self._series_id, "reason": str(reason)},
+        )
+
+    @property
+    def root(self) -> _OpenSpan:
+        return self._root
+
+    def start_span(self, name: str, *, parent: _OpenSpan | None = None, **attrs: Any) -> _OpenSpan:
+        span = _OpenSpan(name, started_at=time.perf_counter(), attrs=attrs)
+        (parent or self._root).children.append(span)
+        return span
+
+    @staticmethod
+    def end_span(span: _OpenSpan, **attrs: Any) -> None:
+        span.ended_at = time.perf_counter()
+        if attrs:
+            span.attrs.update(attrs)
+
+    def add_pipeline_steps(self, *, steps: Sequence[IngestStepResult], parent: _OpenSpan) -> None:
+        """Group `<step>:<series_id>` step results into one child span per series, in pipeline order."""
+        by_series: dict[str, _OpenSpan] = {}
+        for step in steps:
+            step_name, _, series_id = str(step.name).partition(":")
+            started_at = float(step.started_at)
+            if started_at <= 0.0:
+                continue
+            ended_at = started_at + float(step.elapsed_ms) / 1000.0
+            series_span = by_series.get(series_id)
+            if series_span is None:
+                series_span = _OpenSpan(series_id, started_at=started_at, attrs={"series_id": series_id})
+                by_series[series_id] = series_span
+                parent.children.append(series_span)
+            attrs: dict[str, Any] = {"series_id": series_id, "ok": bool(step.ok)}
+            if step.rows is not None:
+                attrs["rows"] = int(step.rows)
+            if step.detail:
+                attrs.update(dict(step.detail))
+            child = _OpenSpan(step_name, started_at=started_at, attrs=attrs)
+            child.ended_at = ended_at
+            series_span.children.append(child)
+            series_span.ended_at = max(float(series_span.ended_at or 0.0), ended_at)
+
+    def finish(self, *, candle_time: int, **attrs: Any) -> IngestTrace:
+        now = time.perf_counter()
+        self._root.ended_at = now
+        self._root.attrs.update(attrs)
+        trace = IngestTrace(
+            trace_id=self._tracer.next_trace_id(),
+            source=self._source,
+            series_id=self._series_id,
+            candle_time=int(candle_time),
+            started_at_ms=self._started_at_ms,
+            root=self._root.freeze(origin=self._root.started_at, now=now),
+        )
+        self._tracer.record(trace)
+        return trace
+
+
+def _stack_frame(name: str) -> str:
+    return str(name).replace(";", "_").replace(" ", "_") or "_"
+
+
+def _collect_self_times(span: IngestTraceSpan, prefix: str, out: dict[str, float]) -> None:
+    stack = f"{prefix};{_stack_frame(span.name)}" if prefix else _stack_frame(span.name)
+    child_total = sum(float(child.duration_ms) for child in span.children)
+    self_ms = max(0.0, float(span.duration_ms) - child_total)
+    out[stack] = float(out.get(stack, 0.0)) + self_ms
+    for child in span.children:
+        _collect_self_times(child, stack, out)
+
+
+def render_collapsed_stacks(traces: Sequence[IngestTrace]) -> str:
+    """Brendan Gregg collapsed-stack format (`a;b;c <self_us>`), summed across traces."""
+    totals: dict[str, float] = {}
+    for trace in traces:
+        _collect_self_times(trace.root, "", totals)
+    lines: list[str] = []
+    for stack, ms in sorted(totals.items()):
+        self_us = int(round(ms * 1000.0))
+        if self_us > 0:
+            lines.append(f"{stack} {self_us}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class IngestTracer:
+    """
+    In-process ingest tracer: samples batches at `sample_rate` and keeps the last `capacity` traces.
+    A rate of 0 disables tracing; `maybe_start` then costs a single comparison.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float,
+        capacity: int = 256,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._sample_rate = max(0.0, min(1.0, float(sample_rate)))
+        self._capacity = max(1, int(capacity))
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._traces: deque[IngestTrace] = deque(maxlen=self._capacity)
+        self._ids = itertools.count(1)
+        self._seen = 0
+        self._sampled = 0
+
+    def enabled(self) -> bool:
+        return self._sample_rate > 0.0
+
+    def maybe_start(self, *, source: str, series_id: str, reason: str) -> IngestTraceBuilder | None:
+        if self._sample_rate <= 0.0:
+            return None
+        self._seen += 1
+        if self._sample_rate < 1.0 and self._rng() >= self._sample_rate:
+            return None
+        self._sampled += 1
+        return IngestTraceBuilder(tracer=self, source=source, series_id=series_id, reason=reason)
+
+    def next_trace_id(self) -> int:
+        return int(next(self._ids))
+
+    def record(self, trace: IngestTrace) -> None:
+        with self._lock:
+            self._traces.append(trace)
+
+    def recent(self, *, limit: int | None = None, series_id: str | None = None) -> list[IngestTrace]:
+        with self._lock:
+            traces = list(self._traces)
+        if series_id:
+            traces = [trace for trace in traces if trace.series_id == series_id]
+        if limit is not None:
+            traces = traces[-max(0, int(limit)) :] if int(limit) > 0 else []
+        return traces
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stored = len(self._traces)
+        return {
+            "enabled": bool(self.enabled()),
+            "sample_rate": float(self._sample_rate),
+            "capacity": int(self._capacity),
+            "stored": int(stored),
+            "seen": int(self._seen),
+            "sampled": int(self._sampled),
+        }
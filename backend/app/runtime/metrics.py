@@ -3,10 +3,17 @@ from __future__ import annotations
 import threading
 import time
 from dataclasses import dataclass
-from typing import Mapping
+from typing import Mapping, Sequence
 
+from .metrics_histogram import LatencyHistogram, normalize_bucket_bounds
 
-def _normalize_labels(labels: Mapping[str, object] | None) -> tuple[tuple[str, str], ...]:
+_Labels = tuple[tuple[str, str], ...]
+_SeriesKey = tuple[str, _Labels]
+_OVERFLOW_LABELS: _Labels = (("overflow", "true"),)
+_SNAPSHOT_QUANTILES: tuple[tuple[str, float], ...] = (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99))
+
+
+def _normalize_labels(labels: Mapping[str, object] | None) -> _Labels:
     if not labels:
         return tuple()
     pairs: list[tuple[str, str]] = []
@@ -19,30 +26,98 @@ def _normalize_labels(labels: Mapping[str, object] | None) -> tuple[tuple[str, s
     return tuple(pairs)
 
 
+def _format_key(key: _SeriesKey) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    labels_str = ",".join(f"{k}={v}" for k, v in labels)
+    return f"{name}{{{labels_str}}}"
+
+
 def _metric_key(name: str, labels: Mapping[str, object] | None = None) -> str:
-    normalized_name = str(name).strip()
-    normalized_labels = _normalize_labels(labels)
-    if not normalized_labels:
-        return normalized_name
-    labels_str = ",".join(f"{key}={value}" for key, value in normalized_labels)
-    return f"{normalized_name}{{{labels_str}}}"
+    return _format_key((str(name).strip(), _normalize_labels(labels)))
+
+
+@dataclass(frozen=True)
+class MetricSample:
+    name: str
+    labels: _Labels
+    value: float
+
+
+@dataclass(frozen=True)
+class HistogramSample:
+    name: str
+    labels: _Labels
+    buckets: tuple[tuple[float, int], ...]
+    count: int
+    total_ms: float
+
+
+@dataclass(frozen=True)
+class RuntimeMetricsExport:
+    counters: tuple[MetricSample, ...]
+    gauges: tuple[MetricSample, ...]
+    histograms: tuple[HistogramSample, ...]
+
+
+class TimerHandle:
+    """Pre-resolved timer series: `observe_ms` skips label normalization and cardinality checks."""
+
+    __slots__ = ("_metrics", "_lock", "_histogram")
+
+    def __init__(self, *, metrics: RuntimeMetrics, histogram: LatencyHistogram) -> None:
+        self._metrics = metrics
+        self._lock = metrics._lock
+        self._histogram = histogram
 
+    def observe_ms(self, duration_ms: float) -> None:
+        value = duration_ms if duration_ms > 0.0 else 0.0
+        with self._lock:
+            self._histogram.record(value)
+        self._metrics._dirty = True
+
+
+class _NoopTimerHandle(TimerHandle):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        pass
 
-@dataclass
-class _TimerStat:
-    count: int = 0
-    total_ms: float = 0.0
-    max_ms: float = 0.0
+    def observe_ms(self, duration_ms: float) -> None:
+        return None
+
+
+_NOOP_TIMER = _NoopTimerHandle()
 
 
 class RuntimeMetrics:
-    def __init__(self, *, enabled: bool) -> None:
+    """
+    In-process counters, gauges and latency histograms.
+    - Each metric name keeps at most `max_series_per_metric` label sets; extra label sets are folded
+      into a single `{overflow=true}` series and counted in `runtime_metrics_overflow_total`.
+    - Hot paths should resolve a `timer(...)` handle once and call `observe_ms` on it.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        max_series_per_metric: int = 1000,
+        latency_buckets_ms: Sequence[float] | None = None,
+    ) -> None:
         self._enabled = bool(enabled)
+        self._max_series_per_metric = max(1, int(max_series_per_metric))
+        self._bounds = normalize_bucket_bounds(latency_buckets_ms)
         self._lock = threading.Lock()
         self._updated_at_ms = 0
-        self._counters: dict[str, float] = {}
-        self._gauges: dict[str, float] = {}
-        self._timers: dict[str, _TimerStat] = {}
+        self._dirty = False
+        self._counters: dict[_SeriesKey, float] = {}
+        self._gauges: dict[_SeriesKey, float] = {}
+        self._timers: dict[_SeriesKey, LatencyHistogram] = {}
+        self._timer_handles: dict[_SeriesKey, TimerHandle] = {}
+        self._series_per_metric: dict[str, int] = {}
+        self._overflow: dict[str, int] = {}
 
     def enabled(self) -> bool:
         return bool(self._enabled)
@@ -51,56 +126,113 @@ class RuntimeMetrics:
     def _now_ms() -> int:
         return int(time.time() * 1000)
 
+    def _admit_locked(self, store: Mapping[_SeriesKey, object], key: _SeriesKey) -> _SeriesKey:
+        if key in store:
+            return key
+        name, labels = key
+        used = int(self._series_per_metric.get(name, 0))
+        if labels and used >= self._max_series_per_metric:
+            self._overflow[name] = int(self._overflow.get(name, 0)) + 1
+            return (name, _OVERFLOW_LABELS)
+        self._series_per_metric[name] = used + 1
+        return key
+
     def incr(self, name: str, *, value: float = 1.0, labels: Mapping[str, object] | None = None) -> None:
         if not self._enabled:
             return
-        metric_key = _metric_key(name, labels)
+        key = (str(name).strip(), _normalize_labels(labels))
         delta = float(value)
         with self._lock:
-            current = float(self._counters.get(metric_key, 0.0))
-            self._counters[metric_key] = current + delta
+            admitted = self._admit_locked(self._counters, key)
+            self._counters[admitted] = float(self._counters.get(admitted, 0.0)) + delta
             self._updated_at_ms = self._now_ms()
 
     def set_gauge(self, name: str, *, value: float, labels: Mapping[str, object] | None = None) -> None:
         if not self._enabled:
             return
-        metric_key = _metric_key(name, labels)
+        key = (str(name).strip(), _normalize_labels(labels))
         with self._lock:
-            self._gauges[metric_key] = float(value)
+            admitted = self._admit_locked(self._gauges, key)
+            self._gauges[admitted] = float(value)
             self._updated_at_ms = self._now_ms()
 
+    def timer(self, name: str, *, labels: Mapping[str, object] | None = None) -> TimerHandle:
+        if not self._enabled:
+            return _NOOP_TIMER
+        key = (str(name).strip(), _normalize_labels(labels))
+        handle = self._timer_handles.get(key)
+        if handle is not None:
+            return handle
+        with self._lock:
+            admitted = self._admit_locked(self._timers, key)
+            histogram = self._timers.get(admitted)
+            if histogram is None:
+                histogram = LatencyHistogram(self._bounds)
+                self._timers[admitted] = histogram
+            handle = TimerHandle(metrics=self, histogram=histogram)
+            if admitted == key:
+                self._timer_handles[key] = handle
+        return handle
+
     def observe_ms(self, name: str, *, duration_ms: float, labels: Mapping[str, object] | None = None) -> None:
         if not self._enabled:
             return
-        metric_key = _metric_key(name, labels)
-        value = max(0.0, float(duration_ms))
-        with self._lock:
-            stat = self._timers.get(metric_key)
-            if stat is None:
-                stat = _TimerStat()
-                self._timers[metric_key] = stat
-            stat.count += 1
-            stat.total_ms += value
-            stat.max_ms = max(float(stat.max_ms), value)
+        self.timer(name, labels=labels).observe_ms(duration_ms)
+
+    def _touch_locked(self) -> None:
+        if self._dirty:
             self._updated_at_ms = self._now_ms()
+            self._dirty = False
 
     def snapshot(self) -> dict:
         with self._lock:
-            counters = {key: float(value) for key, value in sorted(self._counters.items(), key=lambda item: item[0])}
-            gauges = {key: float(value) for key, value in sorted(self._gauges.items(), key=lambda item: item[0])}
+            self._touch_locked()
+            counters = {_format_key(key): float(value) for key, value in sorted(self._counters.items())}
+            gauges = {_format_key(key): float(value) for key, value in sorted(self._gauges.items())}
             timers: dict[str, dict[str, float]] = {}
-            for key, stat in sorted(self._timers.items(), key=lambda item: item[0]):
-                avg_ms = float(stat.total_ms) / float(stat.count) if int(stat.count) > 0 else 0.0
-                timers[key] = {
-                    "count": float(stat.count),
-                    "total_ms": float(stat.total_ms),
-                    "max_ms": float(stat.max_ms),
+            for key, hist in sorted(self._timers.items()):
+                avg_ms = float(hist.total_ms) / float(hist.count) if int(hist.count) > 0 else 0.0
+                timer = {
+                    "count": float(hist.count),
+                    "total_ms": float(hist.total_ms),
+                    "max_ms": float(hist.max_ms),
                     "avg_ms": float(avg_ms),
                 }
+                for field, q in _SNAPSHOT_QUANTILES:
+                    timer[field] = float(hist.quantile(q))
+                timers[_format_key(key)] = timer
             return {
                 "enabled": bool(self._enabled),
                 "updated_at_ms": int(self._updated_at_ms),
                 "counters": counters,
                 "gauges": gauges,
                 "timers": timers,
+                "cardinality": {
+                    "max_series_per_metric": int(self._max_series_per_metric),
+                    "overflow": {name: int(count) for name, count in sorted(self._overflow.items())},
+                },
             }
+
+    def export(self) -> RuntimeMetricsExport:
+        with self._lock:
+            counters = [MetricSample(name=k[0], labels=k[1], value=float(v)) for k, v in sorted(self._counters.items())]
+            for name, count in sorted(self._overflow.items()):
+                counters.append(
+                    MetricSample(
+                        name="runtime_metrics_overflow_total",
+                        labels=(("metric", name),),
+                        value=float(count),
+                    )
+                )
+            gauges = tuple(MetricSample(name=k[0], labels=k[1], value=float(v)) for k, v in sorted(self._gauges.items()))
+            histograms = tuple(
+                HistogramSample(
+                    name=k[0],
+                    labels=k[1],
+                    buckets=tuple(hist.cumulative_counts()),
+                    count=int(hist.count),
+                    total_ms=float(hist.total_ms),
+                )
+                for k, hist in sorted(self._timers.items())
+            )
+        return RuntimeMetricsExport(counters=tuple(counters), gauges=gauges, histograms=histograms)
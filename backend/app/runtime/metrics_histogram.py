@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Sequence
+
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+)
+
+
+def normalize_bucket_bounds(bounds: Sequence[float] | None) -> tuple[float, ...]:
+    raw = DEFAULT_LATENCY_BUCKETS_MS if bounds is None else bounds
+    out = tuple(sorted({float(b) for b in raw if float(b) > 0.0}))
+    if not out:
+        raise ValueError("latency_buckets_empty")
+    return out
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (Prometheus `le` semantics: bucket i counts values <= bounds[i]).
+    - `record` is a bisect plus a few attribute updates; callers own locking.
+    - Quantiles are estimated by linear interpolation inside the owning bucket and clamped to max.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total_ms", "max_ms")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def quantile(self, q: float) -> float:
+        if self.count <= 0:
+            return 0.0
+        rank = max(0.0, min(1.0, float(q))) * float(self.count)
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            if bucket_count <= 0:
+                continue
+            if float(seen + bucket_count) >= rank:
+                lower = 0.0 if idx == 0 else float(self.bounds[idx - 1])
+                upper = float(self.bounds[idx]) if idx < len(self.bounds) else float(self.max_ms)
+                upper = min(upper, float(self.max_ms))
+                lower = min(lower, upper)
+                fraction = (rank - float(seen)) / float(bucket_count)
+                return lower + (upper - lower) * max(0.0, min(1.0, fraction))
+            seen += bucket_count
+        return float(self.max_ms)
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        out: list[tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self.bounds, self.counts):
+            running += bucket_count
+            out.append((float(bound), int(running)))
+        out.append((float("inf"), int(self.count)))
+        return out
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import math
+import re
+
+from .metrics import HistogramSample, MetricSample, RuntimeMetricsExport
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+_INVALID_LABEL_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _metric_name(name: str) -> str:
+    out = _INVALID_NAME_CHARS.sub("_", str(name))
+    if not out or out[0].isdigit():
+        out = f"_{out}"
+    return out
+
+
+def _label_name(name: str) -> str:
+    out = _INVALID_LABEL_CHARS.sub("_", str(name))
+    if not out or out[0].isdigit():
+        out = f"_{out}"
+    return out
+
+
+def _label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{_label_name(k)}="{_label_value(v)}"' for k, v in labels)
+    return f"{{{inner}}}"
+
+
+def _format_value(value: float) -> str:
+    v = float(value)
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    if math.isnan(v):
+        return "NaN"
+    if v.is_integer() and abs(v) < 1e15:
+        return str(int(v))
+    return repr(v)
+
+
+def _render_samples(lines: list[str], samples: tuple[MetricSample, ...], metric_type: str) -> None:
+    typed: set[str] = set()
+    for sample in samples:
+        name = _metric_name(sample.name)
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} {metric_type}")
+        lines.append(f"{name}{_format_labels(sample.labels)} {_format_value(sample.value)}")
+
+
+def _render_histograms(lines: list[str], samples: tuple[HistogramSample, ...]) -> None:
+    typed: set[str] = set()
+    for sample in samples:
+        name = _metric_name(sample.name)
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} histogram")
+        for bound, cumulative in sample.buckets:
+            labels = (*sample.labels, ("le", _format_value(bound)))
+            lines.append(f"{name}_bucket{_format_labels(labels)} {int(cumulative)}")
+        lines.append(f"{name}_sum{_format_labels(sample.labels)} {_format_value(sample.total_ms)}")
+        lines.append(f"{name}_count{_format_labels(sample.labels)} {int(sample.count)}")
+
+
+def render_prometheus_text(export: RuntimeMetricsExport) -> str:
+    """Prometheus text exposition format 0.0.4; timer histograms keep their `_ms` unit."""
+    lines: list[str] = []
+    _render_samples(lines, export.counters, "counter")
+    _render_samples(lines, export.gauges, "gauge")
+    _render_histograms(lines, export.histograms)
+    return "\n".join(lines) + "\n" if lines else ""
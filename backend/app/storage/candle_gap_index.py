@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+
+class MisalignedCandleTime(ValueError):
+    pass
+
+
+class CandleGapIndex:
+    """
+    Run-length index of one series' candle times: sorted, disjoint runs [start, end] of
+    consecutive candles spaced `step_s` apart. Every time must share one phase (t % step_s).
+
+    add/remove cost O(log r) plus a list shift; range queries cost O(log r + runs in range),
+    where r is the number of runs (= gaps + 1), independent of the candle count.
+    """
+
+    def __init__(self, *, step_s: int, phase: int | None = None) -> None:
+        self.step_s = max(1, int(step_s))
+        self._phase = None if phase is None else int(phase) % self.step_s
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._count = 0
+
+    @classmethod
+    def build(cls, *, step_s: int, times: Iterable[int]) -> CandleGapIndex:
+        index = cls(step_s=step_s)
+        ordered = sorted({int(t) for t in times})
+        if not ordered:
+            return index
+        index._phase = ordered[0] % index.step_s
+        step = index.step_s
+        run_start = prev = ordered[0]
+        for t in ordered[1:]:
+            if t % step != index._phase:
+                raise MisalignedCandleTime(str(t))
+            if t != prev + step:
+                index._starts.append(run_start)
+                index._ends.append(prev)
+                run_start = t
+            prev = t
+        index._starts.append(run_start)
+        index._ends.append(prev)
+        index._count = len(ordered)
+        return index
+
+    @classmethod
+    def from_runs(cls, *, step_s: int, runs: Iterable[tuple[int, int]]) -> CandleGapIndex:
+        """Index from ascending, disjoint [start, end] runs already `step_s` apart (e.g. computed in SQL)."""
+        index = cls(step_s=step_s)
+        step = index.step_s
+        for start, end in runs:
+            start, end = int(start), int(end)
+            index._check_phase(start)
+            index._check_phase(end)
+            if end < start or (index._ends and start <= index._ends[-1] + step):
+                raise ValueError(f"candle_gap_index_runs_unordered:{start}")
+            index._starts.append(start)
+            index._ends.append(end)
+            index._count += (end - start) // step + 1
+        return index
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def first_time(self) -> int | None:
+        return self._starts[0] if self._starts else None
+
+    @property
+    def last_time(self) -> int | None:
+        return self._ends[-1] if self._ends else None
+
+    @property
+    def gap_count(self) -> int:
+        return max(0, len(self._starts) - 1)
+
+    def _check_phase(self, t: int) -> None:
+        if self._phase is None:
+            self._phase = t % self.step_s
+        elif t % self.step_s != self._phase:
+            raise MisalignedCandleTime(str(t))
+
+    def add(self, candle_time: int) -> bool:
+        t = int(candle_time)
+        self._check_phase(t)
+        starts, ends, step = self._starts, self._ends, self.step_s
+        i = bisect_right(starts, t) - 1
+        if i >= 0 and t <= ends[i]:
+            return False
+        joins_left = i >= 0 and ends[i] + step == t
+        joins_right = i + 1 < len(starts) and starts[i + 1] - step == t
+        if joins_left and joins_right:
+            ends[i] = ends[i + 1]
+            del starts[i + 1]
+            del ends[i + 1]
+        elif joins_left:
+            ends[i] = t
+        elif joins_right:
+            starts[i + 1] = t
+        else:
+            starts.insert(i + 1, t)
+            ends.insert(i + 1, t)
+        self._count += 1
+        return True
+
+    def remove(self, candle_time: int) -> bool:
+        t = int(candle_time)
+        starts, ends, step = self._starts, self._ends, self.step_s
+        i = bisect_right(starts, t) - 1
+        if i < 0 or t > ends[i] or (t - starts[i]) % step != 0:
+            return False
+        start, end = starts[i], ends[i]
+        if start == end:
+            del starts[i]
+            del ends[i]
+        elif t == start:
+            starts[i] = t + step
+        elif t == end:
+            ends[i] = t - step
+        else:
+            ends[i] = t - step
+            starts.insert(i + 1, t + step)
+            ends.insert(i + 1, end)
+        self._count -= 1
+        return True
+
+    def _grid(self, start_time: int, end_time: int) -> tuple[int, int]:
+        """First/last expected candle time inside [start_time, end_time] on this series' phase."""
+        step, phase = self.step_s, self._phase or 0
+        lo = int(start_time) + (phase - int(start_time)) % step
+        hi = int(end_time) - (int(end_time) - phase) % step
+        return lo, hi
+
+    def _runs_in(self, lo: int, hi: int) -> Iterator[tuple[int, int]]:
+        starts, ends = self._starts, self._ends
+        i = bisect_left(ends, lo)
+        while i < len(starts) and starts[i] <= hi:
+            yield max(starts[i], lo), min(ends[i], hi)
+            i += 1
+
+    def count_between(self, start_time: int, end_time: int) -> int:
+        lo, hi = self._grid(start_time, end_time)
+        return sum((end - start) // self.step_s + 1 for start, end in self._runs_in(lo, hi))
+
+    def missing_ranges(self, start_time: int, end_time: int) -> list[tuple[int, int]]:
+        """Missing candle times in [start_time, end_time] as inclusive (first, last) ranges."""
+        lo, hi = self._grid(start_time, end_time)
+        out: list[tuple[int, int]] = []
+        cursor = lo
+        for start, end in self._runs_in(lo, hi):
+            if start > cursor:
+                out.append((cursor, start - self.step_s))
+            cursor = end + self.step_s
+        if cursor <= hi:
+            out.append((cursor, hi))
+        return out
+
+    def coverage_pct(self, start_time: int, end_time: int) -> float | None:
+        lo, hi = self._grid(start_time, end_time)
+        if hi < lo:
+            return None
+        expected = (hi - lo) // self.step_s + 1
+        return 100.0 * float(self.count_between(lo, hi)) / float(expected)
+
+    def gaps(self) -> Iterator[tuple[int, int]]:
+        """(prev_time, next_time) for every gap between stored candles, oldest first."""
+        return zip(self._ends[:-1], self._starts[1:])
+
+    def recent_gaps(self, limit: int) -> list[tuple[int, int]]:
+        """Newest `limit` gaps, newest first."""
+        n = min(max(0, int(limit)), self.gap_count)
+        return [(self._ends[-2 - k], self._starts[-1 - k]) for k in range(n)]
@@ -3,15 +3,65 @@ from __future__ import annotations
 import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+from .candle_gap_index import CandleGapIndex, MisalignedCandleTime
 from .local_store_runtime import LocalConnectionBase, MemoryCursor, get_or_create_store_state
+from ..core.candle_record import CandleRecord
 from ..core.schemas import CandleClosed
+from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
+
+
+_BOUNDARY_MODELS_MAX = 8192
 
 
 @dataclass
 class _CandleStoreState:
-    candles_by_series: dict[str, dict[int, CandleClosed]] = field(default_factory=dict)
+    candles_by_series: dict[str, dict[int, CandleRecord]] = field(default_factory=dict)
+    # API/WS reads hand out CandleClosed; the hot tail is converted once and reused until its row changes.
+    models_by_series: dict[str, dict[int, CandleClosed]] = field(default_factory=dict)
+    models_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # Built on first gap/coverage query, then kept current by every write path below.
+    gap_index_by_series: dict[str, CandleGapIndex] = field(default_factory=dict)
+    # Row writes and the first index build/registration share this lock, so no write lands between them.
+    write_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def index_changes(self, series_id: str, candle_times: Iterable[int], *, added: bool) -> None:
+        index = self.gap_index_by_series.get(series_id)
+        if index is None:
+            return
+        apply = index.add if added else index.remove
+        try:
+            for candle_time in candle_times:
+                apply(candle_time)
+        except MisalignedCandleTime:
+            self.gap_index_by_series.pop(series_id, None)
+
+    def forget_models(self, series_id: str, candle_times: Iterable[int]) -> None:
+        with self.models_lock:
+            models = self.models_by_series.get(series_id)
+            if models:
+                for candle_time in candle_times:
+                    models.pop(candle_time, None)
+
+    def to_models(self, series_id: str, records: list[CandleRecord]) -> list[CandleClosed]:
+        if len(records) > _BOUNDARY_MODELS_MAX:
+            return [record.to_closed() for record in records]
+        out: list[CandleClosed] = []
+        with self.models_lock:
+            rows = self.candles_by_series.get(series_id, {})
+            models = self.models_by_series.setdefault(series_id, {})
+            if len(models) + len(records) > _BOUNDARY_MODELS_MAX:
+                models.clear()
+            for record in records:
+                model = models.get(record.candle_time)
+                if model is None:
+                    model = record.to_closed()
+                    # A row rewritten after the caller's read must not be cached under its stale values.
+                    if rows.get(record.candle_time) is record:
+                        models[record.candle_time] = model
+                out.append(model)
+        return out
 
 
 _STORE_STATES: dict[str, _CandleStoreState] = {}
@@ -61,7 +111,7 @@ class CandleStore:
     def connect(self) -> _CandleStoreConnection:
         return _CandleStoreConnection(_get_store_state(self.db_path))
 
-    def _series_rows(self, *, state: _CandleStoreState, series_id: str) -> dict[int, CandleClosed]:
+    def _series_rows(self, *, state: _CandleStoreState, series_id: str) -> dict[int, CandleRecord]:
         rows = state.candles_by_series.get(series_id)
         if rows is None:
             rows = {}
@@ -69,20 +119,19 @@ class CandleStore:
         return rows
 
     def upsert_closed_in_conn(self, conn: _CandleStoreConnection, series_id: str, candle: CandleClosed) -> None:
-        rows = self._series_rows(state=conn._state, series_id=series_id)
-        rows[int(candle.candle_time)] = CandleClosed(
-            candle_time=int(candle.candle_time),
-            open=float(candle.open),
-            high=float(candle.high),
-            low=float(candle.low),
-            close=float(candle.close),
-            volume=float(candle.volume),
-        )
-        conn.total_changes += 1
+        self.upsert_many_closed_in_conn(conn, series_id, [candle])
 
     def upsert_many_closed_in_conn(self, conn: _CandleStoreConnection, series_id: str, candles: list[CandleClosed]) -> None:
-        for candle in candles:
-            self.upsert_closed_in_conn(conn, series_id, candle)
+        state = conn._state
+        from_closed = CandleRecord.from_closed
+        records = [from_closed(candle) for candle in candles]
+        with state.write_lock:
+            rows = self._series_rows(state=state, series_id=series_id)
+            for record in records:
+                rows[record.candle_time] = record
+            state.index_changes(series_id, (record.candle_time for record in records), added=True)
+        state.forget_models(series_id, (record.candle_time for record in records))
+        conn.total_changes += len(candles)
 
     def existing_closed_times_in_conn(
         self,
@@ -95,12 +144,17 @@ class CandleStore:
         return {int(t) for t in candle_times if int(t) > 0 and int(t) in rows}
 
     def delete_closed_times_in_conn(self, conn: _CandleStoreConnection, *, series_id: str, candle_times: list[int]) -> int:
-        rows = conn._state.candles_by_series.get(series_id, {})
-        deleted = 0
-        for candle_time in {int(t) for t in candle_times if int(t) > 0}:
-            if candle_time in rows:
-                rows.pop(candle_time, None)
-                deleted += 1
+        state = conn._state
+        removed: list[int] = []
+        with state.write_lock:
+            rows = state.candles_by_series.get(series_id, {})
+            for candle_time in {int(t) for t in candle_times if int(t) > 0}:
+                if candle_time in rows:
+                    rows.pop(candle_time, None)
+                    removed.append(candle_time)
+            state.index_changes(series_id, removed, added=False)
+        deleted = len(removed)
+        state.forget_models(series_id, (int(t) for t in candle_times))
         if deleted > 0:
             conn.total_changes += int(deleted)
         return int(deleted)
@@ -123,6 +177,9 @@ class CandleStore:
         return int(min(rows))
 
     def count_closed_between_times(self, series_id: str, *, start_time: int, end_time: int) -> int:
+        index = self.gap_index(series_id)
+        if index is not None:
+            return int(index.count_between(int(start_time), int(end_time)))
         rows = _get_store_state(self.db_path).candles_by_series.get(series_id, {})
         start = int(start_time)
         end = int(end_time)
@@ -130,19 +187,41 @@ class CandleStore:
 
     def trim_series_to_latest_n_in_conn(self, conn: _CandleStoreConnection, *, series_id: str, keep: int) -> int:
         keep_n = max(1, int(keep))
-        rows = conn._state.candles_by_series.get(series_id, {})
-        if len(rows) <= keep_n:
-            return 0
-        times_desc = sorted(rows.keys(), reverse=True)
-        cutoff = int(times_desc[keep_n - 1])
-        to_delete = [t for t in rows if int(t) < cutoff]
-        for candle_time in to_delete:
-            rows.pop(candle_time, None)
+        state = conn._state
+        with state.write_lock:
+            rows = state.candles_by_series.get(series_id, {})
+            if len(rows) <= keep_n:
+                return 0
+            times_desc = sorted(rows.keys(), reverse=True)
+            cutoff = int(times_desc[keep_n - 1])
+            to_delete = [t for t in rows if int(t) < cutoff]
+            for candle_time in to_delete:
+                rows.pop(candle_time, None)
+            state.index_changes(series_id, to_delete, added=False)
+        state.forget_models(series_id, to_delete)
         deleted = len(to_delete)
         if deleted > 0:
             conn.total_changes += int(deleted)
         return int(deleted)
 
+    def gap_index(self, series_id: str) -> CandleGapIndex | None:
+        """Run-length index of the series' candle times; None when times do not sit on one timeframe grid."""
+        state = _get_store_state(self.db_path)
+        index = state.gap_index_by_series.get(series_id)
+        if index is not None:
+            return index
+        with state.write_lock:
+            index = state.gap_index_by_series.get(series_id)
+            if index is not None:
+                return index
+            try:
+                step_s = timeframe_to_seconds(series_id_timeframe(series_id))
+                index = CandleGapIndex.build(step_s=step_s, times=list(state.candles_by_series.get(series_id, {})))
+            except (ValueError, KeyError):
+                return None
+            state.gap_index_by_series[series_id] = index
+        return index
+
     def floor_time(self, series_id: str, *, at_time: int) -> int | None:
         rows = _get_store_state(self.db_path).candles_by_series.get(series_id, {})
         target = int(at_time)
@@ -152,6 +231,10 @@ class CandleStore:
         return int(max(candidates))
 
     def get_closed(self, series_id: str, *, since: int | None, limit: int) -> list[CandleClosed]:
+        records = self.get_closed_records(series_id, since=since, limit=limit)
+        return _get_store_state(self.db_path).to_models(series_id, records)
+
+    def get_closed_records(self, series_id: str, *, since: int | None, limit: int) -> list[CandleRecord]:
         rows = _get_store_state(self.db_path).candles_by_series.get(series_id, {})
         ordered_times = sorted(int(t) for t in rows)
         if since is None:
@@ -169,6 +252,18 @@ class CandleStore:
         end_time: int,
         limit: int = 20000,
     ) -> list[CandleClosed]:
+        records = self.get_closed_records_between_times(series_id, start_time=start_time, end_time=end_time, limit=limit)
+        return _get_store_state(self.db_path).to_models(series_id, records)
+
+    def get_closed_records_between_times(
+        self,
+        series_id: str,
+        *,
+        start_time: int,
+        end_time: int,
+        limit: int = 20000,
+    ) -> list[CandleRecord]:
+        """Internal read path (factor/overlay/replay): tuple records, no pydantic objects."""
         rows = _get_store_state(self.db_path).candles_by_series.get(series_id, {})
         start = int(start_time)
         end = int(end_time)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
-from typing import Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
+from ..core.candle_record import CandleRecord
 from ..core.schemas import CandleClosed
+from .candle_gap_index import CandleGapIndex
+
+if TYPE_CHECKING:
+    from ..factor.store import FactorEventRow
 
 ConnT = TypeVar("ConnT")
 ConnCovT = TypeVar("ConnCovT", covariant=True)
@@ -42,6 +47,8 @@ class CandleRepository(Protocol[ConnT]):
 
     def count_closed_between_times(self, series_id: str, *, start_time: int, end_time: int) -> int: ...
 
+    def gap_index(self, series_id: str) -> CandleGapIndex | None: ...
+
     def get_closed(self, series_id: str, *, since: int | None, limit: int) -> list[CandleClosed]: ...
 
     def get_closed_between_times(
@@ -53,14 +60,35 @@ class CandleRepository(Protocol[ConnT]):
         limit: int = 20000,
     ) -> list[CandleClosed]: ...
 
+    def get_closed_records_between_times(
+        self,
+        series_id: str,
+        *,
+        start_time: int,
+        end_time: int,
+        limit: int = 20000,
+    ) -> list[CandleRecord]: ...
+
 
 class FactorRepository(Protocol[ConnCovT]):
     def connect(self) -> AbstractContextManager[ConnCovT]: ...
 
     def head_time(self, series_id: str) -> int | None: ...
 
+    def last_event_id(self, series_id: str) -> int: ...
+
+    def series_revision(self, series_id: str) -> int: ...
+
+    def get_events_after_id(
+        self, *, series_id: str, after_event_id: int, limit: int = 20000
+    ) -> list[FactorEventRow]: ...
+
 
 class OverlayRepository(Protocol[ConnCovT]):
     def connect(self) -> AbstractContextManager[ConnCovT]: ...
 
     def head_time(self, series_id: str) -> int | None: ...
+
+    def last_version_id(self, series_id: str) -> int: ...
+
+    def series_revision(self, series_id: str) -> int: ...
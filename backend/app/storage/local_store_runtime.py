@@ -7,6 +7,9 @@ from typing import Any, Callable, Literal, Self, TypeVar
 
 StateT = TypeVar("StateT")
 
+# Every module-level `store_states` registry seen by `get_or_create_store_state`, so a db can be released at once.
+_STATE_REGISTRIES: dict[int, tuple[dict[str, Any], Lock]] = {}
+
 
 def store_key(db_path: Path) -> str:
     return str(Path(db_path))
@@ -25,9 +28,20 @@ def get_or_create_store_state(
         if state is None:
             state = factory()
             store_states[key] = state
+            _STATE_REGISTRIES.setdefault(id(store_states), (store_states, lock))
         return state
 
 
+def release_store_states(db_path: Path) -> int:
+    """Drop the in-memory state of every local store (candles, factors, features, overlays) for `db_path`."""
+    key = store_key(db_path)
+    released = 0
+    for store_states, lock in list(_STATE_REGISTRIES.values()):
+        with lock:
+            released += int(store_states.pop(key, None) is not None)
+    return released
+
+
 def merge_series_head_time(*, series_head: dict[str, int], series_id: str, head_time: int) -> int:
     sid = str(series_id)
     next_head = int(head_time)
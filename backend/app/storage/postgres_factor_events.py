@@ -69,6 +69,30 @@ def get_events_between_times(
     return decode_event_rows(rows)
 
 
+def get_events_after_id(
+    *,
+    connect: Callable[[], AbstractContextManager[DbConnection]],
+    events_table: str,
+    series_id: str,
+    after_event_id: int,
+    limit: int,
+) -> list[FactorEventRow]:
+    """Series events with id > after_event_id in id order; limit <= 0 returns all of them."""
+    sql = f"""
+        SELECT id, series_id, factor_name, candle_time, kind, event_key, payload_json
+        FROM {events_table}
+        WHERE series_id = %s AND id > %s
+        ORDER BY id ASC
+    """
+    params: list[Any] = [str(series_id), int(after_event_id)]
+    if int(limit) > 0:
+        sql += " LIMIT %s"
+        params.append(int(limit))
+    with connect() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return decode_event_rows(rows)
+
+
 def get_events_between_times_paged(
     *,
     connect: Callable[[], AbstractContextManager[DbConnection]],
@@ -13,6 +13,7 @@ from ..factor.store import (
 )
 from .contracts import DbConnection
 from .postgres_factor_events import (
+    get_events_after_id,
     get_events_between_times,
     get_events_between_times_paged,
     iter_events_between_times_paged,
@@ -30,6 +31,7 @@ class PostgresFactorRepository:
     _events_table: str
     _head_snapshots_table: str
     _series_fingerprint_table: str
+    _series_revision_table: str
 
     def __init__(self, *, pool: PostgresPool, schema: str) -> None:
         object.__setattr__(self, "_pool", pool)
@@ -39,6 +41,7 @@ class PostgresFactorRepository:
         object.__setattr__(self, "_events_table", f"{schema_name}.factor_events")
         object.__setattr__(self, "_head_snapshots_table", f"{schema_name}.factor_head_snapshots")
         object.__setattr__(self, "_series_fingerprint_table", f"{schema_name}.factor_series_fingerprint")
+        object.__setattr__(self, "_series_revision_table", f"{schema_name}.factor_series_revision")
 
     def connect(self) -> AbstractContextManager[DbConnection]:
         return self._pool.connect()
@@ -107,6 +110,18 @@ class PostgresFactorRepository:
         value = row_get(row, index=0, key="v")
         return 0 if value is None else int(value)
 
+    def series_revision(self, series_id: str) -> int:
+        """Bumped by the factor_events trigger once per inserted, updated or deleted event of the series."""
+        with self.connect() as conn:
+            row = conn.execute(
+                f"SELECT revision AS v FROM {self._series_revision_table} WHERE series_id = %s",
+                (str(series_id),),
+            ).fetchone()
+        if row is None:
+            return 0
+        value = row_get(row, index=0, key="v")
+        return 0 if value is None else int(value)
+
     def insert_events_in_conn(self, conn: DbConnection, *, events: list[FactorEventWrite]) -> None:
         if not events:
             return
@@ -227,6 +242,15 @@ class PostgresFactorRepository:
             limit=limit,
         )
 
+    def get_events_after_id(self, *, series_id: str, after_event_id: int, limit: int = 20000) -> list[FactorEventRow]:
+        return get_events_after_id(
+            connect=self.connect,
+            events_table=self._events_table,
+            series_id=series_id,
+            after_event_id=after_event_id,
+            limit=limit,
+        )
+
     def get_events_between_times_paged(
         self,
         *,
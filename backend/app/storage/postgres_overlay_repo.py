@@ -22,6 +22,7 @@ class PostgresOverlayRepository:
     _schema: str
     _series_state_table: str
     _versions_table: str
+    _series_revision_table: str
 
     def __init__(self, *, pool: PostgresPool, schema: str) -> None:
         object.__setattr__(self, "_pool", pool)
@@ -29,6 +30,7 @@ class PostgresOverlayRepository:
         object.__setattr__(self, "_schema", schema_name)
         object.__setattr__(self, "_series_state_table", f"{schema_name}.overlay_series_state")
         object.__setattr__(self, "_versions_table", f"{schema_name}.overlay_instruction_versions")
+        object.__setattr__(self, "_series_revision_table", f"{schema_name}.overlay_series_revision")
 
     def connect(self) -> AbstractContextManager[DbConnection]:
         return self._pool.connect()
@@ -65,6 +67,18 @@ class PostgresOverlayRepository:
         value = row_get(row, index=0, key="v")
         return 0 if value is None else int(value)
 
+    def series_revision(self, series_id: str) -> int:
+        """Bumped by the overlay_instruction_versions trigger once per inserted, updated or deleted version."""
+        with self.connect() as conn:
+            row = conn.execute(
+                f"SELECT revision AS v FROM {self._series_revision_table} WHERE series_id = %s",
+                (str(series_id),),
+            ).fetchone()
+        if row is None:
+            return 0
+        value = row_get(row, index=0, key="v")
+        return 0 if value is None else int(value)
+
     def insert_instruction_version_in_conn(
         self,
         conn: DbConnection,
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from contextlib import AbstractContextManager
 
+from ..core.candle_record import CandleRecord, closed_from_records
 from ..core.schemas import CandleClosed
+from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
+from .candle_gap_index import CandleGapIndex
 from .contracts import DbConnection
 from .postgres_common import normalize_identifier, row_get
 from .postgres_pool import PostgresPool
@@ -132,6 +135,38 @@ class PostgresCandleRepository:
             value = row_get(row, index=0, key="cnt")
             return 0 if value is None else int(value)
 
+    def gap_index(self, series_id: str) -> CandleGapIndex | None:
+        """
+        Run-length index of the series' candle times, grouped server-side (gaps-and-islands) so only one row
+        per run crosses the wire. Built per call, so writes from other processes are always seen.
+        None when the timeframe is unknown or times do not sit on one grid.
+        """
+        try:
+            step_s = timeframe_to_seconds(series_id_timeframe(series_id))
+        except (ValueError, KeyError):
+            return None
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT MIN(candle_time) AS run_start, MAX(candle_time) AS run_end
+                FROM (
+                  SELECT candle_time, candle_time - ROW_NUMBER() OVER (ORDER BY candle_time) * %s AS run_key
+                  FROM {self._table}
+                  WHERE series_id = %s
+                ) runs
+                GROUP BY run_key
+                ORDER BY run_start ASC
+                """,
+                (int(step_s), str(series_id)),
+            ).fetchall()
+        runs = [
+            (int(row_get(row, index=0, key="run_start")), int(row_get(row, index=1, key="run_end"))) for row in rows
+        ]
+        try:
+            return CandleGapIndex.from_runs(step_s=step_s, runs=runs)
+        except ValueError:
+            return None
+
     def trim_series_to_latest_n_in_conn(self, conn: DbConnection, *, series_id: str, keep: int) -> int:
         keep_n = max(1, int(keep))
         row = conn.execute(
@@ -223,6 +258,18 @@ class PostgresCandleRepository:
         end_time: int,
         limit: int = 20000,
     ) -> list[CandleClosed]:
+        return closed_from_records(
+            self.get_closed_records_between_times(series_id, start_time=start_time, end_time=end_time, limit=limit)
+        )
+
+    def get_closed_records_between_times(
+        self,
+        series_id: str,
+        *,
+        start_time: int,
+        end_time: int,
+        limit: int = 20000,
+    ) -> list[CandleRecord]:
         with self.connect() as conn:
             rows = conn.execute(
                 f"""
@@ -235,13 +282,13 @@ class PostgresCandleRepository:
                 (str(series_id), int(start_time), int(end_time), int(limit)),
             ).fetchall()
         return [
-            CandleClosed(
-                candle_time=int(row_get(row, index=0, key="candle_time")),
-                open=float(row_get(row, index=1, key="open")),
-                high=float(row_get(row, index=2, key="high")),
-                low=float(row_get(row, index=3, key="low")),
-                close=float(row_get(row, index=4, key="close")),
-                volume=float(row_get(row, index=5, key="volume")),
+            CandleRecord(
+                int(row_get(row, index=0, key="candle_time")),
+                float(row_get(row, index=1, key="open")),
+                float(row_get(row, index=2, key="high")),
+                float(row_get(row, index=3, key="low")),
+                float(row_get(row, index=4, key="close")),
+                float(row_get(row, index=5, key="volume")),
             )
             for row in rows
         ]
@@ -6,6 +6,39 @@ from .postgres_pool import PostgresPool
 from .postgres_common import normalize_identifier
 
 
+def _series_revision_sql(*, schema_name: str, source_table: str, revision_table: str, name: str) -> tuple[str, ...]:
+    """
+    Per-series write counter kept by a row trigger, so every insert/update/delete of `source_table` bumps it,
+    including writes that bypass the repository. Never cleared: it must only grow for watermark keys.
+    """
+    function = f"{schema_name}.bump_{name}_revision"
+    trigger = f"trg_{name}_revision"
+    return (
+        f"""
+        CREATE TABLE IF NOT EXISTS {revision_table} (
+          series_id TEXT PRIMARY KEY,
+          revision BIGINT NOT NULL
+        );
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$
+        DECLARE sid TEXT;
+        BEGIN
+          IF TG_OP = 'DELETE' THEN sid := OLD.series_id; ELSE sid := NEW.series_id; END IF;
+          INSERT INTO {revision_table}(series_id, revision) VALUES (sid, 1)
+          ON CONFLICT(series_id) DO UPDATE SET revision = {revision_table}.revision + 1;
+          RETURN NULL;
+        END;
+        $$;
+        """,
+        f"DROP TRIGGER IF EXISTS {trigger} ON {source_table};",
+        f"""
+        CREATE TRIGGER {trigger} AFTER INSERT OR UPDATE OR DELETE ON {source_table}
+        FOR EACH ROW EXECUTE FUNCTION {function}();
+        """,
+    )
+
+
 def build_postgres_bootstrap_sql(*, schema: str, enable_timescale: bool) -> tuple[str, ...]:
     schema_name = normalize_identifier(schema, key="schema")
     candles_table = f"{schema_name}.candles"
@@ -13,8 +46,10 @@ def build_postgres_bootstrap_sql(*, schema: str, enable_timescale: bool) -> tupl
     factor_events_table = f"{schema_name}.factor_events"
     factor_head_snapshots_table = f"{schema_name}.factor_head_snapshots"
     factor_fingerprint_table = f"{schema_name}.factor_series_fingerprint"
+    factor_revision_table = f"{schema_name}.factor_series_revision"
     overlay_series_state_table = f"{schema_name}.overlay_series_state"
     overlay_versions_table = f"{schema_name}.overlay_instruction_versions"
+    overlay_revision_table = f"{schema_name}.overlay_series_revision"
     statements: list[str] = []
     if bool(enable_timescale):
         statements.append("CREATE EXTENSION IF NOT EXISTS timescaledb;")
@@ -75,8 +110,15 @@ def build_postgres_bootstrap_sql(*, schema: str, enable_timescale: bool) -> tupl
             """,
             f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_factor_events_series_time ON {factor_events_table}(series_id, candle_time);",
             f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_factor_events_series_factor_time ON {factor_events_table}(series_id, factor_name, candle_time);",
+            f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_factor_events_series_id ON {factor_events_table}(series_id, id);",
             f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_factor_head_series_factor_time ON {factor_head_snapshots_table}(series_id, factor_name, candle_time);",
             f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_factor_head_series_time ON {factor_head_snapshots_table}(series_id, candle_time);",
+            *_series_revision_sql(
+                schema_name=schema_name,
+                source_table=factor_events_table,
+                revision_table=factor_revision_table,
+                name="factor_series",
+            ),
             f"""
             CREATE TABLE IF NOT EXISTS {overlay_series_state_table} (
               series_id TEXT PRIMARY KEY,
@@ -97,6 +139,12 @@ def build_postgres_bootstrap_sql(*, schema: str, enable_timescale: bool) -> tupl
             """,
             f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_overlay_versions_series_version ON {overlay_versions_table}(series_id, version_id);",
             f"CREATE INDEX IF NOT EXISTS idx_{schema_name}_overlay_versions_series_visible ON {overlay_versions_table}(series_id, visible_time);",
+            *_series_revision_sql(
+                schema_name=schema_name,
+                source_table=overlay_versions_table,
+                revision_table=overlay_revision_table,
+                name="overlay_series",
+            ),
         )
     )
     if bool(enable_timescale):
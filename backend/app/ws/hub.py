@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import time
+
 from fastapi import WebSocket
 
 from ..core.schemas import CandleClosed
 from ..core.timeframe import series_id_timeframe, timeframe_to_seconds
+from ..runtime.metrics import RuntimeMetrics
 from ..ws_publishers import WsPublisher, WsPubsubEventType
 from .hub_delivery import CandleHubDelivery, GapBackfillHandler
 from .hub_subscription_store import HubSubscriptionStore, Subscription
@@ -18,7 +21,12 @@ class CandleHub:
         gap_backfill_handler: GapBackfillHandler | None = None,
         publisher: WsPublisher | None = None,
         instance_id: str | None = None,
+        runtime_metrics: RuntimeMetrics | None = None,
     ) -> None:
+        metrics = runtime_metrics or RuntimeMetrics(enabled=False)
+        self._fanout_closed_timer = metrics.timer("market_ws_fanout_duration_ms", labels={"kind": "closed"})
+        self._fanout_batch_timer = metrics.timer("market_ws_fanout_duration_ms", labels={"kind": "batch"})
+        self._fanout_forming_timer = metrics.timer("market_ws_fanout_duration_ms", labels={"kind": "forming"})
         self._subscriptions = HubSubscriptionStore()
         self._delivery = CandleHubDelivery(gap_backfill_handler=gap_backfill_handler)
         self._pubsub = WsPubsubBridge(
@@ -130,6 +138,7 @@ class CandleHub:
         candles_sorted = candles[:]
         if len(candles_sorted) > 1:
             candles_sorted.sort(key=lambda c: int(c.candle_time))
+        t0 = time.perf_counter()
         targets = await self._subscriptions.collect_targets(series_id=series_id)
 
         for ws, sub in targets:
@@ -143,6 +152,7 @@ class CandleHub:
                 )
             except Exception:
                 await self.remove_ws(ws)
+        self._fanout_batch_timer.observe_ms((time.perf_counter() - t0) * 1000.0)
         if bool(replicate):
             await self._publish_external(
                 series_id=series_id,
@@ -177,6 +187,7 @@ class CandleHub:
         candle: CandleClosed,
         replicate: bool = True,
     ) -> None:
+        t0 = time.perf_counter()
         targets = await self._subscriptions.collect_targets(series_id=series_id)
         for ws, sub in targets:
             try:
@@ -189,6 +200,7 @@ class CandleHub:
                 )
             except Exception:
                 await self.remove_ws(ws)
+        self._fanout_closed_timer.observe_ms((time.perf_counter() - t0) * 1000.0)
         if bool(replicate):
             await self._publish_external(
                 series_id=series_id,
@@ -203,6 +215,7 @@ class CandleHub:
         candle: CandleClosed,
         replicate: bool = True,
     ) -> None:
+        t0 = time.perf_counter()
         targets = await self._subscriptions.collect_targets(series_id=series_id)
         for ws, sub in targets:
             try:
@@ -217,6 +230,7 @@ class CandleHub:
                 )
             except Exception:
                 await self.remove_ws(ws)
+        self._fanout_forming_timer.observe_ms((time.perf_counter() - t0) * 1000.0)
         if bool(replicate):
             await self._publish_external(
                 series_id=series_id,
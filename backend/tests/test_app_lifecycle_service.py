@@ -39,6 +39,9 @@ class _FakeRuntimeFlags:
     enable_startup_kline_sync: bool
     startup_kline_sync_target_candles: int
     enable_ondemand_ingest: bool = False
+    startup_kline_sync_concurrency: int = 4
+    startup_kline_sync_rate_per_s: float = 0.0
+    derived_base_timeframe: str = "1m"
 
 
 @dataclass(frozen=True)
@@ -56,8 +59,10 @@ class _FakeRuntime:
 def test_lifecycle_startup_delegates_sync_and_supervisor(monkeypatch) -> None:
     calls: list[tuple[bool, int]] = []
 
-    async def _fake_sync(*, runtime, enabled: bool, target_candles: int):  # noqa: ANN001
+    async def _fake_sync(*, runtime, enabled: bool, target_candles: int, schedule=None, progress=None):  # noqa: ANN001
         _ = runtime
+        _ = schedule
+        _ = progress
         calls.append((bool(enabled), int(target_candles)))
         return object()
 
@@ -78,8 +83,10 @@ def test_lifecycle_startup_delegates_sync_and_supervisor(monkeypatch) -> None:
 
 
 def test_lifecycle_startup_ondemand_can_start_reaper_without_whitelist(monkeypatch) -> None:
-    async def _fake_sync(*, runtime, enabled: bool, target_candles: int):  # noqa: ANN001
+    async def _fake_sync(*, runtime, enabled: bool, target_candles: int, schedule=None, progress=None):  # noqa: ANN001
         _ = runtime
+        _ = schedule
+        _ = progress
         _ = enabled
         _ = target_candles
         return object()
@@ -117,3 +124,39 @@ def test_lifecycle_shutdown_closes_supervisor_when_hub_close_fails() -> None:
 
     assert hub.closed == 1
     assert supervisor.closed == 1
+
+
+def test_lifecycle_startup_returns_after_priority_series_and_defers_whitelist(monkeypatch) -> None:
+    release = asyncio.Event()
+
+    async def _fake_sync(*, runtime, enabled: bool, target_candles: int, schedule=None, progress=None):  # noqa: ANN001
+        _ = (runtime, enabled, target_candles)
+        assert schedule.concurrency == 4 and schedule.base_timeframe == "1m"
+        progress.plan(series_ids=("a:1m", "a:1h"), priority=frozenset({"a:1m"}))
+        progress.mark_done("a:1m", error=None)
+        await release.wait()
+        progress.mark_done("a:1h", error=None)
+        progress.finish()
+
+    monkeypatch.setattr("backend.app.lifecycle.service.run_startup_kline_sync_for_runtime", _fake_sync)
+    supervisor = _FakeSupervisor(whitelist_ingest_enabled=True)
+    runtime = _FakeRuntime(
+        runtime_flags=_FakeRuntimeFlags(enable_startup_kline_sync=True, startup_kline_sync_target_candles=700),
+        ingest_ctx=_FakeIngestCtx(supervisor=supervisor),
+        hub=_FakeHub(),
+    )
+    lifecycle = AppLifecycleService(market_runtime=runtime)  # type: ignore[arg-type]
+
+    async def _run() -> None:
+        await lifecycle.startup()
+        snapshot = lifecycle.startup_sync_progress.snapshot()
+        assert snapshot["ready"] is True and snapshot["state"] == "running"
+        assert snapshot["priority_done"] == 1 and snapshot["pending"] == 1
+        assert supervisor.started_whitelist == 0
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert supervisor.started_whitelist == 1
+        assert lifecycle.startup_sync_progress.snapshot()["state"] == "done"
+
+    asyncio.run(_run())
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from backend.app.core.candle_record import CandleRecord, closed_from_records, records_from_closed
+from backend.app.core.schemas import CandleClosed
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+def _closed(t: int, price: float) -> CandleClosed:
+    return CandleClosed(candle_time=t, open=price, high=price + 1, low=price - 1, close=price, volume=2.0)
+
+
+def test_record_round_trip_and_bulk_helpers() -> None:
+    candles = [_closed(60 * i, 100.0 + i) for i in range(1, 4)]
+    records = records_from_closed(candles)
+
+    assert all(type(r) is CandleRecord for r in records)
+    assert records[0].high == 102.0 and records[0].candle_time == 60
+    assert CandleRecord.from_closed(records[0]) is records[0]
+    assert closed_from_records(records) == candles
+    assert records[1].to_closed() == candles[1]
+
+
+def test_store_keeps_records_and_serves_models_at_the_boundary(tmp_path) -> None:
+    store = CandleStore(tmp_path / "market.db")
+    with store.connect() as conn:
+        store.upsert_many_closed_in_conn(conn, SERIES_ID, [_closed(60, 1.0), _closed(120, 2.0)])
+        conn.commit()
+
+    internal = store.get_closed_records_between_times(SERIES_ID, start_time=0, end_time=120)
+    assert [type(r) for r in internal] == [CandleRecord, CandleRecord]
+
+    first = store.get_closed(SERIES_ID, since=None, limit=10)
+    assert all(isinstance(c, CandleClosed) for c in first)
+    assert store.get_closed(SERIES_ID, since=None, limit=10)[0] is first[0]
+
+    store.upsert_closed(SERIES_ID, _closed(60, 9.0))
+    again = store.get_closed_between_times(SERIES_ID, start_time=0, end_time=120)
+    assert again[0].close == 9.0
+    assert again[1] is first[1]
+
+    with store.connect() as conn:
+        store.delete_closed_times_in_conn(conn, series_id=SERIES_ID, candle_times=[120])
+    assert [c.candle_time for c in store.get_closed(SERIES_ID, since=None, limit=10)] == [60]
+
+
+def test_cached_models_are_frozen_and_stale_reads_are_not_cached(tmp_path) -> None:
+    store = CandleStore(tmp_path / "market.db")
+    store.upsert_closed(SERIES_ID, _closed(60, 1.0))
+    stale = store.get_closed_records(SERIES_ID, since=None, limit=10)
+    store.upsert_closed(SERIES_ID, _closed(60, 5.0))
+
+    state = store.connect()._state
+    assert state.to_models(SERIES_ID, stale)[0].close == 1.0
+    served = store.get_closed(SERIES_ID, since=None, limit=10)[0]
+    assert served.close == 5.0
+    with pytest.raises(ValidationError):
+        served.close = 0.0  # type: ignore[misc]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from backend.app.core.series_id import parse_series_id
+from backend.app.market.ccxt_backfill_engine import (
+    CcxtBackfillConfig,
+    CcxtBackfillEngine,
+    RestRateLimiter,
+    plan_segments,
+)
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+T0 = 1_700_000_040
+
+
+class _StubExchange:
+    """Local stand-in for a ccxt client: deterministic 1m klines, optional per-call delay and failures."""
+
+    def __init__(self, *, candles: int, delay_s: float = 0.0, fail_since_ms: set[int] | None = None) -> None:
+        self.candles = candles
+        self.delay_s = delay_s
+        self.fail_since_ms = set(fail_since_ms or ())
+        self.calls: list[int] = []
+        self.clients = 0
+        self.closed = 0
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.markets_loaded = 0
+        self.markets_shared = 0
+
+    def factory(self, series, *, timeout_ms: int):  # noqa: ANN001
+        _ = (series, timeout_ms)
+        with self._lock:
+            self.clients += 1
+        return self
+
+    def load_markets(self) -> dict[str, dict]:
+        with self._lock:
+            self.markets_loaded += 1
+        return {"BTC/USDT:USDT": {}}
+
+    def set_markets(self, markets: dict[str, dict]) -> None:
+        assert markets == {"BTC/USDT:USDT": {}}
+        with self._lock:
+            self.markets_shared += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self.closed += 1
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str, since_ms: int, limit: int) -> list[list[float]]:
+        assert symbol == "BTC/USDT:USDT" and timeframe == "1m"
+        with self._lock:
+            self.calls.append(int(since_ms))
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(self.delay_s)
+            if int(since_ms) in self.fail_since_ms:
+                raise RuntimeError(f"exchange_down:{since_ms}")
+            first = max(0, (int(since_ms) // 1000 - T0) // 60)
+            return [
+                [(T0 + i * 60) * 1000, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0]
+                for i in range(first, min(self.candles, first + int(limit)))
+            ]
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+def _engine(exchange: _StubExchange, *, concurrency: int = 4, checkpoint_dir=None) -> CcxtBackfillEngine:  # noqa: ANN001
+    return CcxtBackfillEngine(
+        config=CcxtBackfillConfig(concurrency=concurrency, pages_per_segment=2, checkpoint_dir=checkpoint_dir),
+        client_factory=exchange.factory,
+        limiter=RestRateLimiter(rate_per_s=0.0),
+    )
+
+
+def test_plan_segments_covers_range_without_overlap() -> None:
+    segments = plan_segments(start_time=T0, end_time=T0 + 249 * 60, tf_s=60, candles_per_segment=100)
+    assert [(s.start_time, s.end_time) for s in segments] == [
+        (T0, T0 + 99 * 60),
+        (T0 + 100 * 60, T0 + 199 * 60),
+        (T0 + 200 * 60, T0 + 249 * 60),
+    ]
+
+
+def test_segments_fetch_concurrently_and_merge_in_order(tmp_path) -> None:
+    exchange = _StubExchange(candles=400, delay_s=0.01)
+    store = CandleStore(tmp_path / "market.db")
+    writes: list[list[int]] = []
+    upsert = store.upsert_many_closed_in_conn
+
+    def _spy(conn, series_id, candles):  # noqa: ANN001
+        writes.append([int(c.candle_time) for c in candles])
+        return upsert(conn, series_id, candles)
+
+    object.__setattr__(store, "upsert_many_closed_in_conn", _spy)
+
+    written = _engine(exchange).run(
+        candle_store=store, series_id=SERIES_ID, start_time=T0, end_time=T0 + 399 * 60, batch_limit=25
+    )
+
+    assert written == 400
+    assert exchange.max_in_flight > 1
+    assert exchange.clients == exchange.closed == 4
+    assert (exchange.markets_loaded, exchange.markets_shared) == (1, 3)
+    flat = [t for batch in writes for t in batch]
+    assert flat == [T0 + i * 60 for i in range(400)]
+    assert len(writes) < len(exchange.calls)
+
+
+def test_interrupted_backfill_resumes_from_checkpoint(tmp_path) -> None:
+    failing_since_ms = (T0 + 150 * 60) * 1000
+    exchange = _StubExchange(candles=300, fail_since_ms={failing_since_ms})
+    store = CandleStore(tmp_path / "market.db")
+    checkpoint_dir = tmp_path / "ckpt"
+    end = T0 + 299 * 60
+
+    with pytest.raises(RuntimeError, match="exchange_down"):
+        _engine(exchange, concurrency=2, checkpoint_dir=checkpoint_dir).run(
+            candle_store=store, series_id=SERIES_ID, start_time=T0, end_time=end, batch_limit=50
+        )
+    assert store.count_closed_between_times(SERIES_ID, start_time=T0, end_time=end) == 100
+    assert store.head_time(SERIES_ID) == T0 + 99 * 60
+    assert list(checkpoint_dir.iterdir())
+
+    exchange.fail_since_ms.clear()
+    exchange.calls.clear()
+    written = _engine(exchange, concurrency=2, checkpoint_dir=checkpoint_dir).run(
+        candle_store=store, series_id=SERIES_ID, start_time=T0, end_time=end, batch_limit=50
+    )
+
+    assert written == 200
+    assert sorted(exchange.calls) == [(T0 + i * 50 * 60) * 1000 for i in range(2, 6)]
+    assert store.count_closed_between_times(SERIES_ID, start_time=T0, end_time=end) == 300
+    assert not list(checkpoint_dir.iterdir())
+
+
+def test_rest_rate_limiter_is_shared_across_threads() -> None:
+    limiter = RestRateLimiter(rate_per_s=200.0, burst=1.0)
+    t0 = time.monotonic()
+    threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - t0 >= 19 / 200.0 * 0.9
+
+
+def test_markets_load_is_rate_limited_with_the_fetches(tmp_path) -> None:
+    class _CountingLimiter(RestRateLimiter):
+        acquired = 0
+
+        def acquire(self) -> float:
+            type(self).acquired += 1
+            return 0.0
+
+    exchange = _StubExchange(candles=100)
+    engine = CcxtBackfillEngine(
+        config=CcxtBackfillConfig(concurrency=1, pages_per_segment=2),
+        client_factory=exchange.factory,
+        limiter=_CountingLimiter(rate_per_s=0.0),
+    )
+    store = CandleStore(tmp_path / "market.db")
+    engine.run(candle_store=store, series_id=SERIES_ID, start_time=T0, end_time=T0 + 99 * 60, batch_limit=50)
+
+    assert exchange.markets_loaded == 1
+    assert _CountingLimiter.acquired == 1 + len(exchange.calls)
+
+
+def test_engines_keep_separate_limiters_per_config() -> None:
+    slow = CcxtBackfillEngine(config=CcxtBackfillConfig(rate_per_s=1.0))
+    series = parse_series_id(SERIES_ID)
+    assert slow.rest_limiter(series) is slow.rest_limiter(series)
+    assert CcxtBackfillEngine().rest_limiter(series) is not slow.rest_limiter(series)
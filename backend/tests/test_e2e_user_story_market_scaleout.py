@@ -11,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from backend.app.main import create_app
 from backend.app.core.schemas import CandleClosed
+from backend.app.core.candle_record import CandleRecord, records_from_closed
 from backend.app.ws_publishers import WsPubsubConsumer, WsPubsubMessage
 
 
@@ -130,6 +131,18 @@ class _FakePgRepo:
             ordered = ordered[: int(limit)]
         return [series[t] for t in ordered]
 
+    def get_closed_records_between_times(
+        self,
+        series_id: str,
+        *,
+        start_time: int,
+        end_time: int,
+        limit: int = 20000,
+    ) -> list[CandleRecord]:
+        return records_from_closed(
+            self.get_closed_between_times(series_id, start_time=start_time, end_time=end_time, limit=limit)
+        )
+
 
 class _FakeBus:
     def __init__(self) -> None:
@@ -97,8 +97,10 @@ class MarketSyncE2EUserStoryTests(unittest.TestCase):
         os.environ["TRADE_CANVAS_MARKET_HISTORY_SOURCE"] = ""
         calls: list[tuple[int, int]] = []
 
-        def fake_ccxt_backfill(*, candle_store, series_id, start_time, end_time, batch_limit=1000, ccxt_timeout_ms=10_000):
-            _ = batch_limit
+        def fake_ccxt_backfill(
+            *, candle_store, series_id, start_time, end_time, batch_limit=1000, ccxt_timeout_ms=10_000, engine=None
+        ):
+            _ = (batch_limit, engine)
             _ = ccxt_timeout_ms
             self.assertEqual(series_id, self.series_id)
             calls.append((int(start_time), int(end_time)))
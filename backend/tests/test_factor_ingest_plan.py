@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from backend.app.core.schemas import CandleClosed
+from backend.app.factor import fingerprint as fingerprint_module
+from backend.app.factor.ingest_plan import FactorIngestPlanCache
+from backend.app.factor.orchestrator import FactorOrchestrator
+from backend.app.factor.runtime_config import FactorSettings
+from backend.app.factor.store import FactorStore
+from backend.app.pipelines import IngestPipeline
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+def _build_orchestrator(tmp_path: Path) -> FactorOrchestrator:
+    db_path = tmp_path / "market.db"
+    return FactorOrchestrator(
+        candle_store=CandleStore(db_path),
+        factor_store=FactorStore(db_path),
+    )
+
+
+def _candle(t: int, price: float) -> CandleClosed:
+    return CandleClosed(candle_time=int(t), open=price, high=price + 1, low=price - 1, close=price, volume=1.0)
+
+
+def test_ingest_plan_matches_fingerprint_and_hashes_sources_once(tmp_path, monkeypatch) -> None:
+    orchestrator = _build_orchestrator(tmp_path)
+    reads: list[Path] = []
+    original = fingerprint_module._file_sha256
+
+    def _counting_sha256(path: Path) -> str:
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(fingerprint_module, "_file_sha256", _counting_sha256)
+    settings = FactorSettings()
+    expected = orchestrator._build_series_fingerprint(series_id=SERIES_ID, settings=settings)
+    reads.clear()
+
+    first = orchestrator._ingest_plan(series_id=SERIES_ID, settings=settings)
+    source_reads = len(reads)
+    second = orchestrator._ingest_plan(series_id=SERIES_ID, settings=settings)
+    other = orchestrator._ingest_plan(series_id="binance:futures:ETH/USDT:5m", settings=settings)
+
+    assert first.plan.fingerprint == expected
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert second.plan is first.plan
+    assert other.cache_hit is False
+    assert other.plan.tf_s == 300
+    assert source_reads > 0
+    assert len(reads) == source_reads
+    assert orchestrator.ingest_plan_stats() == {"size": 2, "hits": 1, "misses": 2, "invalidations": 0}
+
+
+def test_ingest_plan_is_keyed_by_settings(tmp_path) -> None:
+    orchestrator = _build_orchestrator(tmp_path)
+    base = orchestrator._ingest_plan(series_id=SERIES_ID, settings=FactorSettings())
+    changed = orchestrator._ingest_plan(series_id=SERIES_ID, settings=FactorSettings(pivot_window_major=60))
+
+    assert changed.cache_hit is False
+    assert changed.plan.max_window == 60
+    assert changed.plan.fingerprint != base.plan.fingerprint
+    # The old settings' plan is replaced, not kept next to the new one.
+    assert orchestrator.ingest_plan_stats()["size"] == 1
+    assert orchestrator._ingest_plan(series_id=SERIES_ID, settings=FactorSettings()).cache_hit is False
+
+
+def test_ingest_plan_cache_is_bounded_lru(tmp_path) -> None:
+    orchestrator = _build_orchestrator(tmp_path)
+    cache = FactorIngestPlanCache(
+        graph=orchestrator._graph,
+        registry=orchestrator._registry,
+        orchestrator_file=tmp_path / "orchestrator.py",
+        max_series=2,
+    )
+    settings = FactorSettings()
+    btc, eth, sol = (f"binance:futures:{pair}/USDT:1m" for pair in ("BTC", "ETH", "SOL"))
+    cache.lookup(series_id=btc, settings=settings)
+    cache.lookup(series_id=eth, settings=settings)
+    assert cache.lookup(series_id=btc, settings=settings).cache_hit is True
+    cache.lookup(series_id=sol, settings=settings)
+
+    assert cache.stats()["size"] == 2
+    assert cache.lookup(series_id=btc, settings=settings).cache_hit is True
+    assert cache.lookup(series_id=eth, settings=settings).cache_hit is False
+
+
+def test_ingest_plan_invalidates_when_source_file_changes(tmp_path) -> None:
+    orchestrator = _build_orchestrator(tmp_path)
+    source = tmp_path / "orchestrator.py"
+    source.write_text("v1\n", encoding="utf-8")
+    now = [100.0]
+    cache = FactorIngestPlanCache(
+        graph=orchestrator._graph,
+        registry=orchestrator._registry,
+        orchestrator_file=source,
+        source_check_interval_s=5.0,
+        clock=lambda: now[0],
+    )
+    settings = FactorSettings()
+    first = cache.lookup(series_id=SERIES_ID, settings=settings)
+
+    source.write_text("v2 changed\n", encoding="utf-8")
+    now[0] += 1.0
+    assert cache.lookup(series_id=SERIES_ID, settings=settings).cache_hit is True
+
+    now[0] += 5.0
+    refreshed = cache.lookup(series_id=SERIES_ID, settings=settings)
+    assert refreshed.cache_hit is False
+    assert refreshed.plan.fingerprint != first.plan.fingerprint
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_warm_ingest_plans_skips_invalid_series_and_feeds_pipeline_step_detail(tmp_path) -> None:
+    orchestrator = _build_orchestrator(tmp_path)
+    assert orchestrator.warm_ingest_plans(series_ids=[SERIES_ID, "binance:futures:BAD/USDT:1x"]) == 1
+
+    pipeline = IngestPipeline(
+        store=CandleStore(tmp_path / "market.db"),
+        factor_orchestrator=orchestrator,
+    )
+    result = pipeline.run_sync(batches={SERIES_ID: [_candle(60, 10.0), _candle(120, 11.0)]})
+
+    factor_steps = [step for step in result.steps if step.name.startswith("factor.ingest_closed:")]
+    assert len(factor_steps) == 1
+    detail = dict(factor_steps[0].detail or {})
+    assert detail["plan_cache_hit"] is True
+    assert float(detail["plan_ms"]) >= 0.0
@@ -20,7 +20,7 @@ class _CandleStoreStub:
         _ = end_time
         return int(self.total_between)
 
-    def get_closed_between_times(
+    def get_closed_records_between_times(
         self,
         series_id: str,  # noqa: ARG002
         *,
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.app.core.series_id import parse_series_id
+from backend.app.factor.orchestrator import FactorOrchestrator
+from backend.app.factor.store import FactorStore
+from backend.app.ingest.binance_ws import BinanceWsIngestLoopRequest, build_binance_kline_ws_url, run_binance_ws_ingest_loop
+from backend.app.ingest.settings import WhitelistIngestSettings
+from backend.app.market.backfill import backfill_from_ccxt_range
+from backend.app.market.ccxt_backfill_engine import CcxtBackfillConfig, CcxtBackfillEngine
+from backend.app.market.fake_binance import FakeBinanceConfig, FakeBinanceServer
+from backend.app.market.list import BinanceMarketListService
+from backend.app.pipelines import IngestPipeline
+from backend.app.storage.candle_store import CandleStore
+from backend.app.ws.hub import CandleHub
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+RECORDED = Path(__file__).resolve().parents[2] / "fixtures" / "klines_mock_BTCUSDT_1m_60.jsonl"
+
+
+@pytest.fixture
+def fake_binance(monkeypatch):
+    servers: list[FakeBinanceServer] = []
+
+    def _start(**overrides) -> FakeBinanceServer:
+        config = FakeBinanceConfig(**{"symbol_count": 3, "history_candles": 120, "tick_hz": 50.0, **overrides})
+        server = FakeBinanceServer(config).start()
+        servers.append(server)
+        for key, value in server.env().items():
+            monkeypatch.setenv(key, value)
+        return server
+
+    yield _start
+    for server in servers:
+        server.stop()
+
+
+def test_ws_url_and_rest_clients_follow_settings(fake_binance) -> None:
+    server = fake_binance()
+    assert build_binance_kline_ws_url(parse_series_id(SERIES_ID)) == f"{server.ws_base}/ws/btcusdt@kline_1m"
+
+    top, _ = BinanceMarketListService().get_top_markets(market="futures", quote_asset="USDT", limit=10)
+    assert {item.symbol for item in top} == {"BTC/USDT", "ETH/USDT", "SOL/USDT"}
+
+
+def test_ccxt_backfill_reads_fake_rest_klines(fake_binance, tmp_path) -> None:
+    server = fake_binance()
+    book = server.book
+    store = CandleStore(tmp_path / "market.db")
+    start = book.start_time
+    end = start + 59 * book.tf_s
+
+    written = backfill_from_ccxt_range(
+        candle_store=store, series_id=SERIES_ID, start_time=start, end_time=end, batch_limit=25
+    )
+
+    assert written == 60
+    rows = store.get_closed(SERIES_ID, since=None, limit=100)
+    assert [int(c.candle_time) for c in rows] == [start + i * book.tf_s for i in range(60)]
+    assert rows[7].close == pytest.approx(book.candle("BTCUSDT", 7)[4])
+
+
+def test_segmented_ccxt_backfill_against_fake_rest(fake_binance, tmp_path) -> None:
+    server = fake_binance()
+    book = server.book
+    store = CandleStore(tmp_path / "market.db")
+    start = book.start_time
+    end = start + 119 * book.tf_s
+
+    engine = CcxtBackfillEngine(config=CcxtBackfillConfig(concurrency=3, rate_per_s=0.0, pages_per_segment=2))
+    written = engine.run(candle_store=store, series_id=SERIES_ID, start_time=start, end_time=end, batch_limit=10)
+
+    assert written == 120
+    times = [int(c.candle_time) for c in store.get_closed(SERIES_ID, since=None, limit=200)]
+    assert times == [start + i * book.tf_s for i in range(120)]
+
+
+def test_ws_ingest_loop_consumes_fake_stream(fake_binance, tmp_path) -> None:
+    server = fake_binance(tick_hz=40.0, forming_per_candle=1)
+    store = CandleStore(tmp_path / "market.db")
+    pipeline = IngestPipeline(
+        store=store,
+        factor_orchestrator=FactorOrchestrator(candle_store=store, factor_store=FactorStore(tmp_path / "market.db")),
+    )
+
+    async def _run() -> None:
+        stop = asyncio.Event()
+        task = asyncio.create_task(
+            run_binance_ws_ingest_loop(
+                BinanceWsIngestLoopRequest(
+                    series_id=SERIES_ID,
+                    store=store,
+                    hub=CandleHub(),
+                    ingest_pipeline=pipeline,
+                    settings=WhitelistIngestSettings(),
+                    stop=stop,
+                    flush_s=0.1,
+                )
+            )
+        )
+        await asyncio.sleep(1.5)
+        stop.set()
+        await asyncio.wait_for(task, timeout=5.0)
+
+    asyncio.run(_run())
+
+    times = [int(c.candle_time) for c in store.get_closed(SERIES_ID, since=None, limit=1000)]
+    assert len(times) >= 10
+    assert all(b - a == server.book.tf_s for a, b in zip(times, times[1:]))
+
+
+def test_combined_stream_latency_and_disconnect_injection(fake_binance) -> None:
+    import websockets
+
+    server = fake_binance(tick_hz=100.0, latency_ms=120.0, disconnect_after_messages=6)
+
+    async def _run() -> list[dict]:
+        url = f"{server.ws_base}/stream?streams=btcusdt@kline_1m/ethusdt@kline_1m"
+        got: list[dict] = []
+        async with websockets.connect(url) as ws:
+            with pytest.raises(websockets.ConnectionClosed):
+                while True:
+                    got.append(json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0)))
+        return got
+
+    messages = asyncio.run(_run())
+    assert len(messages) == 6
+    assert {m["stream"] for m in messages} == {"btcusdt@kline_1m", "ethusdt@kline_1m"}
+    assert all(m["data"]["k"]["x"] is True for m in messages)
+    lag_ms = [time.time() * 1000 - m["data"]["E"] for m in messages[:1]]
+    assert lag_ms[0] >= 100.0
+
+
+def test_recorded_klines_are_served_verbatim(fake_binance) -> None:
+    server = fake_binance(symbol_count=0, recorded_path=str(RECORDED), history_candles=30, tick_hz=0.0)
+    book = server.book
+
+    assert set(book.symbols) == {"BTCUSDT"}
+    rows = book.rest_klines("BTCUSDT", start_ms=None, end_ms=None, limit=1000)
+    assert len(rows) == 30
+    assert rows[0][0] == 1700000000 * 1000
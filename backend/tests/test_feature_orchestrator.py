@@ -139,3 +139,55 @@ def test_feature_orchestrator_can_be_disabled_by_settings() -> None:
         assert result.wrote == 0
         assert result.head_time is None
         assert feature_store.head_time(series_id) is None
+
+
+def _pen_event(series_id: str, candle_time: int, idx: int) -> FactorEventWrite:
+    return FactorEventWrite(
+        series_id=series_id,
+        factor_name="pen",
+        candle_time=candle_time,
+        kind="pen.confirmed",
+        event_key=f"pen:{candle_time}:{idx}",
+        payload={"direction": 1 if idx % 2 == 0 else -1},
+    )
+
+
+def test_feature_orchestrator_steady_state_reads_only_events_after_cursor(tmp_path) -> None:
+    series_id = "binance:futures:BTC/USDT:1m"
+    factor_store = FactorStore(db_path=tmp_path / "factor.db")
+    incremental_store = FeatureStore(db_path=tmp_path / "incremental.db")
+    overrides = {"pen": FactorCapabilitySpec(factor_name="pen", enable_feature=True)}
+    orchestrator = FeatureOrchestrator(
+        factor_store=factor_store, feature_store=incremental_store, capability_overrides=overrides
+    )
+    range_reads: list[int] = []
+    read_between = factor_store.get_events_between_times
+
+    def _spy(**kwargs):  # noqa: ANN003, ANN202
+        range_reads.append(int(kwargs["end_candle_time"]))
+        return read_between(**kwargs)
+
+    object.__setattr__(factor_store, "get_events_between_times", _spy)
+
+    for step in range(1, 41):
+        t = step * 60
+        with factor_store.connect() as conn:
+            # Factor runs one candle ahead every 10th step: the event past up_to must still be picked up later.
+            times = [t, t + 60] if step % 10 == 0 else [t]
+            events = [_pen_event(series_id, ct, idx) for ct in times for idx in range(step % 3 + 1)]
+            factor_store.insert_events_in_conn(conn, events=events)
+            factor_store.upsert_head_time_in_conn(conn, series_id=series_id, head_time=max(times))
+            conn.commit()
+        orchestrator.ingest_closed(series_id=series_id, up_to_candle_time=t)
+
+    full_store = FeatureStore(db_path=tmp_path / "full.db")
+    FeatureOrchestrator(
+        factor_store=factor_store, feature_store=full_store, capability_overrides=overrides
+    ).ingest_closed(series_id=series_id, up_to_candle_time=40 * 60)
+
+    # Only the first ingest (no cursor yet) and the one-shot full run read by time range.
+    assert range_reads == [60, 40 * 60]
+    got = incremental_store.get_rows_between_times(series_id=series_id, start_candle_time=0, end_candle_time=10**6)
+    want = full_store.get_rows_between_times(series_id=series_id, start_candle_time=0, end_candle_time=10**6)
+    assert [(row.candle_time, row.values) for row in got] == [(row.candle_time, row.values) for row in want]
+    assert len(got) == 40
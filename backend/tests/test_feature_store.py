@@ -125,3 +125,37 @@ def test_feature_store_clear_series_removes_rows_and_head() -> None:
         )
         assert len(remain) == 1
         assert remain[0].series_id == "s2"
+
+
+def test_feature_store_column_range_read_keeps_value_types(tmp_path) -> None:
+    store = FeatureStore(db_path=tmp_path / "feature.db")
+    with store.connect() as conn:
+        store.upsert_rows_in_conn(
+            conn,
+            rows=[
+                FeatureVectorWrite(series_id="s1", candle_time=t, candle_id=f"s1:{t}", values=values)
+                for t, values in (
+                    (160, {"count": 2.0, "flag": True, "direction": 1}),
+                    (100, {"count": 1.0, "flag": False}),
+                    (220, {"count": 3.0, "direction": "up", "note": None}),
+                )
+            ],
+        )
+        conn.commit()
+
+    columns = store.get_columns_between_times(series_id="s1", start_candle_time=100, end_candle_time=200)
+    assert columns.candle_times == [100, 160]
+    assert columns.candle_ids == ["s1:100", "s1:160"]
+    assert columns.columns == {"count": [1.0, 2.0], "flag": [False, True], "direction": [None, 1]}
+
+    wide = store.get_columns_between_times(
+        series_id="s1", start_candle_time=0, end_candle_time=300, keys=("direction", "missing")
+    )
+    assert wide.columns == {"direction": [None, 1, "up"], "missing": [None, None, None]}
+    rows = store.get_rows_between_times(series_id="s1", start_candle_time=0, end_candle_time=300)
+    assert [row.values for row in rows] == [
+        {"count": 1.0, "flag": False},
+        {"count": 2.0, "flag": True, "direction": 1},
+        {"count": 3.0, "direction": "up", "note": None},
+    ]
+    assert [row.id for row in rows] == [2, 1, 3]
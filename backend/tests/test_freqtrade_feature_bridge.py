@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from backend.app.feature.store import FeatureColumnsRange
+from backend.app.freqtrade.feature_bridge import (
+    LazyBucketRecords,
+    LazyFeatureRows,
+    build_signal_buckets_from_features,
+    build_signal_columns_from_features,
+    signal_bucket_records,
+)
+from backend.app.freqtrade.signal_plugin_contract import FreqtradeSignalBucketSpec, FreqtradeSignalContext
+from backend.app.freqtrade.signal_strategies.pen_direction import PenDirectionSignalPlugin
+
+SPECS = (
+    FreqtradeSignalBucketSpec(factor_name="pivot", event_kind="pivot.major", bucket_name="pivot_major"),
+    FreqtradeSignalBucketSpec(
+        factor_name="pen",
+        event_kind="pen.confirmed",
+        bucket_name="pen_confirmed",
+        sort_keys=("visible_time", "start_time"),
+    ),
+    FreqtradeSignalBucketSpec(factor_name="zhongshu", event_kind="zhongshu.dead", bucket_name="zhongshu_dead"),
+)
+
+
+def _fixture() -> FeatureColumnsRange:
+    times = [60 * i for i in range(1, 13)]
+    return FeatureColumnsRange(
+        series_id="s",
+        candle_times=times,
+        candle_ids=[f"s:{t}" for t in times],
+        columns={
+            "pivot_major_count": [1, 0, 2, None, "3", True, -4, 2.7, float("inf"), "x", float("nan"), 1],
+            "pivot_major_direction": ["up", None, "down", "up", None, "up", "down", None, "up", "up", "up", "down"],
+            "pen_confirmed_count": [0, 1, 1, 0, 0, 5, 0, 1, 0, 0, 2, False],
+            "pen_confirmed_direction": [None, 1, -1, None, None, 1, None, 1, None, None, -1, None],
+        },
+    )
+
+
+def test_columnar_buckets_match_row_builder() -> None:
+    features = _fixture()
+    # Unsorted, duplicated, non-positive and out-of-range request times.
+    times = [720, 60, 120, 120, 0, -60, 900, 300, 180, 240, 360, 420, 480, 540, 600, 660]
+
+    want = build_signal_buckets_from_features(
+        bucket_specs=SPECS,
+        feature_rows_by_time=features.rows_by_time(),
+        times=times,
+    )
+    frames = build_signal_columns_from_features(
+        bucket_specs=SPECS,
+        feature_times=features.candle_times,
+        feature_columns=features.columns,
+        times=np.asarray(times),
+    )
+    got = {name: signal_bucket_records(frame) for name, frame in frames.items()}
+
+    assert got == want
+    assert [list(row) for row in got["pen_confirmed"]] == [list(row) for row in want["pen_confirmed"]]
+    assert all(type(row["count"]) is int and type(row["candle_time"]) is int for row in got["pivot_major"])
+    assert got["zhongshu_dead"] == []
+
+
+def test_columnar_buckets_without_features() -> None:
+    frames = build_signal_columns_from_features(
+        bucket_specs=SPECS,
+        feature_times=[],
+        feature_columns={},
+        times=np.asarray([60, 120]),
+    )
+    assert {name: signal_bucket_records(frame) for name, frame in frames.items()} == {
+        "pivot_major": [],
+        "pen_confirmed": [],
+        "zhongshu_dead": [],
+    }
+
+
+def test_lazy_mappings_match_eager_rows_and_records() -> None:
+    features = _fixture()
+    frames = build_signal_columns_from_features(
+        bucket_specs=SPECS,
+        feature_times=features.candle_times,
+        feature_columns=features.columns,
+        times=np.asarray(features.candle_times),
+    )
+    rows = LazyFeatureRows(feature_times=features.candle_times, feature_columns=features.columns)
+    buckets = LazyBucketRecords(frames)
+    assert rows._positions is None and buckets._records == {}
+
+    present = {t: {k: v for k, v in row.items() if v is not None} for t, row in features.rows_by_time().items()}
+    assert rows[120] == present[120]
+    assert rows[240] == {"pivot_major_direction": "up", "pen_confirmed_count": 0}
+    assert dict(rows) == present
+    assert buckets["pen_confirmed"] is buckets["pen_confirmed"]
+    assert list(buckets._records) == ["pen_confirmed"]
+    assert dict(buckets) == {name: signal_bucket_records(frame) for name, frame in frames.items()}
+
+
+def test_pen_plugin_writes_the_same_columns_from_frames_and_records() -> None:
+    features = _fixture()
+    times = features.candle_times
+    frames = build_signal_columns_from_features(
+        bucket_specs=SPECS,
+        feature_times=times,
+        feature_columns=features.columns,
+        times=np.asarray(times),
+    )
+    plugin = PenDirectionSignalPlugin()
+    outputs = []
+    for bucket_frames in (frames, {}):
+        df = pd.DataFrame(index=range(len(times)))
+        plugin.prepare_dataframe(dataframe=df)
+        order = list(df.index)
+        plugin.apply(
+            ctx=FreqtradeSignalContext(
+                series_id="s",
+                timeframe="1m",
+                dataframe=df,
+                order=order,
+                times_by_index=dict(zip(order, times)),
+                buckets=LazyBucketRecords(frames),
+                bucket_frames=bucket_frames,
+            )
+        )
+        outputs.append(df)
+
+    pd.testing.assert_frame_equal(outputs[0], outputs[1])
+    assert outputs[0]["tc_pen_dir"].tolist() == [None, 1, -1, None, None, 1, None, 1, None, None, -1, None]
+    assert outputs[0]["tc_enter_short"].tolist() == [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0]
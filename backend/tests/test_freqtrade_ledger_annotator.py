@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+import threading
+
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from backend.app.freqtrade.adapter_v1 import annotate_factor_ledger
+from backend.app.freqtrade.ledger_annotator import FreqtradeLedgerAnnotator
+from backend.app.freqtrade.signal_plugin_contract import FreqtradeSignalContext
+from backend.app.freqtrade.signal_strategies.pen_direction import PenDirectionSignalPlugin
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+@pytest.fixture(autouse=True)
+def _ledger_env(monkeypatch) -> None:  # noqa: ANN001
+    monkeypatch.setenv("TRADE_CANVAS_ENABLE_FACTOR_INGEST", "1")
+    monkeypatch.setenv("TRADE_CANVAS_ENABLE_FEATURE_INGEST", "1")
+    monkeypatch.setenv("TRADE_CANVAS_PIVOT_WINDOW_MAJOR", "2")
+    monkeypatch.setenv("TRADE_CANVAS_PIVOT_WINDOW_MINOR", "1")
+    monkeypatch.setenv("TRADE_CANVAS_FACTOR_LOOKBACK_CANDLES", "5000")
+
+
+_APPLIED_ROWS: list[int] = []
+
+
+class _CountingPenPlugin(PenDirectionSignalPlugin):
+    def apply(self, *, ctx: FreqtradeSignalContext) -> None:
+        _APPLIED_ROWS.append(len(ctx.order))
+        super().apply(ctx=ctx)
+
+
+_ENTERED = threading.Event()
+_RELEASE = threading.Event()
+_FINISHED: list[str] = []
+
+
+class _BlockingPenPlugin(PenDirectionSignalPlugin):
+    def apply(self, *, ctx: FreqtradeSignalContext) -> None:
+        _ENTERED.set()
+        _RELEASE.wait(timeout=5.0)
+        _FINISHED.append("blocked")
+        super().apply(ctx=ctx)
+
+
+def _frame(start: int, stop: int) -> pd.DataFrame:
+    prices = [100.0 + 8.0 * math.sin(i / 3.0) + 3.0 * math.sin(i / 1.3) for i in range(start, stop)]
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime([60 * (i + 1) for i in range(start, stop)], unit="s", utc=True),
+            "open": prices,
+            "high": [p + 0.5 for p in prices],
+            "low": [p - 0.5 for p in prices],
+            "close": prices,
+            "volume": [1.0] * len(prices),
+        }
+    )
+
+
+def test_incremental_annotation_matches_one_shot(tmp_path) -> None:
+    annotator = FreqtradeLedgerAnnotator()
+    plugins = (_CountingPenPlugin(),)
+    _APPLIED_ROWS.clear()
+    for stop in range(40, 120, 1):
+        # freqtrade hands over a sliding window of the latest candles every tick.
+        frame = _frame(max(0, stop - 50), stop)
+        got = annotator.annotate(
+            frame,
+            series_id=SERIES_ID,
+            timeframe="1m",
+            db_path=tmp_path / "incremental.db",
+            signal_plugins=plugins,
+        )
+        want = annotate_factor_ledger(frame, series_id=SERIES_ID, timeframe="1m", db_path=tmp_path / "full.db")
+        assert got.ok and want.ok, (got.reason, want.reason)
+        pd.testing.assert_frame_equal(got.dataframe, want.dataframe)
+
+    assert int(want.dataframe["tc_pen_confirmed"].sum()) >= 1
+    assert _APPLIED_ROWS[0] == 40
+    assert _APPLIED_ROWS[1:] == [1] * (len(_APPLIED_ROWS) - 1)
+
+
+def test_annotator_bounds_series_and_rows(tmp_path) -> None:
+    annotator = FreqtradeLedgerAnnotator(max_series=2, max_rows=10)
+    for pair in ("BTC/USDT", "ETH/USDT", "SOL/USDT"):
+        res = annotator.annotate(
+            _frame(0, 30),
+            series_id=f"binance:futures:{pair}:1m",
+            timeframe="1m",
+            db_path=tmp_path / "market.db",
+        )
+        assert res.ok, res.reason
+    assert len(annotator) == 2
+    assert all(len(entry.annotated) == 10 for entry in annotator._series.values())
+
+    # Rows that fell out of the bounded cache are recomputed, not dropped.
+    res = annotator.annotate(
+        _frame(0, 31),
+        series_id="binance:futures:SOL/USDT:1m",
+        timeframe="1m",
+        db_path=tmp_path / "market.db",
+    )
+    full = annotate_factor_ledger(
+        _frame(0, 31), series_id="binance:futures:SOL/USDT:1m", timeframe="1m", db_path=tmp_path / "other.db"
+    )
+    pd.testing.assert_frame_equal(res.dataframe, full.dataframe)
+
+
+def test_pairs_do_not_wait_on_each_other(tmp_path) -> None:
+    annotator = FreqtradeLedgerAnnotator()
+    _ENTERED.clear()
+    _RELEASE.clear()
+    _FINISHED.clear()
+    results: list = []
+    blocked = threading.Thread(
+        target=lambda: results.append(
+            annotator.annotate(
+                _frame(0, 30),
+                series_id="binance:futures:BTC/USDT:1m",
+                timeframe="1m",
+                db_path=tmp_path / "market.db",
+                signal_plugins=(_BlockingPenPlugin(),),
+            )
+        )
+    )
+    blocked.start()
+    try:
+        assert _ENTERED.wait(timeout=5.0)
+        res = annotator.annotate(
+            _frame(0, 30), series_id="binance:futures:ETH/USDT:1m", timeframe="1m", db_path=tmp_path / "market.db"
+        )
+        _FINISHED.append("other")
+    finally:
+        _RELEASE.set()
+        blocked.join(timeout=10.0)
+
+    assert res.ok, res.reason
+    assert results and results[0].ok, results
+    assert _FINISHED == ["other", "blocked"]
+    assert annotator._series_locks == {}
+
+
+def test_evicting_the_last_series_of_a_db_releases_its_stores(tmp_path) -> None:
+    annotator = FreqtradeLedgerAnnotator(max_series=1)
+    first, second = tmp_path / "first.db", tmp_path / "second.db"
+    assert annotator.annotate(_frame(0, 30), series_id=SERIES_ID, timeframe="1m", db_path=first).ok
+    assert CandleStore(db_path=first).head_time(SERIES_ID) == 60 * 30
+
+    assert annotator.annotate(_frame(0, 30), series_id=SERIES_ID, timeframe="1m", db_path=second).ok
+    assert CandleStore(db_path=first).head_time(SERIES_ID) is None
+    assert CandleStore(db_path=second).head_time(SERIES_ID) == 60 * 30
+
+    # A released db is rebuilt from the next dataframe it sees.
+    res = annotator.annotate(_frame(0, 31), series_id=SERIES_ID, timeframe="1m", db_path=first)
+    full = annotate_factor_ledger(_frame(0, 31), series_id=SERIES_ID, timeframe="1m", db_path=tmp_path / "full.db")
+    pd.testing.assert_frame_equal(res.dataframe, full.dataframe)
@@ -99,3 +99,107 @@ def test_bootstrap_handles_invalid_feather_schema_gracefully(tmp_path, monkeypat
         market_history_source="freqtrade",
     )
     assert wrote == 0
+
+
+def test_tail_backfill_writes_only_missing_and_skips_unchanged_file(tmp_path, monkeypatch) -> None:
+    from backend.app.market import history_bootstrapper
+    from backend.app.market.history_bootstrapper import backfill_tail_from_freqtrade
+
+    datadir = tmp_path / "datadir"
+    datadir.mkdir(parents=True, exist_ok=True)
+    _write_feather(datadir / "BTC_USDT-1m.feather", n=30)
+    monkeypatch.setenv("TRADE_CANVAS_FREQTRADE_DATADIR", str(datadir))
+    store = CandleStore(db_path=tmp_path / "market.db")
+    series_id = "binance:spot:BTC/USDT:1m"
+
+    assert maybe_bootstrap_from_freqtrade(store, series_id=series_id, limit=20, market_history_source="freqtrade") == 20
+    assert backfill_tail_from_freqtrade(store, series_id=series_id, limit=20, market_history_source="freqtrade") == 0
+
+    def _unexpected_read(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise AssertionError("unchanged file must not be re-read")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(history_bootstrapper, "read_freqtrade_tail", _unexpected_read)
+        assert backfill_tail_from_freqtrade(store, series_id=series_id, limit=20, market_history_source="freqtrade") == 0
+
+    _write_feather(datadir / "BTC_USDT-1m.feather", n=35)
+    assert backfill_tail_from_freqtrade(store, series_id=series_id, limit=20, market_history_source="freqtrade") == 5
+    candles = store.get_closed(series_id, since=None, limit=100)
+    assert len(candles) == 25
+    assert candles[-1].close == 1.05 + 34
+
+
+def test_bootstrap_reads_integer_ms_dates_without_pandas(tmp_path, monkeypatch) -> None:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.feather as feather  # type: ignore[import-untyped]
+
+    datadir = tmp_path / "datadir"
+    datadir.mkdir(parents=True, exist_ok=True)
+    base_ms = 1_704_067_200_000
+    table = pa.table(
+        {
+            "date": [base_ms + i * 60_000 for i in (2, 0, 1, 1)],
+            "open": [3.0, 1.0, 2.0, 2.5],
+            "high": [3.0, 1.0, 2.0, 2.5],
+            "low": [3.0, 1.0, 2.0, 2.5],
+            "close": [3.0, 1.0, 2.0, 2.5],
+            "volume": [1.0, None, 1.0, 1.0],
+        }
+    )
+    feather.write_feather(table, datadir / "BTC_USDT-1m.feather")
+    monkeypatch.setenv("TRADE_CANVAS_FREQTRADE_DATADIR", str(datadir))
+    store = CandleStore(db_path=tmp_path / "market.db")
+    series_id = "binance:spot:BTC/USDT:1m"
+
+    assert maybe_bootstrap_from_freqtrade(store, series_id=series_id, limit=10, market_history_source="freqtrade") == 2
+    candles = store.get_closed(series_id, since=None, limit=10)
+    assert [(c.candle_time, c.close) for c in candles] == [(1_704_067_260, 2.5), (1_704_067_320, 3.0)]
+
+
+def test_bootstrap_two_million_row_file_reads_only_the_tail(tmp_path, monkeypatch) -> None:
+    import numpy as np  # type: ignore[import-untyped]
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.feather as feather  # type: ignore[import-untyped]
+
+    n = 2_000_000
+    datadir = tmp_path / "datadir"
+    datadir.mkdir(parents=True, exist_ok=True)
+    start_ns = np.int64(1_577_836_800) * 1_000_000_000
+    prices = np.arange(n, dtype=np.float64)
+    table = pa.table(
+        {
+            "date": pa.array(start_ns + np.arange(n, dtype=np.int64) * 60_000_000_000, type=pa.timestamp("ns", tz="UTC")),
+            "open": prices,
+            "high": prices + 1.0,
+            "low": prices - 1.0,
+            "close": prices + 0.5,
+            "volume": np.ones(n),
+        }
+    )
+    feather.write_feather(table, datadir / "BTC_USDT-1m.feather", chunksize=1000)
+    monkeypatch.setenv("TRADE_CANVAS_FREQTRADE_DATADIR", str(datadir))
+    store = CandleStore(db_path=tmp_path / "market.db")
+    series_id = "binance:spot:BTC/USDT:1m"
+
+    batches_read: list[int] = []
+    open_file = pa.ipc.open_file
+
+    class _CountingReader:
+        def __init__(self, reader) -> None:  # noqa: ANN001
+            self._reader = reader
+
+        def __getattr__(self, name: str):  # noqa: ANN204
+            return getattr(self._reader, name)
+
+        def get_batch(self, idx: int):  # noqa: ANN201
+            batch = self._reader.get_batch(idx)
+            batches_read.append(int(batch.num_rows))
+            return batch
+
+    monkeypatch.setattr(pa.ipc, "open_file", lambda source: _CountingReader(open_file(source)))
+    wrote = maybe_bootstrap_from_freqtrade(store, series_id=series_id, limit=2000, market_history_source="freqtrade")
+
+    assert wrote == 2000
+    assert store.head_time(series_id) == 1_577_836_800 + (n - 1) * 60
+    # 2000 batches of 1000 rows on disk; only the two trailing ones are materialized.
+    assert batches_read == [1000, 1000]
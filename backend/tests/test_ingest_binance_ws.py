@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
+import backend.app.ingest.binance_ws_series as binance_ws_series_mod
 from backend.app.ingest.binance_ws import (
+    BinanceWsIngestLoopRequest,
     _publish_pipeline_result_from_ws,
     build_binance_kline_ws_url,
     parse_binance_kline_payload,
 )
+from backend.app.ingest.binance_ws_series import BinanceWsSeriesState
+from backend.app.ingest.kline_decode import decode_ws_message, kline_head
+from backend.app.ingest.settings import WhitelistIngestSettings
 from backend.app.pipelines import IngestPipelineResult, IngestSeriesBatch
+from backend.app.core.candle_record import CandleRecord
 from backend.app.core.schemas import CandleClosed
 from backend.app.core.series_id import parse_series_id
 
@@ -49,11 +56,74 @@ def test_parse_binance_kline_payload_ignores_non_final() -> None:
     assert parse_binance_kline_payload(payload) is None
 
 
+def test_kline_decode_rejects_malformed_frames() -> None:
+    assert decode_ws_message("{not json") is None
+    assert kline_head({"k": {"t": "bad"}}) is None
+    assert kline_head({"k": {"t": 0, "x": True}}) is None
+    assert parse_binance_kline_payload({"k": {"t": 1700000000000, "o": "1", "x": True}}) is None
+    assert kline_head(decode_ws_message(json.dumps({"k": {"t": "1700000000000", "x": True}})))[:2] == (1700000000, True)
+
+
+class _HubSpy:
+    def __init__(self) -> None:
+        self.forming: list[int] = []
+        self.forming_types: set[type] = set()
+
+    async def publish_forming(self, *, series_id: str, candle: CandleClosed) -> None:
+        self.forming.append(int(candle.candle_time))
+        self.forming_types.add(type(candle))
+
+
+class _StoreStub:
+    def head_time(self, series_id: str) -> int | None:
+        return None
+
+
+def test_throttled_forming_frames_do_not_build_candles(monkeypatch) -> None:
+    built: list[int] = []
+    real_kline_candle = binance_ws_series_mod.kline_candle
+
+    def _counting_kline_candle(k, candle_time):  # type: ignore[no-untyped-def]
+        built.append(int(candle_time))
+        return real_kline_candle(k, candle_time)
+
+    monkeypatch.setattr(binance_ws_series_mod, "kline_candle", _counting_kline_candle)
+    hub = _HubSpy()
+    request = BinanceWsIngestLoopRequest(
+        series_id="binance:futures:BTC/USDT:1m",
+        store=_StoreStub(),  # type: ignore[arg-type]
+        hub=hub,  # type: ignore[arg-type]
+        ingest_pipeline=_PipelineSpy(),  # type: ignore[arg-type]
+        settings=WhitelistIngestSettings(),
+        stop=asyncio.Event(),
+        forming_min_interval_ms=60_000,
+    )
+    state = BinanceWsSeriesState(request, series=parse_series_id(request.series_id))
+    frame = {"k": {"t": 1700000000000, "o": "1", "h": "1", "l": "1", "c": "1", "v": "1", "x": False}}
+
+    async def _run() -> None:
+        for _ in range(50):
+            await state.on_kline(frame)
+
+    asyncio.run(_run())
+
+    assert hub.forming == [1700000000]
+    assert built == [1700000000]
+    assert hub.forming_types == {CandleClosed}
+
+    closed = {"k": {**frame["k"], "t": 1700000060000, "x": True}}
+    asyncio.run(state.on_kline(closed))
+    # Closed klines stay decoded records until the pipeline publishes them.
+    assert [type(candle) for candle in state.buf] == [CandleRecord]
+
+
 def _candle(t: int, price: float = 1.0) -> CandleClosed:
     return CandleClosed(candle_time=int(t), open=price, high=price, low=price, close=price, volume=1.0)
 
 
 class _PipelineSpy:
+    runtime_metrics = None
+
     def __init__(self) -> None:
         self.publish_ws_calls: list[int] = []
 
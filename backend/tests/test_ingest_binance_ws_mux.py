@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from backend.app.factor.orchestrator import FactorOrchestrator
+from backend.app.factor.store import FactorStore
+from backend.app.ingest.binance_ws import BinanceWsIngestLoopRequest
+from backend.app.ingest.binance_ws_mux import BinanceWsMux, BinanceWsMuxConfig, _MuxMember, _MuxShard
+from backend.app.ingest.loop_guardrail import IngestLoopGuardrail, IngestLoopGuardrailConfig
+from backend.app.ingest.settings import WhitelistIngestSettings
+from backend.app.market.fake_binance import FakeBinanceConfig, FakeBinanceServer
+from backend.app.pipelines import IngestPipeline
+from backend.app.storage.candle_store import CandleStore
+from backend.app.ws.hub import CandleHub
+
+SYMBOLS = ("BTC", "ETH", "SOL", "BNB", "XRP")
+
+
+def _series_id(base: str) -> str:
+    return f"binance:futures:{base}/USDT:1m"
+
+
+@pytest.fixture
+def fake_binance(monkeypatch):
+    servers: list[FakeBinanceServer] = []
+
+    def _start(**overrides) -> FakeBinanceServer:
+        config = FakeBinanceConfig(**{"symbol_count": 5, "history_candles": 120, "tick_hz": 40.0, **overrides})
+        server = FakeBinanceServer(config).start()
+        servers.append(server)
+        for key, value in server.env().items():
+            monkeypatch.setenv(key, value)
+        return server
+
+    yield _start
+    for server in servers:
+        server.stop()
+
+
+class _Harness:
+    def __init__(self, tmp_path, *, mux: BinanceWsMux) -> None:
+        self.store = CandleStore(tmp_path / "market.db")
+        self.pipeline = IngestPipeline(
+            store=self.store,
+            factor_orchestrator=FactorOrchestrator(candle_store=self.store, factor_store=FactorStore(tmp_path / "market.db")),
+        )
+        self.hub = CandleHub()
+        self.mux = mux
+        self.jobs: dict[str, tuple[asyncio.Event, asyncio.Task]] = {}
+
+    def start(self, series_id: str, *, guardrail: IngestLoopGuardrail | None = None) -> None:
+        stop = asyncio.Event()
+        request = BinanceWsIngestLoopRequest(
+            series_id=series_id,
+            store=self.store,
+            hub=self.hub,
+            ingest_pipeline=self.pipeline,
+            settings=WhitelistIngestSettings(),
+            stop=stop,
+            flush_s=0.1,
+            loop_guardrail=guardrail,
+        )
+        self.jobs[series_id] = (stop, asyncio.create_task(self.mux.run_series(request=request)))
+
+    async def stop(self, series_id: str) -> None:
+        stop, task = self.jobs.pop(series_id)
+        stop.set()
+        await asyncio.wait_for(task, timeout=5.0)
+
+    async def stop_all(self) -> None:
+        for series_id in list(self.jobs):
+            await self.stop(series_id)
+        await self.mux.close()
+
+    def times(self, series_id: str) -> list[int]:
+        return [int(c.candle_time) for c in self.store.get_closed(series_id, since=None, limit=5000)]
+
+
+def _assert_contiguous(times: list[int], tf_s: int) -> None:
+    assert len(times) >= 5
+    assert all(b - a == tf_s for a, b in zip(times, times[1:]))
+
+
+def test_mux_shares_one_socket_across_series(fake_binance, tmp_path) -> None:
+    server = fake_binance()
+    harness = _Harness(tmp_path, mux=BinanceWsMux())
+
+    async def _run() -> dict:
+        for base in SYMBOLS:
+            harness.start(_series_id(base))
+        await asyncio.sleep(1.5)
+        snapshot = harness.mux.snapshot()
+        await harness.stop_all()
+        return snapshot
+
+    snapshot = asyncio.run(_run())
+
+    assert server.app.state.ws_connections == 1
+    assert snapshot["connections"] == 1
+    assert snapshot["streams"] == len(SYMBOLS)
+    for base in SYMBOLS:
+        _assert_contiguous(harness.times(_series_id(base)), server.book.tf_s)
+
+
+def test_mux_adds_and_removes_series_without_reconnecting(fake_binance, tmp_path) -> None:
+    server = fake_binance()
+    harness = _Harness(tmp_path, mux=BinanceWsMux(config=BinanceWsMuxConfig(control_min_interval_s=0.05)))
+    late, dropped = _series_id("SOL"), _series_id("ETH")
+
+    async def _run() -> tuple[int, int]:
+        harness.start(_series_id("BTC"))
+        harness.start(dropped)
+        await asyncio.sleep(0.6)
+        harness.start(late)
+        await harness.stop(dropped)
+        dropped_count = len(harness.times(dropped))
+        await asyncio.sleep(1.0)
+        streams = harness.mux.snapshot()["shards"][0]["streams"]
+        await harness.stop_all()
+        return dropped_count, len(streams)
+
+    dropped_count, stream_count = asyncio.run(_run())
+
+    assert server.app.state.ws_connections == 1
+    assert stream_count == 2
+    _assert_contiguous(harness.times(late), server.book.tf_s)
+    assert len(harness.times(dropped)) == dropped_count
+
+
+def test_mux_shards_by_streams_per_socket(fake_binance, tmp_path) -> None:
+    server = fake_binance()
+    harness = _Harness(tmp_path, mux=BinanceWsMux(config=BinanceWsMuxConfig(streams_per_socket=2)))
+
+    async def _run() -> dict:
+        for base in SYMBOLS:
+            harness.start(_series_id(base))
+        await asyncio.sleep(1.0)
+        snapshot = harness.mux.snapshot()
+        await harness.stop_all()
+        return snapshot
+
+    snapshot = asyncio.run(_run())
+
+    assert snapshot["connections"] == 3
+    assert sorted(len(shard["streams"]) for shard in snapshot["shards"]) == [1, 2, 2]
+    assert server.app.state.ws_connections == 3
+    for base in SYMBOLS:
+        _assert_contiguous(harness.times(_series_id(base)), server.book.tf_s)
+
+
+def test_mux_socket_failure_counts_against_every_member_guardrail(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("TRADE_CANVAS_BINANCE_FUTURES_WS_BASE_URL", "ws://127.0.0.1:9")
+    harness = _Harness(tmp_path, mux=BinanceWsMux())
+    config = IngestLoopGuardrailConfig(crash_budget=2, backoff_initial_s=0.05, open_cooldown_s=30.0)
+    guardrails = {_series_id(base): IngestLoopGuardrail(enabled=True, config=config) for base in ("BTC", "ETH")}
+
+    async def _run() -> None:
+        for series_id, guardrail in guardrails.items():
+            harness.start(series_id, guardrail=guardrail)
+        await asyncio.sleep(0.8)
+        await harness.stop_all()
+
+    asyncio.run(_run())
+
+    for guardrail in guardrails.values():
+        snap = guardrail.snapshot()
+        assert snap["state"] == "open"
+        assert snap["window_failures"] == 2
+
+
+class _GatedState:
+    def __init__(self, *, open_gate: bool) -> None:
+        self.gate = asyncio.Event()
+        if open_gate:
+            self.gate.set()
+        self.seen: list[int] = []
+        self.due_checks = 0
+
+    async def on_kline(self, data: dict) -> None:
+        await self.gate.wait()
+        self.seen.append(int(data["i"]))
+
+    async def flush_if_due(self, *, now: float) -> None:  # noqa: ARG002
+        self.due_checks += 1
+
+
+async def _until(predicate, *, timeout_s: float = 2.0) -> None:
+    async def _poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(_poll(), timeout=timeout_s)
+
+
+def test_mux_reader_routes_without_waiting_on_a_slow_series() -> None:
+    async def _run() -> None:
+        shard = _MuxShard(market="futures", config=BinanceWsMuxConfig())
+        slow = _MuxMember(stream="btcusdt@kline_1m", state=_GatedState(open_gate=False), guardrail=None)
+        fast = _MuxMember(stream="ethusdt@kline_1m", state=_GatedState(open_gate=True), guardrail=None)
+        shard._members = {slow.stream: [slow], fast.stream: [fast]}
+        stop = asyncio.Event()
+        tasks = [asyncio.create_task(m.run(stop=stop, tick_s=0.02)) for m in (slow, fast)]
+
+        for i in range(3):
+            for member in (slow, fast):
+                shard._dispatch(json.dumps({"stream": member.stream, "data": {"i": i}}))
+        # Routing is synchronous: nothing ran inline, everything sits in the per-series inboxes.
+        assert shard.snapshot()["backlog"] == 6
+
+        await _until(lambda: fast.state.seen == [0, 1, 2] and fast.state.due_checks > 0)
+        assert slow.state.seen == []
+        assert slow.inbox.qsize() == 2
+
+        slow.state.gate.set()
+        stop.set()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=2.0)
+        assert slow.state.seen == [0, 1, 2]
+
+    asyncio.run(_run())
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+
+from backend.app.core.series_id import parse_series_id
+from backend.app.factor.orchestrator import FactorOrchestrator
+from backend.app.factor.store import FactorStore
+from backend.app.ingest.binance_ws import BinanceWsIngestLoopRequest
+from backend.app.ingest.binance_ws_series import BinanceWsSeriesState
+from backend.app.ingest.flush_controller import AdaptiveFlushConfig, AdaptiveFlushController
+from backend.app.ingest.settings import WhitelistIngestSettings
+from backend.app.pipelines import IngestPipeline, IngestTelemetry
+from backend.app.runtime.metrics import RuntimeMetrics
+from backend.app.storage.candle_store import CandleStore
+from backend.app.ws.hub import CandleHub
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+def _controller(*, max_batch: int = 50, ceiling_s: float = 0.5) -> AdaptiveFlushController:
+    return AdaptiveFlushController(AdaptiveFlushConfig(max_batch=max_batch, latency_ceiling_s=ceiling_s, ewma_alpha=1.0))
+
+
+def test_quiet_series_flushes_on_close() -> None:
+    ctl = _controller()
+    assert ctl.on_closed(now=0.0, buffered=1) == "quiet"
+    ctl.on_flush(duration_s=0.01)
+    assert ctl.on_closed(now=60.0, buffered=1) == "quiet"
+    assert ctl.target_batch == 1
+
+
+def test_burst_grows_batch_up_to_max() -> None:
+    ctl = _controller(max_batch=8, ceiling_s=10.0)
+    assert ctl.on_closed(now=0.0, buffered=1) == "quiet"
+    ctl.on_flush(duration_s=0.05)
+
+    # 1 ms apart with a 50 ms pipeline -> target 50, capped by max_batch=8.
+    reasons = [ctl.on_closed(now=0.001 * i, buffered=i) for i in range(1, 9)]
+    assert reasons[:-1] == [None] * 7
+    assert reasons[-1] == "max_batch"
+    assert ctl.target_batch == 8
+
+
+def test_burst_target_tracks_pipeline_duration() -> None:
+    ctl = _controller(max_batch=200, ceiling_s=10.0)
+    ctl.on_closed(now=0.0, buffered=1)
+    ctl.on_flush(duration_s=0.004)
+
+    reasons = [ctl.on_closed(now=0.001 * i, buffered=i) for i in range(1, 5)]
+    assert reasons == [None, None, None, "burst"]
+    assert ctl.target_batch == 4
+
+
+def test_latency_ceiling_bounds_oldest_wait() -> None:
+    ctl = _controller(max_batch=200, ceiling_s=0.02)
+    ctl.on_closed(now=0.0, buffered=1)
+    ctl.on_flush(duration_s=1.0)
+
+    assert ctl.on_closed(now=0.001, buffered=1) is None
+    assert ctl.due(now=0.0015, buffered=1) is None
+    assert ctl.due(now=0.021, buffered=1) == "ceiling"
+    assert ctl.oldest_wait_s(now=0.021) >= 0.02
+
+
+def test_due_flushes_when_burst_goes_idle() -> None:
+    ctl = _controller(max_batch=200, ceiling_s=10.0)
+    ctl.on_closed(now=0.0, buffered=1)
+    ctl.on_flush(duration_s=1.0)
+    ctl.on_closed(now=0.001, buffered=1)
+    ctl.on_closed(now=0.002, buffered=2)
+    assert ctl.due(now=0.0025, buffered=2) is None
+    assert ctl.due(now=0.005, buffered=2) == "idle"
+    assert ctl.due(now=0.005, buffered=0) is None
+
+
+def test_series_state_exposes_flush_decisions_as_metrics(tmp_path) -> None:
+    store = CandleStore(tmp_path / "market.db")
+    metrics = RuntimeMetrics(enabled=True)
+    pipeline = IngestPipeline(
+        store=store,
+        factor_orchestrator=FactorOrchestrator(candle_store=store, factor_store=FactorStore(tmp_path / "market.db")),
+        telemetry=IngestTelemetry(runtime_metrics=metrics),
+    )
+    request = BinanceWsIngestLoopRequest(
+        series_id=SERIES_ID,
+        store=store,
+        hub=CandleHub(),
+        ingest_pipeline=pipeline,
+        settings=WhitelistIngestSettings(),
+        stop=asyncio.Event(),
+        adaptive_flush=True,
+    )
+    state = BinanceWsSeriesState(request, series=parse_series_id(SERIES_ID))
+    frame = {"k": {"t": 1700000040000, "o": "1", "h": "1", "l": "1", "c": "1", "v": "1", "x": True}}
+
+    asyncio.run(state.on_kline(frame))
+
+    assert state.buf == []
+    assert store.head_time(SERIES_ID) == 1700000040
+    snap = metrics.snapshot()
+    assert snap["counters"]["ingest_ws_flush_total{reason=quiet}"] == 1.0
+    assert snap["gauges"][f"ingest_ws_flush_target_batch{{series_id={SERIES_ID}}}"] == 1.0
+    assert snap["timers"]["ingest_ws_flush_oldest_wait_ms"]["count"] == 1.0
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._perf = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        # Every flush appears to take 1s, so a burst keeps batching instead of flushing per candle.
+        self._perf += 1.0
+        return self._perf
+
+
+def test_forming_frames_enforce_the_latency_ceiling_without_recv_timeouts(tmp_path, monkeypatch) -> None:
+    from backend.app.ingest import binance_ws_series
+
+    clock = _FakeClock()
+    monkeypatch.setattr(binance_ws_series, "time", clock)
+    store = CandleStore(tmp_path / "market.db")
+    metrics = RuntimeMetrics(enabled=True)
+    pipeline = IngestPipeline(
+        store=store,
+        factor_orchestrator=FactorOrchestrator(candle_store=store, factor_store=FactorStore(tmp_path / "market.db")),
+        telemetry=IngestTelemetry(runtime_metrics=metrics),
+    )
+    request = BinanceWsIngestLoopRequest(
+        series_id=SERIES_ID,
+        store=store,
+        hub=CandleHub(),
+        ingest_pipeline=pipeline,
+        settings=WhitelistIngestSettings(),
+        stop=asyncio.Event(),
+        flush_s=0.5,
+        adaptive_flush=True,
+    )
+    state = BinanceWsSeriesState(request, series=parse_series_id(SERIES_ID))
+    t0 = 1700000040
+
+    def _frame(candle_time: int, *, final: bool) -> dict:
+        return {"k": {"t": candle_time * 1000, "o": "1", "h": "1", "l": "1", "c": "1", "v": "1", "x": final}}
+
+    async def _run() -> list[tuple[float, int]]:
+        await state.on_kline(_frame(t0, final=True))
+        # Burst: two closed candles 200ms apart stay buffered (target batch 3).
+        for i in (1, 2):
+            clock.now = 0.2 * i
+            await state.on_kline(_frame(t0 + 60 * i, final=True))
+        assert len(state.buf) == 2
+        # Only forming updates from here on, every 250ms like a live Binance socket; recv never times out.
+        buffered: list[tuple[float, int]] = []
+        for i in range(1, 5):
+            clock.now = 0.46 + 0.25 * (i - 1)
+            await state.on_kline(_frame(t0 + 180, final=False))
+            buffered.append((clock.now, len(state.buf)))
+        return buffered
+
+    buffered = asyncio.run(_run())
+
+    # Oldest candle arrived at t=0.2 with a 0.5s ceiling: still buffered at 0.46, flushed by the 0.71 frame.
+    assert buffered == [(0.46, 2), (0.71, 0), (0.96, 0), (1.21, 0)]
+    assert store.head_time(SERIES_ID) == t0 + 120
+    snap = metrics.snapshot()
+    assert snap["counters"]["ingest_ws_flush_total{reason=ceiling}"] == 1.0
+    assert snap["timers"]["ingest_ws_flush_oldest_wait_ms"]["max_ms"] <= 500.0 + 250.0
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 import pytest
 
 from backend.app.pipelines import IngestPipeline, IngestPipelineError
+from backend.app.core.candle_record import CandleRecord
 from backend.app.core.schemas import CandleClosed
 from backend.app.storage.candle_store import CandleStore
 
@@ -66,6 +67,7 @@ class _OverlayFailing(_Overlay):
 class _Hub:
     def __init__(self) -> None:
         self.closed_batches: list[tuple[str, list[int]]] = []
+        self.closed_types: set[type] = set()
         self.system_events: list[str] = []
 
     async def publish_closed(self, *, series_id: str, candle: CandleClosed) -> None:
@@ -73,6 +75,7 @@ class _Hub:
 
     async def publish_closed_batch(self, *, series_id: str, candles: list[CandleClosed]) -> None:
         self.closed_batches.append((str(series_id), [int(c.candle_time) for c in candles]))
+        self.closed_types.update(type(c) for c in candles)
 
     async def publish_system(self, *, series_id: str, event: str, message: str, data: dict) -> None:
         _ = event
@@ -197,6 +200,20 @@ def test_ingest_pipeline_run_publishes_batches_and_rebuild_system_events() -> No
         assert hub.system_events == ["s1"]
 
 
+def test_ingest_pipeline_publishes_decoded_records_as_models() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        store = CandleStore(db_path=Path(td) / "market.db")
+        hub = _Hub()
+        pipeline = IngestPipeline(store=store, factor_orchestrator=_Factor(), hub=hub)
+        records = [CandleRecord(100, 1.0, 1.0, 1.0, 1.0, 1.0), CandleRecord(160, 1.1, 1.1, 1.1, 1.1, 1.0)]
+
+        asyncio.run(pipeline.run(batches={"s1": records}, publish=True))
+
+        assert hub.closed_batches == [("s1", [100, 160])]
+        assert hub.closed_types == {CandleClosed}
+        assert store.head_time("s1") == 160
+
+
 def test_ingest_pipeline_publish_best_effort_swallows_errors_and_continues() -> None:
     with tempfile.TemporaryDirectory() as td:
         store = CandleStore(db_path=Path(td) / "market.db")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from backend.app.core.schemas import CandleClosed
+from backend.app.factor.orchestrator import FactorOrchestrator
+from backend.app.factor.store import FactorStore
+from backend.app.ingest.ws_hotpath import flush_ws_buffer
+from backend.app.pipelines import IngestPipeline, IngestPipelineResult, IngestTelemetry
+from backend.app.runtime.ingest_trace import IngestTracer, render_collapsed_stacks
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+def _candle(t: int, price: float = 10.0) -> CandleClosed:
+    return CandleClosed(candle_time=int(t), open=price, high=price + 1, low=price - 1, close=price, volume=1.0)
+
+
+def _pipeline(tmp_path: Path, tracer: IngestTracer) -> IngestPipeline:
+    db_path = tmp_path / "market.db"
+    store = CandleStore(db_path)
+    return IngestPipeline(
+        store=store,
+        factor_orchestrator=FactorOrchestrator(candle_store=store, factor_store=FactorStore(db_path)),
+        telemetry=IngestTelemetry(tracer=tracer),
+    )
+
+
+async def _noop_publish(*, ingest_pipeline: IngestPipeline, pipeline_result: IngestPipelineResult) -> None:
+    return None
+
+
+def _flush(pipeline: IngestPipeline, buf: list[CandleClosed]) -> tuple[int, float]:
+    return asyncio.run(
+        flush_ws_buffer(
+            series_id=SERIES_ID,
+            ingest_pipeline=pipeline,
+            fanout=None,
+            buf=buf,
+            reason="threshold",
+            last_emitted_time=0,
+            last_flush_at=0.0,
+            publish_pipeline_result=_noop_publish,
+        )
+    )
+
+
+def test_flush_records_span_tree_with_steps_and_rows(tmp_path) -> None:
+    tracer = IngestTracer(sample_rate=1.0, capacity=8)
+    pipeline = _pipeline(tmp_path, tracer)
+
+    emitted, _ = _flush(pipeline, [_candle(120), _candle(60)])
+
+    assert emitted == 120
+    traces = tracer.recent()
+    assert len(traces) == 1
+    trace = traces[0]
+    assert trace.series_id == SERIES_ID
+    assert trace.candle_time == 120
+    root = trace.root
+    assert root.name == "binance_ws.flush"
+    assert root.attrs["rows"] == 2
+    assert [span.name for span in root.children] == ["ws.prepare_batches", "ingest_pipeline.run", "hub.publish"]
+
+    pipeline_span = root.children[1]
+    series_span = pipeline_span.children[0]
+    assert series_span.name == SERIES_ID
+    step_names = [span.name for span in series_span.children]
+    assert step_names == ["store.upsert_many_closed", "factor.ingest_closed"]
+    assert series_span.children[0].attrs["rows"] == 2
+    assert sum(span.duration_ms for span in series_span.children) <= pipeline_span.duration_ms + 1e-6
+
+    collapsed = render_collapsed_stacks(traces)
+    assert f"binance_ws.flush;ingest_pipeline.run;{SERIES_ID};store.upsert_many_closed " in collapsed
+    for line in collapsed.strip().splitlines():
+        stack, _, value = line.rpartition(" ")
+        assert stack and int(value) > 0
+
+
+def test_tracer_sampling_and_ring_buffer(tmp_path) -> None:
+    assert IngestTracer(sample_rate=0.0).maybe_start(source="binance_ws", series_id=SERIES_ID, reason="x") is None
+
+    draws = iter([0.9, 0.1, 0.6, 0.2, 0.3])
+    tracer = IngestTracer(sample_rate=0.5, capacity=2, rng=lambda: next(draws))
+    pipeline = _pipeline(tmp_path, tracer)
+    for idx in range(5):
+        _flush(pipeline, [_candle(60 * (idx + 1))])
+
+    stats = tracer.stats()
+    assert stats["seen"] == 5
+    assert stats["sampled"] == 3
+    assert stats["stored"] == 2
+    assert [trace.candle_time for trace in tracer.recent()] == [240, 300]
+    assert [trace.trace_id for trace in tracer.recent(limit=1)] == [3]
+
+
+def test_failed_pipeline_run_still_records_trace_with_error(tmp_path) -> None:
+    tracer = IngestTracer(sample_rate=1.0, capacity=8)
+    pipeline = _pipeline(tmp_path, tracer)
+
+    async def _boom(**kwargs) -> IngestPipelineResult:  # noqa: ANN003
+        raise RuntimeError("db down")
+
+    pipeline.run = _boom  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError, match="db down"):
+        _flush(pipeline, [_candle(60)])
+
+    traces = tracer.recent()
+    assert len(traces) == 1
+    root = traces[0].root
+    assert root.attrs["error"] == "RuntimeError"
+    assert [span.name for span in root.children] == ["ws.prepare_batches", "ingest_pipeline.run"]
@@ -4,6 +4,7 @@ import unittest
 from unittest import mock
 
 from backend.app.market.backfill import backfill_market_gap_best_effort
+from backend.app.market.ccxt_backfill_engine import CcxtBackfillEngine
 
 
 class _StoreStub:
@@ -34,7 +35,6 @@ class MarketBackfillTests(unittest.TestCase):
                     series_id="binance:futures:BTC/USDT:1m",
                     expected_next_time=120,
                     actual_time=240,
-                    enable_ccxt_backfill=False,
                     market_history_source="",
                 )
 
@@ -55,7 +55,7 @@ class MarketBackfillTests(unittest.TestCase):
                         series_id="binance:futures:BTC/USDT:1m",
                         expected_next_time=120,
                         actual_time=240,
-                        enable_ccxt_backfill=True,
+                        ccxt_backfill=CcxtBackfillEngine(),
                         ccxt_timeout_ms=3000,
                         market_history_source="",
                     )
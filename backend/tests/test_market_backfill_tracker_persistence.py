@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import json
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from backend.app.market.backfill_tracker import MarketBackfillProgressTracker
+from backend.app.runtime.metrics import RuntimeMetrics
 
 
 class MarketBackfillProgressTrackerPersistenceTests(unittest.TestCase):
@@ -47,6 +51,62 @@ class MarketBackfillProgressTrackerPersistenceTests(unittest.TestCase):
             snapshot = tracker.snapshot(series_id="binance:spot:ETH/USDT:5m")
             self.assertEqual(snapshot.state, "idle")
 
+    def test_write_behind_coalesces_transitions_and_flushes_on_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "runtime_state" / "market_backfill_progress.json"
+            metrics = RuntimeMetrics(enabled=True)
+            tracker = MarketBackfillProgressTracker(state_path=state_path, flush_interval_s=0.2, runtime_metrics=metrics)
+            writes: list[int] = []
+            original_replace = Path.replace
+
+            def _spy_replace(path_self: Path, target):  # noqa: ANN001
+                writes.append(1)
+                return original_replace(path_self, target)
+
+            with mock.patch.object(Path, "replace", _spy_replace):
+                for idx in range(50):
+                    series_id = f"binance:futures:S{idx}/USDT:1m"
+                    tracker.begin(
+                        series_id=series_id,
+                        start_missing_seconds=600,
+                        start_missing_candles=10,
+                        reason="tail_coverage",
+                        now_time=1000,
+                    )
+                    tracker.update(
+                        series_id=series_id,
+                        current_missing_seconds=300,
+                        current_missing_candles=5,
+                        now_time=1001,
+                    )
+                self.assertFalse(state_path.exists())
+                deadline = time.monotonic() + 3.0
+                while not state_path.exists() and time.monotonic() < deadline:
+                    time.sleep(0.02)
+                self.assertTrue(state_path.exists())
+                tracker.succeed(
+                    series_id="binance:futures:S0/USDT:1m",
+                    current_missing_seconds=0,
+                    current_missing_candles=0,
+                    now_time=1002,
+                )
+                tracker.close()
+
+            self.assertLessEqual(len(writes), 3)
+            states = json.loads(state_path.read_text(encoding="utf-8"))["states"]
+            self.assertEqual(len(states), 50)
+            self.assertEqual(states["binance:futures:S0/USDT:1m"]["state"], "succeeded")
+            timers = metrics.snapshot()["timers"]
+            self.assertGreaterEqual(timers["market_backfill_progress_lock_hold_ms"]["count"], 101)
+            self.assertIn("market_backfill_progress_persist_ms", timers)
+
+    def test_close_without_changes_does_not_create_state_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "runtime_state" / "market_backfill_progress.json"
+            tracker = MarketBackfillProgressTracker(state_path=state_path, flush_interval_s=0.5)
+            tracker.close()
+            self.assertFalse(state_path.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -246,7 +246,9 @@ def test_store_backfill_service_falls_back_to_ccxt_for_missing_window(monkeypatc
             end_time: int,
             batch_limit: int = 1000,
             ccxt_timeout_ms: int = 10_000,
+            engine: object = None,
         ) -> int:
+            _ = engine
             _ = batch_limit
             _ = ccxt_timeout_ms
             called.append((int(start_time), int(end_time)))
@@ -298,7 +300,9 @@ def test_store_backfill_service_to_time_none_uses_now_window_for_stale_series(mo
             end_time: int,
             batch_limit: int = 1000,
             ccxt_timeout_ms: int = 10_000,
+            engine: object = None,
         ) -> int:
+            _ = engine
             _ = batch_limit
             _ = ccxt_timeout_ms
             called.append((int(start_time), int(end_time)))
@@ -349,7 +353,9 @@ def test_store_backfill_service_to_time_none_skips_ccxt_by_default(monkeypatch)
             end_time: int,
             batch_limit: int = 1000,
             ccxt_timeout_ms: int = 10_000,
+            engine: object = None,
         ) -> int:
+            _ = engine
             _ = candle_store
             _ = batch_limit
             _ = ccxt_timeout_ms
@@ -391,7 +397,9 @@ def test_store_backfill_service_to_time_none_strict_closed_only_caps_at_previous
             end_time: int,
             batch_limit: int = 1000,
             ccxt_timeout_ms: int = 10_000,
+            engine: object = None,
         ) -> int:
+            _ = engine
             _ = batch_limit
             _ = ccxt_timeout_ms
             called.append((int(start_time), int(end_time)))
@@ -24,6 +24,7 @@ class MarketDebugIngestStateTests(unittest.TestCase):
         os.environ.pop("TRADE_CANVAS_WHITELIST_PATH", None)
         os.environ.pop("TRADE_CANVAS_ENABLE_DEBUG_API", None)
         os.environ.pop("TRADE_CANVAS_ENABLE_RUNTIME_METRICS", None)
+        os.environ.pop("TRADE_CANVAS_INGEST_TRACE_SAMPLE_RATE", None)
         os.environ.pop("TRADE_CANVAS_ENABLE_PG_STORE", None)
         os.environ.pop("TRADE_CANVAS_POSTGRES_DSN", None)
         os.environ.pop("TRADE_CANVAS_POSTGRES_SCHEMA", None)
@@ -69,6 +70,49 @@ class MarketDebugIngestStateTests(unittest.TestCase):
         self.assertIn("gauges", payload)
         self.assertIn("timers", payload)
 
+    def test_debug_ingest_traces_gated_and_reports_sampler(self) -> None:
+        client = TestClient(create_app())
+        self.assertEqual(client.get("/api/market/debug/ingest_traces").status_code, 404)
+
+        os.environ["TRADE_CANVAS_ENABLE_DEBUG_API"] = "1"
+        os.environ["TRADE_CANVAS_INGEST_TRACE_SAMPLE_RATE"] = "0.25"
+        client = TestClient(create_app())
+        resp = client.get("/api/market/debug/ingest_traces", params={"limit": 5})
+        self.assertEqual(resp.status_code, 200, resp.text)
+        payload = resp.json()
+        self.assertTrue(payload["enabled"])
+        self.assertEqual(payload["sample_rate"], 0.25)
+        self.assertEqual(payload["traces"], [])
+
+        collapsed = client.get("/api/market/debug/ingest_traces", params={"format": "collapsed"})
+        self.assertEqual(collapsed.status_code, 200, collapsed.text)
+        self.assertTrue(collapsed.headers["content-type"].startswith("text/plain"))
+
+    def test_prometheus_metrics_404_when_runtime_metrics_disabled(self) -> None:
+        client = TestClient(create_app())
+        resp = client.get("/metrics")
+        self.assertEqual(resp.status_code, 404, resp.text)
+
+    def test_prometheus_metrics_exposes_route_and_pipeline_latency(self) -> None:
+        os.environ["TRADE_CANVAS_ENABLE_RUNTIME_METRICS"] = "1"
+        client = TestClient(create_app())
+        ingest = client.post(
+            "/api/market/ingest/candle_closed",
+            json={
+                "series_id": "binance:futures:BTC/USDT:1m",
+                "candle": {"candle_time": 1700000000, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10},
+            },
+        )
+        self.assertEqual(ingest.status_code, 200, ingest.text)
+
+        resp = client.get("/metrics")
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertTrue(resp.headers["content-type"].startswith("text/plain"))
+        text = resp.text
+        self.assertIn("# TYPE http_request_duration_ms histogram", text)
+        self.assertIn('route="/api/market/ingest/candle_closed"', text)
+        self.assertIn('ingest_pipeline_step_duration_ms_count{step="store.upsert_many_closed"}', text)
+
     def test_debug_series_health_reports_gap_and_bucket_completeness(self) -> None:
         os.environ["TRADE_CANVAS_ENABLE_DEBUG_API"] = "1"
         client = TestClient(create_app())
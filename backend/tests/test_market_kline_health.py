@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import random
+import threading
+
 from backend.app.market.kline_health import analyze_series_health
 from backend.app.core.schemas import CandleClosed
+from backend.app.storage.candle_gap_index import CandleGapIndex
+from backend.app.storage import candle_store as candle_store_module
+from backend.app.storage.candle_store import CandleStore
 
 
 def _candle(t: int, price: float) -> CandleClosed:
@@ -37,6 +43,10 @@ class _StoreWithoutConnect:
         rows = self._series(series_id)
         return sum(1 for row in rows if int(start_time) <= int(row.candle_time) <= int(end_time))
 
+    def gap_index(self, series_id: str) -> None:  # noqa: ARG002
+        # No index: health falls back to the windowed scan path, which the indexed store must match.
+        return None
+
     def get_closed(self, series_id: str, *, since: int | None, limit: int) -> list[CandleClosed]:
         rows = self._series(series_id)
         if since is None:
@@ -79,3 +89,98 @@ def test_analyze_series_health_does_not_require_raw_sql_connection() -> None:
     assert payload["base_series_id"] == base_series_id
     assert payload["base_bucket_completeness"][-1]["bucket_open_time"] == 600
     assert payload["base_bucket_completeness"][-1]["actual_minutes"] == 2
+
+
+def _brute_missing(times: set[int], *, start: int, end: int, step: int) -> list[tuple[int, int]]:
+    out: list[tuple[int, int]] = []
+    first = start + (-start) % step
+    for t in range(first, end + 1, step):
+        if t in times:
+            continue
+        if out and out[-1][1] + step == t:
+            out[-1] = (out[-1][0], t)
+        else:
+            out.append((t, t))
+    return out
+
+
+def test_gap_index_matches_brute_force_under_random_upserts_and_deletes() -> None:
+    rng = random.Random(20261019)
+    step = 60
+    index = CandleGapIndex(step_s=step)
+    times: set[int] = set()
+    for _ in range(3000):
+        t = rng.randrange(0, 400) * step
+        if rng.random() < 0.6:
+            assert index.add(t) == (t not in times)
+            times.add(t)
+        else:
+            assert index.remove(t) == (t in times)
+            times.discard(t)
+
+        a, b = sorted((rng.randrange(-5, 410) * step + rng.randrange(0, step), rng.randrange(-5, 410) * step))
+        ordered = sorted(times)
+        assert index.count == len(times)
+        assert index.first_time == (ordered[0] if ordered else None)
+        assert index.last_time == (ordered[-1] if ordered else None)
+        assert index.count_between(a, b) == sum(1 for x in times if a <= x <= b)
+        assert index.missing_ranges(a, b) == _brute_missing(times, start=a, end=b, step=step)
+        brute_gaps = [(p, n) for p, n in zip(ordered, ordered[1:]) if n - p > step]
+        assert list(index.gaps()) == brute_gaps
+        assert index.recent_gaps(3) == brute_gaps[::-1][:3]
+
+    rebuilt = CandleGapIndex.build(step_s=step, times=times)
+    assert list(rebuilt.gaps()) == list(index.gaps())
+    assert rebuilt.coverage_pct(0, 399 * step) == 100.0 * len(times) / 400
+
+
+def test_candle_store_keeps_gap_index_current_and_health_matches_scan(tmp_path) -> None:
+    store = CandleStore(tmp_path / "market.db")
+    plain = _StoreWithoutConnect()
+    series_id = "binance:futures:BTC/USDT:5m"
+    base_id = "binance:futures:BTC/USDT:1m"
+    rng = random.Random(7)
+    times = {rng.randrange(1, 600) * 300 for _ in range(400)}
+    base_times = {rng.randrange(1, 3000) * 60 for _ in range(2500)}
+    with store.connect() as conn:
+        store.upsert_many_closed_in_conn(conn, series_id, [_candle(t, 1.0) for t in sorted(times)][:200])
+        store.upsert_many_closed_in_conn(conn, base_id, [_candle(t, 1.0) for t in sorted(base_times)])
+        conn.commit()
+    assert store.gap_index(series_id) is not None
+    with store.connect() as conn:
+        store.upsert_many_closed_in_conn(conn, series_id, [_candle(t, 1.0) for t in sorted(times)][200:])
+        dropped = sorted(times)[::7]
+        store.delete_closed_times_in_conn(conn, series_id=series_id, candle_times=dropped)
+        store.trim_series_to_latest_n_in_conn(conn, series_id=series_id, keep=300)
+        conn.commit()
+
+    kept = sorted(times - set(dropped))[-300:]
+    plain.seed(series_id=series_id, candle_times=kept)
+    plain.seed(series_id=base_id, candle_times=sorted(base_times))
+    assert CandleGapIndex.build(step_s=300, times=kept).missing_ranges(0, 600 * 300) == store.gap_index(
+        series_id
+    ).missing_ranges(0, 600 * 300)
+
+    kwargs = {"series_id": series_id, "now_time": 200_000, "max_recent_gaps": 4, "recent_base_buckets": 6}
+    assert analyze_series_health(store=store, **kwargs) == analyze_series_health(store=plain, **kwargs)  # type: ignore[arg-type]
+
+
+def test_write_racing_the_first_gap_index_build_is_not_lost(tmp_path, monkeypatch) -> None:
+    store = CandleStore(tmp_path / "market.db")
+    series_id = "binance:futures:BTC/USDT:1m"
+    store.upsert_closed(series_id, _candle(60, 1.0))
+    writer = threading.Thread(target=store.upsert_closed, args=(series_id, _candle(180, 1.0)))
+    real_build = CandleGapIndex.build
+
+    def _build_while_writing(**kwargs):  # noqa: ANN003, ANN202
+        times = list(kwargs.pop("times"))
+        writer.start()
+        writer.join(timeout=0.2)
+        return real_build(times=times, **kwargs)
+
+    monkeypatch.setattr(candle_store_module.CandleGapIndex, "build", _build_while_writing)
+    index = store.gap_index(series_id)
+    writer.join()
+
+    assert index is not None
+    assert (index.count, index.last_time) == (2, 180)
@@ -9,7 +9,8 @@ from unittest.mock import patch
 from fastapi.testclient import TestClient
 
 from backend.app.main import create_app
-from backend.app.market.list import _exchangeinfo_ttl_s, _futures_base_url, _spot_base_url, _ticker_ttl_s
+from backend.app.market.binance_endpoints import resolve_binance_endpoints
+from backend.app.market.list import _exchangeinfo_ttl_s, _ticker_ttl_s
 
 
 class MarketTopMarketsApiTests(unittest.TestCase):
@@ -149,8 +150,10 @@ def test_market_list_env_parsing_helpers(monkeypatch) -> None:
     monkeypatch.setenv("TRADE_CANVAS_BINANCE_EXCHANGEINFO_TTL_S", "bad")
     monkeypatch.setenv("TRADE_CANVAS_BINANCE_TICKER_TTL_S", "0")
 
-    assert _spot_base_url() == "https://spot.test"
-    assert _futures_base_url() == "https://futures.test"
+    endpoints = resolve_binance_endpoints()
+    assert endpoints.spot_rest == "https://spot.test"
+    assert endpoints.futures_rest == "https://futures.test"
+    assert endpoints.futures_ws == "wss://fstream.binance.com"
     assert _exchangeinfo_ttl_s() == 3600
     assert _ticker_ttl_s() == 1
 
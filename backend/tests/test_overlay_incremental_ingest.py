@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import math
+
+from backend.app.core.schemas import CandleClosed
+from backend.app.factor.orchestrator import FactorOrchestrator, FactorSettings
+from backend.app.factor.store import FactorEventWrite, FactorStore
+from backend.app.overlay.ingest_window import SlidingWindowIngestReader
+from backend.app.overlay.orchestrator import OverlayOrchestrator, OverlaySettings
+from backend.app.overlay.store import OverlayStore
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+BASE = 1_700_100_000
+
+
+def _candle(idx: int) -> CandleClosed:
+    close = 100.0 + 12.0 * math.sin(idx / 9.0) + 5.0 * math.sin(idx / 2.7) + 0.03 * idx
+    return CandleClosed(
+        candle_time=BASE + idx * 60,
+        open=close - 0.5,
+        high=close + 1.0 + (idx % 3) * 0.4,
+        low=close - 1.0 - (idx % 4) * 0.3,
+        close=close,
+        volume=10.0,
+    )
+
+
+def _versions(store: OverlayStore) -> list[tuple]:
+    return [
+        (row.version_id, row.instruction_id, row.kind, row.visible_time, row.payload)
+        for row in store.get_patch_after_version(series_id=SERIES_ID, after_version_id=0, up_to_time=10**12)
+    ]
+
+
+def _overlay(candle_store: CandleStore, factor_store: FactorStore, db_path, *, incremental: bool) -> OverlayOrchestrator:  # noqa: ANN001
+    return OverlayOrchestrator(
+        candle_store=candle_store,
+        factor_store=factor_store,
+        overlay_store=OverlayStore(db_path=db_path),
+        settings=OverlaySettings(window_candles=100, incremental_ingest=incremental),
+    )
+
+
+def _record_dirty(orchestrator: OverlayOrchestrator) -> list:
+    reader = orchestrator._ingest_reader
+    assert isinstance(reader, SlidingWindowIngestReader)
+    seen: list = []
+    read = reader.read
+
+    def _spy(**kwargs):  # noqa: ANN003, ANN202
+        out = read(**kwargs)
+        seen.append(out.dirty_buckets)
+        return out
+
+    object.__setattr__(reader, "read", _spy)
+    return seen
+
+
+def test_incremental_overlay_replay_matches_full_window_reads(tmp_path) -> None:
+    candle_store = CandleStore(db_path=tmp_path / "market.db")
+    factor_store = FactorStore(db_path=tmp_path / "market.db")
+    factor = FactorOrchestrator(
+        candle_store=candle_store,
+        factor_store=factor_store,
+        settings=FactorSettings(
+            pivot_window_major=1,
+            pivot_window_minor=1,
+            lookback_candles=200,
+            state_rebuild_event_limit=1000,
+        ),
+    )
+    incremental = _overlay(candle_store, factor_store, tmp_path / "incremental.db", incremental=True)
+    full = _overlay(candle_store, factor_store, tmp_path / "full.db", incremental=False)
+    dirty = _record_dirty(incremental)
+
+    for idx in range(220):
+        with candle_store.connect() as conn:
+            candle_store.upsert_many_closed_in_conn(conn, SERIES_ID, [_candle(idx)])
+            conn.commit()
+        to_time = BASE + idx * 60
+        factor.ingest_closed(series_id=SERIES_ID, up_to_candle_time=to_time)
+        incremental.ingest_closed(series_id=SERIES_ID, up_to_candle_time=to_time)
+        full.ingest_closed(series_id=SERIES_ID, up_to_candle_time=to_time)
+
+    # Versions are append-only, so equal final logs mean every tick wrote the same versions in the same order.
+    assert _versions(incremental._overlay_store) == _versions(full._overlay_store)
+    assert len(_versions(full._overlay_store)) > 50
+    assert dirty[0] is None
+    assert all(item is not None for item in dirty[1:])
+    assert any("pivot_major" not in item for item in dirty[1:])
+
+
+def test_out_of_range_event_write_forces_full_read(tmp_path) -> None:
+    candle_store = CandleStore(db_path=tmp_path / "market.db")
+    factor_store = FactorStore(db_path=tmp_path / "market.db")
+    overlay = _overlay(candle_store, factor_store, tmp_path / "overlay.db", incremental=True)
+    dirty = _record_dirty(overlay)
+    with candle_store.connect() as conn:
+        candle_store.upsert_many_closed_in_conn(conn, SERIES_ID, [_candle(idx) for idx in range(3)])
+        conn.commit()
+
+    def _pivot(candle_time: int) -> FactorEventWrite:
+        return FactorEventWrite(
+            series_id=SERIES_ID,
+            factor_name="pivot",
+            candle_time=candle_time,
+            kind="pivot.major",
+            event_key=f"major:{candle_time}",
+            payload={"pivot_time": candle_time, "visible_time": candle_time, "direction": "support", "window": 1},
+        )
+
+    overlay.ingest_closed(series_id=SERIES_ID, up_to_candle_time=BASE + 60)
+    with factor_store.connect() as conn:
+        factor_store.insert_events_in_conn(conn, events=[_pivot(BASE)])
+        conn.commit()
+    overlay.ingest_closed(series_id=SERIES_ID, up_to_candle_time=BASE + 120)
+
+    assert dirty == [None, None]
+    markers = overlay._overlay_store.get_latest_defs_up_to_time(series_id=SERIES_ID, up_to_time=BASE + 120)
+    assert [row.instruction_id for row in markers] == [f"pivot.major:{BASE}:support:1"]
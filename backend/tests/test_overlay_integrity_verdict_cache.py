@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from backend.app.core.schemas import CandleClosed, GetFactorSlicesResponseV1
+from backend.app.factor.orchestrator import FactorOrchestrator
+from backend.app.factor.store import FactorStore
+from backend.app.overlay.integrity_cache import OverlayIntegrityVerdictCache
+from backend.app.overlay.orchestrator import OverlayOrchestrator
+from backend.app.overlay.store import OverlayStore
+from backend.app.read_models.draw_read_service import DrawReadService
+from backend.app.read_models.factor_read_service import FactorReadService
+from backend.app.runtime.metrics import RuntimeMetrics
+from backend.app.storage.candle_store import CandleStore
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+HEAD = 60 * 500
+
+
+class _CandleStoreStub:
+    def head_time(self, series_id: str) -> int | None:  # noqa: ARG002
+        return HEAD
+
+    def floor_time(self, series_id: str, *, at_time: int) -> int | None:  # noqa: ARG002
+        return min(int(at_time), HEAD) // 60 * 60
+
+
+class _OverlayStoreStub:
+    def __init__(self) -> None:
+        self.version_id = 7
+        self.revision = 9
+
+    def head_time(self, series_id: str) -> int | None:  # noqa: ARG002
+        return HEAD
+
+    def get_latest_defs_up_to_time(self, *, series_id: str, up_to_time: int) -> list:  # noqa: ARG002
+        return []
+
+    def get_patch_after_version(  # noqa: ANN201
+        self, *, series_id: str, after_version_id: int, up_to_time: int, limit: int = 50000  # noqa: ARG002
+    ):
+        return []
+
+    def last_version_id(self, series_id: str) -> int:  # noqa: ARG002
+        return self.version_id
+
+    def series_revision(self, series_id: str) -> int:  # noqa: ARG002
+        return self.revision
+
+
+class _FactorStoreStub:
+    def __init__(self) -> None:
+        self.event_id = 40
+        self.revision = 3
+
+    def head_time(self, series_id: str) -> int | None:  # noqa: ARG002
+        return HEAD
+
+    def last_event_id(self, series_id: str) -> int:  # noqa: ARG002
+        return self.event_id
+
+    def series_revision(self, series_id: str) -> int:  # noqa: ARG002
+        return self.revision
+
+
+class _FactorSlicesServiceStub:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_slices_aligned(  # noqa: ANN201
+        self, *, series_id: str, aligned_time: int, at_time: int, window_candles: int  # noqa: ARG002
+    ):
+        self.calls += 1
+        candle_id = f"{series_id}:{aligned_time}"
+        return GetFactorSlicesResponseV1(series_id=series_id, at_time=int(aligned_time), candle_id=candle_id)
+
+
+class _DebugHubStub:
+    def emit(self, **kwargs) -> None:  # noqa: ANN003
+        return None
+
+
+class _WithoutFactorStore:
+    factor_store = None
+
+    def __init__(self, inner: FactorReadService) -> None:
+        self._inner = inner
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        return getattr(self._inner, name)
+
+
+class OverlayIntegrityVerdictCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        store = _CandleStoreStub()
+        self.overlay_store = _OverlayStoreStub()
+        self.factor_store = _FactorStoreStub()
+        self.slices = _FactorSlicesServiceStub()
+        self.metrics = RuntimeMetrics(enabled=True)
+        self.cache = OverlayIntegrityVerdictCache(runtime_metrics=self.metrics)
+        self.service = DrawReadService(
+            store=store,
+            overlay_store=self.overlay_store,
+            overlay_orchestrator=None,
+            factor_read_service=FactorReadService(
+                store=store,
+                factor_store=self.factor_store,
+                factor_slices_service=self.slices,
+                strict_mode=True,
+            ),
+            debug_hub=_DebugHubStub(),
+            integrity_verdicts=self.cache,
+        )
+
+    def _read(self, *, cursor_version_id: int = 0) -> None:
+        self.service.read_delta(series_id=SERIES_ID, cursor_version_id=cursor_version_id, window_candles=200)
+
+    def test_unchanged_watermarks_reuse_verdict_without_reading_slices(self) -> None:
+        self._read()
+        self._read()
+        self._read(cursor_version_id=7)
+
+        self.assertEqual(self.slices.calls, 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["overlay_integrity_verdict_cache_total{result=hit}"], 1.0)
+        self.assertEqual(snapshot["counters"]["overlay_integrity_verdict_cache_total{result=miss}"], 1.0)
+        self.assertEqual(snapshot["gauges"]["overlay_integrity_verdict_cache_hit_ratio"], 0.5)
+
+    def test_store_writes_and_invalidation_force_reevaluation(self) -> None:
+        self._read()
+        self.overlay_store.version_id += 1
+        self._read()
+        self.overlay_store.revision += 1
+        self._read()
+        self.factor_store.event_id += 1
+        self._read()
+        self.factor_store.revision += 1
+        self._read()
+        self.assertEqual(self.slices.calls, 5)
+
+        self.cache.invalidate(SERIES_ID)
+        self._read()
+        self.assertEqual(self.slices.calls, 6)
+        self.assertEqual(self.cache.stats()["invalidations"], 1)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_write_racing_the_defs_read_caches_under_the_older_key(self) -> None:
+        read_defs = self.overlay_store.get_latest_defs_up_to_time
+
+        def _defs_then_commit(**kwargs):  # noqa: ANN003, ANN202
+            rows = read_defs(**kwargs)
+            self.overlay_store.version_id += 1
+            self.cache.invalidate(SERIES_ID)
+            return rows
+
+        self.overlay_store.get_latest_defs_up_to_time = _defs_then_commit
+        self._read()
+        self.overlay_store.get_latest_defs_up_to_time = read_defs
+        self._read()
+        self.assertEqual(self.slices.calls, 2)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_capacity_evicts_least_recently_used(self) -> None:
+        cache = OverlayIntegrityVerdictCache(capacity=1)
+        self.service = replace(self.service, integrity_verdicts=cache)
+        self._read()
+        self.overlay_store.version_id += 1
+        self._read()
+        self.overlay_store.version_id -= 1
+        self._read()
+        self.assertEqual((self.slices.calls, cache.stats()["size"]), (3, 1))
+
+    def test_without_a_factor_store_the_cache_is_skipped(self) -> None:
+        self.service = replace(
+            self.service, factor_read_service=_WithoutFactorStore(self.service.factor_read_service)
+        )
+        self._read()
+        self._read()
+        self.assertEqual(self.slices.calls, 2)
+        self.assertEqual(self.cache.stats()["hits"] + self.cache.stats()["misses"], 0)
+
+
+class IntegrityInvalidationHookTests(unittest.TestCase):
+    def test_factor_and_overlay_commits_invalidate_series(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            db_path = Path(td) / "integrity_hooks.db"
+            candle_store = CandleStore(db_path=db_path)
+            factor_store = FactorStore(db_path=db_path)
+            factor = FactorOrchestrator(candle_store=candle_store, factor_store=factor_store)
+            overlay = OverlayOrchestrator(
+                candle_store=candle_store,
+                factor_store=factor_store,
+                overlay_store=OverlayStore(db_path=db_path),
+            )
+            invalidated: list[tuple[str, str]] = []
+            factor.set_integrity_invalidator(lambda sid: invalidated.append(("factor", sid)))
+            overlay.set_integrity_invalidator(lambda sid: invalidated.append(("overlay", sid)))
+
+            candles = [
+                CandleClosed(candle_time=60 * i, open=10.0, high=11.0, low=9.0, close=10.0, volume=1.0)
+                for i in range(1, 6)
+            ]
+            with candle_store.connect() as conn:
+                candle_store.upsert_many_closed_in_conn(conn, SERIES_ID, candles)
+                conn.commit()
+            factor.ingest_closed(series_id=SERIES_ID, up_to_candle_time=300)
+            overlay.ingest_closed(series_id=SERIES_ID, up_to_candle_time=300)
+            overlay.reset_series(series_id=SERIES_ID)
+
+        self.assertEqual(invalidated, [("factor", SERIES_ID), ("overlay", SERIES_ID), ("overlay", SERIES_ID)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -102,6 +102,7 @@ def test_factor_orchestrator_persist_outputs_supports_connection_without_total_c
     orchestrator = FactorOrchestrator.__new__(FactorOrchestrator)
     cast(Any, orchestrator)._factor_store = factor_store
     cast(Any, orchestrator)._graph = SimpleNamespace(topo_order=("pivot", "pen"))
+    cast(Any, orchestrator)._invalidate_integrity = None
     events = [
         FactorEventWrite(
             series_id="binance:futures:BTC/USDT:1m",
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable
+
+from backend.app.overlay.integrity_cache import OverlayIntegrityKey, OverlayIntegrityVerdictCache
+from backend.app.read_models.draw_read_service import DrawReadService
+from backend.app.read_models.factor_read_service import FactorReadService
+from backend.app.read_models.read_context import frame_read_context
+from backend.app.storage.candle_gap_index import CandleGapIndex
+from backend.app.storage.postgres_factor_repo import PostgresFactorRepository
+from backend.app.storage.postgres_overlay_repo import PostgresOverlayRepository
+from backend.app.storage.postgres_repos import PostgresCandleRepository
+from backend.app.storage.postgres_schema import build_postgres_bootstrap_sql
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+class _Cursor:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+        self.rowcount = len(rows)
+
+    def fetchone(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> list[Any]:
+        return list(self._rows)
+
+
+class _FakePool:
+    """Records every statement; `respond(sql, params)` returns the rows Postgres would."""
+
+    def __init__(self, respond: Callable[[str, tuple], list[Any]]) -> None:
+        self._respond = respond
+        self.statements: list[tuple[str, tuple]] = []
+
+    @contextmanager
+    def connect(self):  # noqa: ANN201
+        pool = self
+
+        class _Conn:
+            def execute(self, sql: str, params: Any = ()) -> _Cursor:
+                normalized = " ".join(str(sql).split())
+                pool.statements.append((normalized, tuple(params)))
+                return _Cursor(pool._respond(normalized, tuple(params)))
+
+        yield _Conn()
+
+
+def test_pg_gap_index_is_built_from_server_side_runs() -> None:
+    pool = _FakePool(lambda sql, params: [{"run_start": 60, "run_end": 180}, {"run_start": 300, "run_end": 300}])
+    repo = PostgresCandleRepository(pool=pool, schema="trade_canvas")  # type: ignore[arg-type]
+
+    index = repo.gap_index(SERIES_ID)
+
+    assert index is not None
+    want = CandleGapIndex.build(step_s=60, times=[60, 120, 180, 300])
+    assert (index.count, index.gap_count, list(index.gaps())) == (want.count, want.gap_count, list(want.gaps()))
+    assert index.count_between(0, 240) == 3
+    sql, params = pool.statements[-1]
+    assert "ROW_NUMBER() OVER (ORDER BY candle_time) * %s AS run_key" in sql
+    assert "GROUP BY run_key" in sql
+    assert params == (60, SERIES_ID)
+
+
+def test_pg_gap_index_is_none_off_grid_or_for_unknown_timeframe() -> None:
+    off_grid = _FakePool(lambda sql, params: [{"run_start": 60, "run_end": 120}, {"run_start": 150, "run_end": 150}])
+    repo = PostgresCandleRepository(pool=off_grid, schema="trade_canvas")  # type: ignore[arg-type]
+    assert repo.gap_index(SERIES_ID) is None
+
+    unused = _FakePool(lambda sql, params: [])
+    repo = PostgresCandleRepository(pool=unused, schema="trade_canvas")  # type: ignore[arg-type]
+    assert repo.gap_index("binance:futures:BTC/USDT:7x") is None
+    assert unused.statements == []
+
+
+def test_pg_factor_series_revision_reads_the_trigger_counter() -> None:
+    revisions = {SERIES_ID: 7}
+    pool = _FakePool(
+        lambda sql, params: [{"v": revisions[params[0]]}] if params and params[0] in revisions else []
+    )
+    repo = PostgresFactorRepository(pool=pool, schema="trade_canvas")  # type: ignore[arg-type]
+
+    assert repo.series_revision(SERIES_ID) == 7
+    assert repo.series_revision("binance:spot:ETH/USDT:1m") == 0
+    assert pool.statements[0][0] == "SELECT revision AS v FROM trade_canvas.factor_series_revision WHERE series_id = %s"
+
+
+def test_bootstrap_sql_keeps_factor_revision_with_a_row_trigger() -> None:
+    statements = build_postgres_bootstrap_sql(schema="tc", enable_timescale=False)
+    joined = "\n".join(" ".join(stmt.split()) for stmt in statements)
+
+    assert "CREATE TABLE IF NOT EXISTS tc.factor_series_revision" in joined
+    assert "CREATE OR REPLACE FUNCTION tc.bump_factor_series_revision()" in joined
+    assert (
+        "CREATE TRIGGER trg_factor_series_revision AFTER INSERT OR UPDATE OR DELETE ON tc.factor_events "
+        "FOR EACH ROW EXECUTE FUNCTION tc.bump_factor_series_revision();"
+    ) in joined
+    assert joined.index("DROP TRIGGER IF EXISTS trg_factor_series_revision") < joined.index("CREATE TRIGGER")
+
+
+def _event_row(event_id: int, candle_time: int) -> dict:
+    return {
+        "id": event_id,
+        "series_id": SERIES_ID,
+        "factor_name": "pen",
+        "candle_time": candle_time,
+        "kind": "pen.confirmed",
+        "event_key": f"k{event_id}",
+        "payload_json": {"direction": 1},
+    }
+
+
+def test_pg_get_events_after_id_reads_by_id_cursor() -> None:
+    pool = _FakePool(lambda sql, params: [_event_row(12, 120), _event_row(15, 60)])
+    repo = PostgresFactorRepository(pool=pool, schema="trade_canvas")  # type: ignore[arg-type]
+
+    rows = repo.get_events_after_id(series_id=SERIES_ID, after_event_id=11, limit=0)
+    repo.get_events_after_id(series_id=SERIES_ID, after_event_id=11, limit=500)
+
+    assert [(row.id, row.candle_time) for row in rows] == [(12, 120), (15, 60)]
+    assert rows[0].payload == {"direction": 1}
+    (unbounded, unbounded_params), (bounded, bounded_params) = pool.statements
+    assert "WHERE series_id = %s AND id > %s ORDER BY id ASC" in unbounded
+    assert "LIMIT" not in unbounded and unbounded_params == (SERIES_ID, 11)
+    assert bounded.endswith("LIMIT %s") and bounded_params == (SERIES_ID, 11, 500)
+
+
+def test_bootstrap_sql_indexes_factor_events_for_the_id_cursor() -> None:
+    sql = build_postgres_bootstrap_sql(schema="tc", enable_timescale=False)
+    assert "CREATE INDEX IF NOT EXISTS idx_tc_factor_events_series_id ON tc.factor_events(series_id, id);" in sql
+
+
+def test_bootstrap_sql_keeps_overlay_revision_with_a_row_trigger() -> None:
+    statements = build_postgres_bootstrap_sql(schema="tc", enable_timescale=False)
+    joined = "\n".join(" ".join(stmt.split()) for stmt in statements)
+
+    assert "CREATE TABLE IF NOT EXISTS tc.overlay_series_revision" in joined
+    assert (
+        "CREATE TRIGGER trg_overlay_series_revision AFTER INSERT OR UPDATE OR DELETE "
+        "ON tc.overlay_instruction_versions FOR EACH ROW EXECUTE FUNCTION tc.bump_overlay_series_revision();"
+    ) in joined
+
+
+def test_integrity_key_is_built_from_pg_watermarks() -> None:
+    watermarks = {
+        "MAX(version_id)": 41,
+        "overlay_series_revision": 5,
+        "MAX(id)": 900,
+        "factor_series_revision": 77,
+        "factor_series_state": 6000,
+    }
+
+    def _respond(sql: str, params: tuple) -> list[Any]:  # noqa: ARG001
+        value = next(v for k, v in watermarks.items() if k in sql)
+        return [{"v": value, "head_time": value}]
+
+    pool = _FakePool(_respond)
+    factor_store = PostgresFactorRepository(pool=pool, schema="trade_canvas")  # type: ignore[arg-type]
+    service = DrawReadService(
+        store=PostgresCandleRepository(pool=pool, schema="trade_canvas"),  # type: ignore[arg-type]
+        overlay_store=PostgresOverlayRepository(pool=pool, schema="trade_canvas"),  # type: ignore[arg-type]
+        overlay_orchestrator=None,  # type: ignore[arg-type]
+        factor_read_service=FactorReadService(
+            store=None,  # type: ignore[arg-type]
+            factor_store=factor_store,
+            factor_slices_service=None,  # type: ignore[arg-type]
+        ),
+        debug_hub=None,  # type: ignore[arg-type]
+        integrity_verdicts=OverlayIntegrityVerdictCache(),
+    )
+
+    key = service._integrity_key(series_id=SERIES_ID, to_time=6000, window_candles=200, ctx=frame_read_context(None))
+
+    assert key == OverlayIntegrityKey(
+        series_id=SERIES_ID,
+        to_time=6000,
+        window_candles=200,
+        overlay_version_id=41,
+        overlay_revision=5,
+        factor_event_id=900,
+        factor_revision=77,
+        factor_head_time=6000,
+    )
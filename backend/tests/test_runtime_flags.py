@@ -74,6 +74,67 @@ def test_runtime_flags_runtime_metrics_defaults_off_and_can_override(monkeypatch
     assert override_off.enable_runtime_metrics is False
 
 
+def test_runtime_flags_ingest_trace_sample_rate_is_clamped(monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_CANVAS_INGEST_TRACE_SAMPLE_RATE", raising=False)
+    monkeypatch.delenv("TRADE_CANVAS_INGEST_TRACE_CAPACITY", raising=False)
+    defaults = load_runtime_flags()
+    assert defaults.ingest_trace_sample_rate == 0.0
+    assert defaults.ingest_trace_capacity == 256
+
+    monkeypatch.setenv("TRADE_CANVAS_INGEST_TRACE_SAMPLE_RATE", "5")
+    monkeypatch.setenv("TRADE_CANVAS_INGEST_TRACE_CAPACITY", "0")
+    clamped = load_runtime_flags()
+    assert clamped.ingest_trace_sample_rate == 1.0
+    assert clamped.ingest_trace_capacity == 1
+
+
+def test_runtime_flags_binance_ws_mux_defaults_off_and_streams_are_clamped(monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_CANVAS_ENABLE_BINANCE_WS_MUX", raising=False)
+    monkeypatch.delenv("TRADE_CANVAS_BINANCE_WS_STREAMS_PER_SOCKET", raising=False)
+    defaults = load_runtime_flags()
+    assert defaults.enable_binance_ws_mux is False
+    assert defaults.binance_ws_streams_per_socket == 200
+
+    monkeypatch.setenv("TRADE_CANVAS_ENABLE_BINANCE_WS_MUX", "1")
+    monkeypatch.setenv("TRADE_CANVAS_BINANCE_WS_STREAMS_PER_SOCKET", "5000")
+    clamped = load_runtime_flags()
+    assert clamped.enable_binance_ws_mux is True
+    assert clamped.binance_ws_streams_per_socket == 1024
+
+
+def test_runtime_flags_binance_ws_adaptive_flush_defaults_off(monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_CANVAS_ENABLE_BINANCE_WS_ADAPTIVE_FLUSH", raising=False)
+    assert load_runtime_flags().enable_binance_ws_adaptive_flush is False
+
+    monkeypatch.setenv("TRADE_CANVAS_ENABLE_BINANCE_WS_ADAPTIVE_FLUSH", "1")
+    assert load_runtime_flags().enable_binance_ws_adaptive_flush is True
+
+
+def test_runtime_flags_startup_kline_sync_concurrency_and_rate(monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_CANVAS_STARTUP_KLINE_SYNC_CONCURRENCY", raising=False)
+    monkeypatch.delenv("TRADE_CANVAS_STARTUP_KLINE_SYNC_RATE_PER_S", raising=False)
+    defaults = load_runtime_flags()
+    assert defaults.startup_kline_sync_concurrency == 4
+    assert defaults.startup_kline_sync_rate_per_s == 5.0
+
+    monkeypatch.setenv("TRADE_CANVAS_STARTUP_KLINE_SYNC_CONCURRENCY", "500")
+    monkeypatch.setenv("TRADE_CANVAS_STARTUP_KLINE_SYNC_RATE_PER_S", "0")
+    clamped = load_runtime_flags()
+    assert clamped.startup_kline_sync_concurrency == 32
+    assert clamped.startup_kline_sync_rate_per_s == 0.0
+
+
+def test_runtime_flags_ccxt_backfill_concurrency_and_rate(monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_CANVAS_CCXT_BACKFILL_CONCURRENCY", raising=False)
+    monkeypatch.delenv("TRADE_CANVAS_CCXT_BACKFILL_RATE_PER_S", raising=False)
+    defaults = load_runtime_flags()
+    assert defaults.ccxt_backfill_concurrency == 4
+    assert defaults.ccxt_backfill_rate_per_s == 10.0
+
+    monkeypatch.setenv("TRADE_CANVAS_CCXT_BACKFILL_CONCURRENCY", "99")
+    assert load_runtime_flags().ccxt_backfill_concurrency == 16
+
+
 def test_runtime_flags_pg_and_ws_scaleout_flags_default_off_and_can_override(monkeypatch) -> None:
     for name in (
         "TRADE_CANVAS_ENABLE_CAPACITY_METRICS",
@@ -132,6 +193,14 @@ def test_runtime_flags_backfill_progress_persistence_defaults_off_and_can_overri
     assert override_off.enable_market_backfill_progress_persistence is False
 
 
+def test_runtime_flags_backfill_progress_flush_interval(monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_CANVAS_MARKET_BACKFILL_PROGRESS_FLUSH_MS", raising=False)
+    assert load_runtime_flags().market_backfill_progress_flush_ms == 1000
+
+    monkeypatch.setenv("TRADE_CANVAS_MARKET_BACKFILL_PROGRESS_FLUSH_MS", "0")
+    assert load_runtime_flags().market_backfill_progress_flush_ms == 0
+
+
 def test_runtime_flags_ingest_loop_guardrail_defaults_off_and_can_override(monkeypatch) -> None:
     monkeypatch.delenv("TRADE_CANVAS_ENABLE_INGEST_LOOP_GUARDRAIL", raising=False)
     defaults = load_runtime_flags()
@@ -193,6 +262,7 @@ def test_runtime_flags_replay_and_overlay_controls(monkeypatch) -> None:
     monkeypatch.setenv("TRADE_CANVAS_ENABLE_FEATURE_INGEST", "0")
     monkeypatch.setenv("TRADE_CANVAS_ENABLE_FEATURE_STRICT_READ", "0")
     monkeypatch.setenv("TRADE_CANVAS_OVERLAY_WINDOW_CANDLES", "9")
+    monkeypatch.setenv("TRADE_CANVAS_ENABLE_OVERLAY_INCREMENTAL_INGEST", "0")
     monkeypatch.setenv("TRADE_CANVAS_ENABLE_INGEST_COMPENSATE_OVERLAY_ERROR", "1")
     monkeypatch.setenv("TRADE_CANVAS_ENABLE_INGEST_COMPENSATE_NEW_CANDLES", "1")
     monkeypatch.setenv("TRADE_CANVAS_ENABLE_RUNTIME_METRICS", "1")
@@ -237,6 +307,7 @@ def test_runtime_flags_replay_and_overlay_controls(monkeypatch) -> None:
     assert flags.enable_feature_ingest is False
     assert flags.enable_feature_strict_read is False
     assert flags.overlay_window_candles == 100
+    assert flags.enable_overlay_incremental_ingest is False
     assert flags.enable_ingest_compensate_overlay_error is True
     assert flags.enable_ingest_compensate_new_candles is True
     assert flags.enable_runtime_metrics is True
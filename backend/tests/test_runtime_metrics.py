@@ -3,6 +3,7 @@ from __future__ import annotations
 import unittest
 
 from backend.app.runtime.metrics import RuntimeMetrics
+from backend.app.runtime.metrics_prometheus import render_prometheus_text
 
 
 class RuntimeMetricsTests(unittest.TestCase):
@@ -38,6 +39,50 @@ class RuntimeMetricsTests(unittest.TestCase):
             5.0,
         )
 
+    def test_timer_percentiles_follow_histogram_buckets(self) -> None:
+        metrics = RuntimeMetrics(enabled=True, latency_buckets_ms=(1.0, 10.0, 100.0))
+        handle = metrics.timer("step_ms", labels={"step": "factor"})
+        for _ in range(90):
+            handle.observe_ms(0.5)
+        for _ in range(10):
+            handle.observe_ms(50.0)
+
+        timer = metrics.snapshot()["timers"]["step_ms{step=factor}"]
+        self.assertEqual(timer["count"], 100.0)
+        self.assertLessEqual(timer["p50_ms"], 1.0)
+        self.assertGreater(timer["p95_ms"], 10.0)
+        self.assertLessEqual(timer["p99_ms"], 50.0)
+        self.assertIs(metrics.timer("step_ms", labels={"step": "factor"}), handle)
+
+    def test_label_cardinality_is_capped_per_metric(self) -> None:
+        metrics = RuntimeMetrics(enabled=True, max_series_per_metric=2)
+        for idx in range(5):
+            metrics.incr("ws_sent_total", labels={"series_id": f"s{idx}"})
+            metrics.observe_ms("ws_send_ms", duration_ms=1.0, labels={"series_id": f"s{idx}"})
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["ws_sent_total{overflow=true}"], 3.0)
+        self.assertEqual(len([k for k in snapshot["counters"] if k.startswith("ws_sent_total")]), 3)
+        self.assertEqual(snapshot["timers"]["ws_send_ms{overflow=true}"]["count"], 3.0)
+        self.assertEqual(snapshot["cardinality"]["overflow"], {"ws_send_ms": 3, "ws_sent_total": 3})
+
+    def test_prometheus_text_renders_counters_gauges_and_histograms(self) -> None:
+        metrics = RuntimeMetrics(enabled=True, latency_buckets_ms=(1.0, 10.0))
+        metrics.incr("ingest_total", labels={"result": "ok"})
+        metrics.set_gauge("head_lag_seconds", value=2.5, labels={"series_id": 'a"b'})
+        metrics.observe_ms("ingest_duration_ms", duration_ms=5.0)
+
+        text = render_prometheus_text(metrics.export())
+        self.assertIn("# TYPE ingest_total counter\n", text)
+        self.assertIn('ingest_total{result="ok"} 1\n', text)
+        self.assertIn('head_lag_seconds{series_id="a\\"b"} 2.5\n', text)
+        self.assertIn("# TYPE ingest_duration_ms histogram\n", text)
+        self.assertIn('ingest_duration_ms_bucket{le="1"} 0\n', text)
+        self.assertIn('ingest_duration_ms_bucket{le="10"} 1\n', text)
+        self.assertIn('ingest_duration_ms_bucket{le="+Inf"} 1\n', text)
+        self.assertIn("ingest_duration_ms_sum 5\n", text)
+        self.assertIn("ingest_duration_ms_count 1\n", text)
+
 
 if __name__ == "__main__":
     unittest.main()
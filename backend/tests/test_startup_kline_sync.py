@@ -6,7 +6,17 @@ from types import SimpleNamespace
 from typing import Mapping
 
 from backend.app.ledger.sync_service import LedgerSyncService
-from backend.app.lifecycle.startup_kline_sync import run_startup_kline_sync, run_startup_kline_sync_for_runtime
+from backend.app.lifecycle.startup_kline_sync import (
+    StartupKlineSyncRunner,
+    run_startup_kline_sync,
+    run_startup_kline_sync_for_runtime,
+)
+from backend.app.lifecycle.startup_sync_scheduler import (
+    AsyncTokenBucket,
+    StartupKlineSyncProgress,
+    StartupKlineSyncSchedule,
+    estimate_fetch_pages,
+)
 
 
 class _FakeStore:
@@ -252,3 +262,81 @@ def test_startup_kline_sync_runtime_uses_runtime_ledger_sync_instance(monkeypatc
     assert len(ledger_sync.calls) == 1
     assert ledger_sync.calls[0][0] == series_id
     assert result.series_results[0].refreshed is False
+
+
+def test_startup_kline_sync_runs_priority_first_with_bounded_concurrency(monkeypatch) -> None:
+    in_flight = {"now": 0, "max": 0}
+    started: list[str] = []
+
+    async def _tracking_run_blocking(fn, /, *args, **kwargs):  # noqa: ANN001
+        started.append(str(kwargs["series_id"]))
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr("backend.app.lifecycle.startup_kline_sync.run_blocking", _tracking_run_blocking)
+    whitelist = (
+        "binance:futures:ETH/USDT:1h",
+        "binance:futures:ETH/USDT:1m",
+        "binance:futures:BTC/USDT:5m",
+        "binance:futures:BTC/USDT:1m",
+        "binance:futures:SOL/USDT:1m",
+    )
+    store = _FakeStore(heads={sid: 0 for sid in whitelist})
+    backfill = _FakeBackfill(store=store)
+    progress = StartupKlineSyncProgress()
+    runner = StartupKlineSyncRunner(
+        store=store,
+        backfill=backfill,
+        ledger_sync=_LedgerSyncSpy(),
+        schedule=StartupKlineSyncSchedule(concurrency=2, rate_per_s=0.0, base_timeframe="1m"),
+        progress=progress,
+    )
+
+    result = asyncio.run(runner.run(series_ids=whitelist, enabled=True, target_candles=500, now_time=7200))
+
+    assert started[:3] == [
+        "binance:futures:ETH/USDT:1m",
+        "binance:futures:BTC/USDT:1m",
+        "binance:futures:SOL/USDT:1m",
+    ]
+    assert started[3:] == ["binance:futures:BTC/USDT:5m", "binance:futures:ETH/USDT:1h"]
+    assert in_flight["max"] == 2
+    assert [item.series_id for item in result.series_results] == started
+    assert result.series_synced == 5
+    snapshot = progress.snapshot()
+    assert snapshot["state"] == "done" and snapshot["ready"] is True
+    assert snapshot["priority_total"] == 3 and snapshot["done"] == 5
+
+
+def test_startup_progress_turns_ready_when_priority_series_finish() -> None:
+    progress = StartupKlineSyncProgress()
+    assert progress.ready is True
+
+    progress.start()
+    assert progress.ready is False
+    progress.plan(series_ids=("a:1m", "b:1m", "a:1h"), priority=frozenset({"a:1m", "b:1m"}))
+    progress.mark_running("a:1m")
+    progress.mark_done("a:1m", error=None)
+    assert progress.ready is False
+    progress.mark_done("b:1m", error="boom")
+    assert progress.ready is True
+    assert progress.snapshot()["pending"] == 1 and progress.snapshot()["error"] == 1
+
+
+def test_token_bucket_paces_exchange_pages_and_fetch_estimate() -> None:
+    assert estimate_fetch_pages(head_time=3540, target_time=3540, timeframe_s=60, target_candles=2000) == 0
+    assert estimate_fetch_pages(head_time=None, target_time=3540, timeframe_s=60, target_candles=2000) == 2
+    assert estimate_fetch_pages(head_time=3000, target_time=3540, timeframe_s=60, target_candles=2000) == 1
+
+    async def _run() -> list[float]:
+        bucket = AsyncTokenBucket(rate_per_s=100.0, burst=2.0)
+        return [await bucket.acquire(cost) for cost in (2.0, 1.0, 3.0)]
+
+    waits = asyncio.run(_run())
+    assert waits[0] == 0.0
+    assert waits[1] > 0.0
+    assert waits[2] >= 0.015
+    assert asyncio.run(AsyncTokenBucket(rate_per_s=0.0).acquire(10.0)) == 0.0
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import unittest
+from collections import Counter
+
+from backend.app.core.schemas import GetFactorSlicesResponseV1
+from backend.app.read_models.draw_read_service import DrawReadService
+from backend.app.read_models.factor_read_service import FactorReadService
+from backend.app.read_models.world_read_service import WorldReadService
+
+SERIES_ID = "binance:futures:BTC/USDT:1m"
+HEAD = 60 * 500
+
+
+class _Queries(Counter):
+    def hit(self, name: str) -> None:
+        self[name] += 1
+
+
+class _CandleStoreStub:
+    def __init__(self, queries: _Queries) -> None:
+        self._queries = queries
+
+    def head_time(self, series_id: str) -> int | None:  # noqa: ARG002
+        self._queries.hit("candle.head_time")
+        return HEAD
+
+    def floor_time(self, series_id: str, *, at_time: int) -> int | None:  # noqa: ARG002
+        self._queries.hit("candle.floor_time")
+        return min(int(at_time), HEAD) // 60 * 60
+
+
+class _OverlayStoreStub:
+    def __init__(self, queries: _Queries) -> None:
+        self._queries = queries
+
+    def head_time(self, series_id: str) -> int | None:  # noqa: ARG002
+        self._queries.hit("overlay.head_time")
+        return HEAD
+
+    def get_latest_defs_up_to_time(self, *, series_id: str, up_to_time: int) -> list:  # noqa: ARG002
+        self._queries.hit("overlay.latest_defs")
+        return []
+
+    def get_patch_after_version(  # noqa: ANN201
+        self, *, series_id: str, after_version_id: int, up_to_time: int, limit: int = 50000  # noqa: ARG002
+    ):
+        self._queries.hit("overlay.patch")
+        return []
+
+    def last_version_id(self, series_id: str) -> int:  # noqa: ARG002
+        self._queries.hit("overlay.last_version_id")
+        return 7
+
+
+class _FactorStoreStub:
+    def __init__(self, queries: _Queries) -> None:
+        self._queries = queries
+
+    def head_time(self, series_id: str) -> int | None:  # noqa: ARG002
+        self._queries.hit("factor.head_time")
+        return HEAD
+
+
+class _FactorSlicesServiceStub:
+    """Stands in for the event/head/candle-window reads behind one slices build."""
+
+    def __init__(self, queries: _Queries) -> None:
+        self._queries = queries
+
+    def get_slices_aligned(  # noqa: ANN201
+        self, *, series_id: str, aligned_time: int, at_time: int, window_candles: int  # noqa: ARG002
+    ):
+        self._queries.hit("factor.slices")
+        candle_id = f"{series_id}:{aligned_time}"
+        return GetFactorSlicesResponseV1(series_id=series_id, at_time=int(aligned_time), candle_id=candle_id)
+
+
+class _DebugHubStub:
+    def emit(self, **kwargs) -> None:  # noqa: ANN003
+        return None
+
+
+def _world(queries: _Queries) -> WorldReadService:
+    store = _CandleStoreStub(queries)
+    overlay_store = _OverlayStoreStub(queries)
+    factor_read_service = FactorReadService(
+        store=store,
+        factor_store=_FactorStoreStub(queries),
+        factor_slices_service=_FactorSlicesServiceStub(queries),
+        strict_mode=True,
+    )
+    draw_read_service = DrawReadService(
+        store=store,
+        overlay_store=overlay_store,
+        overlay_orchestrator=None,
+        factor_read_service=factor_read_service,
+        debug_hub=_DebugHubStub(),
+    )
+    return WorldReadService(
+        store=store,
+        overlay_store=overlay_store,
+        factor_read_service=factor_read_service,
+        draw_read_service=draw_read_service,
+        debug_hub=_DebugHubStub(),
+    )
+
+
+class WorldFrameReadContextTests(unittest.TestCase):
+    def test_live_frame_runs_each_store_query_once(self) -> None:
+        queries = _Queries()
+        frame = _world(queries).read_frame_live(series_id=SERIES_ID, window_candles=200)
+
+        self.assertEqual(frame.time.candle_id, f"{SERIES_ID}:{HEAD}")
+        self.assertEqual(frame.draw_state.next_cursor.version_id, 7)
+        self.assertEqual(
+            dict(queries),
+            {
+                "candle.head_time": 1,
+                "candle.floor_time": 1,
+                "overlay.head_time": 1,
+                "factor.head_time": 1,
+                "factor.slices": 1,
+                "overlay.latest_defs": 1,
+                "overlay.patch": 1,
+                "overlay.last_version_id": 1,
+            },
+        )
+
+    def test_frame_at_time_and_next_frame_do_not_share_reads(self) -> None:
+        queries = _Queries()
+        world = _world(queries)
+        world.read_frame_at_time(series_id=SERIES_ID, at_time=HEAD - 90, window_candles=200)
+        self.assertEqual((queries["candle.floor_time"], queries["factor.slices"]), (1, 1))
+
+        world.read_frame_at_time(series_id=SERIES_ID, at_time=HEAD - 90, window_candles=200)
+        self.assertEqual((queries["candle.floor_time"], queries["factor.slices"]), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
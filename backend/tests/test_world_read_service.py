@@ -35,7 +35,7 @@ class _FactorReadServiceStub:
         self._result = result
         self.calls: list[dict] = []
 
-    def read_slices(self, *, series_id: str, at_time: int, window_candles: int, aligned_time=None, ensure_fresh=True):  # noqa: ANN001, ARG002
+    def read_slices(self, *, series_id: str, at_time: int, window_candles: int, aligned_time=None, ensure_fresh=True, read_ctx=None):  # noqa: ANN001, ARG002
         self.calls.append({"series_id": series_id, "at_time": int(at_time), "window_candles": int(window_candles)})
         return self._result
 
@@ -45,7 +45,7 @@ class _DrawReadServiceStub:
         self._result = result
         self.calls: list[dict] = []
 
-    def read_delta(self, *, series_id: str, cursor_version_id: int, window_candles: int, at_time: int | None = None) -> DrawDeltaV1:
+    def read_delta(self, *, series_id: str, cursor_version_id: int, window_candles: int, at_time: int | None = None, read_ctx=None) -> DrawDeltaV1:  # noqa: ANN001, ARG002
         self.calls.append(
             {
                 "series_id": series_id,
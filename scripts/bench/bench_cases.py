@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from bench_cases_ingest import candle_records, decode_fast, decode_legacy
+from bench_cases_kernel import sma_cross_apply, sma_cross_batch
+from bench_data import (
+    DEFAULT_SERIES_ID,
+    BenchDbPaths,
+    BenchScale,
+    BenchWorld,
+    build_stores,
+    build_world,
+    bulk_upsert,
+    generate_klines,
+)
+
+
+@dataclass(frozen=True)
+class BenchSample:
+    ops: int
+    seconds: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    unit: str
+    description: str
+    run: Callable[[BenchContext], BenchSample]
+
+
+class BenchContext:
+    """Per-run state shared by cases: scale, isolated db paths and a lazily built read fixture."""
+
+    def __init__(self, *, scale: BenchScale, tmp_dir: Path, seed: int) -> None:
+        self.scale = scale
+        self.seed = int(seed)
+        self.tmp_dir = Path(tmp_dir)
+        self.paths = BenchDbPaths(self.tmp_dir)
+        self._world: BenchWorld | None = None
+
+    def history(self, extra: int = 0) -> list[Any]:
+        return generate_klines(count=int(self.scale.history_candles) + int(extra), seed=self.seed)
+
+    def world(self) -> BenchWorld:
+        if self._world is None:
+            self._world = build_world(
+                self.paths.fresh("world"),
+                candles=self.history(),
+                window_candles=int(self.scale.window_candles),
+            )
+        return self._world
+
+
+def _timed(fn: Callable[[], Any], *, iterations: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(max(0, int(iterations))):
+        fn()
+    return time.perf_counter() - t0
+
+
+def _candle_upsert(ctx: BenchContext) -> BenchSample:
+    scale = ctx.scale
+    candles = generate_klines(count=int(scale.upsert_candles), seed=ctx.seed)
+    parts = build_stores(ctx.paths.fresh("upsert"))
+    store = parts["store"]
+    batch = max(1, int(scale.upsert_batch))
+    t0 = time.perf_counter()
+    for start in range(0, len(candles), batch):
+        chunk = candles[start : start + batch]
+        with store.connect() as conn:
+            store.existing_closed_times_in_conn(
+                conn,
+                series_id=DEFAULT_SERIES_ID,
+                candle_times=[int(c.candle_time) for c in chunk],
+            )
+            store.upsert_many_closed_in_conn(conn, DEFAULT_SERIES_ID, chunk)
+            conn.commit()
+    return BenchSample(ops=len(candles), seconds=time.perf_counter() - t0, extra={"batch": batch})
+
+
+def _candle_read(ctx: BenchContext) -> BenchSample:
+    world = ctx.world()
+    limit = int(ctx.scale.window_candles)
+    n = int(ctx.scale.read_iterations) * 10
+    seconds = _timed(lambda: world.store.get_closed(world.series_id, since=None, limit=limit), iterations=n)
+    return BenchSample(ops=n, seconds=seconds, extra={"limit": limit})
+
+
+def _factor_tick(ctx: BenchContext) -> BenchSample:
+    ticks = int(ctx.scale.factor_ticks)
+    candles = ctx.history(extra=ticks)
+    history, tail = candles[: -ticks or None], candles[len(candles) - ticks :]
+    world = build_world(ctx.paths.fresh("factor-tick"), candles=history, window_candles=0, with_overlay=False)
+    elapsed = 0.0
+    for candle in tail:
+        world.store.upsert_closed(world.series_id, candle)
+        t0 = time.perf_counter()
+        world.factor_orchestrator.ingest_closed(series_id=world.series_id, up_to_candle_time=int(candle.candle_time))
+        elapsed += time.perf_counter() - t0
+    return BenchSample(ops=len(tail), seconds=elapsed, extra={"history_candles": len(history)})
+
+
+def _factor_rebuild(ctx: BenchContext) -> BenchSample:
+    candles = ctx.history()
+    db_path = ctx.paths.fresh("factor-rebuild")
+    base = build_stores(db_path)
+    bulk_upsert(base["store"], series_id=DEFAULT_SERIES_ID, candles=candles)
+    head = int(candles[-1].candle_time)
+    base["factor_orchestrator"].ingest_closed(series_id=DEFAULT_SERIES_ID, up_to_candle_time=head)
+    # A different logic version changes the fingerprint, which forces a full rebuild on next ingest.
+    bumped = build_stores(db_path, logic_version_override=f"bench-rebuild-{db_path.stem}")
+    t0 = time.perf_counter()
+    result = bumped["factor_orchestrator"].ingest_closed(series_id=DEFAULT_SERIES_ID, up_to_candle_time=head)
+    seconds = time.perf_counter() - t0
+    return BenchSample(ops=len(candles), seconds=seconds, extra={"rebuilt": bool(getattr(result, "rebuilt", False))})
+
+
+def _overlay_ingest(ctx: BenchContext) -> BenchSample:
+    ticks = int(ctx.scale.overlay_ticks)
+    candles = ctx.history(extra=ticks)
+    history, tail = candles[: -ticks or None], candles[len(candles) - ticks :]
+    world = build_world(
+        ctx.paths.fresh("overlay"),
+        candles=history,
+        window_candles=int(ctx.scale.window_candles),
+    )
+    elapsed = 0.0
+    for candle in tail:
+        t = int(candle.candle_time)
+        world.store.upsert_closed(world.series_id, candle)
+        world.factor_orchestrator.ingest_closed(series_id=world.series_id, up_to_candle_time=t)
+        t0 = time.perf_counter()
+        world.overlay_orchestrator.ingest_closed(series_id=world.series_id, up_to_candle_time=t)
+        elapsed += time.perf_counter() - t0
+    return BenchSample(ops=len(tail), seconds=elapsed, extra={"window_candles": int(ctx.scale.window_candles)})
+
+
+def _draw_delta(ctx: BenchContext) -> BenchSample:
+    world = ctx.world()
+    n = int(ctx.scale.read_iterations)
+    window = int(ctx.scale.window_candles)
+    seconds = _timed(
+        lambda: world.draw_read_service.read_delta(series_id=world.series_id, cursor_version_id=0, window_candles=window),
+        iterations=n,
+    )
+    return BenchSample(ops=n, seconds=seconds, extra={"window_candles": window})
+
+
+def _world_frame(ctx: BenchContext) -> BenchSample:
+    world = ctx.world()
+    n = int(ctx.scale.read_iterations)
+    window = int(ctx.scale.window_candles)
+    seconds = _timed(
+        lambda: world.world_read_service.read_frame_live(series_id=world.series_id, window_candles=window),
+        iterations=n,
+    )
+    return BenchSample(ops=n, seconds=seconds, extra={"window_candles": window})
+
+
+def _factor_slices(ctx: BenchContext) -> BenchSample:
+    world = ctx.world()
+    n = int(ctx.scale.read_iterations)
+    window = int(ctx.scale.window_candles)
+    at_time = int(world.candles[-1].candle_time)
+    seconds = _timed(
+        lambda: world.factor_read_service.read_slices(series_id=world.series_id, at_time=at_time, window_candles=window),
+        iterations=n,
+    )
+    return BenchSample(ops=n, seconds=seconds, extra={"window_candles": window})
+
+
+class _CountingWs:
+    __slots__ = ("sent",)
+
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def send_json(self, payload: dict) -> None:
+        self.sent += 1
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        return None
+
+
+def _hub_fanout(ctx: BenchContext) -> BenchSample:
+    from backend.app.ws.hub import CandleHub  # noqa: WPS433
+
+    scale = ctx.scale
+    candles = generate_klines(count=int(scale.hub_publishes), seed=ctx.seed)
+
+    async def _run() -> tuple[float, int]:
+        hub = CandleHub()
+        sockets = [_CountingWs() for _ in range(int(scale.hub_subscribers))]
+        for ws in sockets:
+            await hub.subscribe(ws, series_id=DEFAULT_SERIES_ID, since=None, supports_batch=True)  # type: ignore[arg-type]
+        t0 = time.perf_counter()
+        for candle in candles:
+            await hub.publish_closed(series_id=DEFAULT_SERIES_ID, candle=candle)
+        return time.perf_counter() - t0, sum(ws.sent for ws in sockets)
+
+    seconds, sent = asyncio.run(_run())
+    return BenchSample(ops=sent, seconds=seconds, extra={"subscribers": int(scale.hub_subscribers), "publishes": len(candles)})
+
+
+def _replay_world(ctx: BenchContext) -> tuple[BenchWorld, Any, str]:
+    from backend.app.replay.package_builder_v1 import ReplayBuildParamsV1, build_replay_package_v1  # noqa: WPS433
+    from backend.app.replay.package_reader_v1 import ReplayPackageReaderV1  # noqa: WPS433
+
+    world = ctx.world()
+    reader = ReplayPackageReaderV1(candle_store=world.store, root_dir=ctx.tmp_dir / "replay")
+    cache_key = f"bench-{ctx.paths.fresh('replay').stem}"
+    reader.cache_dir(cache_key).mkdir(parents=True, exist_ok=True)
+    window = int(ctx.scale.replay_window_candles)
+    build_replay_package_v1(
+        package_path=reader.package_path(cache_key),
+        cache_key=cache_key,
+        candle_store=world.store,
+        factor_store=world.factor_store,
+        overlay_store=world.overlay_store,
+        factor_slices_service=world.factor_slices_service,
+        params=ReplayBuildParamsV1(
+            series_id=world.series_id,
+            to_candle_time=int(world.candles[-1].candle_time),
+            window_candles=window,
+            window_size=max(1, window // 2),
+            snapshot_interval=max(1, window // 6),
+        ),
+    )
+    return world, reader, cache_key
+
+
+def _replay_build(ctx: BenchContext) -> BenchSample:
+    t0 = time.perf_counter()
+    _replay_world(ctx)
+    seconds = time.perf_counter() - t0
+    return BenchSample(ops=int(ctx.scale.replay_window_candles), seconds=seconds)
+
+
+def _replay_read(ctx: BenchContext) -> BenchSample:
+    _, reader, cache_key = _replay_world(ctx)
+    total = int(reader.read_meta(cache_key).total_candles)
+    n = int(ctx.scale.read_iterations) * 2
+    t0 = time.perf_counter()
+    for i in range(n):
+        reader.read_window(cache_key, target_idx=(i * 7919) % max(1, total))
+    return BenchSample(ops=n, seconds=time.perf_counter() - t0, extra={"total_candles": total})
+
+
+CASES: tuple[BenchCase, ...] = (
+    BenchCase("candle.upsert_many", "candle", "Batched closed-candle upsert incl. existing-time probe.", _candle_upsert),
+    BenchCase("candle.read_window", "read", "get_closed over the newest window.", _candle_read),
+    BenchCase("factor.tick", "tick", "Incremental factor ingest of one new closed candle.", _factor_tick),
+    BenchCase("factor.rebuild", "candle", "Fingerprint-triggered full factor rebuild.", _factor_rebuild),
+    BenchCase("overlay.ingest", "tick", "Overlay ingest after one new candle (factor tick excluded).", _overlay_ingest),
+    BenchCase("draw.delta", "read", "DrawReadService.read_delta from cursor 0.", _draw_delta),
+    BenchCase("world.frame_live", "read", "WorldReadService.read_frame_live.", _world_frame),
+    BenchCase("factor.slices", "read", "FactorReadService.read_slices at head.", _factor_slices),
+    BenchCase("hub.fanout", "message", "CandleHub.publish_closed to N fake sockets.", _hub_fanout),
+    BenchCase("replay.build", "candle", "build_replay_package_v1 over the replay window.", _replay_build),
+    BenchCase("replay.read_window", "read", "ReplayPackageReaderV1.read_window.", _replay_read),
+    BenchCase("candle.records", "candle", "Bulk CandleClosed <-> CandleRecord conversion; bytes/candle in extra.", candle_records),
+    BenchCase("ws.decode_legacy", "message", "Kline frame decode: json + validated model per frame.", decode_legacy),
+    BenchCase("ws.decode_fast", "message", "Kline frame decode: orjson, throttle before build.", decode_fast),
+    BenchCase("kernel.sma_batch", "candle", "SmaCrossKernel.run_batch over kernel_candles closes.", sma_cross_batch),
+    BenchCase("kernel.sma_apply", "candle", "SmaCrossKernel.apply_closed per candle (upsert_candles).", sma_cross_apply),
+)
+
+
+def select_cases(names: list[str]) -> list[BenchCase]:
+    if not names:
+        return list(CASES)
+    by_name = {case.name: case for case in CASES}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise SystemExit(f"unknown bench case(s): {', '.join(unknown)}; known: {', '.join(by_name)}")
+    return [by_name[name] for name in names]
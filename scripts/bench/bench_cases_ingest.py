@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from typing import Any, Callable
+
+STREAMS = ("btcusdt", "ethusdt", "solusdt", "bnbusdt", "xrpusdt", "dogeusdt", "adausdt", "linkusdt")
+FORMING_PER_FINAL = 29
+FORMING_MIN_INTERVAL_S = 0.25
+
+
+def kline_frames(*, count: int, seed: int) -> list[str]:
+    """Combined-stream kline frames as Binance sends them: string prices, ~30 forming updates per close."""
+    rng = random.Random(seed)
+    frames: list[str] = []
+    open_ms = 1_700_000_040_000
+    price = 30000.0
+    step = 0
+    while len(frames) < count:
+        is_final = step % (FORMING_PER_FINAL + 1) == FORMING_PER_FINAL
+        for symbol in STREAMS:
+            price = max(1.0, price + rng.uniform(-5.0, 5.0))
+            k = {
+                "t": open_ms,
+                "T": open_ms + 59_999,
+                "s": symbol.upper(),
+                "i": "1m",
+                "o": f"{price:.2f}",
+                "h": f"{price + 3:.2f}",
+                "l": f"{price - 3:.2f}",
+                "c": f"{price + 1:.2f}",
+                "v": f"{rng.uniform(1, 50):.3f}",
+                "x": is_final,
+                "q": "0",
+                "n": 100,
+            }
+            body = {"e": "kline", "E": open_ms + 1000, "s": symbol.upper(), "k": k}
+            frames.append(json.dumps({"stream": f"{symbol}@kline_1m", "data": body}, separators=(",", ":")))
+        if is_final:
+            open_ms += 60_000
+        step += 1
+    return frames[:count]
+
+
+class _Throttle:
+    """Per-stream forming throttle state, same rule as BinanceWsSeriesState."""
+
+    def __init__(self) -> None:
+        from backend.app.ingest.ws_hotpath import should_emit_forming  # noqa: WPS433
+
+        self._should_emit = should_emit_forming
+        self._last: dict[str, tuple[int | None, float]] = {}
+
+    def due(self, stream: str, candle_time: int, now: float) -> bool:
+        last_time, last_at = self._last.get(stream, (None, 0.0))
+        if not self._should_emit(
+            candle_time=candle_time,
+            last_emitted_time=0,
+            last_forming_candle_time=last_time,
+            last_forming_emit_at=last_at,
+            now=now,
+            forming_min_interval_s=FORMING_MIN_INTERVAL_S,
+        ):
+            return False
+        self._last[stream] = (candle_time, now)
+        return True
+
+
+def _legacy_decoder(throttle: _Throttle) -> Callable[[str], int]:
+    """Pre-fast-path decoding: stdlib json, per-field coercion and a validated model for every frame."""
+    from backend.app.core.schemas import CandleClosed  # noqa: WPS433
+
+    def decode(raw: str) -> int:
+        msg = json.loads(raw)
+        k = msg["data"]["k"]
+        candle = CandleClosed(
+            candle_time=int(int(k["t"]) // 1000),
+            open=float(k["o"]),
+            high=float(k["h"]),
+            low=float(k["l"]),
+            close=float(k["c"]),
+            volume=float(k["v"]),
+        )
+        if bool(k["x"]):
+            return 1
+        return 1 if throttle.due(msg["stream"], int(candle.candle_time), time.monotonic()) else 0
+
+    return decode
+
+
+def _fast_decoder(throttle: _Throttle) -> Callable[[str], int]:
+    from backend.app.ingest.kline_decode import decode_ws_message, kline_candle, kline_head  # noqa: WPS433
+
+    def decode(raw: str) -> int:
+        msg = decode_ws_message(raw)
+        head = kline_head(msg["data"])
+        if head is None:
+            return 0
+        candle_time, is_final, k = head
+        if not is_final and not throttle.due(msg["stream"], candle_time, time.monotonic()):
+            return 0
+        return 1 if kline_candle(k, candle_time) is not None else 0
+
+    return decode
+
+
+def _decode_case(make_decoder: Callable[[_Throttle], Callable[[str], int]], *, fast: bool) -> Callable[[Any], Any]:
+    def _run(ctx: Any) -> Any:
+        from bench_cases import BenchSample  # noqa: WPS433
+        from backend.app.ingest.kline_decode import KLINE_JSON_BACKEND  # noqa: WPS433
+
+        frames = kline_frames(count=int(ctx.scale.ws_messages), seed=ctx.seed)
+        decode = make_decoder(_Throttle())
+        t0 = time.perf_counter()
+        emitted = sum(decode(raw) for raw in frames)
+        seconds = time.perf_counter() - t0
+        return BenchSample(
+            ops=len(frames),
+            seconds=seconds,
+            extra={"json": KLINE_JSON_BACKEND if fast else "json", "emitted": int(emitted), "streams": len(STREAMS)},
+        )
+
+    return _run
+
+
+decode_legacy = _decode_case(_legacy_decoder, fast=False)
+decode_fast = _decode_case(_fast_decoder, fast=True)
+
+
+def _bytes_per_item(build: Callable[[], list[Any]]) -> float:
+    import tracemalloc  # noqa: WPS433
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / float(max(1, len(items)))
+
+
+def candle_records(ctx: Any) -> Any:
+    """Bulk CandleClosed -> CandleRecord -> CandleClosed round trip, plus resident bytes per candle of each type."""
+    from bench_cases import BenchSample  # noqa: WPS433
+    from bench_data import generate_klines  # noqa: WPS433
+    from backend.app.core.candle_record import closed_from_records, records_from_closed  # noqa: WPS433
+
+    candles = generate_klines(count=int(ctx.scale.upsert_candles), seed=ctx.seed)
+    t0 = time.perf_counter()
+    records = records_from_closed(candles)
+    closed_from_records(records)
+    seconds = time.perf_counter() - t0
+    return BenchSample(
+        ops=len(candles),
+        seconds=seconds,
+        extra={
+            "model_bytes": round(_bytes_per_item(lambda: closed_from_records(records)), 1),
+            "record_bytes": round(_bytes_per_item(lambda: records_from_closed(candles)), 1),
+        },
+    )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Any
+
+
+def sma_closes(*, count: int, seed: int) -> list[Any]:
+    """Deterministic trade_canvas closes (two cycles, no RNG needed at 1M scale) for the SMA-cross kernel."""
+    from trade_canvas.types import CandleClosed  # noqa: WPS433
+
+    phase = float(seed)
+    out: list[CandleClosed] = []
+    for i in range(max(0, int(count))):
+        close = 30000.0 + 400.0 * math.sin((i + phase) / 37.0) + 90.0 * math.sin((i + phase) / 5.3)
+        out.append(CandleClosed("BTC/USDT", "1m", 60 * (i + 1), close, close + 5.0, close - 5.0, close, 1.0))
+    return out
+
+
+def _kernel(ctx: Any, name: str) -> tuple[Any, Any]:
+    from trade_canvas.kernel import SmaCrossKernel  # noqa: WPS433
+    from trade_canvas.store import KernelStore  # noqa: WPS433
+
+    store = KernelStore(ctx.paths.fresh(name))
+    return SmaCrossKernel(store), store.connect()
+
+
+def sma_cross_batch(ctx: Any) -> Any:
+    from bench_cases import BenchSample  # noqa: WPS433
+
+    candles = sma_closes(count=int(ctx.scale.kernel_candles), seed=ctx.seed)
+    kernel, conn = _kernel(ctx, "kernel_batch")
+    t0 = time.perf_counter()
+    res = kernel.run_batch(conn, candles)
+    seconds = time.perf_counter() - t0
+    return BenchSample(
+        ops=len(candles),
+        seconds=seconds,
+        extra={"signals": sum(res.open_long), "candles_per_s": round(len(candles) / max(seconds, 1e-9))},
+    )
+
+
+def sma_cross_apply(ctx: Any) -> Any:
+    from bench_cases import BenchSample  # noqa: WPS433
+
+    candles = sma_closes(count=int(ctx.scale.upsert_candles), seed=ctx.seed)
+    kernel, conn = _kernel(ctx, "kernel_apply")
+    t0 = time.perf_counter()
+    for candle in candles:
+        kernel.apply_closed(conn, candle)
+    seconds = time.perf_counter() - t0
+    return BenchSample(
+        ops=len(candles),
+        seconds=seconds,
+        extra={"candles_per_s": round(len(candles) / max(seconds, 1e-9))},
+    )
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SEED = 7
+DEFAULT_SERIES_ID = "binance:futures:BTC/USDT:1m"
+
+
+@dataclass(frozen=True)
+class BenchScale:
+    name: str
+    history_candles: int
+    upsert_candles: int
+    upsert_batch: int
+    factor_ticks: int
+    overlay_ticks: int
+    read_iterations: int
+    window_candles: int
+    hub_subscribers: int
+    hub_publishes: int
+    replay_window_candles: int
+    ws_messages: int
+    kernel_candles: int
+
+
+SCALES: dict[str, BenchScale] = {
+    "full": BenchScale(
+        name="full",
+        history_candles=2000,
+        upsert_candles=20000,
+        upsert_batch=200,
+        factor_ticks=20,
+        overlay_ticks=6,
+        read_iterations=15,
+        window_candles=2000,
+        hub_subscribers=500,
+        hub_publishes=200,
+        replay_window_candles=150,
+        ws_messages=100000,
+        kernel_candles=1_000_000,
+    ),
+    "quick": BenchScale(
+        name="quick",
+        history_candles=300,
+        upsert_candles=2000,
+        upsert_batch=200,
+        factor_ticks=3,
+        overlay_ticks=2,
+        read_iterations=3,
+        window_candles=300,
+        hub_subscribers=50,
+        hub_publishes=20,
+        replay_window_candles=30,
+        ws_messages=20000,
+        kernel_candles=20000,
+    ),
+}
+
+
+def generate_klines(
+    *,
+    count: int,
+    seed: int = DEFAULT_SEED,
+    start_time: int = 1_700_000_040,
+    timeframe_s: int = 60,
+    start_price: float = 30000.0,
+) -> list[Any]:
+    """
+    Deterministic synthetic klines: two overlapping cycles plus seeded noise, so pivots/pens/zhongshu
+    all fire at a realistic rate. Same (count, seed, ...) always yields identical candles.
+    """
+    from backend.app.core.schemas import CandleClosed  # noqa: WPS433
+
+    rng = random.Random(int(seed))
+    tf = max(1, int(timeframe_s))
+    t0 = (int(start_time) // tf) * tf
+    out: list[CandleClosed] = []
+    prev_close = float(start_price)
+    for i in range(max(0, int(count))):
+        trend = 0.04 * math.sin(i / 97.0) + 0.015 * math.sin(i / 13.0)
+        target = float(start_price) * (1.0 + trend)
+        close = max(1.0, target * (1.0 + rng.gauss(0.0, 0.0015)))
+        open_ = prev_close
+        wick = abs(rng.gauss(0.0, 0.0008))
+        out.append(
+            CandleClosed(
+                candle_time=t0 + i * tf,
+                open=round(open_, 2),
+                high=round(max(open_, close) * (1.0 + wick), 2),
+                low=round(min(open_, close) * (1.0 - wick), 2),
+                close=round(close, 2),
+                volume=round(1.0 + rng.random() * 50.0, 4),
+            )
+        )
+        prev_close = close
+    return out
+
+
+@dataclass
+class BenchWorld:
+    """A fully ingested series (candles + factor + overlay) plus the read services on top of it."""
+
+    series_id: str
+    candles: list[Any]
+    store: Any
+    factor_store: Any
+    overlay_store: Any
+    factor_orchestrator: Any
+    overlay_orchestrator: Any
+    factor_slices_service: Any
+    factor_read_service: Any
+    draw_read_service: Any
+    world_read_service: Any
+
+
+class BenchDbPaths:
+    """Local stores are keyed by db_path, so every scenario gets its own path to stay isolated."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = Path(root)
+        self._next = 0
+
+    def fresh(self, label: str) -> Path:
+        self._next += 1
+        return self._root / f"{label}-{self._next}.db"
+
+
+def build_stores(db_path: Path, *, logic_version_override: str = "", window_candles: int = 2000) -> dict[str, Any]:
+    from backend.app.factor.orchestrator import FactorOrchestrator  # noqa: WPS433
+    from backend.app.factor.store import FactorStore  # noqa: WPS433
+    from backend.app.overlay.orchestrator import OverlayOrchestrator, OverlaySettings  # noqa: WPS433
+    from backend.app.overlay.store import OverlayStore  # noqa: WPS433
+    from backend.app.storage.candle_store import CandleStore  # noqa: WPS433
+
+    store = CandleStore(db_path=db_path)
+    factor_store = FactorStore(db_path=db_path)
+    overlay_store = OverlayStore(db_path=db_path)
+    return {
+        "store": store,
+        "factor_store": factor_store,
+        "overlay_store": overlay_store,
+        "factor_orchestrator": FactorOrchestrator(
+            candle_store=store,
+            factor_store=factor_store,
+            logic_version_override=logic_version_override,
+        ),
+        "overlay_orchestrator": OverlayOrchestrator(
+            candle_store=store,
+            factor_store=factor_store,
+            overlay_store=overlay_store,
+            settings=OverlaySettings(ingest_enabled=True, window_candles=int(window_candles)),
+        ),
+    }
+
+
+def bulk_upsert(store: Any, *, series_id: str, candles: list[Any]) -> None:
+    with store.connect() as conn:
+        store.upsert_many_closed_in_conn(conn, series_id, list(candles))
+        conn.commit()
+
+
+def build_world(
+    db_path: Path,
+    *,
+    candles: list[Any],
+    window_candles: int,
+    series_id: str = DEFAULT_SERIES_ID,
+    with_overlay: bool = True,
+) -> BenchWorld:
+    from backend.app.debug.hub import DebugHub  # noqa: WPS433
+    from backend.app.factor.slices_service import FactorSlicesService  # noqa: WPS433
+    from backend.app.read_models import DrawReadService, FactorReadService, WorldReadService  # noqa: WPS433
+
+    parts = build_stores(db_path, window_candles=window_candles)
+    store = parts["store"]
+    bulk_upsert(store, series_id=series_id, candles=candles)
+    if candles:
+        head = int(candles[-1].candle_time)
+        parts["factor_orchestrator"].ingest_closed(series_id=series_id, up_to_candle_time=head)
+        if with_overlay:
+            parts["overlay_orchestrator"].ingest_closed(series_id=series_id, up_to_candle_time=head)
+
+    slices_service = FactorSlicesService(candle_store=store, factor_store=parts["factor_store"])
+    factor_read = FactorReadService(
+        store=store,
+        factor_store=parts["factor_store"],
+        factor_slices_service=slices_service,
+        strict_mode=True,
+    )
+    debug_hub = DebugHub()
+    draw_read = DrawReadService(
+        store=store,
+        overlay_store=parts["overlay_store"],
+        overlay_orchestrator=parts["overlay_orchestrator"],
+        factor_read_service=factor_read,
+        debug_hub=debug_hub,
+        debug_api_enabled=False,
+    )
+    world_read = WorldReadService(
+        store=store,
+        overlay_store=parts["overlay_store"],
+        factor_read_service=factor_read,
+        draw_read_service=draw_read,
+        debug_hub=debug_hub,
+        debug_api_enabled=False,
+    )
+    return BenchWorld(
+        series_id=series_id,
+        candles=list(candles),
+        store=store,
+        factor_store=parts["factor_store"],
+        overlay_store=parts["overlay_store"],
+        factor_orchestrator=parts["factor_orchestrator"],
+        overlay_orchestrator=parts["overlay_orchestrator"],
+        factor_slices_service=slices_service,
+        factor_read_service=factor_read,
+        draw_read_service=draw_read,
+        world_read_service=world_read,
+    )
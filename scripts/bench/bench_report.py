@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+SCHEMA = "trade_canvas.bench.v1"
+
+
+def summarize_case(*, unit: str, description: str, samples: Sequence[Any]) -> dict[str, Any]:
+    per_op_us = [float(s.seconds) * 1e6 / float(max(1, int(s.ops))) for s in samples]
+    median_us = float(statistics.median(per_op_us)) if per_op_us else 0.0
+    last = samples[-1] if samples else None
+    return {
+        "unit": str(unit),
+        "description": str(description),
+        "repeat": len(per_op_us),
+        "ops": int(last.ops) if last is not None else 0,
+        "per_op_us": {
+            "min": round(min(per_op_us), 3) if per_op_us else 0.0,
+            "median": round(median_us, 3),
+            "max": round(max(per_op_us), 3) if per_op_us else 0.0,
+        },
+        "ops_per_s": round(1e6 / median_us, 3) if median_us > 0 else 0.0,
+        "extra": dict(last.extra) if last is not None else {},
+    }
+
+
+def build_report(*, scale: str, seed: int, cases: dict[str, dict[str, Any]], wall_s: float) -> dict[str, Any]:
+    return {
+        "schema": SCHEMA,
+        "scale": str(scale),
+        "seed": int(seed),
+        "created_at": int(time.time()),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "wall_s": round(float(wall_s), 3),
+        "cases": dict(cases),
+    }
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("schema") != SCHEMA:
+        raise ValueError(f"not a {SCHEMA} report: {path}")
+    return data
+
+
+@dataclass(frozen=True)
+class CaseComparison:
+    name: str
+    status: str
+    baseline_us: float | None
+    current_us: float | None
+    change_pct: float | None
+    threshold_pct: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "baseline_us": self.baseline_us,
+            "current_us": self.current_us,
+            "change_pct": self.change_pct,
+            "threshold_pct": self.threshold_pct,
+        }
+
+
+def compare_reports(
+    *,
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    default_threshold_pct: float,
+    thresholds: dict[str, float] | None = None,
+) -> list[CaseComparison]:
+    """
+    Compare median per-op time of each case against the baseline.
+    - `change_pct` > 0 means slower; above the case threshold the case is `regressed`.
+    - Reports from different scales are not comparable and raise ValueError.
+    """
+    if str(current.get("scale")) != str(baseline.get("scale")):
+        raise ValueError(f"scale mismatch: current={current.get('scale')} baseline={baseline.get('scale')}")
+    overrides = dict(thresholds or {})
+    base_cases = dict(baseline.get("cases") or {})
+    out: list[CaseComparison] = []
+    for name, case in sorted(dict(current.get("cases") or {}).items()):
+        threshold = float(overrides.get(name, default_threshold_pct))
+        cur_us = float(case["per_op_us"]["median"])
+        base = base_cases.get(name)
+        if base is None:
+            out.append(CaseComparison(name, "new", None, cur_us, None, threshold))
+            continue
+        base_us = float(base["per_op_us"]["median"])
+        change = (cur_us - base_us) / base_us * 100.0 if base_us > 0 else 0.0
+        if change > threshold:
+            status = "regressed"
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        out.append(CaseComparison(name, status, base_us, cur_us, round(change, 2), threshold))
+    return out
+
+
+def format_table(report: dict[str, Any], comparisons: Sequence[CaseComparison]) -> str:
+    by_name = {c.name: c for c in comparisons}
+    lines = [f"scale={report['scale']} seed={report['seed']} wall={report['wall_s']}s"]
+    for name, case in sorted(dict(report["cases"]).items()):
+        line = f"  {name:<22} {case['per_op_us']['median']:>12.1f} us/{case['unit']:<8} x{case['ops']}"
+        cmp = by_name.get(name)
+        if cmp is not None and cmp.change_pct is not None:
+            line += f"  {cmp.change_pct:+7.1f}% {cmp.status}"
+        elif cmp is not None:
+            line += f"  {cmp.status}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def _imports() -> None:
+    root = _repo_root()
+    sys.path.insert(0, str(root))
+    sys.path.insert(0, str(root / "backend"))
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+def _parse_threshold(raw: str) -> tuple[str, float]:
+    name, sep, pct = str(raw).partition("=")
+    if not sep or not name.strip():
+        raise argparse.ArgumentTypeError(f"expected case=pct, got {raw!r}")
+    return name.strip(), float(pct)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="热路径基准套件：确定性合成 K 线，输出 JSON 并与基线对比。")
+    p.add_argument("--scale", choices=("full", "quick"), default="full", help="数据规模（默认 full，约 2-4 分钟）。")
+    p.add_argument("--cases", default="", help="逗号分隔的 case 名；为空则全部。")
+    p.add_argument("--list", action="store_true", help="列出全部 case 后退出。")
+    p.add_argument("--repeat", type=int, default=3, help="每个 case 重复次数，取中位数（默认 3）。")
+    p.add_argument("--seed", type=int, default=None, help="合成数据随机种子（默认 7）。")
+    p.add_argument("--json-out", default="", help="结果 JSON 输出路径；为空则打印到 stdout。")
+    p.add_argument(
+        "--baseline",
+        default=str(Path(__file__).resolve().parent / "baseline.json"),
+        help="基线 JSON 路径（默认 scripts/bench/baseline.json）；不存在则跳过对比。",
+    )
+    p.add_argument("--write-baseline", action="store_true", help="把本次结果写入 --baseline。")
+    p.add_argument("--max-regression-pct", type=float, default=30.0, help="默认回退阈值（百分比，默认 30）。")
+    p.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        type=_parse_threshold,
+        help="单个 case 阈值覆盖，如 overlay.ingest=50；可重复。",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    _imports()
+    from bench_cases import CASES, BenchContext, select_cases  # noqa: WPS433
+    from bench_data import DEFAULT_SEED, SCALES  # noqa: WPS433
+    from bench_report import build_report, compare_reports, format_table, load_report, summarize_case  # noqa: WPS433
+
+    if args.list:
+        for case in CASES:
+            print(f"{case.name:<22} {case.description}")
+        return 0
+
+    seed = DEFAULT_SEED if args.seed is None else int(args.seed)
+    names = [name.strip() for name in str(args.cases).split(",") if name.strip()]
+    cases = select_cases(names)
+    repeat = max(1, int(args.repeat))
+    t_start = time.perf_counter()
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="tc-bench-") as tmp:
+        ctx = BenchContext(scale=SCALES[args.scale], tmp_dir=Path(tmp), seed=seed)
+        for case in cases:
+            samples = [case.run(ctx) for _ in range(repeat)]
+            results[case.name] = summarize_case(unit=case.unit, description=case.description, samples=samples)
+            print(f"[bench] {case.name} done", file=sys.stderr)
+    report = build_report(scale=args.scale, seed=seed, cases=results, wall_s=time.perf_counter() - t_start)
+
+    baseline_path = Path(args.baseline)
+    comparisons = []
+    if baseline_path.exists() and not args.write_baseline:
+        try:
+            comparisons = compare_reports(
+                current=report,
+                baseline=load_report(baseline_path),
+                default_threshold_pct=float(args.max_regression_pct),
+                thresholds=dict(args.threshold),
+            )
+        except ValueError as exc:
+            # e.g. `--scale quick` against the committed full-scale baseline: report, don't compare.
+            print(f"[bench] warning: skipping baseline comparison ({exc})", file=sys.stderr)
+            report["comparison"] = {"baseline": str(baseline_path), "skipped": str(exc)}
+        else:
+            report["comparison"] = {
+                "baseline": str(baseline_path),
+                "cases": [c.to_dict() for c in comparisons],
+            }
+
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.json_out:
+        Path(args.json_out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.write_baseline:
+        baseline_path.write_text(text + "\n", encoding="utf-8")
+    print(format_table(report, comparisons), file=sys.stderr)
+
+    regressed = [c.name for c in comparisons if c.status == "regressed"]
+    if regressed:
+        print(f"[bench] regressed: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _imports() -> dict[str, Any]:
+    root = _repo_root()
+    sys.path.insert(0, str(root))
+    sys.path.insert(0, str(root / "backend"))
+
+    from backend.app.runtime.metrics import RuntimeMetrics  # noqa: WPS433
+
+    return {"RuntimeMetrics": RuntimeMetrics}
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="测量 RuntimeMetrics 单次延迟观测开销（ns/observation）。")
+    p.add_argument("--iterations", type=int, default=200_000, help="每轮观测次数（默认 200000）。")
+    p.add_argument("--rounds", type=int, default=5, help="轮数，取最快一轮（默认 5）。")
+    p.add_argument("--max-ns", type=float, default=1000.0, help="timer handle 单次开销上限，超出则退出码 1（默认 1000）。")
+    p.add_argument("--json", action="store_true", help="输出 JSON。")
+    return p.parse_args(argv)
+
+
+def _best_ns(fn, *, iterations: int, rounds: int) -> float:
+    values = [float(i % 997) * 0.37 for i in range(1024)]
+    best = float("inf")
+    for _ in range(max(1, rounds)):
+        t0 = time.perf_counter_ns()
+        for i in range(iterations):
+            fn(values[i & 1023])
+        elapsed = time.perf_counter_ns() - t0
+        best = min(best, float(elapsed) / float(iterations))
+    return best
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    mods = _imports()
+    iterations = max(1, int(args.iterations))
+    rounds = max(1, int(args.rounds))
+
+    metrics = mods["RuntimeMetrics"](enabled=True)
+    handle = metrics.timer("bench_duration_ms", labels={"step": "bench"})
+    disabled = mods["RuntimeMetrics"](enabled=False).timer("bench_duration_ms")
+
+    def _observe_by_name(value: float) -> None:
+        metrics.observe_ms("bench_by_name_ms", duration_ms=value, labels={"step": "bench"})
+
+    out = {
+        "iterations": iterations,
+        "rounds": rounds,
+        "timer_handle_ns": round(_best_ns(handle.observe_ms, iterations=iterations, rounds=rounds), 1),
+        "observe_by_name_ns": round(_best_ns(_observe_by_name, iterations=iterations, rounds=rounds), 1),
+        "disabled_handle_ns": round(_best_ns(disabled.observe_ms, iterations=iterations, rounds=rounds), 1),
+        "max_ns": float(args.max_ns),
+    }
+    out["ok"] = bool(out["timer_handle_ns"] <= float(args.max_ns))
+
+    if args.json:
+        print(json.dumps(out, ensure_ascii=False, indent=2))
+    else:
+        print(
+            f"timer_handle={out['timer_handle_ns']}ns observe_by_name={out['observe_by_name_ns']}ns "
+            f"disabled={out['disabled_handle_ns']}ns max={out['max_ns']}ns ok={out['ok']}"
+        )
+    return 0 if out["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
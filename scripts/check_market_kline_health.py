@@ -26,7 +26,8 @@ def _imports() -> dict[str, Any]:
 
     from backend.app.core.config import load_settings  # noqa: WPS433
     from backend.app.market_data import StoreBackfillService  # noqa: WPS433
-    from backend.app.market_kline_health import analyze_series_health  # noqa: WPS433
+    from backend.app.market.kline_health import analyze_series_health  # noqa: WPS433
+    from backend.app.market.whitelist import load_market_whitelist  # noqa: WPS433
     from backend.app.storage.candle_store import CandleStore  # noqa: WPS433
 
     return {
@@ -34,6 +35,7 @@ def _imports() -> dict[str, Any]:
         "StoreBackfillService": StoreBackfillService,
         "analyze_series_health": analyze_series_health,
         "CandleStore": CandleStore,
+        "load_market_whitelist": load_market_whitelist,
     }
 
 
@@ -45,6 +47,7 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default=[],
         help="可重复指定。默认检查 BTC futures 1m/5m/15m。",
     )
+    p.add_argument("--whitelist", action="store_true", help="检查白名单内全部序列（与 --series-id 合并）。")
     p.add_argument("--db-path", default="", help="覆盖 DB 路径（默认读取 settings db_path）。")
     p.add_argument("--max-recent-gaps", type=int, default=5, help="输出最近 gap 条数（默认 5）。")
     p.add_argument("--recent-base-buckets", type=int, default=8, help="输出最近基准桶数（默认 8）。")
@@ -92,7 +95,12 @@ def main(argv: list[str]) -> int:
     else:
         backfill = None
 
-    series_ids = tuple(args.series_id) if args.series_id else DEFAULT_SERIES_IDS
+    series_ids = tuple(args.series_id)
+    if args.whitelist:
+        whitelist = mods["load_market_whitelist"](settings.whitelist_path).series_ids
+        series_ids += tuple(sid for sid in whitelist if sid not in series_ids)
+    if not series_ids:
+        series_ids = DEFAULT_SERIES_IDS
     out: list[dict[str, Any]] = []
     for sid in series_ids:
         if backfill is not None and not sid.endswith(":1m"):
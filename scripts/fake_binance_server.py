@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _imports() -> dict[str, Any]:
+    root = _repo_root()
+    sys.path.insert(0, str(root))
+    sys.path.insert(0, str(root / "backend"))
+
+    from backend.app.market.fake_binance import FakeBinanceConfig, FakeBinanceServer  # noqa: WPS433
+
+    return {"FakeBinanceConfig": FakeBinanceConfig, "FakeBinanceServer": FakeBinanceServer}
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="本地假 Binance：kline WS（single/combined）、REST klines、exchangeInfo、24hr ticker。")
+    p.add_argument("--host", default="127.0.0.1", help="监听地址（默认 127.0.0.1）。")
+    p.add_argument("--port", type=int, default=18900, help="监听端口（默认 18900；0 为随机）。")
+    p.add_argument("--symbols", type=int, default=5, help="合成 symbol 数（默认 5：BTC/ETH/SOL/BNB/XRP）。")
+    p.add_argument("--quote", default="USDT", help="计价资产（默认 USDT）。")
+    p.add_argument("--timeframe", default="1m", help="K 线周期（默认 1m）。")
+    p.add_argument("--history", type=int, default=1000, help="启动时已收线的历史根数（默认 1000）。")
+    p.add_argument("--tick-hz", type=float, default=1.0, help="每个 stream 每秒收线根数（默认 1；>1/tf 即时间压缩）。")
+    p.add_argument("--forming", type=int, default=0, help="每根收线前推送的 forming 更新数（默认 0）。")
+    p.add_argument("--latency-ms", type=float, default=0.0, help="REST/WS 注入延迟（默认 0）。")
+    p.add_argument("--jitter-ms", type=float, default=0.0, help="注入延迟的随机抖动上限（默认 0）。")
+    p.add_argument("--disconnect-after", type=int, default=0, help="每个 WS 连接发送 N 条后主动断开（默认 0 = 不断开）。")
+    p.add_argument("--seed", type=int, default=7, help="合成数据种子（默认 7）。")
+    p.add_argument("--recorded", default="", help="录制 K 线 jsonl（fixtures 格式），覆盖同名 symbol 的合成数据。")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    mods = _imports()
+    config = mods["FakeBinanceConfig"](
+        symbol_count=int(args.symbols),
+        quote_asset=str(args.quote),
+        timeframe=str(args.timeframe),
+        history_candles=int(args.history),
+        tick_hz=float(args.tick_hz),
+        forming_per_candle=int(args.forming),
+        latency_ms=float(args.latency_ms),
+        jitter_ms=float(args.jitter_ms),
+        disconnect_after_messages=int(args.disconnect_after),
+        seed=int(args.seed),
+        recorded_path=str(args.recorded),
+    )
+    server = mods["FakeBinanceServer"](config, host=str(args.host), port=int(args.port)).start()
+    print(f"[fake_binance] listening on {server.http_base} symbols={','.join(sorted(server.book.symbols))}", file=sys.stderr)
+    print("# point trade_canvas at the fake exchange:")
+    for key, value in server.env().items():
+        print(f"export {key}={value}")
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import ipaddress
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+_LOCAL_HOSTNAMES = {"localhost", "localhost.localdomain"}
+
+
+def is_local_url(url: str) -> bool:
+    """Only loopback targets are allowed: the tool opens thousands of sockets and must never hit a shared host."""
+    host = (urlparse(str(url)).hostname or "").strip().lower()
+    if not host:
+        return False
+    if host in _LOCAL_HOSTNAMES:
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def timeframe_seconds_of(series_id: str) -> int:
+    tf = str(series_id).rsplit(":", 1)[-1].strip()
+    units = {"m": 60, "h": 3600, "d": 86400}
+    try:
+        return max(1, int(tf[:-1]) * units[tf[-1]])
+    except (KeyError, ValueError, IndexError):
+        return 60
+
+
+def build_series_ids(*, explicit: list[str], count: int, template: str) -> list[str]:
+    if explicit:
+        return list(dict.fromkeys(s.strip() for s in explicit if s.strip()))
+    return [template.format(i=i) for i in range(max(1, int(count)))]
+
+
+def _series_weights(*, n: int, distribution: str, zipf_s: float, hot_fraction: float) -> list[float]:
+    if distribution == "uniform":
+        return [1.0] * n
+    if distribution == "zipf":
+        return [1.0 / math.pow(rank, max(0.0, float(zipf_s))) for rank in range(1, n + 1)]
+    if distribution == "hot":
+        hot = max(0.0, min(1.0, float(hot_fraction)))
+        if n == 1:
+            return [1.0]
+        rest = (1.0 - hot) / float(n - 1)
+        return [hot] + [rest] * (n - 1)
+    raise ValueError(f"unknown distribution: {distribution!r}")
+
+
+def assign_subscriptions(
+    *,
+    clients: int,
+    series_ids: list[str],
+    subs_per_client: int,
+    distribution: str,
+    seed: int,
+    zipf_s: float = 1.1,
+    hot_fraction: float = 0.5,
+) -> list[list[str]]:
+    """
+    Deterministic client -> series assignment.
+    - uniform: round-robin, so every series gets clients//len(series) (+1) subscribers.
+    - zipf/hot: weighted draws without duplicates inside one client.
+    """
+    n = len(series_ids)
+    per_client = max(1, min(int(subs_per_client), n))
+    if distribution == "uniform":
+        return [[series_ids[(c * per_client + k) % n] for k in range(per_client)] for c in range(int(clients))]
+    weights = _series_weights(n=n, distribution=distribution, zipf_s=zipf_s, hot_fraction=hot_fraction)
+    rng = random.Random(int(seed))
+    out: list[list[str]] = []
+    for _ in range(int(clients)):
+        picked: list[str] = []
+        while len(picked) < per_client:
+            sid = rng.choices(series_ids, weights=weights, k=1)[0]
+            if sid not in picked:
+                picked.append(sid)
+        out.append(picked)
+    return out
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0.0, min(1.0, float(pct))) * float(len(ordered) - 1)
+    lower = int(math.floor(rank))
+    upper = int(math.ceil(rank))
+    weight = rank - float(lower)
+    return float(ordered[lower] * (1.0 - weight) + ordered[upper] * weight)
+
+
+@dataclass
+class LoadCounters:
+    """Shared counters; the tool is single-event-loop so plain ints are safe."""
+
+    ws_connect_ok: int = 0
+    ws_connect_failed: int = 0
+    ws_disconnects: int = 0
+    ws_messages: int = 0
+    candles_live: int = 0
+    candles_catchup: int = 0
+    forming: int = 0
+    gaps_server: int = 0
+    gaps_client: int = 0
+    resyncs: int = 0
+    ws_errors: int = 0
+    http_ok: int = 0
+    http_4xx: int = 0
+    http_5xx: int = 0
+    http_failed: int = 0
+    ingest_posted: int = 0
+    ingest_failed: int = 0
+    latency_ms: list[float] = field(default_factory=list)
+    connect_ms: list[float] = field(default_factory=list)
+    http_ms: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def error(self, key: str) -> None:
+        k = str(key)[:120]
+        self.errors[k] = int(self.errors.get(k, 0)) + 1
+
+
+def _quantiles(values: list[float]) -> dict[str, float | None]:
+    return {
+        "count": len(values),
+        "p50": percentile(values, 0.50),
+        "p99": percentile(values, 0.99),
+        "max": max(values) if values else None,
+    }
+
+
+def summarize(counters: LoadCounters, *, duration_s: float, config: dict[str, Any]) -> dict[str, Any]:
+    dur = max(1e-9, float(duration_s))
+    return {
+        "config": dict(config),
+        "duration_s": round(dur, 3),
+        "ws": {
+            "connected": counters.ws_connect_ok,
+            "connect_failed": counters.ws_connect_failed,
+            "disconnects": counters.ws_disconnects,
+            "messages": counters.ws_messages,
+            "messages_per_s": round(counters.ws_messages / dur, 3),
+            "candles_live": counters.candles_live,
+            "candles_live_per_s": round(counters.candles_live / dur, 3),
+            "candles_catchup": counters.candles_catchup,
+            "forming": counters.forming,
+            "gaps_server": counters.gaps_server,
+            "gaps_client": counters.gaps_client,
+            "resyncs": counters.resyncs,
+            "server_errors": counters.ws_errors,
+            "connect_ms": _quantiles(counters.connect_ms),
+            "delivery_latency_ms": _quantiles(counters.latency_ms),
+        },
+        "http": {
+            "ok": counters.http_ok,
+            "status_4xx": counters.http_4xx,
+            "status_5xx": counters.http_5xx,
+            "failed": counters.http_failed,
+            "requests_per_s": round((counters.http_ok + counters.http_4xx + counters.http_5xx) / dur, 3),
+            "latency_ms": {name: _quantiles(values) for name, values in sorted(counters.http_ms.items())},
+        },
+        "ingest": {"posted": counters.ingest_posted, "failed": counters.ingest_failed},
+        "errors": dict(sorted(counters.errors.items(), key=lambda kv: -kv[1])[:20]),
+    }
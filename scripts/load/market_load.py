@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+
+def _imports() -> dict[str, Any]:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import load_stats  # noqa: WPS433
+
+    try:
+        import websockets  # noqa: WPS433
+    except Exception as exc:
+        raise SystemExit(f"missing_dependency:websockets:{exc}") from exc
+    return {"stats": load_stats, "websockets": websockets}
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="本地 market WS/HTTP 压测：N 个 WS 客户端 + HTTP 轮询 + 可选 ingest 驱动。")
+    p.add_argument("--base", default="http://127.0.0.1:8000", help="后端地址，仅允许 loopback（默认 http://127.0.0.1:8000）。")
+    p.add_argument("--clients", type=int, default=200, help="WS 客户端数（默认 200）。")
+    p.add_argument("--connect-concurrency", type=int, default=100, help="并发建连上限（默认 100）。")
+    p.add_argument("--series", default="", help="逗号分隔的 series_id；为空则按 --series-count/--series-template 生成。")
+    p.add_argument("--series-count", type=int, default=20, help="生成的 series 数（默认 20）。")
+    p.add_argument("--series-template", default="binance:futures:LOAD{i:03d}/USDT:1m", help="生成 series_id 的模板。")
+    p.add_argument("--subs-per-client", type=int, default=1, help="每个客户端订阅的 series 数（默认 1）。")
+    p.add_argument("--distribution", choices=("uniform", "zipf", "hot"), default="uniform", help="订阅分布（默认 uniform）。")
+    p.add_argument("--zipf-s", type=float, default=1.1, help="zipf 指数（默认 1.1）。")
+    p.add_argument("--hot-fraction", type=float, default=0.5, help="hot 分布下第一个 series 的订阅占比（默认 0.5）。")
+    p.add_argument("--since-lag", type=int, default=0, help=">0 时订阅带 since=now-lag*tf 触发 catchup（默认 0 = 只收实时）。")
+    p.add_argument("--no-resync", action="store_true", help="收到 gap 时不重新订阅补拉。")
+    p.add_argument("--http-pollers", type=int, default=10, help="HTTP 轮询协程数（默认 10）。")
+    p.add_argument("--http-interval-s", type=float, default=1.0, help="每个轮询协程的请求间隔（默认 1.0）。")
+    p.add_argument("--world-ratio", type=float, default=0.5, help="HTTP 请求中 /api/frame/live 的占比，其余为 /api/market/candles。")
+    p.add_argument("--window-candles", type=int, default=500, help="HTTP 请求的窗口/limit（默认 500）。")
+    p.add_argument("--ingest-hz", type=float, default=0.0, help=">0 时以该频率 POST candle_closed 驱动写链路（默认 0）。")
+    p.add_argument("--duration-s", type=float, default=30.0, help="压测时长（默认 30）。")
+    p.add_argument("--seed", type=int, default=7, help="订阅分布随机种子（默认 7）。")
+    p.add_argument("--max-p99-ms", type=float, default=0.0, help="投递 p99 上限，超出退出码 1（默认 0 = 不检查）。")
+    p.add_argument("--max-error-rate", type=float, default=0.01, help="(连接失败+WS error+HTTP 5xx)/请求 上限（默认 0.01）。")
+    p.add_argument("--json-out", default="", help="summary JSON 输出路径；为空则打印到 stdout。")
+    return p.parse_args(argv)
+
+
+class _LoadRun:
+    def __init__(self, *, args: argparse.Namespace, mods: dict[str, Any], series_ids: list[str]) -> None:
+        self.args = args
+        self.stats = mods["stats"]
+        self.websockets = mods["websockets"]
+        self.series_ids = series_ids
+        self.counters = self.stats.LoadCounters()
+        self.stop = asyncio.Event()
+        self.base = str(args.base).rstrip("/")
+        self.ws_url = self.base.replace("http", "ws", 1) + "/ws/market"
+        self.posted_at: dict[tuple[str, int], float] = {}
+        self.tf_s = {sid: self.stats.timeframe_seconds_of(sid) for sid in series_ids}
+
+    def _subscribe_msg(self, series_id: str, since: int | None) -> str:
+        msg: dict[str, Any] = {"type": "subscribe", "series_id": series_id, "supports_batch": True}
+        if since is not None:
+            msg["since"] = int(since)
+        return json.dumps(msg, separators=(",", ":"))
+
+    def _initial_since(self, series_id: str) -> int | None:
+        lag = int(self.args.since_lag)
+        if lag <= 0:
+            return None
+        tf = self.tf_s[series_id]
+        return (int(time.time()) // tf - lag) * tf
+
+    def _on_closed(self, *, series_id: str, candle_time: int, last: dict[str, int], subscribed_at: float) -> bool:
+        """Returns True when a client-side gap was detected (caller resyncs)."""
+        c = self.counters
+        tf = self.tf_s.get(series_id, 60)
+        prev = last.get(series_id)
+        gap = prev is not None and candle_time > prev + tf
+        if prev is None or candle_time > prev:
+            last[series_id] = candle_time
+        origin = self.posted_at.get((series_id, candle_time))
+        if origin is None and candle_time + tf >= subscribed_at:
+            origin = float(candle_time + tf)
+        if origin is None:
+            c.candles_catchup += 1
+        else:
+            c.candles_live += 1
+            c.latency_ms.append(max(0.0, (time.time() - origin) * 1000.0))
+        if gap:
+            c.gaps_client += 1
+        return gap
+
+    async def _handle(self, ws: Any, payload: dict, *, last: dict[str, int], subscribed_at: float) -> None:
+        c = self.counters
+        kind = str(payload.get("type") or "")
+        sid = str(payload.get("series_id") or "")
+        resync_since: int | None = None
+        if kind == "candle_closed":
+            ct = int((payload.get("candle") or {}).get("candle_time") or 0)
+            if self._on_closed(series_id=sid, candle_time=ct, last=last, subscribed_at=subscribed_at):
+                resync_since = last.get(sid)
+        elif kind == "candles_batch":
+            times = [int((item or {}).get("candle_time") or 0) for item in payload.get("candles") or []]
+            c.candles_catchup += len(times)
+            if times:
+                last[sid] = max(max(times), int(last.get(sid, 0)))
+        elif kind == "candle_forming":
+            c.forming += 1
+        elif kind == "gap":
+            c.gaps_server += 1
+            resync_since = last.get(sid)
+        elif kind == "error":
+            c.ws_errors += 1
+            c.error(f"ws:{payload.get('code')}")
+        if resync_since is not None and not self.args.no_resync:
+            c.resyncs += 1
+            await ws.send(self._subscribe_msg(sid, resync_since))
+
+    async def ws_client(self, subs: list[str], sem: asyncio.Semaphore) -> None:
+        c = self.counters
+        started = time.perf_counter()
+        try:
+            async with sem:
+                ws = await self.websockets.connect(self.ws_url, max_queue=256, ping_interval=20, close_timeout=2)
+                for sid in subs:
+                    await ws.send(self._subscribe_msg(sid, self._initial_since(sid)))
+        except Exception as exc:
+            c.ws_connect_failed += 1
+            c.error(f"connect:{type(exc).__name__}")
+            return
+        c.ws_connect_ok += 1
+        c.connect_ms.append((time.perf_counter() - started) * 1000.0)
+        subscribed_at = time.time()
+        last: dict[str, int] = {}
+        try:
+            while not self.stop.is_set():
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                c.ws_messages += 1
+                await self._handle(ws, json.loads(raw), last=last, subscribed_at=subscribed_at)
+        except Exception as exc:
+            if not self.stop.is_set():
+                c.ws_disconnects += 1
+                c.error(f"ws_closed:{type(exc).__name__}")
+        finally:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+    def _http_get(self, url: str) -> int:
+        try:
+            with urllib.request.urlopen(url, timeout=10.0) as resp:
+                resp.read()
+                return int(resp.status)
+        except urllib.error.HTTPError as exc:
+            return int(exc.code)
+
+    async def _request(self, name: str, url: str) -> None:
+        c = self.counters
+        t0 = time.perf_counter()
+        try:
+            status = await asyncio.to_thread(self._http_get, url)
+        except Exception as exc:
+            c.http_failed += 1
+            c.error(f"http:{name}:{type(exc).__name__}")
+            return
+        c.http_ms.setdefault(name, []).append((time.perf_counter() - t0) * 1000.0)
+        if status >= 500:
+            c.http_5xx += 1
+            c.error(f"http:{name}:{status}")
+        elif status >= 400:
+            c.http_4xx += 1
+        else:
+            c.http_ok += 1
+
+    async def http_poller(self, idx: int) -> None:
+        n = 0
+        window = int(self.args.window_candles)
+        while not self.stop.is_set():
+            sid = self.series_ids[(idx + n) % len(self.series_ids)]
+            q = urllib.parse.quote(sid, safe="")
+            if (n * 0.618 + idx * 0.31) % 1.0 < float(self.args.world_ratio):
+                await self._request("frame_live", f"{self.base}/api/frame/live?series_id={q}&window_candles={window}")
+            else:
+                await self._request("candles", f"{self.base}/api/market/candles?series_id={q}&limit={window}")
+            n += 1
+            try:
+                await asyncio.wait_for(self.stop.wait(), timeout=float(self.args.http_interval_s))
+            except asyncio.TimeoutError:
+                pass
+
+    def _post_closed(self, series_id: str, candle_time: int) -> int:
+        price = 100.0 + float(candle_time % 997) / 100.0
+        body = {
+            "series_id": series_id,
+            "candle": {"candle_time": candle_time, "open": price, "high": price + 1, "low": price - 1, "close": price, "volume": 1.0},
+        }
+        req = urllib.request.Request(
+            f"{self.base}/api/market/ingest/candle_closed",
+            data=json.dumps(body).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=10.0) as resp:
+                resp.read()
+                return int(resp.status)
+        except urllib.error.HTTPError as exc:
+            return int(exc.code)
+
+    async def ingest_driver(self) -> None:
+        c = self.counters
+        hz = float(self.args.ingest_hz)
+        per_series = int(float(self.args.duration_s) * hz / len(self.series_ids)) + 2
+        next_time = {sid: (int(time.time()) // tf - per_series) * tf for sid, tf in self.tf_s.items()}
+        n = 0
+        while not self.stop.is_set():
+            sid = self.series_ids[n % len(self.series_ids)]
+            ct = next_time[sid]
+            next_time[sid] = ct + self.tf_s[sid]
+            self.posted_at[(sid, ct)] = time.time()
+            try:
+                status = await asyncio.to_thread(self._post_closed, sid, ct)
+            except Exception as exc:
+                status = 0
+                c.error(f"ingest:{type(exc).__name__}")
+            if status == 200:
+                c.ingest_posted += 1
+            else:
+                c.ingest_failed += 1
+                c.error(f"ingest:{status}")
+            n += 1
+            try:
+                await asyncio.wait_for(self.stop.wait(), timeout=1.0 / hz)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, assignments: list[list[str]]) -> float:
+        sem = asyncio.Semaphore(max(1, int(self.args.connect_concurrency)))
+        t0 = time.perf_counter()
+        tasks = [asyncio.create_task(self.ws_client(subs, sem)) for subs in assignments]
+        tasks += [asyncio.create_task(self.http_poller(i)) for i in range(max(0, int(self.args.http_pollers)))]
+        if float(self.args.ingest_hz) > 0:
+            tasks.append(asyncio.create_task(self.ingest_driver()))
+        await asyncio.sleep(max(0.0, float(self.args.duration_s)))
+        self.stop.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return time.perf_counter() - t0
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    mods = _imports()
+    stats = mods["stats"]
+    if not stats.is_local_url(args.base):
+        print(f"refusing non-local target: {args.base} (only loopback hosts are allowed)", file=sys.stderr)
+        return 2
+    explicit = [s for s in str(args.series).split(",") if s.strip()]
+    series_ids = stats.build_series_ids(explicit=explicit, count=args.series_count, template=args.series_template)
+    assignments = stats.assign_subscriptions(
+        clients=int(args.clients),
+        series_ids=series_ids,
+        subs_per_client=int(args.subs_per_client),
+        distribution=str(args.distribution),
+        seed=int(args.seed),
+        zipf_s=float(args.zipf_s),
+        hot_fraction=float(args.hot_fraction),
+    )
+    runner = _LoadRun(args=args, mods=mods, series_ids=series_ids)
+    duration = asyncio.run(runner.run(assignments))
+    config = {k: v for k, v in vars(args).items() if k != "json_out"}
+    config["series_ids"] = len(series_ids)
+    summary = stats.summarize(runner.counters, duration_s=duration, config=config)
+
+    c = runner.counters
+    attempts = max(1, int(args.clients) + c.http_ok + c.http_4xx + c.http_5xx + c.http_failed)
+    error_rate = float(c.ws_connect_failed + c.ws_errors + c.http_5xx) / float(attempts)
+    p99 = summary["ws"]["delivery_latency_ms"]["p99"]
+    failures: list[str] = []
+    if error_rate > float(args.max_error_rate):
+        failures.append(f"error_rate={error_rate:.4f}>{args.max_error_rate}")
+    if float(args.max_p99_ms) > 0 and p99 is not None and float(p99) > float(args.max_p99_ms):
+        failures.append(f"p99={p99:.1f}ms>{args.max_p99_ms}")
+    summary["error_rate"] = round(error_rate, 6)
+    summary["gate_failures"] = failures
+
+    text = json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.json_out:
+        Path(args.json_out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    ws = summary["ws"]
+    print(
+        f"[market_load] connected={ws['connected']}/{args.clients} live={ws['candles_live']} "
+        f"p50={ws['delivery_latency_ms']['p50']} p99={p99} gaps={ws['gaps_server']}+{ws['gaps_client']} "
+        f"resyncs={ws['resyncs']} errors={c.ws_errors}+{c.http_5xx}",
+        file=sys.stderr,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+
+LOAD_DIR = Path(__file__).resolve().parents[1] / "scripts" / "load"
+sys.path.insert(0, str(LOAD_DIR))
+
+import load_stats  # noqa: E402
+
+
+class MarketLoadCliTests(unittest.TestCase):
+    def test_refuses_non_local_target(self) -> None:
+        proc = subprocess.run(
+            [sys.executable, str(LOAD_DIR / "market_load.py"), "--base", "http://10.1.2.3:8000", "--duration-s", "0"],
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+        self.assertEqual(proc.returncode, 2, proc.stderr)
+        self.assertIn("refusing non-local target", proc.stderr)
+
+    def test_is_local_url(self) -> None:
+        self.assertTrue(load_stats.is_local_url("http://127.0.0.1:8000"))
+        self.assertTrue(load_stats.is_local_url("http://localhost:8000"))
+        self.assertTrue(load_stats.is_local_url("http://[::1]:8000"))
+        self.assertFalse(load_stats.is_local_url("http://example.com"))
+        self.assertFalse(load_stats.is_local_url("http://192.168.1.10:8000"))
+
+    def test_uniform_assignment_spreads_evenly(self) -> None:
+        series = load_stats.build_series_ids(explicit=[], count=200, template="binance:futures:S{i:03d}/USDT:1m")
+        subs = load_stats.assign_subscriptions(
+            clients=2000, series_ids=series, subs_per_client=1, distribution="uniform", seed=1
+        )
+        per_series = Counter(sid for client in subs for sid in client)
+        self.assertEqual(len(per_series), 200)
+        self.assertEqual(set(per_series.values()), {10})
+
+    def test_weighted_assignment_is_deterministic_and_skewed(self) -> None:
+        series = [f"binance:spot:S{i}/USDT:1m" for i in range(20)]
+        kwargs = dict(clients=500, series_ids=series, subs_per_client=3, distribution="zipf", seed=5)
+        first = load_stats.assign_subscriptions(**kwargs)
+        self.assertEqual(first, load_stats.assign_subscriptions(**kwargs))
+        self.assertTrue(all(len(set(client)) == 3 for client in first))
+        counts = Counter(sid for client in first for sid in client)
+        self.assertGreater(counts[series[0]], counts[series[-1]])
+
+        hot = load_stats.assign_subscriptions(
+            clients=1000, series_ids=series, subs_per_client=1, distribution="hot", seed=5, hot_fraction=0.8
+        )
+        hot_share = sum(1 for client in hot if client[0] == series[0]) / 1000.0
+        self.assertGreater(hot_share, 0.7)
+
+    def test_summary_reports_percentiles_and_rates(self) -> None:
+        counters = load_stats.LoadCounters(ws_messages=100, candles_live=50, gaps_server=2, resyncs=2)
+        counters.latency_ms.extend(float(i) for i in range(1, 101))
+        summary = load_stats.summarize(counters, duration_s=10.0, config={"clients": 1})
+        latency = summary["ws"]["delivery_latency_ms"]
+        self.assertAlmostEqual(latency["p50"], 50.5)
+        self.assertAlmostEqual(latency["p99"], 99.01)
+        self.assertEqual(summary["ws"]["messages_per_s"], 10.0)
+        self.assertEqual(summary["ws"]["gaps_server"], 2)
+        self.assertEqual(load_stats.timeframe_seconds_of("binance:spot:BTC/USDT:4h"), 14400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class PerfBenchCliTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.tmpdir.name)
+        self.script_path = Path(__file__).resolve().parents[1] / "scripts" / "bench" / "run_benchmarks.py"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(self.script_path), "--scale", "quick", "--repeat", "1", *args],
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+    def test_quick_run_writes_report_and_baseline(self) -> None:
+        baseline = self.out_dir / "baseline.json"
+        proc = self._run(
+            "--cases",
+            "candle.upsert_many,hub.fanout",
+            "--baseline",
+            str(baseline),
+            "--write-baseline",
+            "--json-out",
+            str(self.out_dir / "out.json"),
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+        report = json.loads((self.out_dir / "out.json").read_text(encoding="utf-8"))
+        self.assertEqual(report["schema"], "trade_canvas.bench.v1")
+        self.assertEqual(report["scale"], "quick")
+        self.assertEqual(sorted(report["cases"]), ["candle.upsert_many", "hub.fanout"])
+        hub = report["cases"]["hub.fanout"]
+        self.assertEqual(hub["ops"], 50 * 20)
+        self.assertGreater(hub["per_op_us"]["median"], 0.0)
+        self.assertEqual(json.loads(baseline.read_text(encoding="utf-8"))["cases"].keys(), report["cases"].keys())
+
+    def test_regression_against_baseline_exits_nonzero(self) -> None:
+        baseline = self.out_dir / "baseline.json"
+        proc = self._run("--cases", "candle.upsert_many", "--baseline", str(baseline), "--write-baseline")
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+        data = json.loads(baseline.read_text(encoding="utf-8"))
+        data["cases"]["candle.upsert_many"]["per_op_us"]["median"] = 1e-6
+        baseline.write_text(json.dumps(data), encoding="utf-8")
+
+        proc = self._run("--cases", "candle.upsert_many", "--baseline", str(baseline))
+        self.assertEqual(proc.returncode, 1, proc.stderr)
+        self.assertIn("regressed: candle.upsert_many", proc.stderr)
+        report = json.loads(proc.stdout)
+        self.assertEqual(report["comparison"]["cases"][0]["status"], "regressed")
+
+        relaxed = self._run("--cases", "candle.upsert_many", "--baseline", str(baseline), "--threshold", "candle.upsert_many=1e12")
+        self.assertEqual(relaxed.returncode, 0, relaxed.stderr)
+
+    def test_quick_scale_against_default_full_baseline_skips_comparison(self) -> None:
+        proc = self._run("--cases", "hub.fanout")
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIn("skipping baseline comparison (scale mismatch: current=quick baseline=full)", proc.stderr)
+        report = json.loads(proc.stdout)
+        self.assertIn("scale mismatch", report["comparison"]["skipped"])
+
+    def test_unknown_case_is_rejected(self) -> None:
+        proc = self._run("--cases", "nope.case", "--baseline", str(self.out_dir / "none.json"))
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("unknown bench case", proc.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import math
+import tempfile
+import unittest
+from pathlib import Path
+
+from trade_canvas.kernel import SmaCrossKernel
+from trade_canvas.store import KernelStore
+from trade_canvas.types import CandleClosed
+
+SYMBOL = "BTC/USDT"
+TIMEFRAME = "1m"
+
+
+def _candles(count: int) -> list[CandleClosed]:
+    out: list[CandleClosed] = []
+    for i in range(count):
+        close = 100.0 + 7.0 * math.sin(i / 6.0) + 2.5 * math.sin(i / 1.7) + 0.013 * i
+        out.append(CandleClosed(SYMBOL, TIMEFRAME, 60 * (i + 1), close, close, close, close, 1.0))
+    return out
+
+
+def _reference_smas(closes: list[float], size: int) -> list[float | None]:
+    """The original list + pop(0) running sum, kept here as the bit-exact reference."""
+    window: list[float] = []
+    total = 0.0
+    out: list[float | None] = []
+    for value in closes:
+        window.append(value)
+        total += value
+        if len(window) > size:
+            total -= window.pop(0)
+        out.append(total / size if len(window) == size else None)
+    return out
+
+
+class SmaCrossKernelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _store(self, name: str) -> tuple[KernelStore, object]:
+        store = KernelStore(self.root / name)
+        return store, store.connect()
+
+    def test_run_batch_matches_apply_closed(self) -> None:
+        candles = _candles(400)
+        store_a, conn_a = self._store("apply.db")
+        kernel_a = SmaCrossKernel(store_a, fast=3, slow=8)
+        results = [kernel_a.apply_closed(conn_a, candle) for candle in candles]
+        kernel_a.checkpoint(conn_a)
+
+        store_b, conn_b = self._store("batch.db")
+        batch = SmaCrossKernel(store_b, fast=3, slow=8).run_batch(conn_b, candles)
+
+        self.assertEqual(batch.sma_fast, [r.ledger["features"]["sma_3"] for r in results])
+        self.assertEqual(batch.sma_slow, [r.ledger["features"]["sma_8"] for r in results])
+        self.assertEqual(batch.open_long, [r.ledger["signal"] is not None for r in results])
+        self.assertEqual(batch.overlay_events, [e for r in results for e in r.overlay_events])
+        self.assertGreaterEqual(sum(batch.open_long), 3)
+        self.assertEqual(
+            store_a.get_latest_ledger(conn_a, symbol=SYMBOL, timeframe=TIMEFRAME),
+            store_b.get_latest_ledger(conn_b, symbol=SYMBOL, timeframe=TIMEFRAME),
+        )
+        query = {"symbol": SYMBOL, "timeframe": TIMEFRAME, "feature_keys": ["sma_3", "sma_8"], "since_time": None}
+        self.assertEqual(
+            store_a.get_plot_points_since_time(conn_a, **query),
+            store_b.get_plot_points_since_time(conn_b, **query),
+        )
+        state_key = f"sma_cross_v1:3:8:{SYMBOL}:{TIMEFRAME}"
+        self.assertEqual(store_a.load_state(conn_a, key=state_key), store_b.load_state(conn_b, key=state_key))
+
+    def test_ring_buffer_is_bit_identical_to_list_window(self) -> None:
+        candles = _candles(1000)
+        store, conn = self._store("ring.db")
+        batch = SmaCrossKernel(store, fast=5, slow=20).run_batch(conn, candles)
+        closes = [c.close for c in candles]
+        self.assertEqual(batch.sma_fast, _reference_smas(closes, 5))
+        self.assertEqual(batch.sma_slow, _reference_smas(closes, 20))
+
+    def test_state_is_saved_with_every_ledger_commit_and_resumes(self) -> None:
+        candles = _candles(60)
+        store, conn = self._store("ckpt.db")
+        state_key = f"sma_cross_v1:5:20:{SYMBOL}:{TIMEFRAME}"
+        kernel = SmaCrossKernel(store)
+        for candle in candles[:30]:
+            kernel.apply_closed(conn, candle)
+            latest = store.get_latest_ledger(conn, symbol=SYMBOL, timeframe=TIMEFRAME)
+            self.assertEqual(latest.candle_time, candle.open_time)
+            self.assertEqual(store.load_state(conn, key=state_key)["fast_window"][-1], candle.close)
+        self.assertEqual(kernel.checkpoint(conn), 0)
+
+        # A fresh kernel (as after a crash) resumes from the state matching the latest ledger.
+        resumed = SmaCrossKernel(store).run_batch(conn, candles[30:])
+        full_store, full_conn = self._store("full.db")
+        full = SmaCrossKernel(full_store).run_batch(full_conn, candles)
+        self.assertEqual(resumed.sma_fast, full.sma_fast[30:])
+        self.assertEqual(resumed.open_long, full.open_long[30:])
+
+if __name__ == "__main__":
+    unittest.main()
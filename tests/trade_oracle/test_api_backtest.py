@@ -13,7 +13,7 @@ client = TestClient(app)
 def test_backtest_api_returns_metrics(monkeypatch):
     monkeypatch.setenv("TRADE_ORACLE_ENABLE_BACKTEST", "1")
 
-    def fake_run(self, *, series_id: str, symbol: str = "BTC") -> dict:
+    def fake_run(self, *, series_id: str, symbol: str = "BTC", workers: int = 1) -> dict:
         return {
             "series_id": series_id,
             "symbol": symbol,
@@ -47,7 +47,7 @@ def test_backtest_api_returns_metrics(monkeypatch):
 def test_backtest_api_market_unavailable(monkeypatch):
     monkeypatch.setenv("TRADE_ORACLE_ENABLE_BACKTEST", "1")
 
-    def fake_run(self, *, series_id: str, symbol: str = "BTC") -> dict:
+    def fake_run(self, *, series_id: str, symbol: str = "BTC", workers: int = 1) -> dict:
         raise MarketSourceUnavailableError("market_api_unreachable")
 
     monkeypatch.setattr(OracleService, "run_market_backtest", fake_run)
@@ -60,7 +60,7 @@ def test_backtest_api_market_unavailable(monkeypatch):
 def test_backtest_api_market_5xx_maps_to_503(monkeypatch):
     monkeypatch.setenv("TRADE_ORACLE_ENABLE_BACKTEST", "1")
 
-    def fake_run(self, *, series_id: str, symbol: str = "BTC") -> dict:
+    def fake_run(self, *, series_id: str, symbol: str = "BTC", workers: int = 1) -> dict:
         raise MarketResponseError("http_status=502")
 
     monkeypatch.setattr(OracleService, "run_market_backtest", fake_run)
@@ -68,3 +68,18 @@ def test_backtest_api_market_5xx_maps_to_503(monkeypatch):
     resp = client.get("/api/oracle/backtest/run")
     assert resp.status_code == 503
     assert "market_source_unavailable" in resp.json()["detail"]
+
+
+def test_backtest_api_forwards_worker_count(monkeypatch):
+    monkeypatch.setenv("TRADE_ORACLE_ENABLE_BACKTEST", "1")
+    seen: list[int] = []
+
+    def fake_run(self, *, series_id: str, symbol: str = "BTC", workers: int = 1) -> dict:
+        seen.append(workers)
+        return {"series_id": series_id, "symbol": symbol, "metrics": {"trades": 3}, "passed": False}
+
+    monkeypatch.setattr(OracleService, "run_market_backtest", fake_run)
+
+    assert client.get("/api/oracle/backtest/run", params={"workers": 4}).status_code == 200
+    assert client.get("/api/oracle/backtest/run", params={"workers": 0}).status_code == 422
+    assert seen == [4]
@@ -4,7 +4,8 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-from trade_oracle.models import BaziSnapshot, GanzhiPillar
+from trade_oracle.models import BaziSnapshot, Candle, GanzhiPillar
+from trade_oracle.packages.calendar_engine.service import CalendarService
 from trade_oracle.packages.research_engine.backtest import run_layer_segment_backtest, run_walk_forward_backtest
 
 
@@ -82,3 +83,24 @@ def test_run_layer_segment_backtest_has_segments_and_layers():
     assert set(result["layer_performance"].keys()) == {"year", "month", "day"}
     assert len(result["time_segments"]) == 3
     assert all("strategy" in seg for seg in result["time_segments"])
+
+
+def test_run_walk_forward_backtest_parallel_matches_sequential():
+    rows = json.loads(Path("trade_oracle/fixtures/btc_1d_mock_120.json").read_text(encoding="utf-8"))
+    candles = [Candle(**r) for r in rows]
+    natal = BaziSnapshot(
+        source="fake",
+        dt_utc=datetime(2009, 1, 3, 16, 15, 0, tzinfo=timezone.utc),
+        year=GanzhiPillar("戊", "子"),
+        month=GanzhiPillar("甲", "子"),
+        day=GanzhiPillar("戊", "申"),
+        hour=GanzhiPillar("辛", "酉"),
+    )
+    calendar = CalendarService(strict_calendar_lib=False)
+    kwargs = dict(candles=candles, natal=natal, calendar=calendar, train_size=30, test_size=10)
+
+    sequential = run_walk_forward_backtest(**kwargs, workers=1)
+    parallel = run_walk_forward_backtest(**kwargs, workers=3, max_workers=3)
+
+    assert sequential.windows == 9
+    assert parallel == sequential
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+
+from trade_oracle.models import BaziSnapshot, GanzhiPillar
+from trade_oracle.packages.bazi_factors.rules import score_factors
+from trade_oracle.packages.research_engine.bar_series import build_bar_series, sweep_returns
+
+STEMS = "甲乙丙丁戊己庚辛壬癸"
+BRANCHES = "子丑寅卯辰巳午未申酉戌亥"
+
+
+def _pillar(k: int) -> GanzhiPillar:
+    return GanzhiPillar(STEMS[k % 10], BRANCHES[k % 12])
+
+
+class _RollingCalendar:
+    def convert_utc(self, dt_utc: datetime) -> BaziSnapshot:
+        day = int(dt_utc.timestamp()) // 86400
+        return BaziSnapshot(
+            source="fake",
+            dt_utc=dt_utc.astimezone(timezone.utc),
+            year=_pillar(day // 365),
+            month=_pillar(day // 30),
+            day=_pillar(day),
+            hour=_pillar(int(dt_utc.timestamp()) // 7200),
+        )
+
+
+class CandleObj:
+    def __init__(self, candle_time: int, close: float):
+        self.candle_time = candle_time
+        self.close = close
+
+
+NATAL = BaziSnapshot(
+    source="fake",
+    dt_utc=datetime(2009, 1, 3, 18, 15, 5, tzinfo=timezone.utc),
+    year=_pillar(0),
+    month=_pillar(1),
+    day=_pillar(2),
+    hour=_pillar(3),
+)
+
+
+def _reference_returns(*, closes, scores, threshold, start_idx, end_idx, fee_rate) -> list[float]:
+    """The original per-threshold loop, kept here as the reference."""
+    out: list[float] = []
+    if end_idx - start_idx < 2:
+        return out
+    for idx in range(start_idx, end_idx - 1):
+        close_now = closes[idx]
+        close_next = closes[idx + 1]
+        if close_now <= 0:
+            continue
+        signal = 0
+        if scores[idx] > threshold:
+            signal = 1
+        elif scores[idx] < -threshold:
+            signal = -1
+        if signal == 0:
+            continue
+        out.append(signal * ((close_next - close_now) / close_now) - fee_rate)
+    return out
+
+
+def _fixture_candles() -> list[CandleObj]:
+    rows = json.loads(Path("trade_oracle/fixtures/btc_1d_mock_120.json").read_text(encoding="utf-8"))
+    candles = [CandleObj(int(r["candle_time"]), float(r["close"])) for r in rows]
+    candles[7].close = 0.0
+    return candles
+
+
+def test_bar_series_scores_match_per_candle_scoring():
+    candles = _fixture_candles()
+    calendar = _RollingCalendar()
+    bars = build_bar_series(candles=candles, natal=NATAL, calendar=calendar, fee_rate=0.0008)
+    for idx, candle in enumerate(candles):
+        transit = calendar.convert_utc(datetime.fromtimestamp(candle.candle_time, tz=timezone.utc))
+        bundle = score_factors(natal=NATAL, transit=transit)
+        assert bars.total_scores[idx] == bundle.total
+        assert {layer: scores[idx] for layer, scores in bars.layer_scores.items()} == bundle.layer_scores
+    assert bars.long_net[7] is None and bars.long_net[-1] is None
+
+
+def test_sweep_returns_matches_per_threshold_loop():
+    candles = _fixture_candles()
+    bars = build_bar_series(candles=candles, natal=NATAL, calendar=_RollingCalendar(), fee_rate=0.0008)
+    rng = random.Random(7)
+    noisy = [s + rng.uniform(-1.5, 1.5) for s in bars.total_scores]
+    thresholds = [1.2, 0.4, -0.3, 0.8, 0.4, 0.0, 1.4]
+    for scores in (bars.total_scores, noisy, bars.layer_scores["day"]):
+        for start_idx, end_idx in ((0, len(candles)), (5, 64), (30, 31), (40, 40)):
+            swept = sweep_returns(
+                bars=bars, scores=scores, thresholds=thresholds, start_idx=start_idx, end_idx=end_idx
+            )
+            for th, got in zip(thresholds, swept):
+                want = _reference_returns(
+                    closes=bars.closes,
+                    scores=scores,
+                    threshold=th,
+                    start_idx=start_idx,
+                    end_idx=end_idx,
+                    fee_rate=0.0008,
+                )
+                assert got == want
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+from trade_oracle.models import BaziSnapshot, GanzhiPillar
+from trade_oracle.packages.calendar_engine.base import CalendarProvider
+from trade_oracle.packages.calendar_engine.service import CalendarService
+
+SPLIT_AT = datetime(2024, 3, 5, 10, 30, tzinfo=timezone.utc)
+
+
+class _CountingProvider(CalendarProvider):
+    """Wraps a provider and counts true-local conversions."""
+
+    def __init__(self, inner: CalendarProvider) -> None:
+        super().__init__(name=inner.name)
+        self._inner = inner
+        self.calls = 0
+
+    def convert_true_local(self, true_local: datetime, *, dt_utc: datetime) -> BaziSnapshot:
+        self.calls += 1
+        return self._inner.convert_true_local(true_local, dt_utc=dt_utc)
+
+
+class _TermProvider(CalendarProvider):
+    """Month pillar flips mid-bucket at SPLIT_AT (true-local clock), like an exact solar-term boundary."""
+
+    def __init__(self) -> None:
+        super().__init__(name="term")
+
+    def convert_true_local(self, true_local: datetime, *, dt_utc: datetime) -> BaziSnapshot:
+        month = GanzhiPillar("丁", "卯") if true_local >= SPLIT_AT else GanzhiPillar("丙", "寅")
+        pillar = GanzhiPillar("甲", "子")
+        return BaziSnapshot(source="term", dt_utc=dt_utc, year=pillar, month=month, day=pillar, hour=pillar)
+
+
+def _with_providers(calendar: CalendarService, primary: CalendarProvider, secondary: CalendarProvider | None = None):
+    object.__setattr__(calendar, "_primary", primary)
+    if secondary is not None:
+        object.__setattr__(calendar, "_secondary", secondary)
+    return calendar
+
+
+def _direct(calendar: CalendarService, dt_utc: datetime) -> BaziSnapshot:
+    primary = calendar._primary.convert_utc(dt_utc)
+    secondary = calendar._secondary.convert_utc(dt_utc)
+    if CalendarService._same_bazi(primary, secondary):
+        return primary
+    return replace(primary, source=f"{primary.source}|crosscheck_mismatch:{secondary.source}")
+
+
+def test_cached_conversion_matches_direct_providers():
+    calendar = CalendarService(enable_crosscheck=True)
+    rng = random.Random(5)
+    base = datetime(2024, 1, 28, tzinfo=timezone.utc)
+    # Dense through 立春 and a few midnights, then scattered over the year.
+    samples = [base + timedelta(minutes=37 * i) for i in range(60)]
+    samples += [base + timedelta(seconds=rng.randrange(0, 86400 * 365)) for _ in range(40)]
+    for dt_utc in samples:
+        assert calendar.convert_utc(dt_utc) == _direct(calendar, dt_utc)
+
+
+def test_bucket_is_verified_once_including_crosscheck():
+    calendar = CalendarService(enable_crosscheck=True)
+    primary = _CountingProvider(calendar._primary)
+    secondary = _CountingProvider(calendar._secondary)
+    _with_providers(calendar, primary, secondary)
+
+    start = datetime(2024, 6, 1, 9, 30, tzinfo=timezone.utc)
+    first = calendar.convert_utc(start)
+    assert (primary.calls, secondary.calls) == (2, 2)
+    # True-local 11:12..11:51 (Helsinki longitude), all inside the 午 block.
+    for minute in range(1, 40):
+        snapshot = calendar.convert_utc(start + timedelta(minutes=minute))
+        assert snapshot.hour == first.hour and snapshot.source == first.source
+    assert (primary.calls, secondary.calls) == (2, 2)
+    assert calendar.cached_buckets() == 1
+
+
+def test_bucket_split_by_boundary_is_converted_directly():
+    calendar = _with_providers(CalendarService(enable_true_solar_time=False), _TermProvider())
+    before = calendar.convert_utc(SPLIT_AT - timedelta(minutes=10))
+    after = calendar.convert_utc(SPLIT_AT + timedelta(minutes=10))
+    assert before.month.text == "丙寅" and after.month.text == "丁卯"
+    assert calendar.cached_buckets() == 1
+    assert next(iter(calendar._buckets.values())) is None
+
+
+def test_precomputed_table_round_trip(tmp_path):
+    path = tmp_path / "pillars.json"
+    calendar = _with_providers(CalendarService(enable_true_solar_time=False), _TermProvider())
+    assert calendar.precompute(start_year=2024, end_year=2024) == 366 * 13
+    calendar.save_table(path)
+
+    counting = _CountingProvider(_TermProvider())
+    loaded = _with_providers(CalendarService(enable_true_solar_time=False, table_path=str(path)), counting)
+    assert loaded.cached_buckets() == 366 * 13 - 1
+    dt_utc = datetime(2024, 8, 8, 8, 8, tzinfo=timezone.utc)
+    assert loaded.convert_utc(dt_utc) == calendar.convert_utc(dt_utc)
+    assert counting.calls == 0
+
+    foreign = CalendarService(enable_true_solar_time=True, table_path=str(path))
+    assert foreign.cached_buckets() == 0
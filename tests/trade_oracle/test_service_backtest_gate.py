@@ -77,3 +77,29 @@ def test_run_market_backtest_pass_flag_false_when_target_not_met():
 
     result = svc.run_market_backtest(series_id="binance:futures:BTC/USDT:1d")
     assert result["passed"] is False
+
+
+def test_run_market_backtest_caps_workers_at_configured_pool_size(monkeypatch):
+    monkeypatch.setenv("TRADE_ORACLE_WF_MAX_WORKERS", "2")
+    seen: list[tuple[int, int]] = []
+    svc = OracleService(_settings())
+    svc.market = _FakeMarket(_mock_candles())
+
+    def _fake_run(**kwargs) -> StrategyMetrics:
+        seen.append((kwargs["workers"], kwargs["max_workers"]))
+        return StrategyMetrics(
+            trades=0,
+            win_rate=0.0,
+            profit_factor=0.0,
+            avg_win=0.0,
+            avg_loss=0.0,
+            expectancy=0.0,
+            reward_risk=0.0,
+            threshold=0.0,
+            windows=0,
+        )
+
+    svc._run_backtest = _fake_run
+    result = svc.run_market_backtest(series_id="binance:futures:BTC/USDT:1d", workers=16)
+    assert seen == [(2, 2)]
+    assert result["settings"]["wf_workers"] == 2
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from trade_oracle.models import Candle
-from trade_oracle.packages.research_engine.walk_forward import build_daily_windows
+from trade_oracle.packages.research_engine import walk_forward
+from trade_oracle.packages.research_engine.walk_forward import build_daily_windows, map_windows
 
 
 def test_build_daily_windows():
@@ -18,3 +19,26 @@ def test_build_daily_windows():
     assert windows[0].test_start == candles[360].candle_time
     assert windows[1].test_end_idx == 539
     assert windows[1].test_end == candles[539].candle_time
+
+
+def _window_span(shared: dict, window) -> tuple[int, int, str]:
+    return (window.train_start_idx, window.test_end_idx, shared["tag"])
+
+
+def test_map_windows_parallel_keeps_window_order():
+    candles = [
+        Candle(candle_time=1700000000 + i * 86400, open=1, high=1, low=1, close=1, volume=1) for i in range(200)
+    ]
+    windows = build_daily_windows(candles, train_size=30, test_size=10)
+
+    sequential = map_windows(_window_span, windows, shared={"tag": "x"}, workers=1)
+    parallel = map_windows(_window_span, windows, shared={"tag": "x"}, workers=3, max_workers=2)
+    again = map_windows(_window_span, windows, shared={"tag": "y"}, workers=2, max_workers=2)
+
+    assert len(windows) == 17
+    assert parallel == sequential
+    assert sequential[0] == (0, 39, "x") and sequential[-1] == (160, 199, "x")
+    assert again[-1] == (160, 199, "y")
+    pool = walk_forward._POOLS[2]
+    assert pool._max_workers == 2
+    assert pool._mp_context.get_start_method() in {"forkserver", "spawn"}
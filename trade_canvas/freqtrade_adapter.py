@@ -30,6 +30,15 @@ def default_strategy_state_path(*, strategy_name: str) -> Path:
     return tmpdir / f"trade_canvas_{strategy_name}_{os.getpid()}.db"
 
 
+def _unix_seconds(dates: Any) -> Any:
+    """`date` column -> int epoch seconds Series (vectorized for datetime64 columns)."""
+    import pandas as pd  # type: ignore
+
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return ((dates - pd.Timestamp(0, tz=dates.dt.tz)) // pd.Timedelta(seconds=1)).astype("int64")
+    return dates.map(_to_unix_seconds).astype("int64")
+
+
 @dataclass(frozen=True)
 class KernelAnnotateResult:
     ok: bool
@@ -96,35 +105,35 @@ def annotate_sma_cross(
         last_time = store.get_latest_candle_time(conn, symbol=pair, timeframe=timeframe)
 
         # Replay in chronological order (freqtrade df is usually ascending, but don't assume).
-        # Keep index order stable for assignments.
-        order = df["date"].map(_to_unix_seconds).sort_values().index
-
-        for idx in order:
-            row = df.loc[idx]
-            open_time = _to_unix_seconds(row["date"])
-            if last_time is not None and open_time <= last_time:
-                continue
-
-            candle = CandleClosed(
+        # Positions (not labels) keep assignments correct even with a duplicated index.
+        times = _unix_seconds(df["date"]).to_numpy()
+        positions = times.argsort(kind="quicksort")
+        if last_time is not None:
+            positions = positions[times[positions] > int(last_time)]
+        columns = [
+            df[name].to_numpy(dtype=float)[positions].tolist() for name in ("open", "high", "low", "close", "volume")
+        ]
+        candles = [
+            CandleClosed(
                 symbol=pair,
                 timeframe=timeframe,
-                open_time=open_time,
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                volume=float(row["volume"]),
+                open_time=int(open_time),
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+                volume=v,
             )
+            for open_time, o, h, lo, c, v in zip(times[positions].tolist(), *columns)
+        ]
+        for candle in candles:
             store.upsert_candle(conn, candle=candle)
-            res = kernel.apply_closed(conn, candle)
-
-            features = res.ledger.get("features", {})
-            df.at[idx, "tc_sma_fast"] = features.get(f"sma_{fast}")
-            df.at[idx, "tc_sma_slow"] = features.get(f"sma_{slow}")
+        res = kernel.run_batch(conn, candles)
 
-            sig = res.ledger.get("signal")
-            if isinstance(sig, dict) and sig.get("type") == "OPEN_LONG":
-                df.at[idx, "tc_open_long"] = 1
+        if candles:
+            df.iloc[positions, df.columns.get_loc("tc_sma_fast")] = pd.Series(res.sma_fast, dtype=object).to_numpy()
+            df.iloc[positions, df.columns.get_loc("tc_sma_slow")] = pd.Series(res.sma_slow, dtype=object).to_numpy()
+            df.iloc[positions, df.columns.get_loc("tc_open_long")] = [int(flag) for flag in res.open_long]
 
         return KernelAnnotateResult(ok=True, reason=None, dataframe=df)
     finally:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 
 from .store import KernelStore
 from .types import CandleClosed
@@ -12,12 +14,86 @@ class KernelResult:
     overlay_events: list[tuple[str, dict]]  # (kind, payload)
 
 
+@dataclass(frozen=True)
+class KernelBatchResult:
+    """Column-wise `run_batch` output: entry i belongs to the i-th input candle."""
+
+    sma_fast: list[float | None] = field(default_factory=list)
+    sma_slow: list[float | None] = field(default_factory=list)
+    open_long: list[bool] = field(default_factory=list)
+    overlay_events: list[tuple[str, dict]] = field(default_factory=list)
+
+
+class _RollingWindow:
+    """Fixed-size ring buffer with a running sum; push is O(1)."""
+
+    __slots__ = ("size", "values", "total")
+
+    def __init__(self, size: int, values: Sequence[float] = (), total: float = 0.0) -> None:
+        self.size = int(size)
+        self.values: deque[float] = deque((float(v) for v in values), maxlen=self.size)
+        self.total = float(total)
+
+    def push(self, value: float) -> float | None:
+        # Same add-then-subtract order as the list version, so the running sum is bit-identical.
+        evicted = self.values[0] if len(self.values) == self.size else None
+        self.values.append(value)
+        self.total += value
+        if evicted is not None:
+            self.total -= evicted
+        return self.total / self.size if len(self.values) == self.size else None
+
+
+class _SmaCrossState:
+    """In-memory state of one series; persisted through `KernelStore` together with its ledger writes."""
+
+    __slots__ = ("fast", "slow", "prev_fast", "prev_slow", "pending")
+
+    def __init__(self, *, fast: int, slow: int, payload: dict[str, Any] | None = None) -> None:
+        payload = payload or {}
+        self.fast = _RollingWindow(fast, payload.get("fast_window") or (), float(payload.get("fast_sum") or 0.0))
+        self.slow = _RollingWindow(slow, payload.get("slow_window") or (), float(payload.get("slow_sum") or 0.0))
+        self.prev_fast: float | None = payload.get("prev_fast")
+        self.prev_slow: float | None = payload.get("prev_slow")
+        self.pending = 0
+
+    def step(self, close: float) -> tuple[float | None, float | None, bool]:
+        """Push one close; returns (fast_sma, slow_sma, crossed_up)."""
+        fast_sma = self.fast.push(close)
+        slow_sma = self.slow.push(close)
+        prev_fast, prev_slow = self.prev_fast, self.prev_slow
+        crossed = (
+            fast_sma is not None
+            and slow_sma is not None
+            and prev_fast is not None
+            and prev_slow is not None
+            and prev_fast <= prev_slow
+            and fast_sma > slow_sma
+        )
+        self.prev_fast = fast_sma
+        self.prev_slow = slow_sma
+        self.pending += 1
+        return fast_sma, slow_sma, crossed
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "fast_sum": self.fast.total,
+            "slow_sum": self.slow.total,
+            "fast_window": list(self.fast.values),
+            "slow_window": list(self.slow.values),
+            "prev_fast": self.prev_fast,
+            "prev_slow": self.prev_slow,
+        }
+
+
 class SmaCrossKernel:
     """
     Minimal, deterministic "factor-kernel" for E2E:
     - Consumes only CandleClosed
-    - Incremental update (rolling SMA)
+    - Incremental update (rolling SMA, O(1) per candle)
     - Produces ledger + overlay marker on signal
+    - State lives in memory and is saved in the same commit as the ledger it produced, so a restart
+      never resumes from a state older than the latest ledger
     """
 
     def __init__(self, store: KernelStore, *, fast: int = 5, slow: int = 20) -> None:
@@ -27,69 +103,51 @@ class SmaCrossKernel:
         self._fast = fast
         self._slow = slow
         self._state_prefix = f"sma_cross_v1:{fast}:{slow}"
+        self._states: dict[str, _SmaCrossState] = {}
 
-    def apply_closed(self, conn, candle: CandleClosed) -> KernelResult:
+    def _state(self, conn, candle: CandleClosed) -> tuple[str, _SmaCrossState]:
         state_key = f"{self._state_prefix}:{candle.symbol}:{candle.timeframe}"
-        state = self._store.load_state(conn, key=state_key) or {
-            "fast_sum": 0.0,
-            "slow_sum": 0.0,
-            "fast_window": [],
-            "slow_window": [],
-            "prev_fast": None,
-            "prev_slow": None,
-        }
-
-        def push(window_key: str, sum_key: str, size: int, value: float) -> None:
-            window = list(state[window_key])
-            total = float(state[sum_key])
-            window.append(value)
-            total += value
-            if len(window) > size:
-                total -= float(window.pop(0))
-            state[window_key] = window
-            state[sum_key] = total
-
-        close = float(candle.close)
-        push("fast_window", "fast_sum", self._fast, close)
-        push("slow_window", "slow_sum", self._slow, close)
-
-        fast_sma = None
-        slow_sma = None
-        if len(state["fast_window"]) == self._fast:
-            fast_sma = float(state["fast_sum"]) / self._fast
-        if len(state["slow_window"]) == self._slow:
-            slow_sma = float(state["slow_sum"]) / self._slow
+        state = self._states.get(state_key)
+        if state is None:
+            payload = self._store.load_state(conn, key=state_key)
+            state = _SmaCrossState(fast=self._fast, slow=self._slow, payload=payload)
+            self._states[state_key] = state
+        return state_key, state
+
+    def checkpoint(self, conn) -> int:
+        """Persist every state with unsaved candles; returns how many were written."""
+        written = 0
+        for state_key, state in self._states.items():
+            if state.pending:
+                self._save_state(conn, state_key, state)
+                written += 1
+        return written
+
+    def _save_state(self, conn, state_key: str, state: _SmaCrossState) -> None:
+        self._store.save_state(conn, key=state_key, payload=state.to_payload())
+        state.pending = 0
+
+    def _entry_event(self, candle: CandleClosed, close: float) -> tuple[str, dict]:
+        return (
+            "signal.entry",
+            {
+                "candle_id": candle.candle_id,
+                "time": candle.open_time,
+                "price": close,
+                "label": "ENTRY",
+            },
+        )
 
+    def _ledger(self, candle: CandleClosed, fast_sma: float | None, slow_sma: float | None, crossed: bool) -> dict:
         signal = None
-        overlay_events: list[tuple[str, dict]] = []
-
-        prev_fast = state.get("prev_fast")
-        prev_slow = state.get("prev_slow")
-        if fast_sma is not None and slow_sma is not None and prev_fast is not None and prev_slow is not None:
-            if prev_fast <= prev_slow and fast_sma > slow_sma:
-                signal = {
-                    "type": "OPEN_LONG",
-                    "candle_id": candle.candle_id,
-                    "time": candle.open_time,
-                    "price": close,
-                }
-                overlay_events.append(
-                    (
-                        "signal.entry",
-                        {
-                            "candle_id": candle.candle_id,
-                            "time": candle.open_time,
-                            "price": close,
-                            "label": "ENTRY",
-                        },
-                    )
-                )
-
-        # Update prev values after signal calculation.
-        state["prev_fast"] = fast_sma
-        state["prev_slow"] = slow_sma
-
-        ledger = {
+        if crossed:
+            signal = {
+                "type": "OPEN_LONG",
+                "candle_id": candle.candle_id,
+                "time": candle.open_time,
+                "price": float(candle.close),
+            }
+        return {
             "candle_id": candle.candle_id,
             "time": candle.open_time,
             "symbol": candle.symbol,
@@ -101,29 +159,46 @@ class SmaCrossKernel:
             "signal": signal,
         }
 
+    def _write_outputs(
+        self,
+        conn,
+        candle: CandleClosed,
+        fast_sma: float | None,
+        slow_sma: float | None,
+        overlay_events: list[tuple[str, dict]],
+    ) -> None:
         # Persist minimal plot points for low-latency chart updates.
-        if fast_sma is not None:
-            self._store.upsert_plot_point(
-                conn,
-                symbol=candle.symbol,
-                timeframe=candle.timeframe,
-                feature_key=f"sma_{self._fast}",
-                candle_id=candle.candle_id,
-                candle_time=candle.open_time,
-                value=float(fast_sma),
-            )
-        if slow_sma is not None:
-            self._store.upsert_plot_point(
+        for feature_key, value in ((f"sma_{self._fast}", fast_sma), (f"sma_{self._slow}", slow_sma)):
+            if value is not None:
+                self._store.upsert_plot_point(
+                    conn,
+                    symbol=candle.symbol,
+                    timeframe=candle.timeframe,
+                    feature_key=feature_key,
+                    candle_id=candle.candle_id,
+                    candle_time=candle.open_time,
+                    value=float(value),
+                )
+        for kind, payload in overlay_events:
+            self._store.append_overlay_event(
                 conn,
                 symbol=candle.symbol,
                 timeframe=candle.timeframe,
-                feature_key=f"sma_{self._slow}",
                 candle_id=candle.candle_id,
                 candle_time=candle.open_time,
-                value=float(slow_sma),
+                kind=kind,
+                payload=payload,
             )
 
-        self._store.save_state(conn, key=state_key, payload=state)
+    def apply_closed(self, conn, candle: CandleClosed) -> KernelResult:
+        state_key, state = self._state(conn, candle)
+        close = float(candle.close)
+        fast_sma, slow_sma, crossed = state.step(close)
+        overlay_events = [self._entry_event(candle, close)] if crossed else []
+        ledger = self._ledger(candle, fast_sma, slow_sma, crossed)
+
+        self._write_outputs(conn, candle, fast_sma, slow_sma, overlay_events)
+        self._save_state(conn, state_key, state)
         self._store.set_latest_ledger(
             conn,
             symbol=candle.symbol,
@@ -132,15 +207,40 @@ class SmaCrossKernel:
             candle_time=candle.open_time,
             payload=ledger,
         )
-        for kind, payload in overlay_events:
-            self._store.append_overlay_event(
+        conn.commit()
+        return KernelResult(ledger=ledger, overlay_events=overlay_events)
+
+    def run_batch(self, conn, candles: Sequence[CandleClosed]) -> KernelBatchResult:
+        """
+        Same outputs as `apply_closed` per candle, but the latest ledger is written once per series,
+        state is checkpointed once and the connection committed once at the end.
+        """
+        out = KernelBatchResult()
+        last_by_series: dict[str, tuple[CandleClosed, float | None, float | None, bool]] = {}
+        state_key, state, series = "", None, None
+        for candle in candles:
+            if state is None or (candle.symbol, candle.timeframe) != series:
+                state_key, state = self._state(conn, candle)
+                series = (candle.symbol, candle.timeframe)
+            close = float(candle.close)
+            fast_sma, slow_sma, crossed = state.step(close)
+            events = [self._entry_event(candle, close)] if crossed else []
+            self._write_outputs(conn, candle, fast_sma, slow_sma, events)
+            out.sma_fast.append(fast_sma)
+            out.sma_slow.append(slow_sma)
+            out.open_long.append(crossed)
+            out.overlay_events.extend(events)
+            last_by_series[state_key] = (candle, fast_sma, slow_sma, crossed)
+
+        for candle, fast_sma, slow_sma, crossed in last_by_series.values():
+            self._store.set_latest_ledger(
                 conn,
                 symbol=candle.symbol,
                 timeframe=candle.timeframe,
                 candle_id=candle.candle_id,
                 candle_time=candle.open_time,
-                kind=kind,
-                payload=payload,
+                payload=self._ledger(candle, fast_sma, slow_sma, crossed),
             )
+        self.checkpoint(conn)
         conn.commit()
-        return KernelResult(ledger=ledger, overlay_events=overlay_events)
+        return out
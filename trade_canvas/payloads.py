@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def _clone_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+    if isinstance(value, dict):
+        # JSON object keys: str as-is, int/float/bool/None in their JSON spelling ("1", "true", "null").
+        return {k if isinstance(k, str) else json.dumps(k): _clone_value(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_clone_value(v) for v in value]
+    return json.loads(json.dumps(value))
+
+
+def clone_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Structural copy with the same result as a sorted-keys JSON round trip, without encoding to text."""
+    return _clone_value(payload)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Self
 
+from .payloads import clone_payload as _clone_payload
+
 
 @dataclass(frozen=True)
 class LatestLedgerRow:
@@ -62,10 +63,6 @@ def _series_key(symbol: str, timeframe: str) -> str:
     return f"{str(symbol)}:{str(timeframe)}"
 
 
-def _clone_payload(payload: dict[str, Any]) -> dict[str, Any]:
-    return json.loads(json.dumps(payload, separators=(",", ":"), sort_keys=True))
-
-
 class KernelStoreConnection:
     def __init__(self, state: _KernelStoreState) -> None:
         self._state = state
@@ -13,6 +13,7 @@ router = APIRouter(prefix="/api/oracle", tags=["oracle"])
 def backtest_run(
     series_id: str = Query("binance:futures:BTC/USDT:1d", min_length=1),
     symbol: str = Query("BTC", min_length=1),
+    workers: int = Query(1, ge=1, le=32, description="walk-forward workers (capped at TRADE_ORACLE_WF_MAX_WORKERS)"),
 ) -> dict:
     settings = load_settings()
     if not settings.enable_backtest:
@@ -20,7 +21,7 @@ def backtest_run(
 
     service = OracleService(settings)
     try:
-        result = service.run_market_backtest(series_id=series_id, symbol=symbol)
+        result = service.run_market_backtest(series_id=series_id, symbol=symbol, workers=workers)
     except MarketSourceUnavailableError as exc:
         raise HTTPException(
             status_code=503,
@@ -12,15 +12,23 @@ from trade_oracle.service import OracleService
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run trade_oracle BTC analysis and audits")
-    parser.add_argument("--task", choices=["analyze", "backtest-live", "calendar-audit"], default="analyze")
+    parser.add_argument(
+        "--task",
+        choices=["analyze", "backtest-live", "calendar-audit", "calendar-table"],
+        default="analyze",
+    )
     parser.add_argument("--series-id", default="binance:futures:BTC/USDT:1d")
     parser.add_argument("--symbol", default="BTC")
     parser.add_argument("--output-dir", default="trade_oracle/output")
     parser.add_argument("--backtest-output", default="backtest_evidence.json")
+    parser.add_argument("--wf-workers", type=int, default=1)
     parser.add_argument("--audit-output", default="calendar_crosscheck.json")
     parser.add_argument("--audit-start-utc", default="2009-01-03T16:15:00+00:00")
     parser.add_argument("--audit-end-utc", default="2026-01-01T00:00:00+00:00")
     parser.add_argument("--audit-step-days", type=int, default=30)
+    parser.add_argument("--table-start-year", type=int, default=2009)
+    parser.add_argument("--table-end-year", type=int, default=2030)
+    parser.add_argument("--table-output", default="calendar_pillars.json")
     return parser
 
 
@@ -50,7 +58,7 @@ def _run_analyze(args: argparse.Namespace, *, out_dir: Path) -> int:
 def _run_backtest_live(args: argparse.Namespace, *, out_dir: Path) -> int:
     settings = load_settings()
     svc = OracleService(settings)
-    result = svc.run_market_backtest(series_id=args.series_id, symbol=args.symbol)
+    result = svc.run_market_backtest(series_id=args.series_id, symbol=args.symbol, workers=args.wf_workers)
     output_path = out_dir / args.backtest_output
     output_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
 
@@ -76,6 +84,16 @@ def _run_calendar_audit(args: argparse.Namespace, *, out_dir: Path) -> int:
     return 0
 
 
+def _run_calendar_table(args: argparse.Namespace, *, out_dir: Path) -> int:
+    settings = load_settings()
+    calendar = OracleService(settings).calendar
+    added = calendar.precompute(start_year=args.table_start_year, end_year=args.table_end_year)
+    output_path = calendar.save_table(settings.calendar_table_path or out_dir / args.table_output)
+    print(f"calendar_table={output_path}")
+    print(f"buckets={calendar.cached_buckets()} added={added}")
+    return 0
+
+
 def main() -> int:
     args = build_parser().parse_args()
     out_dir = Path(args.output_dir)
@@ -87,6 +105,8 @@ def main() -> int:
         return _run_backtest_live(args, out_dir=out_dir)
     if args.task == "calendar-audit":
         return _run_calendar_audit(args, out_dir=out_dir)
+    if args.task == "calendar-table":
+        return _run_calendar_table(args, out_dir=out_dir)
     raise ValueError(f"unsupported task: {args.task}")
 
 
@@ -20,6 +20,7 @@ class OracleSettings:
     solar_longitude_deg: float
     solar_tz_offset_hours: float
     strict_calendar_lib: bool
+    calendar_table_path: str | None = None
 
 
 def _truthy(raw: str | None) -> bool:
@@ -28,6 +29,16 @@ def _truthy(raw: str | None) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def load_wf_max_workers() -> int:
+    """Size of the process-wide walk-forward pool; request `workers` are clamped to it."""
+    raw = (os.environ.get("TRADE_ORACLE_WF_MAX_WORKERS") or "").strip()
+    default = os.cpu_count() or 1
+    try:
+        return max(1, min(32, int(raw))) if raw else max(1, min(32, default))
+    except ValueError:
+        return max(1, min(32, default))
+
+
 def load_settings() -> OracleSettings:
     market_limit_raw = (os.environ.get("TRADE_ORACLE_MARKET_LIMIT") or "2000").strip()
     try:
@@ -88,4 +99,5 @@ def load_settings() -> OracleSettings:
         solar_longitude_deg=solar_longitude_deg,
         solar_tz_offset_hours=solar_tz_offset_hours,
         strict_calendar_lib=_truthy(os.environ.get("TRADE_ORACLE_STRICT_CALENDAR_LIB") or "1"),
+        calendar_table_path=(os.environ.get("TRADE_ORACLE_CALENDAR_TABLE_PATH") or "").strip() or None,
     )
@@ -107,6 +107,11 @@ def _compute_layer_scores(*, natal: BaziSnapshot, transit: BaziSnapshot) -> tupl
     return day_master, layer_scores
 
 
+def transit_score_key(transit: BaziSnapshot) -> tuple[str, str, str]:
+    """The transit fields `score_factors` reads: equal keys (same natal) give equal bundles."""
+    return (transit.year.stem, transit.month.stem, transit.day.stem)
+
+
 def score_factors(*, natal: BaziSnapshot, transit: BaziSnapshot) -> FactorBundle:
     day_master, layer_scores = _compute_layer_scores(natal=natal, transit=transit)
     relation = sum(layer_scores.values())
@@ -17,6 +17,10 @@ class CalendarProvider:
     def convert_utc(self, dt_utc: datetime) -> BaziSnapshot:
         raise NotImplementedError
 
+    def convert_true_local(self, true_local: datetime, *, dt_utc: datetime) -> BaziSnapshot:
+        """Pillars for an already true-solar-adjusted local time; the result depends on `true_local` only."""
+        raise NotImplementedError
+
 
 GAN: tuple[str, ...] = ("甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸")
 ZHI: tuple[str, ...] = ("子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥")
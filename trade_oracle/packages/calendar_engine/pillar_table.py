@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+from trade_oracle.models import BaziSnapshot, GanzhiPillar
+
+# (true-solar local date ordinal, hour block): block 0 = 00:00-00:59, 1..11 = two-hour 子丑.. blocks from 01:00,
+# 12 = 23:00-23:59. Pillars change at most once inside a bucket (hour pillar, day, solar term, year).
+BucketKey = tuple[int, int]
+# (source, year, month, day, hour); None marks a bucket some pillar boundary falls into.
+PillarEntry = tuple[str, GanzhiPillar, GanzhiPillar, GanzhiPillar, GanzhiPillar] | None
+
+TABLE_VERSION = 1
+HOUR_BLOCKS = 13
+
+
+def bucket_key(true_local: datetime) -> BucketKey:
+    return (true_local.toordinal(), (true_local.hour + 1) // 2)
+
+
+def bucket_bounds(key: BucketKey) -> tuple[datetime, datetime]:
+    """First and last whole second of the bucket, in the provider's true-local clock (UTC-labelled)."""
+    ordinal, block = key
+    day = datetime.combine(date.fromordinal(ordinal), datetime.min.time(), tzinfo=timezone.utc)
+    start_hour = 0 if block == 0 else 2 * block - 1
+    end_hour = 0 if block == 0 else min(23, 2 * block)
+    return day + timedelta(hours=start_hour), day + timedelta(hours=end_hour, minutes=59, seconds=59)
+
+
+def bucket_keys_for_years(start_year: int, end_year: int) -> Iterator[BucketKey]:
+    first = date(int(start_year), 1, 1).toordinal()
+    last = date(int(end_year), 12, 31).toordinal()
+    for ordinal in range(first, last + 1):
+        for block in range(HOUR_BLOCKS):
+            yield (ordinal, block)
+
+
+def entry_of(snapshot: BaziSnapshot) -> PillarEntry:
+    return (snapshot.source, snapshot.year, snapshot.month, snapshot.day, snapshot.hour)
+
+
+def snapshot_of(entry: PillarEntry, *, dt_utc: datetime) -> BaziSnapshot:
+    source, year, month, day, hour = entry
+    return BaziSnapshot(source=source, dt_utc=dt_utc, year=year, month=month, day=day, hour=hour)
+
+
+def _encode(entry: PillarEntry, sources: dict[str, int]) -> str | None:
+    if entry is None:
+        return None
+    idx = sources.setdefault(entry[0], len(sources))
+    return f"{idx}:" + "".join(p.text for p in entry[1:])
+
+
+def _decode(raw: str | None, sources: list[str]) -> PillarEntry:
+    if raw is None:
+        return None
+    idx, text = str(raw).split(":", 1)
+    if len(text) != 8:
+        raise ValueError(f"invalid pillar text: {raw!r}")
+    year, month, day, hour = (GanzhiPillar(stem=text[i], branch=text[i + 1]) for i in range(0, 8, 2))
+    return (sources[int(idx)], year, month, day, hour)
+
+
+def save_table(path: Path, *, signature: dict, entries: dict[BucketKey, PillarEntry]) -> None:
+    sources: dict[str, int] = {}
+    days: dict[str, list[str | None]] = {}
+    for (ordinal, block), entry in sorted(entries.items()):
+        row = days.setdefault(date.fromordinal(ordinal).isoformat(), [None] * HOUR_BLOCKS)
+        row[block] = _encode(entry, sources)
+    payload = {
+        "version": TABLE_VERSION,
+        "signature": signature,
+        "sources": list(sources),
+        "days": days,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+def load_table(path: Path, *, signature: dict) -> dict[BucketKey, PillarEntry]:
+    """Entries of a table built for the same calendar settings; a missing or foreign table loads as empty."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != TABLE_VERSION or payload.get("signature") != signature:
+            return {}
+        return _parse_days(payload)
+    except (OSError, ValueError, TypeError, IndexError, AttributeError):
+        return {}
+
+
+def _parse_days(payload: dict) -> dict[BucketKey, PillarEntry]:
+    sources = [str(s) for s in payload.get("sources") or []]
+    out: dict[BucketKey, PillarEntry] = {}
+    for day_text, row in (payload.get("days") or {}).items():
+        ordinal = date.fromisoformat(day_text).toordinal()
+        for block, raw in enumerate(row[:HOUR_BLOCKS]):
+            # Split buckets are stored as null and get re-checked on first use.
+            if raw is not None:
+                out[(ordinal, block)] = _decode(raw, sources)
+    return out
@@ -25,7 +25,9 @@ class SxtwlProvider(CalendarProvider):
         if dt_utc.tzinfo is None:
             dt_utc = dt_utc.replace(tzinfo=timezone.utc)
         dt_utc = dt_utc.astimezone(timezone.utc)
-        true_local = to_true_solar_local(dt_utc, config=self._solar_config)
+        return self.convert_true_local(to_true_solar_local(dt_utc, config=self._solar_config), dt_utc=dt_utc)
+
+    def convert_true_local(self, true_local: datetime, *, dt_utc: datetime) -> BaziSnapshot:
         try:
             import sxtwl  # type: ignore
 
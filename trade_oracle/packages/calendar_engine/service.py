@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 
 from trade_oracle.models import BaziSnapshot
 
+from .pillar_table import (
+    BucketKey,
+    PillarEntry,
+    bucket_bounds,
+    bucket_key,
+    bucket_keys_for_years,
+    entry_of,
+    load_table,
+    save_table,
+    snapshot_of,
+)
 from .provider_lunar import LunarPythonProvider
 from .provider_sxtwl import SxtwlProvider
-from .solar_time import TrueSolarConfig
+from .solar_time import TrueSolarConfig, format_true_solar_tag, to_true_solar_local
+
+_MISSING = object()
 
 
 @dataclass(frozen=True)
@@ -17,6 +31,7 @@ class CalendarService:
     solar_longitude_deg: float = 24.9384
     solar_tz_offset_hours: float = 2.0
     strict_calendar_lib: bool = True
+    table_path: str | None = None
 
     def __post_init__(self) -> None:
         solar_config = TrueSolarConfig(
@@ -24,14 +39,65 @@ class CalendarService:
             longitude_deg=float(self.solar_longitude_deg),
             tz_offset_hours=float(self.solar_tz_offset_hours),
         )
+        object.__setattr__(self, "_solar_config", solar_config)
         object.__setattr__(self, "_primary", LunarPythonProvider(solar_config=solar_config, strict_calendar_lib=self.strict_calendar_lib))
         object.__setattr__(self, "_secondary", SxtwlProvider(solar_config=solar_config, strict_calendar_lib=self.strict_calendar_lib))
+        buckets = load_table(Path(self.table_path), signature=self.table_signature()) if self.table_path else {}
+        object.__setattr__(self, "_buckets", buckets)
+
+    def table_signature(self) -> dict:
+        return {
+            "true_solar": format_true_solar_tag(self._solar_config),
+            "crosscheck": bool(self.enable_crosscheck),
+            "strict_calendar_lib": bool(self.strict_calendar_lib),
+        }
+
+    def cached_buckets(self) -> int:
+        return len(self._buckets)
 
     def convert_utc(self, dt_utc: datetime) -> BaziSnapshot:
-        primary = self._primary.convert_utc(dt_utc)
+        if dt_utc.tzinfo is None:
+            dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+        dt_utc = dt_utc.astimezone(timezone.utc)
+        true_local = to_true_solar_local(dt_utc, config=self._solar_config)
+        key = bucket_key(true_local)
+        entry = self._buckets.get(key, _MISSING)
+        if entry is _MISSING:
+            entry = self._buckets[key] = self._verify_bucket(key)
+        if entry is None:
+            return self._convert_true_local(true_local, dt_utc=dt_utc)
+        return snapshot_of(entry, dt_utc=dt_utc)
+
+    def precompute(self, *, start_year: int, end_year: int) -> int:
+        """Verify every bucket of the true-local years [start_year, end_year]; returns how many were new."""
+        added = 0
+        for key in bucket_keys_for_years(start_year, end_year):
+            if key not in self._buckets:
+                self._buckets[key] = self._verify_bucket(key)
+                added += 1
+        return added
+
+    def save_table(self, path: str | Path | None = None) -> Path:
+        raw = path or self.table_path
+        if not raw:
+            raise ValueError("table_path is required")
+        target = Path(raw)
+        save_table(target, signature=self.table_signature(), entries=self._buckets)
+        return target
+
+    def _verify_bucket(self, key: BucketKey) -> PillarEntry:
+        # Pillars change at most once per bucket, so equal first/last seconds (crosscheck included) cover it all.
+        # dt_utc is only carried along here; entries keep the pillars and source.
+        first, last = bucket_bounds(key)
+        head = entry_of(self._convert_true_local(first, dt_utc=first))
+        tail = entry_of(self._convert_true_local(last, dt_utc=last))
+        return head if head == tail else None
+
+    def _convert_true_local(self, true_local: datetime, *, dt_utc: datetime) -> BaziSnapshot:
+        primary = self._primary.convert_true_local(true_local, dt_utc=dt_utc)
         if not self.enable_crosscheck:
             return primary
-        secondary = self._secondary.convert_utc(dt_utc)
+        secondary = self._secondary.convert_true_local(true_local, dt_utc=dt_utc)
         if self._same_bazi(primary, secondary):
             return primary
         return BaziSnapshot(
@@ -1,17 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Protocol
-
 from trade_oracle.models import BaziSnapshot, Candle, StrategyMetrics
-from trade_oracle.packages.bazi_factors.rules import score_factors
-
-from .walk_forward import build_daily_windows
 
+from .bar_series import BarSeries, CalendarLike, build_bar_series, sweep_returns
+from .walk_forward import WalkForwardWindow, build_daily_windows, map_windows
 
-class CalendarLike(Protocol):
-    def convert_utc(self, dt_utc: datetime) -> BaziSnapshot:
-        ...
+THRESHOLD_GRID = (0.4, 0.6, 0.8, 1.0, 1.2, 1.4)
 
 
 def _empty_metrics(*, threshold: float | None = None, windows: int = 0) -> StrategyMetrics:
@@ -56,61 +50,6 @@ def _metrics_from_returns(returns: list[float], *, threshold: float | None, wind
     )
 
 
-def _build_scores(*, candles: list[Candle], natal: BaziSnapshot, calendar: CalendarLike) -> list[float]:
-    scores: list[float] = []
-    for candle in candles:
-        dt_utc = datetime.fromtimestamp(int(candle.candle_time), tz=timezone.utc)
-        transit = calendar.convert_utc(dt_utc)
-        bundle = score_factors(natal=natal, transit=transit)
-        scores.append(bundle.total)
-    return scores
-
-
-def _build_scores_and_layers(
-    *, candles: list[Candle], natal: BaziSnapshot, calendar: CalendarLike
-) -> tuple[list[float], dict[str, list[float]]]:
-    total_scores: list[float] = []
-    layer_scores: dict[str, list[float]] = {"year": [], "month": [], "day": []}
-    for candle in candles:
-        dt_utc = datetime.fromtimestamp(int(candle.candle_time), tz=timezone.utc)
-        transit = calendar.convert_utc(dt_utc)
-        bundle = score_factors(natal=natal, transit=transit)
-        total_scores.append(bundle.total)
-        for layer in layer_scores:
-            layer_scores[layer].append(float(bundle.layer_scores.get(layer, 0.0)))
-    return total_scores, layer_scores
-
-
-def _returns_for_range(
-    *,
-    closes: list[float],
-    scores: list[float],
-    threshold: float,
-    start_idx: int,
-    end_idx: int,
-    fee_rate: float,
-) -> list[float]:
-    out: list[float] = []
-    if end_idx - start_idx < 2:
-        return out
-    for idx in range(start_idx, end_idx - 1):
-        close_now = closes[idx]
-        close_next = closes[idx + 1]
-        if close_now <= 0:
-            continue
-        signal = 0
-        if scores[idx] > threshold:
-            signal = 1
-        elif scores[idx] < -threshold:
-            signal = -1
-        if signal == 0:
-            continue
-        gross_ret = (close_next - close_now) / close_now
-        net_ret = signal * gross_ret - fee_rate
-        out.append(net_ret)
-    return out
-
-
 def _safe_num(value: float) -> float | None:
     if value == float("inf") or value == float("-inf"):
         return None
@@ -163,18 +102,13 @@ def run_layer_segment_backtest(
             },
         }
 
-    closes = [float(c.close) for c in candles]
-    total_scores, layer_scores = _build_scores_and_layers(candles=candles, natal=natal, calendar=calendar)
+    bars = build_bar_series(candles=candles, natal=natal, calendar=calendar, fee_rate=fee_rate)
+    closes = bars.closes
 
     layer_perf: dict[str, dict] = {}
-    for layer, scores in layer_scores.items():
-        returns = _returns_for_range(
-            closes=closes,
-            scores=scores,
-            threshold=layer_threshold,
-            start_idx=0,
-            end_idx=len(candles),
-            fee_rate=fee_rate,
+    for layer, scores in bars.layer_scores.items():
+        (returns,) = sweep_returns(
+            bars=bars, scores=scores, thresholds=[layer_threshold], start_idx=0, end_idx=len(candles)
         )
         metrics = _metrics_from_returns(returns, threshold=layer_threshold, windows=1)
         layer_perf[layer] = {
@@ -184,13 +118,8 @@ def run_layer_segment_backtest(
 
     segments: list[dict] = []
     for label, start_idx, end_idx in _segment_ranges(len(candles)):
-        returns = _returns_for_range(
-            closes=closes,
-            scores=total_scores,
-            threshold=segment_threshold,
-            start_idx=start_idx,
-            end_idx=end_idx,
-            fee_rate=fee_rate,
+        (returns,) = sweep_returns(
+            bars=bars, scores=bars.total_scores, thresholds=[segment_threshold], start_idx=start_idx, end_idx=end_idx
         )
         metrics = _metrics_from_returns(returns, threshold=segment_threshold, windows=1)
 
@@ -219,6 +148,37 @@ def run_layer_segment_backtest(
     }
 
 
+def _evaluate_window(bars: BarSeries, w: WalkForwardWindow) -> tuple[float, list[float]]:
+    """Pick the best grid threshold on the train slice; returns (threshold, test returns)."""
+    best_threshold = THRESHOLD_GRID[0]
+    best_metrics = _empty_metrics(threshold=best_threshold, windows=1)
+
+    # One pass over the train range yields the returns of every grid threshold.
+    train_sweep = sweep_returns(
+        bars=bars,
+        scores=bars.total_scores,
+        thresholds=THRESHOLD_GRID,
+        start_idx=w.train_start_idx,
+        end_idx=w.train_end_idx + 1,
+    )
+    for th, train_returns in zip(THRESHOLD_GRID, train_sweep):
+        cur = _metrics_from_returns(train_returns, threshold=th, windows=1)
+        cur_pf = cur.profit_factor if cur.profit_factor != float("inf") else 9999.0
+        best_pf = best_metrics.profit_factor if best_metrics.profit_factor != float("inf") else 9999.0
+        if (cur_pf, cur.expectancy, cur.win_rate) > (best_pf, best_metrics.expectancy, best_metrics.win_rate):
+            best_metrics = cur
+            best_threshold = th
+
+    (test_returns,) = sweep_returns(
+        bars=bars,
+        scores=bars.total_scores,
+        thresholds=[best_threshold],
+        start_idx=w.test_start_idx,
+        end_idx=w.test_end_idx + 1,
+    )
+    return best_threshold, test_returns
+
+
 def run_walk_forward_backtest(
     *,
     candles: list[Candle],
@@ -227,6 +187,8 @@ def run_walk_forward_backtest(
     train_size: int = 90,
     test_size: int = 30,
     fee_rate: float = 0.0008,
+    workers: int = 1,
+    max_workers: int = 1,
 ) -> StrategyMetrics:
     if len(candles) < max(30, train_size + test_size):
         return _empty_metrics()
@@ -235,42 +197,14 @@ def run_walk_forward_backtest(
     if not windows:
         return _empty_metrics()
 
-    closes = [float(c.close) for c in candles]
-    scores = _build_scores(candles=candles, natal=natal, calendar=calendar)
+    bars = build_bar_series(candles=candles, natal=natal, calendar=calendar, fee_rate=fee_rate)
+    # Windows are independent; results come back in window order, so aggregation matches workers=1 exactly.
+    results = map_windows(_evaluate_window, windows, shared=bars, workers=workers, max_workers=max_workers)
 
-    threshold_grid = [0.4, 0.6, 0.8, 1.0, 1.2, 1.4]
     all_test_returns: list[float] = []
     selected_thresholds: list[float] = []
-
-    for w in windows:
-        best_threshold = threshold_grid[0]
-        best_metrics = _empty_metrics(threshold=best_threshold, windows=1)
-
-        for th in threshold_grid:
-            train_returns = _returns_for_range(
-                closes=closes,
-                scores=scores,
-                threshold=th,
-                start_idx=w.train_start_idx,
-                end_idx=w.train_end_idx + 1,
-                fee_rate=fee_rate,
-            )
-            cur = _metrics_from_returns(train_returns, threshold=th, windows=1)
-            cur_pf = cur.profit_factor if cur.profit_factor != float("inf") else 9999.0
-            best_pf = best_metrics.profit_factor if best_metrics.profit_factor != float("inf") else 9999.0
-            if (cur_pf, cur.expectancy, cur.win_rate) > (best_pf, best_metrics.expectancy, best_metrics.win_rate):
-                best_metrics = cur
-                best_threshold = th
-
+    for best_threshold, test_returns in results:
         selected_thresholds.append(best_threshold)
-        test_returns = _returns_for_range(
-            closes=closes,
-            scores=scores,
-            threshold=best_threshold,
-            start_idx=w.test_start_idx,
-            end_idx=w.test_end_idx + 1,
-            fee_rate=fee_rate,
-        )
         all_test_returns.extend(test_returns)
 
     avg_threshold = sum(selected_thresholds) / len(selected_thresholds)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Protocol, Sequence
+
+from trade_oracle.models import BaziSnapshot, Candle
+from trade_oracle.packages.bazi_factors.rules import FactorBundle, score_factors, transit_score_key
+
+LAYERS = ("year", "month", "day")
+
+
+class CalendarLike(Protocol):
+    def convert_utc(self, dt_utc: datetime) -> BaziSnapshot:
+        ...
+
+
+@dataclass(frozen=True)
+class BarSeries:
+    """
+    Per-bar backtest inputs, computed once per candle list.
+    long_net[i] / short_net[i]: net return of holding bar i -> i+1 long / short; None when close_i <= 0 or i is last.
+    """
+
+    closes: list[float]
+    long_net: list[float | None]
+    short_net: list[float | None]
+    total_scores: list[float]
+    layer_scores: dict[str, list[float]]
+
+
+def build_bar_series(
+    *,
+    candles: Sequence[Candle],
+    natal: BaziSnapshot,
+    calendar: CalendarLike,
+    fee_rate: float,
+) -> BarSeries:
+    closes = [float(c.close) for c in candles]
+    long_net: list[float | None] = []
+    short_net: list[float | None] = []
+    for close_now, close_next in zip(closes, closes[1:]):
+        if close_now <= 0:
+            long_net.append(None)
+            short_net.append(None)
+            continue
+        gross_ret = (close_next - close_now) / close_now
+        long_net.append(1 * gross_ret - fee_rate)
+        short_net.append(-1 * gross_ret - fee_rate)
+    if closes:
+        long_net.append(None)
+        short_net.append(None)
+
+    # Bars whose transits score alike (a day of hourly bars, say) share one bundle.
+    bundles: dict[tuple[str, str, str], FactorBundle] = {}
+    total_scores: list[float] = []
+    layer_scores: dict[str, list[float]] = {layer: [] for layer in LAYERS}
+    for candle in candles:
+        transit = calendar.convert_utc(datetime.fromtimestamp(int(candle.candle_time), tz=timezone.utc))
+        key = transit_score_key(transit)
+        bundle = bundles.get(key)
+        if bundle is None:
+            bundle = bundles[key] = score_factors(natal=natal, transit=transit)
+        total_scores.append(bundle.total)
+        for layer in LAYERS:
+            layer_scores[layer].append(float(bundle.layer_scores.get(layer, 0.0)))
+    return BarSeries(
+        closes=closes,
+        long_net=long_net,
+        short_net=short_net,
+        total_scores=total_scores,
+        layer_scores=layer_scores,
+    )
+
+
+def sweep_returns(
+    *,
+    bars: BarSeries,
+    scores: Sequence[float],
+    thresholds: Sequence[float],
+    start_idx: int,
+    end_idx: int,
+) -> list[list[float]]:
+    """
+    Trade returns over bars [start_idx, end_idx - 1) for every threshold in one pass (bar order kept).
+    Signal per threshold: long if score > th, else short if score < -th. With thresholds sorted ascending the
+    long set is the prefix below `score` and the short set the next run below `-score`, found by bisection.
+    """
+    order = sorted(range(len(thresholds)), key=lambda k: float(thresholds[k]))
+    ascending = [float(thresholds[k]) for k in order]
+    by_rank: list[list[float]] = [[] for _ in ascending]
+    long_net, short_net = bars.long_net, bars.short_net
+    for idx in range(int(start_idx), max(int(start_idx), int(end_idx) - 1)):
+        long_ret = long_net[idx]
+        if long_ret is None:
+            continue
+        score = scores[idx]
+        n_long = bisect_left(ascending, score)
+        for rank in range(n_long):
+            by_rank[rank].append(long_ret)
+        short_ret = short_net[idx]
+        for rank in range(n_long, bisect_left(ascending, -score)):
+            by_rank[rank].append(short_ret)
+    out: list[list[float]] = [[] for _ in thresholds]
+    for rank, k in enumerate(order):
+        out[k] = by_rank[rank]
+    return out
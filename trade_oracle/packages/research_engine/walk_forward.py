@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, TypeVar
 
 from trade_oracle.models import Candle
 
+R = TypeVar("R")
+
+# Long-lived pools keyed by size: HTTP requests reuse processes instead of forking a pool each.
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class WalkForwardWindow:
@@ -40,3 +51,47 @@ def build_daily_windows(candles: list[Candle], *, train_size: int = 360, test_si
         )
         idx += test_size
     return windows
+
+
+def _shared_pool(size: int) -> ProcessPoolExecutor:
+    """
+    Process-wide pool of `size` workers, created on first use.
+    forkserver (spawn where unavailable) keeps workers from inheriting the API server's threads and sockets.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(size)
+        if pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            pool = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context(method))
+            _POOLS[size] = pool
+        return pool
+
+
+def _run_chunk(
+    evaluate: Callable[[Any, WalkForwardWindow], R], shared: Any, chunk: list[WalkForwardWindow]
+) -> list[R]:
+    return [evaluate(shared, w) for w in chunk]
+
+
+def map_windows(
+    evaluate: Callable[[Any, WalkForwardWindow], R],
+    windows: list[WalkForwardWindow],
+    *,
+    shared: Any,
+    workers: int = 1,
+    max_workers: int = 1,
+) -> list[R]:
+    """
+    `evaluate(shared, window)` for every window, results in window order.
+    workers > 1 fans `workers` contiguous chunks out to the process-wide pool of `max_workers` processes, which
+    also bounds concurrent requests; `shared` (the precomputed bar arrays) travels with each chunk.
+    `evaluate` must be a module-level pure function, so results equal workers=1.
+    """
+    pool_size = max(1, int(max_workers))
+    n_workers = min(max(1, int(workers)), pool_size, len(windows))
+    if n_workers <= 1:
+        return [evaluate(shared, w) for w in windows]
+    chunk_size = -(-len(windows) // n_workers)
+    chunks = [windows[i : i + chunk_size] for i in range(0, len(windows), chunk_size)]
+    pool = _shared_pool(pool_size)
+    return [result for part in pool.map(partial(_run_chunk, evaluate, shared), chunks) for result in part]
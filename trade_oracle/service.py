@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict
 from datetime import datetime, timezone
 
-from trade_oracle.config import OracleSettings
+from trade_oracle.config import OracleSettings, load_wf_max_workers
 from trade_oracle.models import BaziSnapshot, Candle, StrategyMetrics
 from trade_oracle.market_client import MarketClient
 from trade_oracle.packages.asset_registry.registry import get_asset_birth
@@ -23,6 +23,7 @@ class OracleService:
             solar_longitude_deg=settings.solar_longitude_deg,
             solar_tz_offset_hours=settings.solar_tz_offset_hours,
             strict_calendar_lib=settings.strict_calendar_lib,
+            table_path=settings.calendar_table_path,
         )
 
     def analyze_current(self, *, series_id: str, symbol: str = "BTC") -> tuple[dict, str]:
@@ -82,11 +83,13 @@ class OracleService:
         report_md = render_markdown(analysis)
         return payload, report_md
 
-    def run_market_backtest(self, *, series_id: str, symbol: str = "BTC") -> dict:
+    def run_market_backtest(self, *, series_id: str, symbol: str = "BTC", workers: int = 1) -> dict:
         candles = self.market.fetch_candles(series_id=series_id, limit=self.settings.market_limit)
         birth = get_asset_birth(symbol)
         birth_bazi = self.calendar.convert_utc(birth.birth_time_utc)
-        metrics = self._run_backtest(candles=candles, birth_bazi=birth_bazi)
+        max_workers = load_wf_max_workers()
+        workers = max(1, min(int(workers), max_workers))
+        metrics = self._run_backtest(candles=candles, birth_bazi=birth_bazi, workers=workers, max_workers=max_workers)
         passed = bool(
             metrics.trades > 0
             and metrics.win_rate >= self.settings.target_win_rate
@@ -105,12 +108,15 @@ class OracleService:
                 "wf_train_size": self.settings.wf_train_size,
                 "wf_test_size": self.settings.wf_test_size,
                 "trade_fee_rate": self.settings.trade_fee_rate,
+                "wf_workers": workers,
             },
             "metrics": asdict(metrics),
             "passed": passed,
         }
 
-    def _run_backtest(self, *, candles: list[Candle], birth_bazi: BaziSnapshot) -> StrategyMetrics:
+    def _run_backtest(
+        self, *, candles: list[Candle], birth_bazi: BaziSnapshot, workers: int = 1, max_workers: int = 1
+    ) -> StrategyMetrics:
         return run_walk_forward_backtest(
             candles=candles,
             natal=birth_bazi,
@@ -118,4 +124,6 @@ class OracleService:
             train_size=self.settings.wf_train_size,
             test_size=self.settings.wf_test_size,
             fee_rate=self.settings.trade_fee_rate,
+            workers=workers,
+            max_workers=max_workers,
         )